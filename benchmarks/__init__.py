@@ -0,0 +1 @@
+# 效能基準測試 - 合成遊戲專案產生器與各階段耗時量測
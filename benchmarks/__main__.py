@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+基準測試入口 - python -m benchmarks
+
+使用方式:
+    python -m benchmarks generate <輸出目錄> [--preset small] [--seed 0] [--png 5000 ...]
+    python -m benchmarks run [--preset small] [--repeat 3] [--gui]           (在暫存目錄產生合成專案並量測)
+    python -m benchmarks run --project <專案路徑>                            (量測既有專案)
+    python -m benchmarks run --save-baseline baseline.ini                   (保存基準線)
+    python -m benchmarks run --baseline baseline.ini [--threshold 0.2]      (與基準線比較)
+    python -m benchmarks check [名稱 ...]                                   (正確性檢查，在暫存目錄執行)
+
+基準線與機器相關，不提交到版本庫；請在同一台機器上先保存再比較。
+
+結束代碼:
+    0  量測完成 (沒有退步)
+    1  有階段比基準線慢超過 threshold，或正確性檢查失敗
+    2  參數錯誤、基準線不存在或基準線的規格與目前不同
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.checks import CHECKS, run_checks
+from benchmarks.project_generator import PRESETS, ProjectSpec, generate_project
+from benchmarks.runner import (baseline_mismatch, compare_with_baseline, format_report, load_baseline,
+                               run_benchmark, save_baseline)
+from src.scanner.scan_engine import SCAN_PROFILES
+
+
+EXIT_OK = 0
+EXIT_REGRESSION = 1
+EXIT_USAGE = 2
+
+# 命令列的設定檔名稱 -> SCAN_PROFILES 鍵值
+PROFILE_CHOICES = {name[:-len('_scan')]: name for name in SCAN_PROFILES}
+
+
+def _add_spec_arguments(parser: argparse.ArgumentParser):
+    """合成專案規格的參數 (未指定的欄位使用預設規模的值)"""
+    parser.add_argument('--preset', choices=sorted(PRESETS), default='small', help='預設規模 (預設 small)')
+    parser.add_argument('--seed', type=int, help='亂數種子')
+    for extension in ('efk', 'efkmat', 'efkmodel', 'c3b', 'lua', 'png'):
+        parser.add_argument(f'--{extension}', type=int, help=f'.{extension} 檔案數')
+    parser.add_argument('--depth', type=int, help='目錄最大深度')
+    parser.add_argument('--files-per-directory', type=int, help='平均每個目錄的檔案數')
+    parser.add_argument('--duplicate-ratio', type=float, help='使用重複檔名的圖片比例')
+    parser.add_argument('--cross-directory-ratio', type=float, help='指向其他目錄的引用比例')
+    parser.add_argument('--png-size', type=int, help='圖片檔平均大小 (位元組)')
+
+
+def _spec_from_args(args: argparse.Namespace) -> ProjectSpec:
+    """依命令列參數建立專案規格"""
+    overrides = {field: getattr(args, field) for field in ProjectSpec.FIELDS}
+    return ProjectSpec.from_preset(args.preset, **overrides)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """建立命令列參數解析器"""
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='掃描效能基準測試')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    generate = subparsers.add_parser('generate', help='產生合成遊戲專案')
+    generate.add_argument('output', help='輸出目錄 (必須不存在或為空目錄)')
+    _add_spec_arguments(generate)
+
+    run = subparsers.add_parser('run', help='量測各階段耗時')
+    run.add_argument('--project', help='量測既有專案 (未指定時在暫存目錄產生合成專案)')
+    _add_spec_arguments(run)
+    run.add_argument('--profile', choices=sorted(PROFILE_CHOICES), default='all', help='掃描設定檔 (預設 all)')
+    run.add_argument('--repeat', type=int, default=3, help='重複次數，取最快的一次 (預設 3)')
+    run.add_argument('--gui', action='store_true', help='同時量測介面列表的填入 (需要顯示器)')
+    run.add_argument('--baseline', metavar='FILE', help='與基準線比較')
+    run.add_argument('--save-baseline', metavar='FILE', help='把這次的量測結果保存為基準線')
+    run.add_argument('--threshold', type=float, default=0.2, help='容許的變慢比例 (預設 0.2 = 20%%)')
+
+    check = subparsers.add_parser('check', help='在暫存目錄建立小型專案並確認掃描結果')
+    check.add_argument('names', nargs='*', metavar='NAME',
+                       help=f"要執行的檢查 (預設全部: {', '.join(sorted(CHECKS))})")
+    return parser
+
+
+def _generate(args: argparse.Namespace) -> int:
+    """generate 子命令"""
+    spec = _spec_from_args(args)
+    started = time.perf_counter()
+    try:
+        project = generate_project(args.output, spec)
+    except ValueError as e:
+        print(f"錯誤: {e}", file=sys.stderr)
+        return EXIT_USAGE
+    print(f"已產生 {project.total_files} 個檔案 ({project.total_bytes / 1024 / 1024:.1f} MB, "
+          f"{time.perf_counter() - started:.1f} 秒): {args.output}")
+    for extension in sorted(project.file_counts):
+        print(f"  {extension:<10}{project.file_counts[extension]:8d}")
+    return EXIT_OK
+
+
+def _run(args: argparse.Namespace) -> int:
+    """run 子命令"""
+    profile = PROFILE_CHOICES[args.profile]
+    baseline = None
+    if args.baseline:
+        try:
+            baseline = load_baseline(args.baseline)
+        except FileNotFoundError:
+            print(f"錯誤: 基準線不存在: {args.baseline}", file=sys.stderr)
+            return EXIT_USAGE
+
+    if args.project:
+        if not os.path.isdir(args.project):
+            print(f"錯誤: 專案路徑不存在: {args.project}", file=sys.stderr)
+            return EXIT_USAGE
+        spec = None
+        measurements = run_benchmark(args.project, profile, args.repeat, args.gui)
+    else:
+        spec = _spec_from_args(args)
+        with tempfile.TemporaryDirectory(prefix='clearproj-bench-') as project_path:
+            project = generate_project(project_path, spec)
+            print(f"# 合成專案: {project.total_files} 個檔案, {project.total_bytes / 1024 / 1024:.1f} MB "
+                  f"(preset={args.preset}, seed={spec.seed})")
+            measurements = run_benchmark(project_path, profile, args.repeat, args.gui)
+
+    print(format_report(measurements))
+    if args.gui and 'gui' not in {measurement.name for measurement in measurements}:
+        print("# 無法建立視窗 (沒有顯示器)，略過 gui 階段")
+
+    if args.save_baseline:
+        save_baseline(args.save_baseline, measurements, spec, profile)
+        print(f"# 基準線已保存: {args.save_baseline}")
+
+    if baseline is None:
+        return EXIT_OK
+    differences = baseline_mismatch(baseline, spec, profile)
+    if differences:
+        print("錯誤: 基準線的量測設定與目前不同:", file=sys.stderr)
+        for difference in differences:
+            print(f"  {difference}", file=sys.stderr)
+        return EXIT_USAGE
+
+    regressions = compare_with_baseline(measurements, baseline, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION\t{regression.phase}\t{regression.baseline_seconds * 1000:.2f} ms -> "
+              f"{regression.current_seconds * 1000:.2f} ms (x{regression.ratio:.2f})")
+    if regressions:
+        return EXIT_REGRESSION
+    print(f"# 與基準線比較: 沒有階段慢超過 {args.threshold:.0%}")
+    return EXIT_OK
+
+
+def _check(args: argparse.Namespace) -> int:
+    """check 子命令"""
+    unknown = sorted(set(args.names) - set(CHECKS))
+    if unknown:
+        print(f"錯誤: 沒有這個檢查: {', '.join(unknown)}", file=sys.stderr)
+        return EXIT_USAGE
+    failed = False
+    for name, problems in run_checks(args.names):
+        print(f"{'FAIL' if problems else 'PASS'}\t{name}")
+        for problem in problems:
+            print(f"  {problem}")
+        failed = failed or bool(problems)
+    return EXIT_REGRESSION if failed else EXIT_OK
+
+
+def main(argv=None) -> int:
+    """主函數"""
+    args = build_parser().parse_args(argv)
+    if args.command == 'generate':
+        return _generate(args)
+    if args.command == 'check':
+        return _check(args)
+    return _run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
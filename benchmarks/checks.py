@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+正確性檢查 - 在暫存目錄建立小型專案，確認掃描結果與預期相同
+
+每個檢查接收一個空的暫存目錄，寫入專案後執行掃描，返回不符合預期的描述 (空列表代表通過)；
+暫存目錄在檢查結束後自動刪除，不會留下任何檔案。
+"""
+
+import os
+import struct
+import tempfile
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from benchmarks.project_generator import _utf16_string
+from src.scanner.scan_engine import ScanEngine
+from src.scanner.shard import merge_partials, run_shards
+
+
+_UINT32 = struct.Struct('<I')
+_PNG_CONTENT = b'\x89PNG\r\n\x1a\n' + b'\x00' * 56
+
+
+def _write(project_path: str, relative_path: str, content: bytes):
+    """寫入專案中的一個檔案 (自動建立目錄)"""
+    file_path = os.path.join(project_path, *relative_path.split('/'))
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, 'wb') as f:
+        f.write(content)
+
+
+def _effekseer(magic: bytes, version: int, references: Iterable[str]) -> bytes:
+    """Effekseer 格式的檔案內容: 檔頭 + 以二進位資料分隔的 UTF-16 引用字串"""
+    parts = [magic, _UINT32.pack(version)]
+    for reference in references:
+        parts += [b'\x00' * 32, _utf16_string(reference)]
+    parts.append(b'\x00' * 32)
+    return b''.join(parts)
+
+
+def _relative_unused(project_path: str, unused_files: Iterable[str]) -> List[str]:
+    """以相對於專案目錄、'/' 分隔的路徑表示未使用檔案 (排序後比較)"""
+    return sorted(os.path.relpath(file_path, project_path).replace(os.sep, '/') for file_path in unused_files)
+
+
+def _compare(label: str, actual: List[str], expected: List[str]) -> List[str]:
+    """比較未使用檔案列表，返回差異描述"""
+    problems = []
+    missing = sorted(set(expected) - set(actual))
+    extra = sorted(set(actual) - set(expected))
+    if missing:
+        problems.append(f"{label}: 應列為未使用但沒有列出: {', '.join(missing)}")
+    if extra:
+        problems.append(f"{label}: 不應列為未使用: {', '.join(extra)}")
+    return problems
+
+
+def check_lua_root_reachability(project_path: str) -> List[str]:
+    """
+    Lua 入口腳本載入的特效鏈與 require 的腳本都必須可到達
+
+    main.lua 以字串載入 fx/fire.efk (-> .efkmat -> .png) 並 require("lua.other")，
+    other.lua 引用 ui/btn.png；沒有人載入的 fx/dead.efk 整條鏈與 ui/orphan.png 才是未使用。
+    單一行程與分片掃描的結果都要相同
+    """
+    _write(project_path, 'lua/main.lua',
+           b'local effect = "fx/fire.efk"\nlocal other = require("lua.other")\n')
+    _write(project_path, 'lua/other.lua', b'return { icon = "ui/btn.png" }\n')
+    _write(project_path, 'fx/fire.efk', _effekseer(b'SKFE', 1610, ['fire.efkmat', 'fire_tex.png']))
+    _write(project_path, 'fx/fire.efkmat', _effekseer(b'EFKM', 3, ['fire_mat.png']))
+    _write(project_path, 'fx/dead.efk', _effekseer(b'SKFE', 1610, ['dead.efkmat']))
+    _write(project_path, 'fx/dead.efkmat', _effekseer(b'EFKM', 3, ['dead.png']))
+    for relative_path in ('fx/fire_tex.png', 'fx/fire_mat.png', 'fx/dead.png', 'ui/btn.png', 'ui/orphan.png'):
+        _write(project_path, relative_path, _PNG_CONTENT)
+
+    expected = ['fx/dead.efk', 'fx/dead.efkmat', 'fx/dead.png', 'ui/orphan.png']
+    root_patterns = ['lua/main.lua']
+
+    result = ScanEngine.from_profile('all_scan', project_path, root_patterns=root_patterns).run()
+    problems = _compare('單一行程', _relative_unused(project_path, result.unused_files), expected)
+
+    with tempfile.TemporaryDirectory(prefix='clearproj-check-shards-') as output_dir:
+        partial_paths = run_shards(project_path, 'all_scan', 2, output_dir, max_workers=1,
+                                   root_patterns=root_patterns)
+        result = merge_partials(partial_paths, project_path, 'all_scan', root_patterns=root_patterns)
+    problems += _compare('分片掃描', _relative_unused(project_path, result.unused_files), expected)
+    return problems
+
+
+# 檢查名稱 -> 檢查函數
+CHECKS: Dict[str, Callable[[str], List[str]]] = {
+    'lua_root_reachability': check_lua_root_reachability,
+}
+
+
+def run_checks(names: Iterable[str] = ()) -> List[Tuple[str, List[str]]]:
+    """
+    在各自的暫存目錄執行檢查
+
+    Args:
+        names: 要執行的檢查名稱 (空代表全部)
+
+    Returns:
+        List[Tuple[str, List[str]]]: (檢查名稱, 不符合預期的描述列表)
+    """
+    results = []
+    for name in (list(names) or list(CHECKS)):
+        with tempfile.TemporaryDirectory(prefix='clearproj-check-') as project_path:
+            results.append((name, CHECKS[name](project_path)))
+    return results
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+合成遊戲專案產生器 - 以固定亂數種子產生可重現的測試專案
+
+產生的檔案內容符合各掃描器的解析方式 (長度前綴的 UTF-16 / UTF-8 字串、Lua 字串常值)，
+因此引用解析、同名檔案比對與跨目錄引用都會被實際執行:
+    .png       只有 PNG 檔頭與隨機內容
+    .efk       引用同目錄的 .efkmat / .efkmodel / .png (部分為跨目錄的相對路徑)
+    .efkmat    引用 .png
+    .efkmodel  少量字串與 .png 引用
+    .c3b       引用 .png 檔名
+    .lua       以檔名引用任意目錄的 .png
+"""
+
+import os
+import random
+import struct
+from typing import Dict, List, Optional
+
+
+_UINT32 = struct.Struct('<I')
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# 重複使用的檔名 (模擬不同目錄下的同名圖片)
+DUPLICATE_NAMES = ('icon.png', 'bg.png', 'glow_01.png', 'mask.png', 'noise.png', 'particle.png')
+
+# 預設規模: 各副檔名的檔案數
+PRESETS = {
+    'small': {'efk': 40, 'efkmat': 40, 'efkmodel': 20, 'c3b': 40, 'lua': 60, 'png': 800},
+    'medium': {'efk': 400, 'efkmat': 400, 'efkmodel': 200, 'c3b': 400, 'lua': 600, 'png': 8000},
+    'large': {'efk': 2000, 'efkmat': 2000, 'efkmodel': 1000, 'c3b': 2000, 'lua': 3000, 'png': 40000},
+}
+
+
+class ProjectSpec:
+    """合成專案的規格 (相同規格與種子一定產生相同的專案)"""
+
+    # 參與規格比對 (基準線是否適用) 的欄位
+    FIELDS = ('efk', 'efkmat', 'efkmodel', 'c3b', 'lua', 'png', 'depth',
+              'files_per_directory', 'duplicate_ratio', 'cross_directory_ratio', 'png_size', 'seed')
+
+    def __init__(self, efk: int = 40, efkmat: int = 40, efkmodel: int = 20, c3b: int = 40, lua: int = 60,
+                 png: int = 800, depth: int = 4, files_per_directory: int = 40, duplicate_ratio: float = 0.05,
+                 cross_directory_ratio: float = 0.1, png_size: int = 4096, seed: int = 0):
+        """
+        初始化專案規格
+
+        Args:
+            efk / efkmat / efkmodel / c3b / lua / png: 各副檔名的檔案數
+            depth: 目錄最大深度
+            files_per_directory: 平均每個目錄的檔案數
+            duplicate_ratio: 使用重複檔名的圖片比例
+            cross_directory_ratio: 指向其他目錄的引用比例 (特效與模型以相對路徑引用)
+            png_size: 圖片檔平均大小 (位元組)
+            seed: 亂數種子
+        """
+        self.efk = efk
+        self.efkmat = efkmat
+        self.efkmodel = efkmodel
+        self.c3b = c3b
+        self.lua = lua
+        self.png = png
+        self.depth = depth
+        self.files_per_directory = files_per_directory
+        self.duplicate_ratio = duplicate_ratio
+        self.cross_directory_ratio = cross_directory_ratio
+        self.png_size = png_size
+        self.seed = seed
+
+    @classmethod
+    def from_preset(cls, preset: str, **overrides) -> 'ProjectSpec':
+        """
+        依預設規模建立規格
+
+        Args:
+            preset: PRESETS 中的名稱
+            **overrides: 要覆寫的欄位 (值為 None 的欄位會被忽略)
+
+        Returns:
+            ProjectSpec: 專案規格
+        """
+        values = dict(PRESETS[preset])
+        values.update({key: value for key, value in overrides.items() if value is not None})
+        return cls(**values)
+
+    def as_dict(self) -> Dict[str, str]:
+        """以字串表示所有欄位 (寫入基準線檔案用)"""
+        return {field: str(getattr(self, field)) for field in self.FIELDS}
+
+    @property
+    def total_files(self) -> int:
+        """檔案總數"""
+        return self.efk + self.efkmat + self.efkmodel + self.c3b + self.lua + self.png
+
+
+class GeneratedProject:
+    """產生結果 - 各副檔名的檔案數與總大小"""
+
+    def __init__(self, root: str):
+        """
+        初始化產生結果
+
+        Args:
+            root: 專案根目錄
+        """
+        self.root = root
+        # 副檔名 -> 檔案數 / 位元組數
+        self.file_counts: Dict[str, int] = {}
+        self.byte_counts: Dict[str, int] = {}
+
+    def record(self, file_path: str, size: int):
+        """記錄一個已寫入的檔案"""
+        extension = os.path.splitext(file_path)[1].lower()
+        self.file_counts[extension] = self.file_counts.get(extension, 0) + 1
+        self.byte_counts[extension] = self.byte_counts.get(extension, 0) + size
+
+    @property
+    def total_files(self) -> int:
+        """檔案總數"""
+        return sum(self.file_counts.values())
+
+    @property
+    def total_bytes(self) -> int:
+        """總位元組數"""
+        return sum(self.byte_counts.values())
+
+
+def _utf16_string(text: str) -> bytes:
+    """EFK 格式的字串: 字元數 (uint32) + UTF-16LE"""
+    return _UINT32.pack(len(text)) + text.encode('utf-16le')
+
+
+def _utf8_string(text: str) -> bytes:
+    """C3B 格式的字串: 位元組數 (uint32, 含結尾 null) + UTF-8"""
+    encoded = text.encode('utf-8') + b'\x00'
+    return _UINT32.pack(len(encoded)) + encoded
+
+
+class _ProjectWriter:
+    """依規格寫出合成專案 (所有隨機選擇都來自同一個 Random，確保可重現)"""
+
+    def __init__(self, root: str, spec: ProjectSpec):
+        self.root = root
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+        self.result = GeneratedProject(root)
+        self.directories = self._make_directories()
+        # 目錄 -> 該目錄中各副檔名的檔案 (相對於專案根目錄，分隔符為 '/')
+        self.files: Dict[str, Dict[str, List[str]]] = {directory: {} for directory in self.directories}
+        self.all_png: List[str] = []
+
+    def _make_directories(self) -> List[str]:
+        """產生目錄樹 (深度 1..depth)"""
+        count = max(1, self.spec.total_files // max(1, self.spec.files_per_directory))
+        directories = []
+        for index in range(count):
+            depth = self.rng.randint(1, max(1, self.spec.depth))
+            parts = ['assets'] + [f'g{self.rng.randrange(8)}' for _ in range(depth - 1)] + [f'd{index:04d}']
+            directories.append('/'.join(parts))
+        return directories
+
+    def _write(self, relative_path: str, content: bytes):
+        """寫入一個檔案"""
+        file_path = os.path.join(self.root, *relative_path.split('/'))
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, 'wb') as f:
+            f.write(content)
+        self.result.record(file_path, len(content))
+        directory, _, _ = relative_path.rpartition('/')
+        extension = os.path.splitext(relative_path)[1].lower()
+        self.files[directory].setdefault(extension, []).append(relative_path)
+
+    def _pick_targets(self, directory: str, extension: str, count: int) -> List[str]:
+        """
+        選擇引用目標: 優先使用同目錄的檔案，部分改為其他目錄的檔案 (以相對路徑表示)
+
+        Returns:
+            List[str]: 相對於來源目錄的引用路徑
+        """
+        references = []
+        local = self.files[directory].get(extension, [])
+        for _ in range(count):
+            if local and self.rng.random() >= self.spec.cross_directory_ratio:
+                target = self.rng.choice(local)
+            else:
+                other = self.rng.choice(self.directories)
+                candidates = self.files[other].get(extension)
+                if not candidates:
+                    continue
+                target = self.rng.choice(candidates)
+            references.append(os.path.relpath(target, directory).replace(os.sep, '/'))
+        return references
+
+    def _png_content(self) -> bytes:
+        """PNG 檔頭 + 隨機內容"""
+        size = max(16, int(self.rng.gauss(self.spec.png_size, self.spec.png_size / 4)))
+        return _PNG_SIGNATURE + self.rng.randbytes(size - len(_PNG_SIGNATURE))
+
+    def _binary_padding(self) -> bytes:
+        """字串之間的隨機二進位資料 (模擬浮點數與索引資料)"""
+        return self.rng.randbytes(self.rng.randint(32, 512))
+
+    def write_all(self) -> GeneratedProject:
+        """依序寫出所有檔案 (先寫被引用的檔案，來源檔案才找得到引用目標)"""
+        spec = self.spec
+        for index in range(spec.png):
+            directory = self.rng.choice(self.directories)
+            if self.rng.random() < spec.duplicate_ratio:
+                name = self.rng.choice(DUPLICATE_NAMES)
+                if name in (os.path.basename(path) for path in self.files[directory].get('.png', ())):
+                    name = f'tex_{index:06d}.png'
+            else:
+                name = f'tex_{index:06d}.png'
+            relative_path = f'{directory}/{name}'
+            self._write(relative_path, self._png_content())
+            self.all_png.append(relative_path)
+
+        for index in range(spec.efkmodel):
+            directory = self.rng.choice(self.directories)
+            parts = [b'EFKM', _UINT32.pack(1), _utf16_string(f'Mesh_{index}')]
+            for reference in self._pick_targets(directory, '.png', 1):
+                parts += [self._binary_padding(), _utf16_string(reference)]
+            parts.append(self._binary_padding())
+            self._write(f'{directory}/model_{index:05d}.efkmodel', b''.join(parts))
+
+        for index in range(spec.efkmat):
+            directory = self.rng.choice(self.directories)
+            parts = [b'EFKM', _UINT32.pack(3)]
+            for reference in self._pick_targets(directory, '.png', self.rng.randint(1, 3)):
+                parts += [self._binary_padding(), _utf16_string(reference)]
+            parts.append(self._binary_padding())
+            self._write(f'{directory}/mat_{index:05d}.efkmat', b''.join(parts))
+
+        for index in range(spec.efk):
+            directory = self.rng.choice(self.directories)
+            references = (self._pick_targets(directory, '.efkmat', self.rng.randint(0, 2))
+                          + self._pick_targets(directory, '.efkmodel', self.rng.randint(0, 1))
+                          + self._pick_targets(directory, '.png', self.rng.randint(1, 3)))
+            parts = [b'SKFE', _UINT32.pack(1610)]
+            for reference in references:
+                parts += [self._binary_padding(), _utf16_string(reference)]
+            parts.append(self._binary_padding())
+            self._write(f'{directory}/effect_{index:05d}.efk', b''.join(parts))
+
+        for index in range(spec.c3b):
+            directory = self.rng.choice(self.directories)
+            parts = [b'C3B\x00', _UINT32.pack(3), _utf8_string(f'material_{index}')]
+            for reference in self._pick_targets(directory, '.png', self.rng.randint(1, 2)):
+                parts += [self._binary_padding(), _utf8_string(os.path.basename(reference))]
+            parts.append(self._binary_padding())
+            self._write(f'{directory}/model_{index:05d}.c3b', b''.join(parts))
+
+        for index in range(spec.lua):
+            directory = self.rng.choice(self.directories)
+            lines = [f'local Scene{index} = class("Scene{index}")', '']
+            for line_index in range(self.rng.randint(20, 80)):
+                if self.all_png and self.rng.random() < 0.15:
+                    name = os.path.basename(self.rng.choice(self.all_png))
+                    lines.append(f'    local sprite{line_index} = display.newSprite("{name}")')
+                else:
+                    lines.append(f'    self.value{line_index} = self.value{line_index} + {line_index} -- update')
+            lines += ['', f'return Scene{index}', '']
+            self._write(f'{directory}/scene_{index:05d}.lua', '\n'.join(lines).encode('utf-8'))
+
+        return self.result
+
+
+def generate_project(root: str, spec: Optional[ProjectSpec] = None) -> GeneratedProject:
+    """
+    在指定目錄產生合成專案
+
+    Args:
+        root: 輸出目錄 (必須不存在或為空目錄)
+        spec: 專案規格 (預設為 small 規模)
+
+    Returns:
+        GeneratedProject: 產生結果
+
+    Raises:
+        ValueError: 輸出目錄不是空目錄時 (避免覆寫真實專案)
+    """
+    if os.path.isdir(root) and os.listdir(root):
+        raise ValueError(f"輸出目錄不是空目錄: {root}")
+    os.makedirs(root, exist_ok=True)
+    return _ProjectWriter(root, spec or ProjectSpec.from_preset('small')).write_all()
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+基準測試執行器 - 量測掃描各階段的耗時與吞吐量，並與基準線比較
+
+量測的階段:
+    walk            走訪目錄並建立索引 (ScanResult.timings['index'])
+    parse           所有掃描器解析來源檔案的總耗時
+    parse.<掃描器>  各掃描器單獨解析其負責的檔案 (另外一輪量測)
+    resolve         解析引用字串並加入引用關係圖
+    diff            計算未引用檔案
+    gui             將未引用檔案加入介面列表 (需要顯示器，加上 --gui 才會量測)
+    total           完整掃描的總耗時
+
+每個階段重複量測數次並取最快的一次；吞吐量以 檔案(或項目)/秒 與 MB/秒 表示。
+基準線以 INI 格式保存 (每個階段一個 section)，目前耗時超過基準線 (1 + threshold) 倍即視為退步。
+"""
+
+import configparser
+import contextlib
+import os
+import platform
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from benchmarks.project_generator import ProjectSpec
+from src.scanner.scan_engine import ScanEngine
+
+
+_MB = 1024 * 1024
+
+# 耗時低於此值的階段不做退步判定 (計時誤差會大於實際差異)
+MIN_COMPARABLE_SECONDS = 0.005
+
+
+class PhaseMeasurement:
+    """單一階段的量測結果"""
+
+    def __init__(self, name: str, seconds: float, items: int = 0, size: int = 0):
+        """
+        初始化量測結果
+
+        Args:
+            name: 階段名稱
+            seconds: 耗時 (秒)
+            items: 處理的檔案或項目數
+            size: 處理的位元組數 (不讀取檔案內容的階段為 0)
+        """
+        self.name = name
+        self.seconds = seconds
+        self.items = items
+        self.size = size
+
+    @property
+    def items_per_second(self) -> float:
+        """每秒處理的檔案或項目數"""
+        return self.items / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        """每秒處理的 MB 數"""
+        return self.size / _MB / self.seconds if self.seconds > 0 else 0.0
+
+    def keep_faster(self, other: 'PhaseMeasurement'):
+        """重複量測時保留較快的一次"""
+        if other.seconds < self.seconds:
+            self.seconds = other.seconds
+            self.items = other.items
+            self.size = other.size
+
+
+class Regression:
+    """與基準線比較後發現的退步"""
+
+    def __init__(self, phase: str, baseline_seconds: float, current_seconds: float):
+        self.phase = phase
+        self.baseline_seconds = baseline_seconds
+        self.current_seconds = current_seconds
+
+    @property
+    def ratio(self) -> float:
+        """目前耗時 / 基準線耗時"""
+        return self.current_seconds / self.baseline_seconds
+
+
+def _file_sizes(file_paths: List[str]) -> int:
+    """檔案大小總和"""
+    total = 0
+    for file_path in file_paths:
+        try:
+            total += os.path.getsize(file_path)
+        except OSError:
+            pass
+    return total
+
+
+def _measure_scan(project_path: str, profile: str) -> Tuple[List[PhaseMeasurement], object]:
+    """
+    完整掃描一次，並依各掃描器負責的檔案再單獨量測一輪解析
+
+    Returns:
+        Tuple[List[PhaseMeasurement], ScanResult]: 各階段的量測結果與掃描結果
+    """
+    engine = ScanEngine.from_profile(profile, project_path)
+    started = time.perf_counter()
+    result = engine.run()
+    total_seconds = time.perf_counter() - started
+
+    index = engine.file_index
+    parsed_files: List[str] = []
+    per_scanner: List[PhaseMeasurement] = []
+    for name, scanner in engine.scanners.items():
+        files = index.files_with_extensions(scanner.FILE_EXTENSIONS)
+        if not files:
+            continue
+        parsed_files.extend(files)
+        scanner_started = time.perf_counter()
+        for file_path in files:
+            try:
+                scanner.parse_file(Path(file_path))
+            except Exception:
+                pass
+        per_scanner.append(PhaseMeasurement(f'parse.{name}', time.perf_counter() - scanner_started,
+                                            len(files), _file_sizes(files)))
+
+    statistics = result.get_statistics()
+    timings = result.timings
+    return [
+        PhaseMeasurement('walk', timings.get('index', 0.0), result.total_indexed_files),
+        PhaseMeasurement('parse', timings.get('parse', 0.0), len(parsed_files), _file_sizes(parsed_files)),
+        *per_scanner,
+        PhaseMeasurement('resolve', timings.get('resolve', 0.0),
+                         statistics['total_references'] + statistics['total_unresolved_references']),
+        PhaseMeasurement('diff', timings.get('diff', 0.0), statistics['total_target_files']),
+        PhaseMeasurement('total', total_seconds, result.total_indexed_files,
+                         _file_sizes(index.all_files())),
+    ], result
+
+
+def _measure_gui(result) -> Optional[PhaseMeasurement]:
+    """
+    量測把未引用檔案加入介面列表的耗時
+
+    Returns:
+        Optional[PhaseMeasurement]: 沒有顯示器 (無法建立 Tk 視窗) 時為 None
+    """
+    import tkinter as tk
+    try:
+        from src.gui.main_window import MainWindow
+        window = MainWindow()
+    except tk.TclError:
+        return None
+    try:
+        window.root.withdraw()
+        # 檔案大小與介面相同，在背景執行緒 (這裡為計時之前) 讀取
+        result.collect_unused_file_sizes()
+        started = time.perf_counter()
+        window._display_unused_files(result)
+        # 其餘批次在閒置時加入，update_idletasks 會執行到全部加入為止
+        window.root.update_idletasks()
+        seconds = time.perf_counter() - started
+    finally:
+        window.root.destroy()
+    return PhaseMeasurement('gui', seconds, len(result.unused_files))
+
+
+def run_benchmark(project_path: str, profile: str = 'all_scan', repeat: int = 3,
+                  measure_gui: bool = False) -> List[PhaseMeasurement]:
+    """
+    量測各階段耗時 (每個階段取最快的一次)
+
+    Args:
+        project_path: 專案路徑
+        profile: 掃描設定檔名稱
+        repeat: 重複次數
+        measure_gui: 是否量測介面列表的填入 (只量測一次，需要顯示器)
+
+    Returns:
+        List[PhaseMeasurement]: 各階段的量測結果
+    """
+    best: Dict[str, PhaseMeasurement] = {}
+    order: List[str] = []
+    result = None
+    for _ in range(max(1, repeat)):
+        # 部分掃描器會把解析過程輸出到 stdout，量測時導向 devnull (不影響報表輸出)
+        with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+            measurements, result = _measure_scan(project_path, profile)
+        for measurement in measurements:
+            if measurement.name in best:
+                best[measurement.name].keep_faster(measurement)
+            else:
+                best[measurement.name] = measurement
+                order.append(measurement.name)
+
+    if measure_gui:
+        gui = _measure_gui(result)
+        if gui is not None:
+            best[gui.name] = gui
+            order.insert(order.index('total'), gui.name)
+    return [best[name] for name in order]
+
+
+def format_report(measurements: List[PhaseMeasurement]) -> str:
+    """
+    格式化量測結果表格
+
+    Args:
+        measurements: 各階段的量測結果
+
+    Returns:
+        str: 表格文字
+    """
+    lines = [f"{'階段':<16}{'耗時(ms)':>12}{'項目':>10}{'項目/秒':>14}{'MB/秒':>10}"]
+    for measurement in measurements:
+        megabytes = f"{measurement.megabytes_per_second:10.2f}" if measurement.size else f"{'-':>10}"
+        lines.append(f"{measurement.name:<16}{measurement.seconds * 1000:12.2f}{measurement.items:10d}"
+                     f"{measurement.items_per_second:14.0f}{megabytes}")
+    return '\n'.join(lines)
+
+
+def save_baseline(path: str, measurements: List[PhaseMeasurement], spec: Optional[ProjectSpec], profile: str):
+    """
+    把量測結果保存為基準線 (INI 格式)
+
+    Args:
+        path: 基準線檔案路徑
+        measurements: 各階段的量測結果
+        spec: 合成專案規格 (量測既有專案時為 None)
+        profile: 掃描設定檔名稱
+    """
+    config = configparser.ConfigParser()
+    config['benchmark'] = {
+        'profile': profile,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'created_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+    }
+    if spec is not None:
+        config['spec'] = spec.as_dict()
+    for measurement in measurements:
+        config[f'phase:{measurement.name}'] = {
+            'seconds': f'{measurement.seconds:.6f}',
+            'items': str(measurement.items),
+            'bytes': str(measurement.size),
+        }
+    with open(path, 'w', encoding='utf-8') as f:
+        config.write(f)
+
+
+def load_baseline(path: str) -> configparser.ConfigParser:
+    """
+    讀取基準線檔案
+
+    Raises:
+        FileNotFoundError: 檔案不存在時
+    """
+    config = configparser.ConfigParser()
+    if not config.read(path, encoding='utf-8'):
+        raise FileNotFoundError(path)
+    return config
+
+
+def baseline_mismatch(baseline: configparser.ConfigParser, spec: Optional[ProjectSpec], profile: str) -> List[str]:
+    """
+    檢查基準線是否以相同的設定量測 (設定不同時比較沒有意義)
+
+    Returns:
+        List[str]: 不一致的項目說明 (空列表代表可以比較)
+    """
+    differences = []
+    if baseline.get('benchmark', 'profile', fallback=profile) != profile:
+        differences.append(f"profile: 基準線 {baseline.get('benchmark', 'profile')} / 目前 {profile}")
+    if spec is not None and baseline.has_section('spec'):
+        for field, value in spec.as_dict().items():
+            recorded = baseline.get('spec', field, fallback=None)
+            if recorded != value:
+                differences.append(f"{field}: 基準線 {recorded} / 目前 {value}")
+    return differences
+
+
+def compare_with_baseline(measurements: List[PhaseMeasurement], baseline: configparser.ConfigParser,
+                          threshold: float) -> List[Regression]:
+    """
+    與基準線比較，找出耗時超過基準線 (1 + threshold) 倍的階段
+
+    Args:
+        measurements: 各階段的量測結果
+        baseline: 基準線
+        threshold: 容許的變慢比例 (0.2 代表 20%)
+
+    Returns:
+        List[Regression]: 退步的階段
+    """
+    regressions = []
+    for measurement in measurements:
+        section = f'phase:{measurement.name}'
+        if not baseline.has_section(section):
+            continue
+        baseline_seconds = baseline.getfloat(section, 'seconds')
+        if max(baseline_seconds, measurement.seconds) < MIN_COMPARABLE_SECONDS:
+            continue
+        if measurement.seconds > baseline_seconds * (1 + threshold):
+            regressions.append(Regression(measurement.name, baseline_seconds, measurement.seconds))
+    return regressions
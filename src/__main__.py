@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+命令列入口 - python -m src
+"""
+
+import sys
+
+from src.cli import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,512 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+命令列介面 - 不需要顯示器即可執行掃描 (供建置伺服器與排程工作使用)
+
+使用方式:
+    python -m src scan <專案路徑> [--profile all] [--code <程式碼路徑>] [--output <檔案>]
+    python -m src scan <專案路徑> --root 'lua/main.lua' --root 'scenes/*.csb'   (可達性分析)
+    python -m src scan <專案路徑> --shards 8                                   (本機多行程分片掃描)
+
+多台機器分工 (各機器的專案路徑必須相同):
+    python -m src shard-plan <專案路徑> --shards 4
+    python -m src shard-scan <專案路徑> --shards 4 --index 1 --output part1.shard   (每台機器各跑一個分片)
+    (可達性分析時 shard-scan 與 merge 都要加上相同的 --root / --root-manifest)
+    python -m src merge <專案路徑> part1.shard part2.shard part3.shard part4.shard
+
+快照與差異 (只看這次才變成未使用的檔案):
+    python -m src scan <專案路徑> --snapshot today.snap --snapshot-base yesterday.snap [--delta-only]
+    python -m src diff yesterday.snap today.snap
+
+結果資料庫 (大型專案，結果寫入 SQLite 供之後查詢):
+    python -m src scan <專案路徑> --store results.sqlite
+
+效能統計 (各階段耗時、各格式解析耗時分布、讀取位元組數、解析器快取命中):
+    python -m src scan <專案路徑> --metrics metrics.tsv
+
+追蹤 (各階段與每個檔案的解析 / 引用解析區間，systrace 格式，可在 Perfetto 或 about://tracing 開啟):
+    python -m src scan <專案路徑> --trace scan.trace [--shards 4]
+
+進度 (每秒最多一行，輸出到 stderr；分片掃描時彙總所有工作行程並以位元組估算剩餘時間):
+    python -m src scan <專案路徑> --progress [--shards 4]
+
+輸出格式 (每行一筆，欄位以 Tab 分隔，邊掃描邊輸出):
+    REF     <來源檔案>  <引用字串>      (需加上 --show-references)
+    UNUSED  <檔案路徑>
+    NEW_UNUSED / NEW_REFERENCED / DELETED  <檔案路徑>   (--delta-only 或 diff)
+    SHARD   <分片編號>  <檔案數>  <目錄>  (shard-plan；只包含第一層檔案的目錄標示為 <目錄>/*)
+    COUNTER / TIMER / HIST  <名稱>  <數值...>  (--metrics 指定的檔案，見 src.utils.instrumentation)
+摘要與各階段耗時輸出到 stderr，開頭為 "# "。
+
+結束代碼:
+    0  掃描完成
+    1  掃描完成且找到未引用檔案 (需加上 --fail-on-unused)
+    2  參數錯誤或路徑不存在
+    3  掃描過程中發生錯誤
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from typing import Callable, List, Optional, TextIO
+
+# 注意: 本模組不可匯入 tkinter 或 src.gui
+from src.scanner.reachability import load_root_manifest
+from src.scanner.result_store import ResultStore
+from src.scanner.scan_engine import ScanEngine, SCAN_PROFILES
+from src.scanner.shard import census, merge_partials, plan_shards, run_shards, scan_shard, shard_roots
+from src.scanner.snapshot import Snapshot, diff_snapshots, record_snapshot
+from src.utils.instrumentation import Instrumentation
+from src.utils.progress import ProgressReporter, ProgressUpdate
+from src.utils.tracer import Tracer
+
+
+EXIT_OK = 0
+EXIT_UNUSED_FOUND = 1
+EXIT_USAGE = 2
+EXIT_ERROR = 3
+
+# 命令列的設定檔名稱 -> SCAN_PROFILES 鍵值
+PROFILE_CHOICES = {name[:-len('_scan')]: name for name in SCAN_PROFILES}
+
+# --progress 每秒最多輸出的行數
+PROGRESS_LINES_PER_SECOND = 1.0
+
+
+def _add_project_arguments(parser: argparse.ArgumentParser):
+    """加入專案路徑、掃描設定檔與程式碼路徑參數"""
+    parser.add_argument('project_path', help='專案根目錄路徑')
+    parser.add_argument('--profile', choices=sorted(PROFILE_CHOICES), default='all',
+                        help='掃描設定檔 (預設: all)')
+    parser.add_argument('--code', action='append', default=[], metavar='PATH',
+                        help='程式碼專案路徑 (可重複指定)')
+
+
+def _add_root_arguments(parser: argparse.ArgumentParser):
+    """加入可達性分析的根檔案參數 (scan、shard-scan 與 merge 共用)"""
+    parser.add_argument('--root', action='append', default=[], metavar='PATTERN',
+                        help='可達性分析的根檔案樣式 (相對於專案或程式碼路徑，可重複指定)；'
+                             '指定後無法從根檔案到達的檔案都視為未使用')
+    parser.add_argument('--root-manifest', metavar='FILE',
+                        help='根檔案清單檔 (每行一個樣式，# 開頭為註解)')
+
+
+def _add_result_arguments(parser: argparse.ArgumentParser):
+    """加入結果輸出相關參數 (scan 與 merge 共用)"""
+    _add_root_arguments(parser)
+    parser.add_argument('--output', '-o', metavar='FILE',
+                        help='結果輸出檔案 (預設輸出到 stdout)')
+    parser.add_argument('--show-references', action='store_true',
+                        help='同時輸出每個來源檔案的引用')
+    parser.add_argument('--snapshot', metavar='FILE',
+                        help='把這次分析的快照寫入檔案 (檔案已存在時先與它比較)')
+    parser.add_argument('--snapshot-base', metavar='FILE',
+                        help='要比較的上一次快照 (預設為 --snapshot 指定的既有檔案)')
+    parser.add_argument('--delta-only', action='store_true',
+                        help='只輸出與上一次快照的差異 (需搭配 --snapshot)')
+    parser.add_argument('--store', metavar='FILE',
+                        help='把檔案、引用與未使用狀態寫入 SQLite 結果資料庫 (會覆寫資料庫中的上一次結果)')
+    parser.add_argument('--metrics', metavar='FILE',
+                        help='收集效能統計並以 Tab 分隔格式寫入檔案 (摘要中也會列出)')
+    parser.add_argument('--trace', metavar='FILE',
+                        help='記錄各階段與每個檔案的處理區間，寫成 systrace 格式的追蹤檔')
+    parser.add_argument('--progress', action='store_true',
+                        help='把掃描進度與預估剩餘時間輸出到 stderr (每秒最多一行)')
+    parser.add_argument('--fail-on-unused', action='store_true',
+                        help='找到未引用檔案時以結束代碼 1 結束')
+    parser.add_argument('--quiet', '-q', action='store_true',
+                        help='不輸出摘要與耗時')
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    建立命令列參數解析器
+
+    Returns:
+        argparse.ArgumentParser: 參數解析器
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m src',
+        description='遊戲圖片檢索工具 - 命令列版本'
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    scan_parser = subparsers.add_parser('scan', help='掃描專案並列出未引用的檔案')
+    _add_project_arguments(scan_parser)
+    _add_result_arguments(scan_parser)
+    scan_parser.add_argument('--shards', type=int, default=0, metavar='N',
+                             help='以 N 個分片在多個行程中平行解析 (預設: 不分片)')
+    scan_parser.add_argument('--workers', type=int, default=None, metavar='N',
+                             help='分片掃描最多同時執行的行程數 (預設: CPU 數量)')
+
+    plan_parser = subparsers.add_parser('shard-plan', help='列出分片計畫 (每個分片負責的目錄)')
+    _add_project_arguments(plan_parser)
+    plan_parser.add_argument('--shards', type=int, required=True, metavar='N', help='分片數量')
+
+    shard_parser = subparsers.add_parser('shard-scan', help='只執行一個分片的解析並寫出部分結果檔')
+    _add_project_arguments(shard_parser)
+    shard_parser.add_argument('--shards', type=int, required=True, metavar='N', help='分片數量')
+    shard_parser.add_argument('--index', type=int, required=True, metavar='I',
+                              help='要執行的分片編號 (從 1 開始)')
+    shard_parser.add_argument('--output', '-o', required=True, metavar='FILE', help='部分結果檔路徑')
+    _add_root_arguments(shard_parser)
+
+    merge_parser = subparsers.add_parser('merge', help='合併分片部分結果並列出未引用的檔案')
+    _add_project_arguments(merge_parser)
+    merge_parser.add_argument('partials', nargs='+', metavar='PARTIAL', help='部分結果檔')
+    _add_result_arguments(merge_parser)
+
+    diff_parser = subparsers.add_parser('diff', help='比較兩次分析快照')
+    diff_parser.add_argument('old_snapshot', help='較舊的快照檔')
+    diff_parser.add_argument('new_snapshot', help='較新的快照檔')
+    diff_parser.add_argument('--output', '-o', metavar='FILE',
+                             help='結果輸出檔案 (預設輸出到 stdout)')
+    diff_parser.add_argument('--fail-on-unused', action='store_true',
+                             help='有新增的未使用檔案時以結束代碼 1 結束')
+
+    return parser
+
+
+def _write_record(stream: TextIO, *fields: str):
+    """輸出一筆以 Tab 分隔的結果並立即 flush，讓下游可以串流讀取"""
+    stream.write('\t'.join(fields) + '\n')
+    stream.flush()
+
+
+def _print_message(text: str):
+    """輸出訊息到 stderr"""
+    print(f"# {text}", file=sys.stderr)
+
+
+def _write_delta(stream: TextIO, delta):
+    """輸出快照差異"""
+    for file_path in delta.newly_unused:
+        _write_record(stream, 'NEW_UNUSED', file_path)
+    for file_path in delta.newly_referenced:
+        _write_record(stream, 'NEW_REFERENCED', file_path)
+    for file_path in delta.deleted:
+        _write_record(stream, 'DELETED', file_path)
+
+
+def _print_delta_summary(delta):
+    """輸出快照差異摘要到 stderr"""
+    print(
+        f"# 與上次快照比較: 新增未使用 {len(delta.newly_unused)}, "
+        f"新被引用 {len(delta.newly_referenced)}, 已刪除 {len(delta.deleted)}",
+        file=sys.stderr
+    )
+
+
+def _print_progress(update: ProgressUpdate):
+    """輸出一行進度到 stderr"""
+    print(f"# [進度] {update.describe()}", file=sys.stderr)
+
+
+def _print_summary(result, quiet: bool):
+    """輸出摘要與各階段耗時到 stderr"""
+    if quiet:
+        return
+
+    for name, stats in result.scanner_statistics.items():
+        print(
+            f"# [{name}] 檔案數: {stats['total_files']}, 已分析: {stats['analyzed_files']}, "
+            f"失敗: {stats['failed_scans']}, 引用數: {stats['total_referenced_files']}",
+            file=sys.stderr
+        )
+
+    stats = result.get_statistics()
+    print(
+        f"# 索引檔案: {stats['total_indexed_files']}, 引用: {stats['total_references']}, "
+        f"無法解析: {stats['total_unresolved_references']}, 目標檔案: {stats['total_target_files']}, "
+        f"未引用: {stats['total_unused_files']}",
+        file=sys.stderr
+    )
+    if stats['total_root_files']:
+        print(f"# 可達性分析根檔案: {stats['total_root_files']}", file=sys.stderr)
+    if result.snapshot_delta is not None:
+        _print_delta_summary(result.snapshot_delta)
+    timings = ', '.join(f"{phase}={seconds:.3f}s" for phase, seconds in result.timings.items())
+    print(f"# 耗時: {timings} (總計 {sum(result.timings.values()):.3f}s)", file=sys.stderr)
+    if result.metrics is not None:
+        for line in result.metrics.format_lines():
+            print(f"# [效能統計] {line}", file=sys.stderr)
+
+
+def _validate_paths(args: argparse.Namespace) -> bool:
+    """檢查專案路徑與程式碼路徑是否存在"""
+    if not os.path.isdir(args.project_path):
+        print(f"錯誤: 專案路徑不存在: {args.project_path}", file=sys.stderr)
+        return False
+    for code_path in args.code:
+        if not os.path.isdir(code_path):
+            print(f"錯誤: 程式碼專案路徑不存在: {code_path}", file=sys.stderr)
+            return False
+    return True
+
+
+def _load_root_patterns(args: argparse.Namespace) -> Optional[List[str]]:
+    """取得 --root 與 --root-manifest 指定的根檔案樣式 (清單檔無法讀取時返回None)"""
+    root_patterns = list(args.root)
+    if args.root_manifest:
+        try:
+            root_patterns.extend(load_root_manifest(args.root_manifest))
+        except OSError as e:
+            print(f"錯誤: 無法讀取根檔案清單: {str(e)}", file=sys.stderr)
+            return None
+    return root_patterns
+
+
+def _validate_shard_count(shard_count: int, minimum: int) -> bool:
+    """檢查分片數量"""
+    if shard_count < minimum:
+        print(f"錯誤: 分片數量必須大於或等於 {minimum}", file=sys.stderr)
+        return False
+    return True
+
+
+def _run_and_report(args: argparse.Namespace, produce: Callable) -> int:
+    """
+    執行掃描並輸出結果 (scan 與 merge 共用)
+
+    Args:
+        args: 解析後的命令列參數
+        produce: 執行掃描的函數，接收 (根檔案樣式, source_callback, 結果資料庫, 效能統計, 追蹤記錄器,
+            進度回報器)，返回 ScanResult
+
+    Returns:
+        int: 結束代碼
+    """
+    root_patterns = _load_root_patterns(args)
+    if root_patterns is None:
+        return EXIT_USAGE
+    if args.delta_only and not args.snapshot:
+        print("錯誤: --delta-only 需要搭配 --snapshot", file=sys.stderr)
+        return EXIT_USAGE
+
+    output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    store = None
+    try:
+        if args.store:
+            store = ResultStore(args.store)
+        source_callback = None
+        if args.show_references:
+            def source_callback(scanner_name, source_file, references):
+                for reference in references:
+                    _write_record(output, 'REF', source_file, reference)
+
+        instrumentation = Instrumentation() if args.metrics else None
+        tracer = Tracer() if args.trace else None
+        progress = ProgressReporter(_print_progress, PROGRESS_LINES_PER_SECOND) if args.progress else None
+        result = produce(root_patterns, source_callback, store, instrumentation, tracer, progress)
+        if args.snapshot and not result.cancelled:
+            result.snapshot_delta = record_snapshot(result, args.snapshot, args.snapshot_base)
+
+        if args.delta_only and result.snapshot_delta is not None:
+            _write_delta(output, result.snapshot_delta)
+        else:
+            if args.delta_only:
+                print("# 沒有上一次的快照，輸出完整的未引用列表", file=sys.stderr)
+            # 使用結果資料庫時從資料庫分批讀取 (必須在關閉資料庫之前)
+            for file_path in result.iter_unused():
+                _write_record(output, 'UNUSED', file_path)
+
+        if instrumentation is not None:
+            with open(args.metrics, 'w', encoding='utf-8') as metrics_file:
+                instrumentation.write_tsv(metrics_file)
+        if tracer is not None:
+            tracer.save(args.trace)
+    except Exception as e:
+        print(f"錯誤: 掃描過程中發生錯誤: {str(e)}", file=sys.stderr)
+        return EXIT_ERROR
+    finally:
+        if store is not None:
+            store.close()
+        if output is not sys.stdout:
+            output.close()
+
+    _print_summary(result, args.quiet)
+
+    unused_found = result.unused_count()
+    if args.delta_only and result.snapshot_delta is not None:
+        unused_found = len(result.snapshot_delta.newly_unused)
+    if args.fail_on_unused and unused_found:
+        return EXIT_UNUSED_FOUND
+    return EXIT_OK
+
+
+def run_scan(args: argparse.Namespace) -> int:
+    """
+    執行 scan 子命令
+
+    Args:
+        args: 解析後的命令列參數
+
+    Returns:
+        int: 結束代碼
+    """
+    if not _validate_paths(args) or not _validate_shard_count(args.shards, 0):
+        return EXIT_USAGE
+    profile_name = PROFILE_CHOICES[args.profile]
+
+    def produce(root_patterns, source_callback, store, instrumentation, tracer, progress):
+        if args.shards:
+            message_callback = None if args.quiet else _print_message
+            with tempfile.TemporaryDirectory(prefix='clearproj-shards-') as output_dir:
+                partial_paths = run_shards(args.project_path, profile_name, args.shards, output_dir,
+                                           args.code, args.workers, message_callback, trace=tracer is not None,
+                                           progress=progress, root_patterns=root_patterns)
+                return merge_partials(partial_paths, args.project_path, profile_name, args.code,
+                                      root_patterns, source_callback=source_callback, store=store,
+                                      instrumentation=instrumentation, tracer=tracer, progress=progress)
+
+        engine = ScanEngine.from_profile(
+            profile_name,
+            args.project_path,
+            code_paths=args.code,
+            source_callback=source_callback,
+            root_patterns=root_patterns,
+            store=store,
+            instrumentation=instrumentation,
+            tracer=tracer,
+            progress=progress
+        )
+        return engine.run()
+
+    return _run_and_report(args, produce)
+
+
+def run_shard_plan(args: argparse.Namespace) -> int:
+    """
+    執行 shard-plan 子命令
+
+    Args:
+        args: 解析後的命令列參數
+
+    Returns:
+        int: 結束代碼
+    """
+    if not _validate_paths(args) or not _validate_shard_count(args.shards, 1):
+        return EXIT_USAGE
+
+    shards = plan_shards(census(shard_roots(args.project_path, args.code), args.shards), args.shards)
+    for shard_index, units in enumerate(shards, 1):
+        for unit in units:
+            path = unit.path if unit.recursive else os.path.join(unit.path, '*')
+            _write_record(sys.stdout, 'SHARD', str(shard_index), str(unit.file_count), path)
+    return EXIT_OK
+
+
+def run_shard_scan(args: argparse.Namespace) -> int:
+    """
+    執行 shard-scan 子命令
+
+    Args:
+        args: 解析後的命令列參數
+
+    Returns:
+        int: 結束代碼
+    """
+    if not _validate_paths(args) or not _validate_shard_count(args.shards, 1):
+        return EXIT_USAGE
+    root_patterns = _load_root_patterns(args)
+    if root_patterns is None:
+        return EXIT_USAGE
+
+    try:
+        shards = plan_shards(census(shard_roots(args.project_path, args.code), args.shards), args.shards)
+        if not 1 <= args.index <= len(shards):
+            print(f"錯誤: 分片編號必須介於 1 到 {len(shards)} 之間", file=sys.stderr)
+            return EXIT_USAGE
+
+        partial = scan_shard(args.project_path, PROFILE_CHOICES[args.profile], shards[args.index - 1],
+                             args.code, args.index - 1, len(shards), root_patterns=root_patterns)
+        partial.write(args.output)
+    except Exception as e:
+        print(f"錯誤: 分片掃描過程中發生錯誤: {str(e)}", file=sys.stderr)
+        return EXIT_ERROR
+
+    print(f"# 分片 {args.index}/{len(shards)}: {len(partial.files)} 個檔案, "
+          f"{len(partial.sources)} 個來源檔案 -> {args.output}", file=sys.stderr)
+    return EXIT_OK
+
+
+def run_merge(args: argparse.Namespace) -> int:
+    """
+    執行 merge 子命令
+
+    Args:
+        args: 解析後的命令列參數
+
+    Returns:
+        int: 結束代碼
+    """
+    if not _validate_paths(args):
+        return EXIT_USAGE
+
+    def produce(root_patterns, source_callback, store, instrumentation, tracer, progress):
+        return merge_partials(args.partials, args.project_path, PROFILE_CHOICES[args.profile], args.code,
+                              root_patterns, source_callback=source_callback, store=store,
+                              instrumentation=instrumentation, tracer=tracer, progress=progress)
+
+    return _run_and_report(args, produce)
+
+
+def run_diff(args: argparse.Namespace) -> int:
+    """
+    執行 diff 子命令
+
+    Args:
+        args: 解析後的命令列參數
+
+    Returns:
+        int: 結束代碼
+    """
+    for snapshot_path in (args.old_snapshot, args.new_snapshot):
+        if not os.path.isfile(snapshot_path):
+            print(f"錯誤: 快照檔不存在: {snapshot_path}", file=sys.stderr)
+            return EXIT_USAGE
+
+    output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        delta = diff_snapshots(Snapshot.read(args.old_snapshot), Snapshot.read(args.new_snapshot))
+        _write_delta(output, delta)
+    except Exception as e:
+        print(f"錯誤: 比較快照時發生錯誤: {str(e)}", file=sys.stderr)
+        return EXIT_ERROR
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    _print_delta_summary(delta)
+    if args.fail_on_unused and delta.newly_unused:
+        return EXIT_UNUSED_FOUND
+    return EXIT_OK
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    命令列入口點
+
+    Args:
+        argv: 命令列參數 (預設為 sys.argv[1:])
+
+    Returns:
+        int: 結束代碼
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    commands = {
+        'scan': run_scan,
+        'shard-plan': run_shard_plan,
+        'shard-scan': run_shard_scan,
+        'merge': run_merge,
+        'diff': run_diff,
+    }
+    command = commands.get(args.command)
+    if command is not None:
+        return command(args)
+
+    parser.print_help()
+    return EXIT_USAGE
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+背景分析工作者 - 在背景執行緒執行掃描，UI 更新一律透過佇列交回 Tk 主執行緒
+
+背景執行緒不可直接操作任何 Tk 元件；進度、輸出文字與結果都先放進 queue.Queue，
+再由主執行緒以 root.after 定期取出處理。
+"""
+
+import queue
+import threading
+import traceback
+from typing import Any, Callable, Optional, Tuple
+
+
+# 佇列訊息種類
+MSG_OUTPUT = 'output'       # 輸出文字 (payload: str)
+MSG_PROGRESS = 'progress'   # 進度 (payload: (value, message))
+MSG_RESULT = 'result'       # 分析結果 (payload: 任意物件)
+MSG_ERROR = 'error'         # 發生例外 (payload: 錯誤訊息)
+MSG_DONE = 'done'           # 工作結束 (payload: None)
+
+
+class AnalysisWorker:
+    """背景分析工作者 - 以背景執行緒執行分析工作並透過佇列回報"""
+
+    def __init__(self, task: Callable[['AnalysisWorker'], Any]):
+        """
+        初始化工作者
+
+        Args:
+            task: 要在背景執行的函數，接收工作者本身 (用於回報進度與輸出)，返回值會以 MSG_RESULT 送出
+        """
+        self.queue: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+        self._task = task
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """啟動背景執行緒"""
+        self._thread = threading.Thread(target=self._run, name="AnalysisWorker", daemon=True)
+        self._thread.start()
+
+    def is_running(self) -> bool:
+        """背景執行緒是否仍在執行"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        """背景執行緒主體"""
+        try:
+            result = self._task(self)
+            self.queue.put((MSG_RESULT, result))
+        except Exception as e:
+            traceback.print_exc()
+            self.queue.put((MSG_ERROR, str(e)))
+        finally:
+            self.queue.put((MSG_DONE, None))
+
+    def post_output(self, text: str):
+        """送出一行輸出文字 (可在背景執行緒呼叫)"""
+        self.queue.put((MSG_OUTPUT, text))
+
+    def post_progress(self, value: float, message: str = ""):
+        """送出進度 (可在背景執行緒呼叫)"""
+        self.queue.put((MSG_PROGRESS, (value, message)))
+
+    def next_message(self) -> Optional[Tuple[str, Any]]:
+        """
+        取出一則佇列訊息 (在主執行緒呼叫，不會阻塞)
+
+        Returns:
+            Optional[Tuple[str, Any]]: (訊息種類, 內容)，佇列為空時返回None
+        """
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            return None
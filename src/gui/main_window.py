@@ -2,11 +2,28 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from typing import List, Set, Dict, Any
 import os
+import tempfile
+import time
+
+from src.gui.output_console import OutputConsole
+from src.gui.virtual_listbox import VirtualListbox
 
 
 class MainWindow:
     """主視窗類別 - 負責GUI介面的顯示和基本互動"""
     
+    # 背景分析佇列的輪詢間隔 (約60fps) 與每次輪詢可使用的時間
+    WORKER_POLL_INTERVAL_MS = 16
+    WORKER_FRAME_BUDGET = 0.008
+    
+    # 大型專案模式的結果資料庫 (每次分析覆寫) 與未引用檔案列表每頁筆數
+    RESULT_STORE_FILE_NAME = "ClearProjMachine-results.sqlite"
+    # 效能統計時寫出的追蹤檔 (每次分析覆寫，可在 Perfetto 或 about://tracing 開啟)
+    TRACE_FILE_NAME = "ClearProjMachine-scan.trace"
+    UNUSED_PAGE_SIZE = 500
+    # 未引用檔案列表每次閒置時加入的檔案數
+    UNUSED_INSERT_CHUNK = 5000
+    
     def __init__(self):
         """初始化主視窗"""
         self.root = tk.Tk()
@@ -17,15 +34,18 @@ class MainWindow:
         self.selected_path = tk.StringVar()
         self.selected_function = tk.StringVar()
         self.code_project_path = tk.StringVar()  # 新增：程式碼專案路徑
+        self.snapshot_path = tk.StringVar()  # 分析快照檔 (可選，用於比較兩次分析的差異)
+        self.show_delta_only = tk.BooleanVar(value=False)
+        self.use_result_store = tk.BooleanVar(value=False)  # 大型專案模式: 結果寫入資料庫並分頁顯示
+        self.collect_metrics = tk.BooleanVar(value=False)  # 效能統計: 列出各階段耗時並寫出追蹤檔
         self.functions = {
             "EFK檔案掃描": "efk_scan",
-            "c3b圖片掃描": "c3b_scan"
+            "c3b圖片掃描": "c3b_scan",
+            "全部引用掃描": "all_scan"
         }
         
         # 初始化資料結構
         self.unused_files = []
-        self.file_checkboxes = {}
-        self.file_labels = {}
         
         # 新增統計追蹤變數
         self.total_unused_count = 0
@@ -33,6 +53,21 @@ class MainWindow:
         self.remaining_count = 0
         self.remaining_size = 0
         self.deleted_files = set()
+        # 未引用檔案 -> 檔案大小 (在背景執行緒讀取後隨結果送回，主執行緒只查表)
+        self.file_sizes: Dict[str, int] = {}
+        
+        # 大型專案模式的結果資料庫 (主執行緒開啟的唯讀連線)、目前頁碼 (從 0 開始)
+        # 與已瀏覽頁面的起始鍵 (第 i 頁從路徑大於 unused_page_keys[i] 的檔案開始)
+        self.result_store = None
+        self.unused_page_index = 0
+        self.unused_page_keys = ['']
+        # 分批加入未引用檔案的待執行工作 (加入完成或清除列表時為 None)
+        self._populate_after_id = None
+        
+        # 背景分析工作者、取消權杖與結果處理函數 (分析或大型專案模式的批量刪除進行中才存在)
+        self._analysis_worker = None
+        self._cancel_token = None
+        self._worker_result_handler = None
         
         # 設定UI
         self._setup_ui()
@@ -143,14 +178,65 @@ class MainWindow:
         code_clear_button = ttk.Button(self.code_path_frame, text="清除", command=self._clear_code_path)
         code_clear_button.grid(row=0, column=2, padx=(5, 0))
         
+        # 分析控制按鈕區域 (開始 / 暫停 / 停止)
+        analysis_control_frame = ttk.Frame(main_frame)
+        analysis_control_frame.grid(row=4, column=0, columnspan=2, pady=(20, 10))
+        
         # 開始分析按鈕 (調整row)
-        analyze_button = ttk.Button(
-            main_frame, 
+        self.analyze_button = ttk.Button(
+            analysis_control_frame, 
             text="開始分析", 
             command=self._start_analysis,
             style="Accent.TButton"
         )
-        analyze_button.grid(row=4, column=0, columnspan=2, pady=(20, 10))
+        self.analyze_button.grid(row=0, column=0)
+        
+        # 暫停 / 繼續分析按鈕
+        self.pause_button = ttk.Button(
+            analysis_control_frame,
+            text="暫停",
+            command=self._toggle_pause_analysis,
+            state=tk.DISABLED
+        )
+        self.pause_button.grid(row=0, column=1, padx=(5, 0))
+        
+        # 停止分析按鈕
+        self.stop_button = ttk.Button(
+            analysis_control_frame,
+            text="停止",
+            command=self._stop_analysis,
+            state=tk.DISABLED
+        )
+        self.stop_button.grid(row=0, column=2, padx=(5, 0))
+        
+        # 分析快照 (與上次分析比較)
+        self.snapshot_button = ttk.Button(
+            analysis_control_frame,
+            text="快照檔...",
+            command=self._select_snapshot_path
+        )
+        self.snapshot_button.grid(row=0, column=3, padx=(20, 0))
+        
+        self.delta_only_checkbutton = ttk.Checkbutton(
+            analysis_control_frame,
+            text="只顯示變更",
+            variable=self.show_delta_only
+        )
+        self.delta_only_checkbutton.grid(row=0, column=4, padx=(5, 0))
+        
+        self.result_store_checkbutton = ttk.Checkbutton(
+            analysis_control_frame,
+            text="大型專案模式",
+            variable=self.use_result_store
+        )
+        self.result_store_checkbutton.grid(row=0, column=5, padx=(5, 0))
+        
+        self.metrics_checkbutton = ttk.Checkbutton(
+            analysis_control_frame,
+            text="效能統計",
+            variable=self.collect_metrics
+        )
+        self.metrics_checkbutton.grid(row=0, column=6, padx=(5, 0))
         
         # 未引用檔案區域 (調整row)
         unused_frame = ttk.LabelFrame(main_frame, text="未引用檔案列表", padding="10")
@@ -185,23 +271,17 @@ class MainWindow:
         )
         self.status_label.grid(row=1, column=0, sticky="w", pady=(0, 5))
         
-        # 重新設計的檔案列表 - 使用簡單的Listbox，調整高度以顯示至少4條內容
-        self.unused_listbox = tk.Listbox(
+        # 檔案列表 - 虛擬化列表 (含捲軸)，只繪製看得到的列，數十萬個檔案也能立即顯示
+        self.unused_listbox = VirtualListbox(
             unused_frame,
             height=12,  # 增加高度，確保能顯示至少4條內容的預設高度
-            selectmode=tk.EXTENDED,
             font=("Consolas", 9)
         )
-        self.unused_listbox.grid(row=2, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 5))
+        self.unused_listbox.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 5))
         
-        # 綁定選擇事件來處理已刪除檔案的選擇限制
+        # 已刪除的檔案由列表本身禁止選取，這裡只更新選擇統計
         self.unused_listbox.bind("<<ListboxSelect>>", self._on_listbox_select)
         
-        # 檔案列表的捲軸
-        unused_scrollbar = ttk.Scrollbar(unused_frame, orient="vertical", command=self.unused_listbox.yview)
-        unused_scrollbar.grid(row=2, column=1, sticky=(tk.N, tk.S))
-        self.unused_listbox.configure(yscrollcommand=unused_scrollbar.set)
-        
         # 檔案操作按鈕框架
         file_buttons_frame = ttk.Frame(unused_frame)
         file_buttons_frame.grid(row=3, column=0, columnspan=2, pady=(5, 0))
@@ -233,6 +313,26 @@ class MainWindow:
         )
         self.open_in_explorer_button.grid(row=0, column=2)
         
+        # 分頁按鈕 (只有大型專案模式從結果資料庫分頁讀取時啟用)
+        self.prev_page_button = ttk.Button(
+            file_buttons_frame,
+            text="◀ 上一頁",
+            command=lambda: self._show_unused_page(self.unused_page_index - 1),
+            state="disabled"
+        )
+        self.prev_page_button.grid(row=0, column=3, padx=(20, 0))
+        
+        self.page_label = ttk.Label(file_buttons_frame, text="", foreground="gray")
+        self.page_label.grid(row=0, column=4, padx=(5, 5))
+        
+        self.next_page_button = ttk.Button(
+            file_buttons_frame,
+            text="下一頁 ▶",
+            command=lambda: self._show_unused_page(self.unused_page_index + 1),
+            state="disabled"
+        )
+        self.next_page_button.grid(row=0, column=5)
+        
         # 統計資訊框架 - 在按鈕下方
         stats_frame = ttk.Frame(unused_frame)
         stats_frame.grid(row=4, column=0, columnspan=2, pady=(10, 0), sticky=(tk.W, tk.E))
@@ -266,6 +366,7 @@ class MainWindow:
         
         # 放置文字區域和捲軸
         self.output_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.output_console = OutputConsole(self.output_text)
         self.output_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
         
         # 清除輸出按鈕
@@ -305,6 +406,18 @@ class MainWindow:
             display_path = path if len(path) <= 50 else "..." + path[-47:]
             self.code_path_label.config(text=f"程式碼專案: {display_path}", foreground="black")
     
+    def _select_snapshot_path(self):
+        """選擇分析快照檔 (已存在的快照會作為比較基準，分析完成後以新快照覆寫)"""
+        path = filedialog.asksaveasfilename(
+            title="選擇分析快照檔",
+            defaultextension=".snap",
+            filetypes=[("分析快照", "*.snap"), ("所有檔案", "*.*")],
+            confirmoverwrite=False
+        )
+        if path:
+            self.snapshot_path.set(path)
+            self.snapshot_button.config(text=f"快照: {os.path.basename(path)}")
+    
     def _clear_code_path(self):
         """清除程式碼專案路徑"""
         self.code_project_path.set("")
@@ -318,7 +431,7 @@ class MainWindow:
             self._clear_unused_files_list()
             
             # 根據選擇的功能顯示/隱藏程式碼專案選擇器
-            if selected == "c3b圖片掃描":
+            if selected in ("c3b圖片掃描", "全部引用掃描"):
                 # 顯示程式碼專案選擇區域
                 self.code_path_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
             else:
@@ -338,82 +451,11 @@ class MainWindow:
     
     def _clear_output(self):
         """清除輸出視窗"""
-        self.output_text.delete(1.0, tk.END)
+        self.output_console.clear()
     
     def _append_output(self, text):
-        """添加文字到輸出視窗，根據訊息類型自動選擇顏色"""
-        # 配置顏色標籤（如果尚未配置）
-        self._configure_output_colors()
-        
-        # 根據訊息內容判斷顏色
-        color_tag = self._get_message_color_tag(text)
-        
-        if color_tag:
-            # 插入帶顏色的文字
-            start_pos = self.output_text.index(tk.END + "-1c")  # 取得當前結束位置
-            self.output_text.insert(tk.END, text + "\n", color_tag)  # 直接在插入時應用標籤
-        else:
-            # 插入普通文字
-            self.output_text.insert(tk.END, text + "\n")
-        
-        self.output_text.see(tk.END)  # 自動捲動到底部
-        self.root.update()  # 更新GUI
-    
-    def _configure_output_colors(self):
-        """配置輸出視窗的顏色標籤"""
-        if not hasattr(self, '_colors_configured'):
-            # 成功訊息 - 綠色 (使用更明顯的顏色)
-            self.output_text.tag_configure("success", 
-                                         foreground="green",
-                                         font=("Consolas", 9, "normal"))
-            
-            # 失敗訊息 - 紅色 (使用更明顯的顏色)
-            self.output_text.tag_configure("error", 
-                                         foreground="red",
-                                         font=("Consolas", 9, "normal"))
-            
-            # 警告訊息 - 橙色 (使用更明顯的顏色)
-            self.output_text.tag_configure("warning", 
-                                         foreground="orange",
-                                         font=("Consolas", 9, "normal"))
-            
-            # 資訊訊息 - 藍色 (使用更明顯的顏色)
-            self.output_text.tag_configure("info", 
-                                         foreground="blue",
-                                         font=("Consolas", 9, "normal"))
-            
-            # 設定標籤優先級（確保我們的標籤在最上層）
-            self.output_text.tag_raise("success")
-            self.output_text.tag_raise("error") 
-            self.output_text.tag_raise("warning")
-            self.output_text.tag_raise("info")
-            
-            # 強制更新配置
-            self.output_text.update()
-            
-            # 標記已配置
-            self._colors_configured = True
-    
-    def _get_message_color_tag(self, text):
-        """根據訊息內容判斷應該使用的顏色標籤"""
-        # 警告訊息 - 橙色 (優先檢查，避免被錯誤訊息攔截)
-        if any(indicator in text for indicator in ["⚠️", "警告", "無法解析", "UI更新失敗"]) or (text.startswith("⚠️") and "檔案不存在" in text):
-            return "warning"
-        
-        # 成功訊息 - 綠色
-        elif any(indicator in text for indicator in ["✅", "成功", "完成", "已刪除檔案", "已在檔案總管中開啟", "已複製檔案路徑", "沒有找到未引用的檔案"]):
-            return "success"
-        
-        # 失敗訊息 - 紅色  
-        elif any(indicator in text for indicator in ["❌", "失敗", "錯誤", "無法", "不存在", "未找到任何EFK", "刪除檔案失敗", "檢查結果時發生錯誤"]):
-            return "error"
-        
-        # 資訊訊息 - 藍色
-        elif any(indicator in text for indicator in ["🔍", "📊", "📁", "📄", "📋", "==="]):
-            return "info"
-        
-        # 默認不使用顏色
-        return None
+        """添加文字到輸出視窗 (依訊息類型自動選擇顏色，每個畫面週期合併插入一次)"""
+        self.output_console.append(text)
     
     def _clear_unused_files_list(self):
         """清除未引用檔案列表"""
@@ -428,15 +470,22 @@ class MainWindow:
                 print("警告: GUI框架不存在")
                 return
             
-            # 清除所有項目
-            self.unused_listbox.delete(0, tk.END)
+            # 停止尚未完成的分批加入並清除所有項目
+            if self._populate_after_id is not None:
+                self.root.after_cancel(self._populate_after_id)
+                self._populate_after_id = None
+            self.unused_listbox.clear()
             
             # 重置資料
             self.unused_files = []
-            self.file_checkboxes = {}
-            self.file_labels = {}
-            if hasattr(self, 'file_delete_buttons'):
-                self.file_delete_buttons = {}
+            
+            # 關閉上一次的結果資料庫
+            if self.result_store is not None:
+                self.result_store.close()
+                self.result_store = None
+            self.unused_page_index = 0
+            self.unused_page_keys = ['']
+            self._update_page_controls()
             
             # 重置統計變數
             self.total_unused_count = 0
@@ -444,6 +493,7 @@ class MainWindow:
             self.remaining_count = 0
             self.remaining_size = 0
             self.deleted_files = set()
+            self.file_sizes = {}
             
             # 禁用全部清除按鈕
             if hasattr(self, 'clear_all_button') and self.clear_all_button.winfo_exists():
@@ -479,74 +529,50 @@ class MainWindow:
     
     def _add_unused_file(self, file_path: str):
         """新增未引用檔案到列表"""
-        if file_path in self.unused_files:
-            return
-        
+        self._add_unused_files([file_path])
+        self._update_stats_display()
+    
+    def _add_unused_files(self, file_paths: List[str]):
+        """
+        一次新增多個未引用檔案到列表 (只更新資料、累計統計與狀態標籤，列表在閒置時重畫一次；
+        統計顯示由呼叫端在全部加入後更新)
+        
+        Args:
+            file_paths: 檔案路徑 (已在列表中的檔案會略過)
+        """
         # 檢查GUI元件是否已經初始化
-        if not hasattr(self, 'unused_listbox'):
+        if not hasattr(self, 'unused_listbox') or not self.unused_listbox.winfo_exists():
             print("警告: GUI元件尚未初始化")
             return
         
-        # 檢查框架是否存在
-        if not self.unused_listbox.winfo_exists():
-            print("警告: GUI框架不存在")
+        index_of = self.unused_listbox.index_of
+        new_files = [file_path for file_path in dict.fromkeys(file_paths) if index_of(file_path) is None]
+        if not new_files:
             return
-        
-        self.unused_files.append(file_path)
-        
-        try:
-            # 添加項目到Listbox
-            self.unused_listbox.insert(tk.END, file_path)
-            
-            # 建立checkbox變數
-            checkbox_var = tk.BooleanVar()
-            self.file_checkboxes[file_path] = checkbox_var
-            
-            # 初始化file_delete_buttons如果不存在
-            if not hasattr(self, 'file_delete_buttons'):
-                self.file_delete_buttons = {}
-            
-            # 啟用全部清除按鈕
-            if hasattr(self, 'clear_all_button') and self.clear_all_button.winfo_exists():
-                self.clear_all_button.config(state="normal")
-            
-            # 啟用刪除選中按鈕
-            if hasattr(self, 'delete_selected_button') and self.delete_selected_button.winfo_exists():
-                self.delete_selected_button.config(state="normal")
-            
-            # 啟用開啟總管按鈕
-            if hasattr(self, 'open_in_explorer_button') and self.open_in_explorer_button.winfo_exists():
-                self.open_in_explorer_button.config(state="normal")
-            
-            # 更新狀態標籤
-            if hasattr(self, 'status_label'):
-                self.status_label.config(
-                    text=f"未引用檔案列表 (找到 {len(self.unused_files)} 個檔案)",
-                    foreground="black"
-                )
-            
-            # 更新統計資訊
-            self._update_stats_display()
-            
-            # 添加調試信息
-            print(f"=== 檔案項目調試信息 ===")
-            print(f"檔案路徑: {file_path}")
-            print(f"Listbox存在: {self.unused_listbox.winfo_exists()}")
-            print(f"Listbox大小: {self.unused_listbox.winfo_width()}x{self.unused_listbox.winfo_height()}")
-            print(f"Listbox項目數: {self.unused_listbox.size()}")
-            
-            # 檢查檔案項目是否可見
-            try:
-                items = self.unused_listbox.get(0, tk.END)
-                print(f"Listbox所有項目: {items}")
-            except Exception as e:
-                print(f"檢查Listbox項目時發生錯誤: {str(e)}")
-                
-        except Exception as e:
-            print(f"添加檔案到列表時發生錯誤: {str(e)}")
-            # 如果添加失敗，從列表中移除
-            if file_path in self.unused_files:
-                self.unused_files.remove(file_path)
+        self.unused_files.extend(new_files)
+        # 檔案大小作為列表項目的權重，選取統計隨選取增減累計
+        sizes = [self._get_file_size(file_path) for file_path in new_files]
+        self.unused_listbox.extend(new_files, sizes)
+        
+        # 總數與剩餘統計隨加入累計 (刪除時再扣除)，更新統計時不需要重新加總
+        added_size = sum(sizes)
+        self.total_unused_count += len(new_files)
+        self.total_unused_size += added_size
+        self.remaining_count += len(new_files)
+        self.remaining_size += added_size
+        
+        # 啟用全部清除、刪除選中與開啟總管按鈕
+        for button_name in ('clear_all_button', 'delete_selected_button', 'open_in_explorer_button'):
+            button = getattr(self, button_name, None)
+            if button is not None and button.winfo_exists():
+                button.config(state="normal")
+        
+        # 更新狀態標籤
+        if hasattr(self, 'status_label'):
+            self.status_label.config(
+                text=f"未引用檔案列表 (找到 {len(self.unused_files)} 個檔案)",
+                foreground="black"
+            )
     
     def _delete_single_file(self, file_path: str):
         """刪除單個檔案"""
@@ -555,7 +581,7 @@ class MainWindow:
                 os.remove(file_path)
                 
                 # 將檔案標記為已刪除
-                self.deleted_files.add(file_path)
+                self._mark_file_deleted(file_path)
                 
                 # 檢查GUI元件是否已經初始化
                 if not hasattr(self, 'unused_listbox') or not self.unused_listbox.winfo_exists():
@@ -563,37 +589,8 @@ class MainWindow:
                     self._update_stats_display()
                     return
                 
-                # 將檔案項目變為灰色並加上刪除線效果
-                if file_path in self.file_labels:
-                    labels = self.file_labels[file_path]
-                    if labels['name'].winfo_exists():
-                        labels['name'].config(
-                            foreground="gray",
-                            font=("TkDefaultFont", 9, "overstrike")
-                        )
-                    if labels['dir'].winfo_exists():
-                        labels['dir'].config(
-                            foreground="lightgray",
-                            font=("TkDefaultFont", 8, "overstrike")
-                        )
-                    if labels['size'] and labels['size'].winfo_exists():
-                        labels['size'].config(
-                            foreground="lightgray",
-                            font=("TkDefaultFont", 8, "overstrike")
-                        )
-                
-                # 禁用checkbox
-                if file_path in self.file_checkboxes:
-                    # 找到對應的checkbox widget並禁用
-                    for widget in self.unused_listbox.winfo_children():
-                        for child in widget.winfo_children():
-                            if isinstance(child, ttk.Checkbutton) and child.winfo_exists() and child.cget("variable") == str(self.file_checkboxes[file_path]):
-                                child.config(state="disabled")
-                                break
-                
-                # 禁用刪除按鈕
-                if hasattr(self, 'file_delete_buttons') and file_path in self.file_delete_buttons and self.file_delete_buttons[file_path].winfo_exists():
-                    self.file_delete_buttons[file_path].config(state="disabled")
+                # 將檔案項目變為灰色並禁止選取
+                self._update_deleted_file_display(file_path)
                 
                 self._append_output(f"✅ 已刪除檔案: {file_path}")
                 
@@ -636,6 +633,8 @@ class MainWindow:
         
         deleted_count = 0
         failed_count = 0
+        # 大型專案模式: 這一批刪除的檔案最後以一個交易寫入結果資料庫
+        store_deleted = []
         
         for file_path in file_paths_to_delete:
             try:
@@ -647,7 +646,10 @@ class MainWindow:
                     self._append_output(f"✅ 已刪除檔案: {file_path}")
                     
                     # 將檔案標記為已刪除
-                    self.deleted_files.add(file_path)
+                    if self.result_store is not None:
+                        store_deleted.append(file_path)
+                    else:
+                        self._mark_file_deleted(file_path)
                     
                     # 只有在GUI已初始化的情況下才更新UI
                     if hasattr(self, 'unused_listbox') and self.unused_listbox.winfo_exists():
@@ -664,89 +666,59 @@ class MainWindow:
                 failed_count += 1
                 self._append_output(f"❌ 刪除檔案失敗: {file_path} - {str(e)}")
         
+        if store_deleted:
+            self.result_store.mark_deleted(store_deleted)
         self._append_output(f"✅ 批量刪除完成: 成功 {deleted_count} 個，失敗 {failed_count} 個")
         
         # 更新統計資訊
         self._update_stats_display()
         self._update_selection_stats()
     
+    def _mark_file_deleted(self, file_path: str):
+        """記錄已刪除的檔案 (大型專案模式只寫入結果資料庫，換頁後仍保持已刪除狀態)"""
+        if self.result_store is not None:
+            self.result_store.mark_deleted([file_path])
+        elif file_path not in self.deleted_files:
+            # 從剩餘統計扣除這個檔案 (大小在加入列表時已記錄)
+            self.deleted_files.add(file_path)
+            self.remaining_count -= 1
+            self.remaining_size -= self._get_file_size(file_path)
+    
     def _update_deleted_file_display(self, file_path: str):
-        """更新已刪除檔案在Listbox中的顯示"""
+        """更新已刪除檔案在列表中的顯示 (統計資訊由呼叫端在批次結束後更新)"""
         try:
-            # 找到檔案在Listbox中的索引
-            items = self.unused_listbox.get(0, tk.END)
-            file_index = -1
-            
-            for i, item in enumerate(items):
-                if item == file_path or item.endswith(file_path):
-                    file_index = i
-                    break
+            file_index = self.unused_listbox.index_of(file_path)
+            if file_index is None:
+                return
             
-            if file_index >= 0:
-                # 標記檔案為已刪除狀態
-                if not hasattr(self, 'deleted_files'):
-                    self.deleted_files = set()
+            # 標記檔案為已刪除狀態，列表會以灰色顯示並禁止再選取 (大型專案模式的狀態只記錄在資料庫)
+            if self.result_store is None:
                 self.deleted_files.add(file_path)
-                
-                # 更新Listbox項目的顯示，添加已刪除標記和視覺效果
-                self.unused_listbox.delete(file_index)
-                deleted_display = f"🗑️ [已刪除] {os.path.basename(file_path)} - {os.path.dirname(file_path)}"
-                self.unused_listbox.insert(file_index, deleted_display)
-                
-                # 清除該項目的選擇狀態
-                self.unused_listbox.selection_clear(file_index)
-                
-                # 追蹤已刪除檔案的索引，防止重新選擇
-                if not hasattr(self, 'disabled_items'):
-                    self.disabled_items = set()
-                self.disabled_items.add(file_index)
-                
-                # 嘗試設定該項目為灰色背景（如果支援的話）
-                try:
-                    self.unused_listbox.itemconfig(file_index, {'bg': '#E0E0E0', 'fg': '#808080'})
-                except:
-                    # 如果不支援itemconfig，則忽略
-                    pass
-                
-                print(f"已更新檔案顯示: {file_path} (索引: {file_index})")
-                
-                # 更新統計資訊
-                self._update_stats_display()
-                self._update_selection_stats()
+            deleted_display = f"🗑️ [已刪除] {os.path.basename(file_path)} - {os.path.dirname(file_path)}"
+            self.unused_listbox.set_disabled(file_index, deleted_display)
             
         except Exception as e:
             print(f"更新刪除檔案顯示時發生錯誤: {str(e)}")
     
     def _on_listbox_select(self, event):
-        """處理Listbox選擇事件，防止選擇已刪除的檔案"""
+        """處理列表選擇事件 (已刪除的檔案由列表本身禁止選取)"""
         try:
-            if hasattr(self, 'disabled_items'):
-                # 取得當前選擇
-                current_selection = list(self.unused_listbox.curselection())
-                
-                # 移除已刪除檔案的選擇
-                valid_selection = []
-                for index in current_selection:
-                    if index not in self.disabled_items:
-                        valid_selection.append(index)
-                
-                # 如果選擇有變化，更新選擇狀態
-                if len(valid_selection) != len(current_selection):
-                    self.unused_listbox.selection_clear(0, tk.END)
-                    for index in valid_selection:
-                        self.unused_listbox.selection_set(index)
-            
             # 更新選擇統計資訊
             self._update_selection_stats()
             
         except Exception as e:
-            print(f"處理Listbox選擇事件時發生錯誤: {str(e)}")
+            print(f"處理列表選擇事件時發生錯誤: {str(e)}")
     
     def _clear_all_unused_files(self):
         """清除所有未引用的檔案"""
         if not self.unused_files:
             return
         
+        # 大型專案模式刪除資料庫中所有頁面的檔案，而不只是目前這一頁 (在背景執行緒進行)
+        if self.result_store is not None:
+            self._clear_all_unused_files_in_store()
+            return
+        
         # 確認對話框
         result = messagebox.askyesno(
             "確認刪除", 
@@ -772,7 +744,7 @@ class MainWindow:
                     self._append_output(f"✅ 已刪除檔案: {file_path}")
                     
                     # 將檔案標記為已刪除
-                    self.deleted_files.add(file_path)
+                    self._mark_file_deleted(file_path)
                     
                     # 只有在GUI已初始化的情況下才更新UI
                     if gui_initialized:
@@ -790,46 +762,98 @@ class MainWindow:
                 self._append_output(f"❌ 刪除檔案失敗: {file_path} - {str(e)}")
         
         self._append_output(f"✅ 批量刪除完成: 成功 {deleted_count} 個，失敗 {failed_count} 個")
-        
+
         # 更新統計資訊
         self._update_stats_display()
         self._update_selection_stats()
+
+    def _clear_all_unused_files_in_store(self):
+        """
+        大型專案模式: 在背景工作者刪除結果資料庫中所有尚未刪除的未引用檔案
+        
+        背景執行緒另外開啟自己的資料庫連線，每 BATCH_SIZE 個已刪除的檔案以一個交易標記；
+        已刪除狀態只記錄在資料庫，完成後主執行緒重新載入目前頁面與統計
+        """
+        from src.gui.analysis_worker import AnalysisWorker
+        from src.scanner.result_store import BATCH_SIZE, ResultStore
+        from src.utils.cancellation import CancellationToken, ScanCancelled
+        from src.utils.progress import ProgressReporter
+        
+        if self._analysis_worker is not None:
+            messagebox.showinfo("資訊", "分析進行中，請等待目前的分析完成")
+            return
         
-        # 更新統計資訊
-        self._update_stats_display()
-        self._update_selection_stats()
-    
-    def _find_unused_files(self, referenced_files: Set[str], project_path: str) -> List[str]:
-        """找出未被引用的檔案"""
-        unused_files = []
+        file_count = self.result_store.unused_summary()[2]
+        result = messagebox.askyesno(
+            "確認刪除", 
+            f"確定要刪除所有 {file_count} 個未引用的檔案嗎？\n此操作無法復原！"
+        )
         
-        try:
-            # 擴展檔案類型，包含圖片檔案和效果檔案
-            target_extensions = {
-                # 圖片檔案
-                '.png', '.jpg', '.jpeg', '.tga', '.dds', '.bmp', '.tiff', '.tif', '.webp', '.ktx', '.pvr',
-                # 效果檔案
-                '.efkmat', '.efkmodel'
-            }
-            
-            for root, dirs, files in os.walk(project_path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    file_ext = os.path.splitext(file)[1].lower()
-                    
-                    # 檢查是否為目標檔案類型
-                    if file_ext in target_extensions:
-                        # 檢查是否被引用
-                        if file_path not in referenced_files:
-                            unused_files.append(file_path)
-            
-        except Exception as e:
-            self._append_output(f"❌ 搜尋未引用檔案時發生錯誤: {str(e)}")
+        if not result:
+            return
         
-        return unused_files
+        store_path = self.result_store.path
+        cancel_token = CancellationToken()
+        
+        def run_delete(worker):
+            """背景執行緒: 刪除檔案並分批標記為已刪除，返回 (成功數, 失敗數)"""
+            def post_progress(update):
+                fraction = update.fraction
+                worker.post_progress(0.0 if fraction is None else fraction * 100.0, update.describe())
+            
+            progress = ProgressReporter(post_progress)
+            progress.begin_stage('delete', "正在刪除未引用檔案", file_count)
+            deleted_count = 0
+            failed_count = 0
+            batch = []
+            store = ResultStore(store_path)
+            try:
+                for file_path in store.iter_unused():
+                    cancel_token.checkpoint()
+                    try:
+                        os.remove(file_path)
+                        batch.append(file_path)
+                        deleted_count += 1
+                    except FileNotFoundError:
+                        # 檔案不存在，不算失敗，因為可能已經被刪除了
+                        worker.post_output(f"⚠️ 檔案不存在: {file_path}")
+                    except OSError as e:
+                        failed_count += 1
+                        worker.post_output(f"❌ 刪除檔案失敗: {file_path} - {str(e)}")
+                    progress.advance(1, detail=file_path)
+                    if len(batch) >= BATCH_SIZE:
+                        store.mark_deleted(batch)
+                        batch = []
+            except ScanCancelled:
+                worker.post_output("⚠️ 已停止刪除，其餘檔案保留")
+            finally:
+                store.mark_deleted(batch)
+                store.close()
+            progress.flush()
+            return deleted_count, failed_count
+        
+        # 刪除進行中停用刪除按鈕 (完成後重新載入頁面時恢復)
+        for button_name in ('clear_all_button', 'delete_selected_button'):
+            button = getattr(self, button_name, None)
+            if button is not None and button.winfo_exists():
+                button.config(state="disabled")
+        self._start_progress("正在刪除未引用檔案...")
+        self._start_worker(AnalysisWorker(run_delete), cancel_token, self._on_bulk_delete_finished)
     
+    def _on_bulk_delete_finished(self, counts):
+        """主執行緒: 大型專案模式的批量刪除完成後重新載入目前頁面 (其他頁面的檔案也已標記為已刪除)"""
+        deleted_count, failed_count = counts
+        self._append_output(f"✅ 批量刪除完成: 成功 {deleted_count} 個，失敗 {failed_count} 個")
+        self._stop_progress("刪除完成")
+        if self.result_store is not None:
+            self._show_unused_page(self.unused_page_index)
+
     def _start_analysis(self):
         """開始分析按鈕的回調函數"""
+        if self._analysis_worker is not None:
+            messagebox.showinfo("資訊", "分析進行中，請等待目前的分析完成")
+            return
+        
         if self.selected_function.get() == "選擇功能":
             messagebox.showwarning("警告", "請先選擇功能！")
             return
@@ -843,220 +867,294 @@ class MainWindow:
         print(f"選擇的功能: {self.selected_function.get()}")
         print(f"選擇的路徑: {self.selected_path.get()}")
         
-        if function_type == "efk_scan":
-            self._start_efk_analysis()
-        elif function_type == "c3b_scan":
-            self._start_c3b_analysis()
+        if function_type in ("efk_scan", "c3b_scan", "all_scan"):
+            self._start_engine_analysis(function_type)
         else:
             messagebox.showinfo("資訊", f"{self.selected_function.get()}功能將在後續步驟中實作")
     
-    def _start_efk_analysis(self):
-        """開始EFK檔案分析"""
-        from src.scanner.efk_scanner import EFKScanner
+    def _start_engine_analysis(self, function_type: str):
+        """以掃描引擎執行分析 (EFK / C3B / 全部引用來源共用同一流程)，掃描在背景執行緒進行"""
+        from src.scanner.scan_engine import ScanEngine, SCAN_PROFILES
+        from src.scanner.snapshot import record_snapshot
+        from src.scanner.result_store import ResultStore
+        from src.gui.analysis_worker import AnalysisWorker
+        from src.utils.cancellation import CancellationToken
+        from src.utils.instrumentation import Instrumentation
+        from src.utils.progress import ProgressReporter
+        from src.utils.tracer import Tracer
+        
+        profile = SCAN_PROFILES[function_type]
+        project_path = self.selected_path.get()
+        code_path = self.code_project_path.get()
+        snapshot_path = self.snapshot_path.get()
+        store_path = None
+        if self.use_result_store.get():
+            store_path = os.path.join(tempfile.gettempdir(), self.RESULT_STORE_FILE_NAME)
+        collect_metrics = self.collect_metrics.get()
+        trace_path = os.path.join(tempfile.gettempdir(), self.TRACE_FILE_NAME) if collect_metrics else None
+        # 各階段在進度條上佔用的範圍 (走訪與解析同時進行)
+        stage_ranges = {
+            'parse': (10.0, 60.0),
+            'resolve': (60.0, 80.0),
+            'diff': (80.0, 81.0),
+            'store': (81.0, 82.0),
+        }
+        
+        # 開始進度條 - 0%
+        self._start_progress("正在準備分析...")
+        
+        # 清除輸出視窗和未引用檔案列表
+        self._clear_output()
+        self._clear_unused_files_list()
+        self._append_output(f"=== {profile['title']}開始 ===")
+        self._append_output(f"掃描路徑: {project_path}")
+        if code_path:
+            self._append_output(f"程式碼專案路徑: {code_path}")
+        if snapshot_path:
+            self._append_output(f"分析快照: {snapshot_path}")
+        if store_path:
+            self._append_output(f"結果資料庫: {store_path}")
+        self._append_output("")
+        self._append_output("請稍候，分析進行中...")
+        self._append_output("")
+        self._update_progress(10, "正在初始化掃描器")
+        
+        cancel_token = CancellationToken()
+        
+        def run_scan(worker):
+            """背景執行緒: 執行掃描，所有UI更新都透過佇列送回主執行緒"""
+            def post_progress(update):
+                # 已由 ProgressReporter 合併，每秒最多送出幾次，不再逐檔案寫入輸出視窗
+                start, end = stage_ranges.get(update.stage, (0.0, 100.0))
+                fraction = update.fraction
+                value = start if fraction is None else start + fraction * (end - start)
+                worker.post_progress(value, update.describe())
+            
+            # sqlite3 連線不可跨執行緒使用: 背景執行緒寫入後關閉，主執行緒再另外開啟讀取
+            store = ResultStore(store_path) if store_path else None
+            tracer = Tracer() if trace_path else None
+            try:
+                engine = ScanEngine.from_profile(
+                    function_type,
+                    project_path,
+                    code_paths=[code_path],
+                    message_callback=worker.post_output,
+                    cancel_token=cancel_token,
+                    store=store,
+                    instrumentation=Instrumentation() if collect_metrics else None,
+                    tracer=tracer,
+                    progress=ProgressReporter(post_progress)
+                )
+                result = engine.run()
+                # 大型專案模式的未引用檔案只在資料庫中，快照必須在關閉資料庫之前建立
+                if snapshot_path and not result.cancelled:
+                    try:
+                        result.snapshot_delta = record_snapshot(result, snapshot_path)
+                    except Exception as e:
+                        worker.post_output(f"⚠️ 無法寫入分析快照: {str(e)}")
+            finally:
+                if store is not None:
+                    store.close()
+            if tracer is not None:
+                try:
+                    tracer.save(trace_path)
+                    worker.post_output(f"🧭 追蹤檔: {trace_path} (可在 Perfetto 或 about://tracing 開啟)")
+                except OSError as e:
+                    worker.post_output(f"⚠️ 無法寫入追蹤檔: {str(e)}")
+            if not result.store_path:
+                # 在背景執行緒讀取檔案大小 (大型專案模式的大小已記錄在結果資料庫)
+                result.collect_unused_file_sizes()
+            return result
+        
+        self._start_worker(AnalysisWorker(run_scan), cancel_token, self._on_analysis_result)
+    
+    def _start_worker(self, worker, cancel_token, on_result):
+        """
+        啟動背景工作者並開始輪詢 (同一時間只會有一個背景工作)
+        
+        Args:
+            worker: 背景分析工作者 (AnalysisWorker)
+            cancel_token: 暫停 / 停止按鈕操作的取消權杖
+            on_result: 在主執行緒處理工作返回值的函數
+        """
+        self._cancel_token = cancel_token
+        self._worker_result_handler = on_result
+        self._set_analysis_running(True)
+        self._analysis_worker = worker
+        worker.start()
+        self.root.after(self.WORKER_POLL_INTERVAL_MS, self._poll_analysis_worker)
+    
+    def _poll_analysis_worker(self):
+        """主執行緒: 定期取出背景分析送回的訊息並更新UI"""
+        from src.gui.analysis_worker import MSG_OUTPUT, MSG_PROGRESS, MSG_RESULT, MSG_ERROR, MSG_DONE
+        
+        worker = self._analysis_worker
+        if worker is None:
+            return
         
+        # 每次輪詢只處理一個畫格時間內的訊息，其餘留到下一次輪詢
+        deadline = time.perf_counter() + self.WORKER_FRAME_BUDGET
+        latest_progress = None
+        finished = False
         try:
-            # 開始進度條 - 0%
-            self._start_progress("正在準備分析...")
-            
-            # 清除輸出視窗和未引用檔案列表
-            self._clear_output()
-            self._clear_unused_files_list()
-            self._append_output("=== EFK檔案分析開始 ===")
-            self._append_output(f"掃描路徑: {self.selected_path.get()}")
-            self._append_output("")
-            
-            # 進度 10% - 初始化掃描器
-            self._update_progress(10, "正在初始化掃描器")
-            
-            # 定義進度回調函數
-            def progress_callback(current, total, message):
-                """掃描進度回調函數 - 同時更新文字輸出和進度條"""
-                if total > 0:
-                    # 更新文字輸出
-                    progress_text = f"({current}/{total}) {message}"
-                    self._append_output(progress_text)
-                    
-                    # 計算檔案分析階段的進度
-                    # 檔案分析階段佔30%到60%的進度空間（共30%）
-                    analysis_start = 30.0  # 分析階段開始進度
-                    analysis_range = 30.0  # 分析階段進度範圍（30%-60%）
-                    
-                    # 計算當前檔案在分析階段的百分比
-                    file_progress = current / total  # 0.0 到 1.0
-                    
-                    # 轉換為實際進度值
-                    actual_progress = analysis_start + (file_progress * analysis_range)
-                    
-                    # 確保進度值在合理範圍內
-                    actual_progress = min(max(actual_progress, analysis_start), analysis_start + analysis_range)
-                    
-                    # 更新進度條（滑順更新）
-                    self._update_progress(actual_progress, f"正在分析檔案 ({current}/{total})")
-                    
-                    # 更新GUI顯示
-                    self.root.update_idletasks()
-                else:
-                    # 處理沒有檔案的情況
-                    self._append_output("(0/0) 未找到任何EFK相關檔案")
-                    self._update_progress(60, "沒有檔案需要分析")
-                    self.root.update_idletasks()
-            
-            # 使用預設的圖片類型集合
-            default_image_types = {"png", "jpg", "jpeg", "tga", "dds", "bmp", "tiff", "tif", "webp", "ktx", "pvr"}
-            scanner = EFKScanner(self.selected_path.get(), default_image_types, progress_callback)
+            while time.perf_counter() < deadline:
+                message = worker.next_message()
+                if message is None:
+                    break
+                kind, payload = message
+                if kind == MSG_OUTPUT:
+                    self._append_output(payload)
+                elif kind == MSG_PROGRESS:
+                    # 同一次輪詢只需要畫最後一個進度
+                    latest_progress = payload
+                elif kind == MSG_RESULT:
+                    latest_progress = None
+                    self._worker_result_handler(payload)
+                elif kind == MSG_ERROR:
+                    latest_progress = None
+                    self._stop_progress("分析失敗")
+                    self._append_output(f"❌ 錯誤: 分析過程中發生錯誤：{payload}")
+                elif kind == MSG_DONE:
+                    finished = True
+                    break
             
-            # 顯示進度訊息
-            self._append_output("正在掃描EFK檔案...")
-            self._append_output("請稍候，分析進行中...")
+            if latest_progress is not None:
+                self._update_progress(*latest_progress)
+        except Exception as e:
+            self._append_output(f"❌ 更新分析進度時發生錯誤: {str(e)}")
+        
+        if finished:
+            self._analysis_worker = None
+            self._cancel_token = None
+            self._worker_result_handler = None
+            self._set_analysis_running(False)
+        else:
+            self.root.after(self.WORKER_POLL_INTERVAL_MS, self._poll_analysis_worker)
+    
+    def _on_analysis_result(self, result):
+        """主執行緒: 顯示背景掃描的結果"""
+        self._show_engine_results_in_output(result)
+        if result.cancelled:
+            # 部分結果只顯示已解析的引用，不列出未引用檔案以免誤刪
             self._append_output("")
-            
-            # 進度 30% - 開始掃描EFK檔案（檔案分析階段的起始點）
-            self._update_progress(30, "開始掃描EFK檔案")
-            
-            # 執行掃描（進度條會在callback中滑順更新）
-            results = scanner.scan_efk_files()
-            
-            # 進度 60% - 處理掃描結果
-            self._update_progress(60, "正在處理掃描結果")
-            
-            # 顯示結果
-            self._show_analysis_results_in_output(results, scanner)
-            
-            # 進度 80% - 查找未引用檔案
-            self._update_progress(80, "正在查找未引用檔案")
-            
-            # 找出未引用的檔案
-            self._find_and_display_unused_files(results, scanner)
-            
-            # 進度 90% - 整理結果
-            self._update_progress(90, "正在整理分析結果")
-            
-            # 進度 100% - 分析完成
+            self._append_output("⚠️ 分析已取消，以上為已完成的部分結果")
+            self._stop_progress("分析已取消")
+        else:
+            self._display_unused_files(result)
             self._stop_progress("分析完成")
-            
-        except KeyboardInterrupt:
-            self._stop_progress("分析被中斷")
-            self._append_output("❌ 分析已被使用者中斷")
-        except Exception as e:
-            # 停止進度條
-            self._stop_progress("分析失敗")
-            # 使用更安全的錯誤處理
-            try:
-                error_msg = f"分析過程中發生錯誤：{str(e)}"
-            except Exception:
-                error_msg = "分析過程中發生未知錯誤"
-            self._append_output(f"❌ 錯誤: {error_msg}")
     
-    def _find_and_display_unused_files(self, results: Dict[str, List[str]], scanner):
-        """找出並顯示未引用的檔案 - 修正邏輯16: 考慮目錄範圍限制"""
+    def _set_analysis_running(self, running: bool):
+        """分析進行中時停用開始分析按鈕 (避免重複啟動)，並啟用暫停 / 停止按鈕"""
+        if hasattr(self, 'analyze_button') and self.analyze_button.winfo_exists():
+            self.analyze_button.config(state=tk.DISABLED if running else tk.NORMAL)
+        if hasattr(self, 'pause_button') and self.pause_button.winfo_exists():
+            self.pause_button.config(text="暫停", state=tk.NORMAL if running else tk.DISABLED)
+        if hasattr(self, 'stop_button') and self.stop_button.winfo_exists():
+            self.stop_button.config(state=tk.NORMAL if running else tk.DISABLED)
+    
+    def _toggle_pause_analysis(self):
+        """暫停 / 繼續目前的分析"""
+        token = self._cancel_token
+        if token is None or token.is_cancelled:
+            return
+        
+        if token.is_paused:
+            token.resume()
+            self.pause_button.config(text="暫停")
+            self._update_status("分析繼續進行中...", "blue")
+        else:
+            token.pause()
+            self.pause_button.config(text="繼續")
+            self._update_status("分析已暫停", "orange")
+    
+    def _stop_analysis(self):
+        """停止目前的分析 (掃描執行緒會在下一個檢查點結束，並保留部分結果)"""
+        token = self._cancel_token
+        if token is None or token.is_cancelled:
+            return
+        
+        token.cancel()
+        self.pause_button.config(text="暫停", state=tk.DISABLED)
+        self.stop_button.config(state=tk.DISABLED)
+        self._update_status("正在停止分析...", "orange")
+    
+    def _show_engine_results_in_output(self, result):
+        """在輸出視窗中顯示掃描引擎的分析結果"""
+        stats = result.get_statistics()
+        
+        self._append_output("")
+        self._append_output("=== 分析結果 ===")
+        self._append_output(f"索引檔案數: {stats['total_indexed_files']}")
+        for name, scanner_stats in result.scanner_statistics.items():
+            self._append_output(
+                f"[{name}] 檔案數: {scanner_stats['total_files']}, "
+                f"已分析: {scanner_stats['analyzed_files']}, "
+                f"失敗: {scanner_stats['failed_scans']}, "
+                f"引用數: {scanner_stats['total_referenced_files']}"
+            )
+        self._append_output(f"已解析引用數: {stats['total_references']}")
+        self._append_output(f"無法解析引用數: {stats['total_unresolved_references']}")
+        self._append_output("")
+        
+        if result.metrics is not None:
+            self._append_output("=== 效能統計 ===")
+            for line in result.metrics.format_lines():
+                self._append_output(f"  {line}")
+            self._append_output("")
+        
+        # 顯示詳細結果 (直接從引用關係圖讀取)
+        references = result.references
+        if not references:
+            self._append_output("⚠️ 未解析出任何引用的檔案")
+            return
+        
+        if result.store_path:
+            # 大型專案模式不把每條引用寫入輸出視窗，需要時從結果資料庫查詢
+            self._append_output(f"詳細引用已寫入結果資料庫: {result.store_path}")
+            self._append_output("=== 分析完成 ===")
+            return
+        
+        self._append_output("=== 詳細結果 ===")
+        for file_path, referenced_files in references.items():
+            file_type = os.path.splitext(file_path)[1].lstrip('.').upper()
+            self._append_output(f"📁 {file_type}檔案: {os.path.basename(file_path)}")
+            self._append_output(f"   完整路徑: {file_path}")
+            self._append_output(f"   引用的檔案 ({len(referenced_files)} 個):")
+            for i, ref_file in enumerate(referenced_files, 1):
+                self._append_output(f"     {i}. {ref_file}")
+            for reference in result.unresolved.get(file_path, ()):
+                self._append_output(f"     ⚠️ 無法解析: {reference}")
+            self._append_output("")
+        
+        self._append_output("=== 分析完成 ===")
+    
+    def _display_unused_files(self, result):
+        """將掃描引擎找出的未引用檔案加入GUI列表"""
         try:
-            # 進度 82% - 開始收集引用檔案
-            self._update_progress(82, "正在收集被引用的檔案")
-            
-            # 收集所有被引用的檔案路徑 - 新增目錄範圍檢查
-            referenced_files = set()
-            
-            # 方法1: 從掃描結果中收集引用檔案，但要檢查目錄範圍
-            for efk_file, ref_files in results.items():
-                efk_dir = os.path.dirname(efk_file)  # EFK檔案所在的目錄
-                
-                for ref_file in ref_files:
-                    # 嘗試找到檔案的完整路徑
-                    full_path = self._find_file_path_in_directory(ref_file, efk_dir)
-                    if full_path:
-                        # 檢查引用檔案是否在同一個目錄下（或其子目錄）
-                        if self._is_in_same_directory_scope(efk_file, full_path):
-                            referenced_files.add(full_path)
-                            self._append_output(f"🔍 找到同目錄引用檔案: {ref_file} -> {full_path}")
-                        else:
-                            self._append_output(f"⚠️  跨目錄引用（忽略）: {ref_file} -> {full_path}")
-                    else:
-                        # 如果在EFK檔案目錄找不到，嘗試在整個專案中找
-                        full_path = self._find_file_path(ref_file, self.selected_path.get())
-                        if full_path and self._is_in_same_directory_scope(efk_file, full_path):
-                            referenced_files.add(full_path)
-                            self._append_output(f"🔍 找到引用檔案: {ref_file} -> {full_path}")
-                        else:
-                            self._append_output(f"⚠️  無法解析引用檔案或跨目錄: {ref_file}")
-            
-            # 進度 84% - 開始掃描專案檔案
-            self._update_progress(84, "正在掃描專案中的所有檔案")
+            unused_files = result.unused_files
             
-            # 方法2: 直接從掃描器獲取所有檔案
-            all_files_in_project = set()
-            # 擴展檔案類型，包含圖片檔案和效果檔案
-            target_extensions = {
-                # 圖片檔案
-                '.png', '.jpg', '.jpeg', '.tga', '.dds', '.bmp', '.tiff', '.tif', '.webp', '.ktx', '.pvr',
-                # 效果檔案
-                '.efkmat', '.efkmodel'
-            }
+            self._append_output(f"📊 專案中總共有 {len(result.target_files)} 個目標檔案")
+            self._append_output(f"📊 被引用的檔案: {result.referenced_count} 個")
             
-            for root, dirs, files in os.walk(self.selected_path.get()):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    file_ext = os.path.splitext(file)[1].lower()
-                    
-                    # 檢查是否為目標檔案類型
-                    if file_ext in target_extensions:
-                        all_files_in_project.add(file_path)
-            
-            # 進度 86% - 統計檔案數量
-            self._update_progress(86, "正在統計檔案數量")
-            
-            self._append_output(f"📊 專案中總共有 {len(all_files_in_project)} 個目標檔案（圖片 + 效果檔案）")
-            self._append_output(f"📊 被引用的檔案（同目錄範圍）: {len(referenced_files)} 個")
-            
-            # 進度 88% - 開始檢查未引用檔案
-            self._update_progress(88, "正在檢查未引用的檔案")
-            
-            # 方法3: 改進的未引用檔案檢查 - 加入目錄範圍限制
-            unused_files = []
-            total_files = len(all_files_in_project)
-            processed_files = 0
-            
-            for file_path in all_files_in_project:
-                processed_files += 1
-                
-                # 計算檢查階段的細粒度進度（88%-90%之間）
-                check_progress = 88.0 + (processed_files / total_files) * 2.0  # 2%的進度範圍
-                if processed_files % 10 == 0:  # 每10個檔案更新一次進度，避免過於頻繁
-                    self._update_progress(check_progress, f"檢查檔案 ({processed_files}/{total_files})")
-                    self.root.update_idletasks()
-                
-                is_referenced = False
-                
-                # 檢查是否在引用檔案列表中（已經過目錄範圍檢查）
-                if file_path in referenced_files:
-                    is_referenced = True
-                else:
-                    # 進一步檢查檔案名匹配，但仍要考慮目錄範圍
-                    file_name = os.path.basename(file_path)
-                    file_dir = os.path.dirname(file_path)
-                    
-                    for ref_path in referenced_files:
-                        if os.path.basename(ref_path).lower() == file_name.lower():
-                            # 檢查是否在相同的目錄範圍內
-                            if self._is_in_same_directory_scope(file_path, ref_path):
-                                is_referenced = True
-                                break
-                    
-                    # 檢查相對路徑是否被引用（同樣考慮目錄範圍）
-                    if not is_referenced:
-                        relative_path = os.path.relpath(file_path, self.selected_path.get())
-                        for efk_file, ref_files_list in results.items():
-                            efk_dir = os.path.dirname(efk_file)
-                            for ref_file in ref_files_list:
-                                if ref_file.replace('\\', '/').lower() == relative_path.replace('\\', '/').lower():
-                                    # 檢查是否在同一個目錄範圍
-                                    if self._is_in_same_directory_scope(efk_file, file_path):
-                                        is_referenced = True
-                                        break
-                            if is_referenced:
-                                break
-                
-                if not is_referenced:
-                    unused_files.append(file_path)
+            delta = result.snapshot_delta
+            if delta is not None:
+                self._append_output(
+                    f"📊 與上次快照比較: 新增未使用 {len(delta.newly_unused)} 個, "
+                    f"新被引用 {len(delta.newly_referenced)} 個, 已刪除 {len(delta.deleted)} 個"
+                )
+                for file_path in delta.newly_referenced:
+                    self._append_output(f"  ✅ 新被引用: {file_path}")
+                for file_path in delta.deleted:
+                    self._append_output(f"  🗑️ 已刪除: {file_path}")
+                if self.show_delta_only.get():
+                    # 只列出這次新增的未使用檔案
+                    unused_files = delta.newly_unused
+                    self._append_output("🔍 只顯示這次新增的未使用檔案")
+            
+            if result.store_path and unused_files is result.unused_files:
+                self._display_unused_files_from_store(result.store_path)
+                self._update_progress(90, "未引用檔案查找完成")
+                return
             
             if unused_files:
                 self._append_output("")
@@ -1081,52 +1179,9 @@ class MainWindow:
                         foreground="blue"
                     )
                 
-                # 將未引用檔案加入GUI列表
-                added_count = 0
-                total_unused = len(unused_files)
-                for i, file_path in enumerate(unused_files, 1):
-                    try:
-                        print(f"正在添加檔案到GUI: {file_path}")
-                        self._add_unused_file(file_path)
-                        self._append_output(f"  📄 {file_path}")
-                        added_count += 1
-                        
-                        # 顯示添加進度（89%-90%之間）
-                        if i % 5 == 0 or i == total_unused:  # 每5個檔案或最後一個檔案更新進度
-                            add_progress = 89.0 + (i / total_unused) * 1.0  # 1%的進度範圍
-                            self._update_progress(add_progress, f"添加檔案到列表 ({i}/{total_unused})")
-                        
-                        # 強制更新GUI
-                        self.root.update()
-                        self.root.after(50)  # 等待50毫秒
-                        
-                    except Exception as e:
-                        self._append_output(f"  ❌ 添加檔案到列表失敗: {file_path} - {str(e)}")
-                        print(f"添加檔案失敗: {str(e)}")
-                
-                self._append_output(f"✅ 成功添加 {added_count} 個檔案到列表")
-                
-                # 最終狀態更新
-                if hasattr(self, 'status_label'):
-                    self.status_label.config(
-                        text=f"未引用檔案列表 (找到 {added_count} 個檔案)",
-                        foreground="black"
-                    )
-                
-                # 最終強制更新GUI
-                self.root.update()
-                self.root.after(200)  # 等待200毫秒確保完全更新
-                
-                # 檢查GUI列表中的實際項目
-                if hasattr(self, 'unused_listbox') and self.unused_listbox.winfo_exists():
-                    items = self.unused_listbox.get(0, tk.END)
-                    self._append_output(f"🔍 GUI列表實際項目數: {len(items)}")
-                    
-                    for i, item in enumerate(items):
-                        self._append_output(f"  📋 項目 {i+1}: {item}")
-                
-                self._append_output("")
-                self._append_output("您可以使用上方的checkbox選擇檔案，或使用刪除按鈕進行操作")
+                # 分批加入列表: 第一批立即加入，其餘在事件迴圈閒置時加入，全部完成後才更新一次統計
+                self.file_sizes = result.unused_file_sizes
+                self._populate_unused_files(list(unused_files))
             else:
                 self._append_output("")
                 self._append_output("✅ 沒有找到未引用的檔案")
@@ -1142,303 +1197,105 @@ class MainWindow:
             self._update_progress(90, "未引用檔案查找完成")
                 
         except Exception as e:
-            self._append_output(f"❌ 搜尋未引用檔案時發生錯誤: {str(e)}")
+            self._append_output(f"❌ 顯示未引用檔案時發生錯誤: {str(e)}")
             import traceback
             traceback.print_exc()
     
-    def _find_file_path(self, file_name: str, project_path: str) -> str:
-        """根據檔案名尋找完整路徑 - 修復跨目錄引用問題"""
-        try:
-            # 方法1: 直接檢查完整路徑
-            if os.path.isabs(file_name) and os.path.exists(file_name):
-                return file_name
-            
-            # 方法2: 相對於專案路徑檢查
-            relative_path = os.path.join(project_path, file_name)
-            if os.path.exists(relative_path):
-                return relative_path
-            
-            # 方法3: 改進的檔案搜尋 - 優先考慮路徑結構匹配
-            if '/' in file_name or '\\' in file_name:
-                # 如果引用包含路徑，嘗試精確匹配路徑結構
-                clean_name = file_name.replace('\\', '/').strip('/')
-                
-                # 在專案路徑下搜尋匹配的檔案結構
-                for root, dirs, files in os.walk(project_path):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        relative_to_project = os.path.relpath(file_path, project_path)
-                        relative_normalized = relative_to_project.replace('\\', '/')
-                        
-                        # 精確匹配相對路徑
-                        if relative_normalized.lower() == clean_name.lower():
-                            return file_path
-                        
-                        # 檢查末尾匹配（處理部分路徑的情況）
-                        if relative_normalized.lower().endswith(clean_name.lower()):
-                            # 確保是完整的檔案路徑匹配，而不是部分字串匹配
-                            parts = clean_name.split('/')
-                            rel_parts = relative_normalized.split('/')
-                            if len(parts) <= len(rel_parts):
-                                if rel_parts[-len(parts):] == [p.lower() for p in parts]:
-                                    return file_path
-            
-            # 方法4: 檔案名精確匹配 - 改進版
-            target_filename = os.path.basename(file_name).lower()
-            target_ext = os.path.splitext(target_filename)[1]
-            
-            # 只搜尋相同副檔名的檔案
-            valid_extensions = {'.png', '.jpg', '.jpeg', '.tga', '.dds', '.bmp', '.tiff', '.tif', '.webp', '.ktx', '.pvr', '.efkmat', '.efkmodel'}
-            
-            if target_ext in valid_extensions:
-                matches = []
-                for root, dirs, files in os.walk(project_path):
-                    for file in files:
-                        if file.lower() == target_filename:
-                            file_path = os.path.join(root, file)
-                            matches.append(file_path)
-                
-                # 如果只有一個匹配，直接返回
-                if len(matches) == 1:
-                    return matches[0]
-                
-                # 如果有多個匹配，優先選擇路徑結構相似的
-                if len(matches) > 1 and ('/' in file_name or '\\' in file_name):
-                    file_dir_parts = file_name.replace('\\', '/').split('/')[:-1]  # 除了檔案名的目錄部分
-                    
-                    best_match = None
-                    max_common_parts = 0
-                    
-                    for match in matches:
-                        match_rel = os.path.relpath(match, project_path)
-                        match_dir_parts = match_rel.replace('\\', '/').split('/')[:-1]
-                        
-                        # 計算共同的路徑部分
-                        common_parts = 0
-                        min_len = min(len(file_dir_parts), len(match_dir_parts))
-                        for i in range(min_len):
-                            if file_dir_parts[-(i+1)].lower() == match_dir_parts[-(i+1)].lower():
-                                common_parts += 1
-                            else:
-                                break
-                        
-                        if common_parts > max_common_parts:
-                            max_common_parts = common_parts
-                            best_match = match
-                    
-                    if best_match:
-                        return best_match
-                
-                # 如果沒有最佳匹配，返回第一個
-                if matches:
-                    return matches[0]
-            
-            # 方法5: 模糊檔案名匹配（處理檔案名可能有輕微差異的情況）
-            base_name = os.path.splitext(os.path.basename(file_name))[0].lower()
-            base_ext = os.path.splitext(os.path.basename(file_name))[1].lower()
-            
-            if base_ext in valid_extensions and len(base_name) > 2:
-                for root, dirs, files in os.walk(project_path):
-                    for file in files:
-                        file_base = os.path.splitext(file)[0].lower()
-                        file_ext = os.path.splitext(file)[1].lower()
-                        
-                        # 相同副檔名且檔案名相似
-                        if file_ext == base_ext and file_base == base_name:
-                            return os.path.join(root, file)
-                                
-        except Exception as e:
-            print(f"路徑解析錯誤: {str(e)}")
-        
-        return None
     
-    def _find_file_path_in_directory(self, file_name: str, directory_path: str) -> str:
-        """在特定目錄下尋找檔案的完整路徑"""
-        try:
-            # 方法1: 直接檢查完整路徑
-            if os.path.isabs(file_name) and os.path.exists(file_name):
-                return file_name
-            
-            # 方法2: 相對於目錄檢查
-            relative_path = os.path.join(directory_path, file_name)
-            if os.path.exists(relative_path):
-                return relative_path
-            
-            # 方法3: 改進的檔案搜尋 - 優先考慮路徑結構匹配
-            if '/' in file_name or '\\' in file_name:
-                # 如果引用包含路徑，嘗試精確匹配路徑結構
-                clean_name = file_name.replace('\\', '/').strip('/')
-                
-                # 在目錄下搜尋匹配的檔案結構
-                for root, dirs, files in os.walk(directory_path):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        relative_to_dir = os.path.relpath(file_path, directory_path)
-                        relative_normalized = relative_to_dir.replace('\\', '/')
-                        
-                        # 精確匹配相對路徑
-                        if relative_normalized.lower() == clean_name.lower():
-                            return file_path
-                        
-                        # 檢查末尾匹配（處理部分路徑的情況）
-                        if relative_normalized.lower().endswith(clean_name.lower()):
-                            # 確保是完整的檔案路徑匹配，而不是部分字串匹配
-                            parts = clean_name.split('/')
-                            rel_parts = relative_normalized.split('/')
-                            if len(parts) <= len(rel_parts):
-                                if rel_parts[-len(parts):] == [p.lower() for p in parts]:
-                                    return file_path
-            
-            # 方法4: 檔案名精確匹配 - 改進版
-            target_filename = os.path.basename(file_name).lower()
-            target_ext = os.path.splitext(target_filename)[1]
-            
-            # 只搜尋相同副檔名的檔案
-            valid_extensions = {'.png', '.jpg', '.jpeg', '.tga', '.dds', '.bmp', '.tiff', '.tif', '.webp', '.ktx', '.pvr', '.efkmat', '.efkmodel'}
-            
-            if target_ext in valid_extensions:
-                matches = []
-                for root, dirs, files in os.walk(directory_path):
-                    for file in files:
-                        if file.lower() == target_filename:
-                            file_path = os.path.join(root, file)
-                            matches.append(file_path)
-                
-                # 如果只有一個匹配，直接返回
-                if len(matches) == 1:
-                    return matches[0]
-                
-                # 如果有多個匹配，優先選擇路徑結構相似的
-                if len(matches) > 1 and ('/' in file_name or '\\' in file_name):
-                    file_dir_parts = file_name.replace('\\', '/').split('/')[:-1]  # 除了檔案名的目錄部分
-                    
-                    best_match = None
-                    max_common_parts = 0
-                    
-                    for match in matches:
-                        match_rel = os.path.relpath(match, directory_path)
-                        match_dir_parts = match_rel.replace('\\', '/').split('/')[:-1]
-                        
-                        # 計算共同的路徑部分
-                        common_parts = 0
-                        min_len = min(len(file_dir_parts), len(match_dir_parts))
-                        for i in range(min_len):
-                            if file_dir_parts[-(i+1)].lower() == match_dir_parts[-(i+1)].lower():
-                                common_parts += 1
-                            else:
-                                break
-                        
-                        if common_parts > max_common_parts:
-                            max_common_parts = common_parts
-                            best_match = match
-                    
-                    if best_match:
-                        return best_match
-                
-                # 如果沒有最佳匹配，返回第一個
-                if matches:
-                    return matches[0]
-            
-            # 方法5: 模糊檔案名匹配（處理檔案名可能有輕微差異的情況）
-            base_name = os.path.splitext(os.path.basename(file_name))[0].lower()
-            base_ext = os.path.splitext(os.path.basename(file_name))[1].lower()
-            
-            if base_ext in valid_extensions and len(base_name) > 2:
-                for root, dirs, files in os.walk(directory_path):
-                    for file in files:
-                        file_base = os.path.splitext(file)[0].lower()
-                        file_ext = os.path.splitext(file)[1].lower()
-                        
-                        # 相同副檔名且檔案名相似
-                        if file_ext == base_ext and file_base == base_name:
-                            return os.path.join(root, file)
-                                
-        except Exception as e:
-            print(f"路徑解析錯誤: {str(e)}")
+    def _populate_unused_files(self, file_paths: List[str], start: int = 0):
+        """
+        分批把未引用檔案加入列表 (每批之間交回事件迴圈，介面在加入大量檔案時仍可操作)
+        
+        Args:
+            file_paths: 要加入的檔案路徑
+            start: 這一批的起始位置
+        """
+        self._populate_after_id = None
+        end = start + self.UNUSED_INSERT_CHUNK
+        self._add_unused_files(file_paths[start:end])
+        if end < len(file_paths):
+            self._populate_after_id = self.root.after_idle(self._populate_unused_files, file_paths, end)
+            return
         
-        return None
+        self._update_stats_display()
+        self._append_output(f"✅ 成功添加 {len(self.unused_files)} 個檔案到列表")
+        self._append_output("")
+        self._append_output("您可以選擇檔案 (Ctrl / Shift 可多選) 後使用刪除按鈕進行操作")
     
-    def _is_in_same_directory_scope(self, efk_file_path: str, ref_file_path: str) -> bool:
-        """檢查引用檔案是否在EFK檔案所在的目錄範圍內"""
-        try:
-            efk_dir = os.path.dirname(efk_file_path)
-            ref_dir = os.path.dirname(ref_file_path)
-            
-            # 標準化路徑
-            efk_dir = os.path.normpath(efk_dir)
-            ref_dir = os.path.normpath(ref_dir)
-            
-            # 檢查兩種情況：
-            # 1. 引用檔案在相同目錄
-            # 2. 引用檔案在EFK檔案目錄的子目錄中
-            if efk_dir == ref_dir:
-                return True
-            
-            # 檢查引用檔案是否在EFK檔案目錄的子目錄中
-            rel_path = os.path.relpath(ref_dir, efk_dir)
-            # 如果相對路徑不以 '..' 開始，表示是子目錄或當前目錄
-            return not rel_path.startswith('..')
-            
-        except Exception as e:
-            print(f"檢查目錄範圍時發生錯誤: {str(e)}")
-            return False
+    def _display_unused_files_from_store(self, store_path: str):
+        """大型專案模式: 從結果資料庫分頁顯示未引用檔案 (列表一次只保留一頁)"""
+        from src.scanner.result_store import ResultStore
+        
+        self.result_store = ResultStore(store_path)
+        total = self.result_store.unused_count()
+        self._append_output("")
+        if not total:
+            self._append_output("✅ 沒有找到未引用的檔案")
+            self.status_label.config(text="未引用檔案列表 (沒有找到未引用檔案)", foreground="green")
+            return
+        
+        self._append_output(f"找到 {total} 個未被引用的檔案 (每頁顯示 {self.UNUSED_PAGE_SIZE} 個，請使用分頁按鈕瀏覽)")
+        self._show_unused_page(0)
     
-    def _show_analysis_results_in_output(self, results, scanner):
-        """在輸出視窗中顯示分析結果"""
-        # 檢查是否有檔案被掃描到
-        try:
-            total_files = len(scanner.efk_files) + len(scanner.efkmat_files) + len(scanner.efkmodel_files)
-            if total_files == 0:
-                self._append_output("❌ 未找到任何EFK、EFKMAT或EFKMODEL檔案")
-                return
-            
-            if not results:
-                self._append_output(f"⚠️ 找到 {len(scanner.efk_files)} 個EFK檔案, {len(scanner.efkmat_files)} 個EFKMAT檔案, {len(scanner.efkmodel_files)} 個EFKMODEL檔案，但未解析出引用的檔案")
-                return
-        except Exception as e:
-            try:
-                self._append_output(f"❌ 檢查結果時發生錯誤：{str(e)}")
-            except Exception:
-                self._append_output("❌ 檢查結果時發生未知錯誤")
+    def _show_unused_page(self, page: int):
+        """
+        從結果資料庫載入一頁未引用檔案到列表
+        
+        頁面只能從第一頁依序前後切換，每一頁以上一頁最後的路徑接續查詢 (不使用 OFFSET，
+        越後面的頁面也不會變慢)；已瀏覽頁面的起始鍵保存在 unused_page_keys
+        
+        Args:
+            page: 頁碼 (從 0 開始，只能是已知起始鍵的頁面)
+        """
+        if self.result_store is None:
             return
         
-        # 顯示統計資訊
-        stats = scanner.get_statistics()
-        self._append_output("=== 分析結果 ===")
-        self._append_output(f"總EFK檔案數: {stats['total_efk_files']}")
-        self._append_output(f"總EFKMAT檔案數: {stats['total_efkmat_files']}")
-        self._append_output(f"總EFKMODEL檔案數: {stats['total_efkmodel_files']}")
-        self._append_output(f"已分析檔案數: {stats['analyzed_efk_files']}")
-        self._append_output(f"總引用檔案數: {stats['total_referenced_files']}")
-        self._append_output("")
+        total = self.result_store.unused_count()
+        page = max(0, min(page, len(self.unused_page_keys) - 1))
+        rows = self.result_store.unused_page(self.unused_page_keys[page], self.UNUSED_PAGE_SIZE)
+        # 記錄下一頁的起始鍵 (之後的頁面起始鍵不變，保留供往後翻頁)
+        if rows and page == len(self.unused_page_keys) - 1 and (page + 1) * self.UNUSED_PAGE_SIZE < total:
+            self.unused_page_keys.append(rows[-1][0])
+        
+        self.unused_page_index = page
+        offset = page * self.UNUSED_PAGE_SIZE
+        self.unused_files = [file_path for file_path, _, _ in rows]
+        self.unused_listbox.set_items(self.unused_files, [size for _, _, size in rows])
+        for file_path, is_deleted, _ in rows:
+            if is_deleted:
+                self._update_deleted_file_display(file_path)
+        
+        state = "normal" if rows else "disabled"
+        for button_name in ('clear_all_button', 'delete_selected_button', 'open_in_explorer_button'):
+            button = getattr(self, button_name, None)
+            if button is not None and button.winfo_exists():
+                button.config(state=state)
+        
+        self.status_label.config(
+            text=f"未引用檔案列表 (共 {total} 個檔案，顯示第 {offset + 1}-{offset + len(rows)} 個)",
+            foreground="black"
+        )
+        self._update_page_controls()
+        self._update_stats_display()
+        self._update_selection_stats()
+    
+    def _update_page_controls(self):
+        """更新分頁按鈕與頁碼 (沒有結果資料庫時停用)"""
+        if not hasattr(self, 'page_label') or not self.page_label.winfo_exists():
+            return
         
-        # 顯示詳細結果
-        if results:
-            self._append_output("=== 詳細結果 ===")
-            for file_path, referenced_files in results.items():
-                # 提取檔案名和類型
-                file_name = os.path.basename(file_path)
-                file_ext = os.path.splitext(file_name)[1].lower()
-                
-                if file_ext == '.efk':
-                    file_type = "EFK檔案"
-                elif file_ext == '.efkmat':
-                    file_type = "EFKMAT檔案"
-                elif file_ext == '.efkmodel':
-                    file_type = "EFKMODEL檔案"
-                else:
-                    file_type = "檔案"
-                
-                self._append_output(f"📁 {file_type}: {file_name}")
-                self._append_output(f"   完整路徑: {file_path}")
-                self._append_output(f"   引用的檔案 ({len(referenced_files)} 個):")
-                
-                for i, ref_file in enumerate(referenced_files, 1):
-                    self._append_output(f"     {i}. {ref_file}")
-                
-                self._append_output("")
+        if self.result_store is None:
+            self.page_label.config(text="")
+            self.prev_page_button.config(state="disabled")
+            self.next_page_button.config(state="disabled")
+            return
         
-        self._append_output("=== 分析完成 ===")
+        total = self.result_store.unused_count()
+        page_count = max(1, (total + self.UNUSED_PAGE_SIZE - 1) // self.UNUSED_PAGE_SIZE)
+        page = self.unused_page_index + 1
+        self.page_label.config(text=f"第 {page} / {page_count} 頁", foreground="black")
+        self.prev_page_button.config(state="normal" if page > 1 else "disabled")
+        self.next_page_button.config(state="normal" if page < page_count else "disabled")
     
     def _show_analysis_results(self, results):
         """顯示分析結果（保留舊方法以備將來使用）"""
@@ -1465,31 +1322,27 @@ class MainWindow:
             return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
     
     def _get_file_size(self, file_path: str) -> int:
-        """獲取檔案大小（位元組）"""
-        try:
-            if os.path.exists(file_path):
-                return os.path.getsize(file_path)
-            else:
-                return 0
-        except Exception:
-            return 0
+        """獲取檔案大小（位元組；優先查詢背景執行緒讀取的大小，不在表中時才讀取並記錄）"""
+        size = self.file_sizes.get(file_path)
+        if size is None:
+            try:
+                size = os.path.getsize(file_path)
+            except OSError:
+                size = 0
+            self.file_sizes[file_path] = size
+        return size
     
     def _calculate_total_stats(self):
-        """計算總統計資訊"""
+        """
+        計算總統計資訊
+        
+        一般模式的統計在加入列表與刪除檔案時已累計 (不讀取檔案，也不重新加總)；
+        大型專案模式以資料庫中記錄的檔案大小統計所有頁面
+        """
         try:
-            self.total_unused_count = len(self.unused_files)
-            self.total_unused_size = 0
-            self.remaining_count = 0
-            self.remaining_size = 0
-            
-            for file_path in self.unused_files:
-                file_size = self._get_file_size(file_path)
-                self.total_unused_size += file_size
-                
-                # 如果檔案未被刪除，計入剩餘統計
-                if file_path not in self.deleted_files:
-                    self.remaining_count += 1
-                    self.remaining_size += file_size
+            if self.result_store is not None:
+                (self.total_unused_count, self.total_unused_size,
+                 self.remaining_count, self.remaining_size) = self.result_store.unused_summary()
                     
         except Exception as e:
             print(f"計算統計資訊時發生錯誤: {str(e)}")
@@ -1528,39 +1381,8 @@ class MainWindow:
             if not hasattr(self, 'unused_listbox') or not self.unused_listbox.winfo_exists():
                 return
                 
-            selected_indices = self.unused_listbox.curselection()
-            
-            if not selected_indices:
-                self.selection_stats_label.config(text="")
-                return
-            
-            selected_count = 0
-            selected_size = 0
-            valid_selections = []
-            
-            for index in selected_indices:
-                try:
-                    file_path = self.unused_listbox.get(index)
-                    
-                    # 跳過已刪除的檔案（檢查檔案路徑是否包含已刪除標記）
-                    if "🗑️ [已刪除]" in file_path:
-                        continue
-                        
-                    # 檢查檔案是否在已刪除列表中
-                    original_path = file_path
-                    for unused_file in self.unused_files:
-                        if unused_file.endswith(os.path.basename(file_path)) or unused_file == file_path:
-                            original_path = unused_file
-                            break
-                    
-                    if original_path not in self.deleted_files:
-                        selected_count += 1
-                        selected_size += self._get_file_size(original_path)
-                        valid_selections.append(original_path)
-                        
-                except Exception as e:
-                    print(f"處理選中項目時發生錯誤: {str(e)}")
-                    continue
+            # 列表隨選取增減累計列數與檔案大小 (已刪除的檔案不能選取)，拖曳或全選時不需要重新加總
+            selected_count, selected_size = self.unused_listbox.selection_summary()
             
             if selected_count > 0:
                 size_text = self._format_file_size(selected_size)
@@ -1806,9 +1628,6 @@ class MainWindow:
                         fill='#388E3C', outline='#388E3C', width=0
                     )
                 
-                # 強制更新畫布
-                self.progress_canvas.update()
-                
         except Exception as e:
             print(f"繪製進度條時發生錯誤: {str(e)}")
     
@@ -1820,362 +1639,3 @@ class MainWindow:
         """更新狀態標籤"""
         if hasattr(self, 'status_label') and self.status_label.winfo_exists():
             self.status_label.config(text=message, foreground=color)
-    
-    def _start_c3b_analysis(self):
-        """開始C3B檔案分析"""
-        from src.scanner.c3b_scanner import C3BScanner
-        
-        try:
-            # 開始進度條 - 0%
-            self._start_progress("正在準備分析...")
-            
-            # 清除輸出視窗和未引用檔案列表
-            self._clear_output()
-            self._clear_unused_files_list()
-            self._append_output("=== C3B檔案分析開始 ===")
-            self._append_output(f"掃描路徑: {self.selected_path.get()}")
-            self._append_output("")
-            
-            # 進度 10% - 初始化掃描器
-            self._update_progress(10, "正在初始化掃描器")
-            
-            # 定義進度回調函數
-            def progress_callback(current, total, message):
-                """掃描進度回調函數 - 同時更新文字輸出和進度條"""
-                if total > 0:
-                    # 更新文字輸出
-                    progress_text = f"({current}/{total}) {message}"
-                    self._append_output(progress_text)
-                    
-                    # 計算檔案分析階段的進度
-                    # 檔案分析階段佔30%到60%的進度空間（共30%）
-                    analysis_start = 30.0  # 分析階段開始進度
-                    analysis_range = 30.0  # 分析階段進度範圍（30%-60%）
-                    
-                    # 計算當前檔案在分析階段的百分比
-                    file_progress = current / total  # 0.0 到 1.0
-                    
-                    # 轉換為實際進度值
-                    actual_progress = analysis_start + (file_progress * analysis_range)
-                    
-                    # 確保進度值在合理範圍內
-                    actual_progress = min(max(actual_progress, analysis_start), analysis_start + analysis_range)
-                    
-                    # 更新進度條（滑順更新）
-                    self._update_progress(actual_progress, f"正在分析檔案 ({current}/{total})")
-                    
-                    # 更新GUI顯示
-                    self.root.update_idletasks()
-                else:
-                    # 處理沒有檔案的情況
-                    self._append_output("(0/0) 未找到任何C3B檔案")
-                    self._update_progress(60, "沒有檔案需要分析")
-                    self.root.update_idletasks()
-            
-            # 使用預設的圖片類型集合（只關心.png和.jpg）
-            default_image_types = {"png", "jpg", "jpeg"}
-            scanner = C3BScanner(self.selected_path.get(), default_image_types, progress_callback)
-            
-            # 顯示進度訊息
-            self._append_output("正在掃描C3B檔案...")
-            self._append_output("請稍候，分析進行中...")
-            self._append_output("")
-            
-            # 進度 30% - 開始掃描C3B檔案（檔案分析階段的起始點）
-            self._update_progress(30, "開始掃描C3B檔案")
-            
-            # 執行掃描（進度條會在callback中滑順更新）
-            results = scanner.scan_c3b_files()
-            
-            # 進度 60% - 處理掃描結果
-            self._update_progress(60, "正在處理掃描結果")
-            
-            # 顯示結果
-            self._show_c3b_analysis_results_in_output(results, scanner)
-            
-            # 進度 80% - 查找未引用檔案
-            self._update_progress(80, "正在查找未引用檔案")
-            
-            # 找出未引用的檔案
-            self._find_and_display_c3b_unused_files(results, scanner)
-            
-            # 進度 90% - 整理結果
-            self._update_progress(90, "正在整理分析結果")
-            
-            # 進度 100% - 分析完成
-            self._stop_progress("分析完成")
-            
-        except KeyboardInterrupt:
-            self._stop_progress("分析被中斷")
-            self._append_output("❌ 分析已被使用者中斷")
-        except Exception as e:
-            # 停止進度條
-            self._stop_progress("分析失敗")
-            # 使用更安全的錯誤處理
-            try:
-                error_msg = f"分析過程中發生錯誤：{str(e)}"
-            except Exception:
-                error_msg = "分析過程中發生未知錯誤"
-            self._append_output(f"❌ 錯誤: {error_msg}")
-    
-    def _show_c3b_analysis_results_in_output(self, results: Dict[str, List[str]], scanner):
-        """在輸出視窗中顯示C3B分析結果"""
-        try:
-            # 取得統計資訊
-            stats = scanner.get_statistics()
-            
-            self._append_output("=== C3B分析結果 ===")
-            self._append_output(f"總共找到 {stats['total_c3b_files']} 個C3B檔案")
-            self._append_output(f"成功分析 {stats['analyzed_files']} 個檔案")
-            self._append_output(f"分析失敗 {stats['failed_scans']} 個檔案")
-            self._append_output(f"總共找到 {stats['total_referenced_files']} 個圖片引用")
-            
-            # 顯示每個C3B檔案的引用詳情
-            if results:
-                self._append_output("")
-                self._append_output("=== C3B檔案詳細引用 ===")
-                for c3b_file, referenced_files in results.items():
-                    self._append_output(f"\n📁 C3B檔案: {os.path.basename(c3b_file)}")
-                    self._append_output(f"   路徑: {c3b_file}")
-                    
-                    if referenced_files:
-                        self._append_output(f"   引用圖片 ({len(referenced_files)} 個):")
-                        for ref_file in referenced_files:
-                            self._append_output(f"     🖼️  {ref_file}")
-                    else:
-                        self._append_output("   ❌ 未找到圖片引用")
-            else:
-                self._append_output("❌ 未找到任何C3B檔案或引用的圖片")
-            
-        except Exception as e:
-            error_msg = str(e)
-            self._append_output(f"❌ 顯示結果時發生錯誤: {error_msg}")
-    
-    def _find_and_display_c3b_unused_files(self, results: Dict[str, List[str]], scanner):
-        """找出並顯示未被C3B檔案引用的圖片檔案"""
-        try:
-            # 進度 82% - 開始收集引用檔案
-            self._update_progress(82, "正在收集被引用的圖片檔案")
-            
-            # 收集所有被引用的圖片檔案路徑
-            referenced_files = set()
-            
-            # 從掃描結果中收集引用檔案
-            for c3b_file, ref_files in results.items():
-                c3b_dir = os.path.dirname(c3b_file)  # C3B檔案所在的目錄
-                
-                for ref_file in ref_files:
-                    # 嘗試找到檔案的完整路徑
-                    full_path = self._find_file_path_in_directory(ref_file, c3b_dir)
-                    if full_path:
-                        # 檢查引用檔案是否在同一個目錄下（或其子目錄）
-                        if self._is_in_same_directory_scope(c3b_file, full_path):
-                            referenced_files.add(full_path)
-                            self._append_output(f"🔍 找到同目錄引用圖片: {ref_file} -> {full_path}")
-                        else:
-                            self._append_output(f"⚠️  跨目錄引用（忽略）: {ref_file} -> {full_path}")
-                    else:
-                        # 如果在C3B檔案目錄找不到，嘗試在整個專案中找
-                        full_path = self._find_file_path(ref_file, self.selected_path.get())
-                        if full_path and self._is_in_same_directory_scope(c3b_file, full_path):
-                            referenced_files.add(full_path)
-                            self._append_output(f"🔍 找到引用圖片: {ref_file} -> {full_path}")
-                        else:
-                            self._append_output(f"⚠️  無法解析引用圖片或跨目錄: {ref_file}")
-            
-            # 進度 84% - 開始掃描專案檔案
-            self._update_progress(84, "正在掃描專案中的所有圖片檔案")
-            
-            # 掃描專案中的所有圖片檔案
-            all_files_in_project = set()
-            # 只關心PNG和JPG檔案
-            target_extensions = {'.png', '.jpg', '.jpeg'}
-            
-            for root, dirs, files in os.walk(self.selected_path.get()):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    file_ext = os.path.splitext(file)[1].lower()
-                    
-                    # 檢查是否為目標檔案類型
-                    if file_ext in target_extensions:
-                        all_files_in_project.add(file_path)
-            
-            # 進度 86% - 統計檔案數量
-            self._update_progress(86, "正在統計檔案數量")
-            
-            self._append_output(f"📊 專案中總共有 {len(all_files_in_project)} 個圖片檔案（PNG + JPG）")
-            self._append_output(f"📊 被引用的圖片檔案（同目錄範圍）: {len(referenced_files)} 個")
-            
-            # 進度 88% - 開始檢查未引用檔案
-            self._update_progress(88, "正在檢查未引用的圖片檔案")
-            
-            # 檢查是否需要進行Lua檔案分析
-            lua_analyzer = None
-            if self.code_project_path.get():
-                self._append_output("")
-                self._append_output("=== Lua檔案分析開始 ===")
-                self._append_output(f"程式碼專案路徑: {self.code_project_path.get()}")
-                self._update_progress(88.5, "正在分析Lua檔案中的圖片引用")
-                
-                try:
-                    from src.utils.lua_analyzer import LuaAnalyzer
-                    lua_analyzer = LuaAnalyzer(self.code_project_path.get())
-                    lua_image_refs = lua_analyzer.scan_lua_files()
-                    
-                    lua_stats = lua_analyzer.get_statistics()
-                    self._append_output(f"📊 Lua檔案分析完成: 掃描 {lua_stats['total_lua_files']} 個檔案，找到 {lua_stats['total_image_references']} 個圖片引用")
-                    
-                    if lua_image_refs:
-                        self._append_output("🔍 在Lua檔案中找到的圖片引用:")
-                        for ref in sorted(lua_image_refs):
-                            self._append_output(f"     🖼️  {ref}")
-                    else:
-                        self._append_output("⚠️  未在Lua檔案中找到任何圖片引用")
-                        
-                except Exception as e:
-                    self._append_output(f"❌ Lua檔案分析時發生錯誤: {str(e)}")
-                    lua_analyzer = None
-                
-                self._append_output("")
-            
-            # 檢查未引用檔案
-            unused_files = []
-            total_files = len(all_files_in_project)
-            processed_files = 0
-            
-            for file_path in all_files_in_project:
-                processed_files += 1
-                
-                # 計算檢查階段的細粒度進度（88%-90%之間）
-                check_progress = 88.0 + (processed_files / total_files) * 2.0  # 2%的進度範圍
-                if processed_files % 10 == 0:  # 每10個檔案更新一次進度，避免過於頻繁
-                    self._update_progress(check_progress, f"檢查檔案 ({processed_files}/{total_files})")
-                    self.root.update_idletasks()
-                
-                is_referenced = False
-                
-                # 檢查是否在引用檔案列表中
-                if file_path in referenced_files:
-                    is_referenced = True
-                else:
-                    # 進一步檢查檔案名匹配
-                    file_name = os.path.basename(file_path)
-                    
-                    for ref_path in referenced_files:
-                        if os.path.basename(ref_path).lower() == file_name.lower():
-                            # 檢查是否在相同的目錄範圍內
-                            if self._is_in_same_directory_scope(file_path, ref_path):
-                                is_referenced = True
-                                break
-                    
-                    # 檢查相對路徑是否被引用
-                    if not is_referenced:
-                        relative_path = os.path.relpath(file_path, self.selected_path.get())
-                        for c3b_file, ref_files_list in results.items():
-                            c3b_dir = os.path.dirname(c3b_file)
-                            for ref_file in ref_files_list:
-                                if ref_file.replace('\\', '/').lower() == relative_path.replace('\\', '/').lower():
-                                    # 檢查是否在同一個目錄範圍
-                                    if self._is_in_same_directory_scope(c3b_file, file_path):
-                                        is_referenced = True
-                                        break
-                            if is_referenced:
-                                break
-                
-                # 如果還沒有被引用，且有Lua分析器，則檢查Lua檔案中的引用
-                if not is_referenced and lua_analyzer:
-                    if lua_analyzer.check_if_file_referenced_in_lua(os.path.basename(file_path), file_path):
-                        is_referenced = True
-                        self._append_output(f"  ✅ 檔案 {os.path.basename(file_path)} 在Lua檔案中被引用，排除未引用列表")
-                
-                if not is_referenced:
-                    unused_files.append(file_path)
-            
-            if unused_files:
-                self._append_output("")
-                self._append_output("=== 未引用圖片檔案列表 ===")
-                
-                # 根據是否有Lua檢查來調整描述
-                if lua_analyzer:
-                    self._append_output(f"找到 {len(unused_files)} 個未被C3B檔案和Lua程式碼引用的圖片:")
-                    self._append_output("(已排除在C3B檔案和Lua檔案中被引用的圖片)")
-                else:
-                    self._append_output(f"找到 {len(unused_files)} 個未被C3B檔案引用的圖片:")
-                    self._append_output("(僅檢查C3B檔案引用，未檢查程式碼引用)")
-                
-                # 檢查GUI元件是否已初始化
-                if not hasattr(self, 'unused_listbox'):
-                    self._append_output("⚠️  GUI元件尚未初始化，無法顯示檔案列表")
-                    self._append_output("請重新啟動應用程式")
-                    return
-                
-                if not self.unused_listbox.winfo_exists():
-                    self._append_output("⚠️  GUI框架不存在，無法顯示檔案列表")
-                    self._append_output("請重新啟動應用程式")
-                    return
-                
-                # 更新狀態標籤
-                if hasattr(self, 'status_label'):
-                    self.status_label.config(
-                        text=f"未引用檔案列表 (正在添加 {len(unused_files)} 個檔案...)",
-                        foreground="blue"
-                    )
-                
-                # 將未引用檔案加入GUI列表
-                added_count = 0
-                total_unused = len(unused_files)
-                for i, file_path in enumerate(unused_files, 1):
-                    try:
-                        print(f"正在添加檔案到GUI: {file_path}")
-                        self._add_unused_file(file_path)
-                        self._append_output(f"  📄 {file_path}")
-                        added_count += 1
-                        
-                        # 顯示添加進度（89%-90%之間）
-                        if i % 5 == 0 or i == total_unused:  # 每5個檔案或最後一個檔案更新進度
-                            add_progress = 89.0 + (i / total_unused) * 1.0  # 1%的進度範圍
-                            self._update_progress(add_progress, f"添加檔案到列表 ({i}/{total_unused})")
-                        
-                        # 強制更新GUI
-                        self.root.update()
-                        self.root.after(50)  # 等待50毫秒
-                        
-                    except Exception as e:
-                        self._append_output(f"  ❌ 添加檔案到列表失敗: {file_path} - {str(e)}")
-                        print(f"添加檔案失敗: {str(e)}")
-                
-                self._append_output(f"✅ 成功添加 {added_count} 個檔案到列表")
-                
-                # 最終狀態更新
-                if hasattr(self, 'status_label'):
-                    self.status_label.config(
-                        text=f"未引用檔案列表 (找到 {added_count} 個檔案)",
-                        foreground="black"
-                    )
-                
-                # 最終強制更新GUI
-                self.root.update()
-                self.root.after(200)  # 等待200毫秒確保完全更新
-                
-                self._append_output("")
-                self._append_output("您可以使用上方的checkbox選擇檔案，或使用刪除按鈕進行操作")
-            else:
-                self._append_output("")
-                self._append_output("✅ 沒有找到未引用的圖片檔案")
-                
-                # 更新狀態標籤
-                if hasattr(self, 'status_label'):
-                    self.status_label.config(
-                        text="未引用檔案列表 (沒有找到未引用檔案)",
-                        foreground="green"
-                    )
-            
-            # 進度 90% - 未引用檔案查找完成
-            self._update_progress(90, "未引用檔案查找完成")
-                
-        except Exception as e:
-            self._append_output(f"❌ 搜尋未引用圖片檔案時發生錯誤: {str(e)}")
-            import traceback
-            traceback.print_exc()
-    
- 
\ No newline at end of file
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+輸出視窗 - 以環狀緩衝區暫存新訊息，每個畫面週期只插入一次
+
+append 只做兩件事: 用預先編譯的單一正規表示式判斷顏色標籤，把 (文字, 標籤) 放進待插入的緩衝區；
+實際的 tk.Text 插入在 FLUSH_INTERVAL_MS 後一次完成 (連續同色的行合併成一段，
+整批只呼叫一次 insert 與 see)。文字區域最多保留 max_lines 行，超過時從最舊的行開始刪除，
+待插入的緩衝區也有相同的上限，一次湧入數十萬行時只會保留最後的部分。
+"""
+
+import re
+import tkinter as tk
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+
+# 兩次插入之間的間隔 (約60fps)
+FLUSH_INTERVAL_MS = 16
+
+# 文字區域保留的最多行數
+DEFAULT_MAX_LINES = 5000
+
+# 顏色標籤與判斷用的關鍵字 (依優先順序: 警告優先，避免被錯誤訊息攔截)
+MESSAGE_INDICATORS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("warning", ("⚠️", "警告", "無法解析", "UI更新失敗")),
+    ("success", ("✅", "成功", "完成", "已刪除檔案", "已在檔案總管中開啟", "已複製檔案路徑", "沒有找到未引用的檔案")),
+    ("error", ("❌", "失敗", "錯誤", "無法", "不存在", "未找到任何EFK", "刪除檔案失敗", "檢查結果時發生錯誤")),
+    ("info", ("🔍", "📊", "📁", "📄", "📋", "===")),
+)
+
+MESSAGE_COLORS = {
+    "success": "green",
+    "error": "red",
+    "warning": "orange",
+    "info": "blue",
+}
+
+
+def _compile_classifier(indicators: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> re.Pattern:
+    """
+    把各標籤的關鍵字編譯成一個正規表示式
+
+    每個標籤是一個「往後看得到任一關鍵字」的前瞻分支，分支依優先順序排列並錨定在開頭，
+    所以 match 的 lastgroup 就是第一個符合的標籤 (與逐一檢查各標籤的結果相同)。
+    """
+    branches = [f"(?=.*?(?:{'|'.join(re.escape(word) for word in words)}))(?P<{tag}>)"
+                for tag, words in indicators]
+    return re.compile('|'.join(branches), re.DOTALL)
+
+
+_CLASSIFIER = _compile_classifier(MESSAGE_INDICATORS)
+
+
+def classify_message(text: str) -> Optional[str]:
+    """
+    根據訊息內容判斷應該使用的顏色標籤
+
+    Args:
+        text: 訊息文字
+
+    Returns:
+        Optional[str]: 標籤名稱 (warning / success / error / info)，不需要顏色時為 None
+    """
+    match = _CLASSIFIER.match(text)
+    return match.lastgroup if match else None
+
+
+class OutputConsole:
+    """包裝 tk.Text 的輸出視窗 - 合併插入並限制保留的行數 (只能在主執行緒使用)"""
+
+    def __init__(self, text_widget: tk.Text, max_lines: int = DEFAULT_MAX_LINES,
+                 flush_interval_ms: int = FLUSH_INTERVAL_MS):
+        """
+        初始化輸出視窗
+
+        Args:
+            text_widget: 顯示訊息的文字區域
+            max_lines: 文字區域與待插入緩衝區保留的最多行數
+            flush_interval_ms: 兩次插入之間的間隔 (毫秒)
+        """
+        self.text = text_widget
+        self.max_lines = max(1, max_lines)
+        self.flush_interval_ms = flush_interval_ms
+        self._pending: Deque[Tuple[str, Optional[str]]] = deque(maxlen=self.max_lines)
+        # 文字區域目前的行數 (自行計算，不必每次向 Tk 查詢)
+        self._line_count = 0
+        self._flush_after_id = None
+
+        for tag, color in MESSAGE_COLORS.items():
+            text_widget.tag_configure(tag, foreground=color)
+            # 確保顏色標籤在選取等其他標籤之上
+            text_widget.tag_raise(tag)
+
+    def append(self, text: str):
+        """加入一行訊息 (在下一個畫面週期才會顯示)"""
+        text = str(text)
+        self._pending.append((text, classify_message(text)))
+        if self._flush_after_id is None:
+            self._flush_after_id = self.text.after(self.flush_interval_ms, self.flush)
+
+    def clear(self):
+        """清除所有訊息 (包含尚未顯示的)"""
+        self._cancel_flush()
+        self._pending.clear()
+        self.text.delete('1.0', tk.END)
+        self._line_count = 0
+
+    def flush(self):
+        """立即把待插入的訊息寫入文字區域"""
+        self._cancel_flush()
+        if not self._pending:
+            return
+        lines = list(self._pending)
+        self._pending.clear()
+
+        # 連續同色的行合併成一段: insert(END, 文字1, 標籤1, 文字2, 標籤2, ...)
+        chunks: List[str] = []
+        parts: List[str] = []
+        current_tag: Optional[str] = None
+        for text, tag in lines:
+            if tag != current_tag and parts:
+                chunks.extend((''.join(parts), current_tag or ''))
+                parts = []
+            current_tag = tag
+            parts.append(text)
+            parts.append('\n')
+        chunks.extend((''.join(parts), current_tag or ''))
+
+        widget = self.text
+        widget.insert(tk.END, *chunks)
+        self._line_count += sum(text.count('\n') + 1 for text, _ in lines)
+        excess = self._line_count - self.max_lines
+        if excess > 0:
+            # 刪除最舊的行 (tk.Text 的行號從 1 開始)
+            widget.delete('1.0', f'{excess + 1}.0')
+            self._line_count = self.max_lines
+        widget.see(tk.END)
+
+    def _cancel_flush(self):
+        if self._flush_after_id is not None:
+            self.text.after_cancel(self._flush_after_id)
+            self._flush_after_id = None
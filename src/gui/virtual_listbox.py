@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+虛擬化列表 - 資料保存在 Python 列表中，Tk 列表元件只放目前看得到的幾十列
+
+tk.Listbox 每一列都是 Tcl 物件，加入數十萬列時插入與捲動都會變慢；
+這裡的 tk.Listbox 只當作「畫面」，捲動時重新填入可見範圍的文字，
+選取狀態、停用 (已刪除) 狀態與顯示文字覆寫都以資料索引記錄，不隨畫面重建而遺失。
+
+介面與 tk.Listbox 相近 (size / get / curselection / selection_set / see)，
+選取改變時同樣產生 <<ListboxSelect>> 虛擬事件 (在 VirtualListbox 本身上)。
+每個項目可以附帶一個權重 (例如檔案大小)，選取的列數與權重總和隨選取增減累計，
+拖曳延伸範圍時只處理增減的列，selection_summary 不需要重新加總。
+"""
+
+import tkinter as tk
+from tkinter import font as tkfont
+from tkinter import ttk
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+# 停用列 (已刪除的檔案) 的顏色
+DISABLED_BACKGROUND = '#E0E0E0'
+DISABLED_FOREGROUND = '#808080'
+
+
+class VirtualListbox(ttk.Frame):
+    """虛擬化列表 (含垂直捲軸)，支援以資料索引多選 (Ctrl / Shift 點選、拖曳、Ctrl+A)"""
+
+    def __init__(self, master, height: int = 10, **listbox_options):
+        """
+        初始化虛擬化列表
+
+        Args:
+            master: 父元件
+            height: 預設顯示的列數
+            **listbox_options: 傳給內部 tk.Listbox 的選項 (例如 font)
+        """
+        super().__init__(master)
+        self._items: List[str] = []
+        # 項目 -> 資料索引 (重複的項目記錄第一個)
+        self._positions: Dict[str, int] = {}
+        self._selection: Set[int] = set()
+        self._disabled: Set[int] = set()
+        self._display: Dict[int, str] = {}
+        # 各項目的權重與累計值 (全部 / 已停用 / 已選取)
+        self._weights: List[int] = []
+        self._total_weight = 0
+        self._disabled_weight = 0
+        self._selected_weight = 0
+        # 目前的選取是否為 Shift / 拖曳產生的 (錨點, 終點) 範圍 (延伸時只處理增減的列)
+        self._range: Optional[Tuple[int, int]] = None
+        self._top = 0
+        self._rows = height
+        self._anchor: Optional[int] = None
+        self._active: Optional[int] = None
+        self._render_pending = False
+
+        self._listbox = tk.Listbox(self, height=height, selectmode=tk.BROWSE, exportselection=False,
+                                   activestyle='none', **listbox_options)
+        self._listbox.grid(row=0, column=0, sticky="nsew")
+        self._scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+        self._scrollbar.grid(row=0, column=1, sticky="ns")
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+
+        listbox = self._listbox
+        listbox.bind('<Configure>', self._on_configure)
+        # 以 "break" 取代 tk.Listbox 的預設行為 (預設行為只認得畫面上的列)
+        listbox.bind('<Button-1>', lambda event: self._on_click(event, 'set'))
+        listbox.bind('<Control-Button-1>', lambda event: self._on_click(event, 'toggle'))
+        listbox.bind('<Shift-Button-1>', lambda event: self._on_click(event, 'range'))
+        listbox.bind('<B1-Motion>', self._on_drag)
+        listbox.bind('<MouseWheel>', self._on_mouse_wheel)
+        listbox.bind('<Button-4>', lambda event: self._scroll_by(-3))
+        listbox.bind('<Button-5>', lambda event: self._scroll_by(3))
+        listbox.bind('<Up>', lambda event: self._on_arrow(-1, False))
+        listbox.bind('<Down>', lambda event: self._on_arrow(1, False))
+        listbox.bind('<Shift-Up>', lambda event: self._on_arrow(-1, True))
+        listbox.bind('<Shift-Down>', lambda event: self._on_arrow(1, True))
+        listbox.bind('<Prior>', lambda event: self._scroll_by(-self._rows))
+        listbox.bind('<Next>', lambda event: self._scroll_by(self._rows))
+        listbox.bind('<Home>', lambda event: self._scroll_to(0))
+        listbox.bind('<End>', lambda event: self._scroll_to(len(self._items)))
+        listbox.bind('<Control-a>', lambda event: self._on_select_all())
+        listbox.bind('<Control-A>', lambda event: self._on_select_all())
+
+    # ---- 資料 ----
+
+    def set_items(self, items: Iterable[str], weights: Optional[Iterable[int]] = None):
+        """
+        取代所有項目 (清除選取與停用狀態)
+
+        Args:
+            items: 項目
+            weights: 各項目的權重 (與 items 等長；None 代表全部為 0)
+        """
+        self._items = list(items)
+        self._positions = {}
+        for index, item in enumerate(self._items):
+            self._positions.setdefault(item, index)
+        self._weights = list(weights) if weights is not None else [0] * len(self._items)
+        self._total_weight = sum(self._weights)
+        self._disabled_weight = 0
+        self._selected_weight = 0
+        self._range = None
+        self._selection.clear()
+        self._disabled.clear()
+        self._display.clear()
+        self._top = 0
+        self._anchor = self._active = None
+        self._schedule_render()
+
+    def extend(self, items: Iterable[str], weights: Optional[Iterable[int]] = None):
+        """
+        在尾端加入多個項目 (畫面在閒置時才更新一次)
+
+        Args:
+            items: 項目
+            weights: 各項目的權重 (與 items 等長；None 代表全部為 0)
+        """
+        positions = self._positions
+        start = len(self._items)
+        self._items.extend(items)
+        for index in range(start, len(self._items)):
+            positions.setdefault(self._items[index], index)
+        added = len(self._items) - start
+        weights = list(weights) if weights is not None else [0] * added
+        self._weights.extend(weights)
+        self._total_weight += sum(weights)
+        self._schedule_render()
+
+    def clear(self):
+        """清除所有項目"""
+        self.set_items(())
+
+    def size(self) -> int:
+        """項目數"""
+        return len(self._items)
+
+    def get(self, index: int) -> str:
+        """取得資料索引對應的項目 (不受顯示文字覆寫影響)"""
+        return self._items[index]
+
+    def index_of(self, item: str) -> Optional[int]:
+        """取得項目的資料索引 (不存在時為 None)"""
+        return self._positions.get(item)
+
+    def set_disabled(self, index: int, display_text: Optional[str] = None):
+        """
+        停用一列 (不可選取，以灰色顯示)
+
+        Args:
+            index: 資料索引
+            display_text: 取代原本項目的顯示文字 (None 代表不變)
+        """
+        self._deselect((index,))
+        if index not in self._disabled:
+            self._disabled.add(index)
+            self._disabled_weight += self._weights[index]
+        if display_text is not None:
+            self._display[index] = display_text
+        self._schedule_render()
+
+    def is_disabled(self, index: int) -> bool:
+        """該列是否已停用"""
+        return index in self._disabled
+
+    # ---- 選取 ----
+
+    def curselection(self) -> Tuple[int, ...]:
+        """已選取的資料索引 (由小到大)"""
+        return tuple(sorted(self._selection))
+
+    def selection_summary(self) -> Tuple[int, int]:
+        """
+        已選取的列數與權重總和 (隨選取增減累計，不重新加總)
+
+        Returns:
+            Tuple[int, int]: (列數, 權重總和)
+        """
+        return len(self._selection), self._selected_weight
+
+    def selection_set(self, first: int, last: Optional[int] = None):
+        """選取一列或一段範圍 (略過停用的列)"""
+        last = first if last is None else last
+        if first > last:
+            first, last = last, first
+        self._range = None
+        self._select(range(max(0, first), min(last, len(self._items) - 1) + 1))
+        self._schedule_render()
+
+    def selection_clear(self):
+        """清除所有選取"""
+        self._clear_selection()
+        self._schedule_render()
+
+    def select_all(self):
+        """選取所有未停用的列"""
+        self._range = None
+        self._selection = set(range(len(self._items))) - self._disabled
+        self._selected_weight = self._total_weight - self._disabled_weight
+        self._schedule_render()
+
+    def _select(self, indices: Iterable[int]):
+        """加入選取 (略過停用與已選取的列) 並累計權重"""
+        selection = self._selection
+        disabled = self._disabled
+        weights = self._weights
+        added = 0
+        for index in indices:
+            if index not in selection and index not in disabled:
+                selection.add(index)
+                added += weights[index]
+        self._selected_weight += added
+
+    def _deselect(self, indices: Iterable[int]):
+        """移除選取並扣除權重"""
+        selection = self._selection
+        weights = self._weights
+        removed = 0
+        for index in indices:
+            if index in selection:
+                selection.remove(index)
+                removed += weights[index]
+        self._selected_weight -= removed
+
+    def _clear_selection(self):
+        self._selection.clear()
+        self._selected_weight = 0
+        self._range = None
+
+    def _select_range(self, anchor: int, index: int):
+        """
+        以 anchor 到 index 的範圍取代目前的選取
+
+        延伸同一個錨點的範圍時 (拖曳、Shift+方向鍵)，新舊範圍都包含錨點，
+        只需要處理兩端增減的列
+        """
+        last = len(self._items) - 1
+        if last < 0:
+            return
+        anchor = max(0, min(anchor, last))
+        index = max(0, min(index, last))
+        new_low, new_high = min(anchor, index), max(anchor, index)
+        if self._range is not None and self._range[0] == anchor:
+            old_low, old_high = min(anchor, self._range[1]), max(anchor, self._range[1])
+            self._deselect(range(old_low, new_low))
+            self._deselect(range(new_high + 1, old_high + 1))
+            self._select(range(new_low, old_low))
+            self._select(range(old_high + 1, new_high + 1))
+        else:
+            self._clear_selection()
+            self._select(range(new_low, new_high + 1))
+        self._range = (anchor, index)
+        self._schedule_render()
+
+    def see(self, index: int):
+        """捲動到讓該列可見"""
+        if index < self._top:
+            self._scroll_to(index)
+        elif index >= self._top + self._rows:
+            self._scroll_to(index - self._rows + 1)
+
+    # ---- 捲動 (ttk.Scrollbar 的 command) ----
+
+    def yview(self, *args):
+        """捲軸回調: ('moveto', 比例) 或 ('scroll', 數量, 'units' / 'pages')"""
+        if not args:
+            return self._fractions()
+        if args[0] == 'moveto':
+            self._scroll_to(int(float(args[1]) * len(self._items)))
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            self._scroll_by(amount * self._rows if args[2] == 'pages' else amount)
+        return None
+
+    def _fractions(self) -> Tuple[float, float]:
+        """可見範圍佔全部項目的比例"""
+        total = len(self._items)
+        if total <= self._rows:
+            return 0.0, 1.0
+        return self._top / total, min(1.0, (self._top + self._rows) / total)
+
+    def _scroll_to(self, top: int) -> str:
+        top = max(0, min(top, len(self._items) - self._rows))
+        if top != self._top:
+            self._top = top
+            self._render()
+        return "break"
+
+    def _scroll_by(self, rows: int) -> str:
+        return self._scroll_to(self._top + rows)
+
+    def _on_mouse_wheel(self, event) -> str:
+        # Windows 每格 120，macOS 每格 1
+        step = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        return self._scroll_by(-3 * step)
+
+    # ---- 滑鼠與鍵盤 ----
+
+    def _index_at(self, y: int) -> Optional[int]:
+        """畫面座標對應的資料索引 (空白處為 None)"""
+        if not self._items:
+            return None
+        index = self._top + self._listbox.nearest(y)
+        return index if index < len(self._items) else None
+
+    def _on_click(self, event, mode: str) -> str:
+        self._listbox.focus_set()
+        index = self._index_at(event.y)
+        if index is None:
+            return "break"
+        if mode == 'range' and self._anchor is not None:
+            self._select_range(self._anchor, index)
+        elif index not in self._disabled:
+            self._range = None
+            if mode == 'toggle' and index in self._selection:
+                self._deselect((index,))
+            else:
+                if mode != 'toggle':
+                    self._clear_selection()
+                self._select((index,))
+            self._anchor = index
+        self._active = index
+        self._render()
+        self._notify()
+        return "break"
+
+    def _on_drag(self, event) -> str:
+        if self._anchor is None:
+            return "break"
+        # 拖曳到列表外時順便捲動
+        if event.y < 0:
+            self._scroll_by(-1)
+        elif event.y > self._listbox.winfo_height():
+            self._scroll_by(1)
+        index = self._index_at(min(max(event.y, 0), self._listbox.winfo_height()))
+        if index is not None and index != self._active:
+            self._active = index
+            self._select_range(self._anchor, index)
+            self._render()
+            self._notify()
+        return "break"
+
+    def _on_arrow(self, step: int, extend: bool) -> str:
+        if not self._items:
+            return "break"
+        current = self._active if self._active is not None else self._top - step
+        index = max(0, min(current + step, len(self._items) - 1))
+        self._active = index
+        if extend and self._anchor is not None:
+            self._select_range(self._anchor, index)
+        else:
+            self._anchor = index
+            self._clear_selection()
+            self._select((index,))
+        self.see(index)
+        self._render()
+        self._notify()
+        return "break"
+
+    def _on_select_all(self) -> str:
+        self.select_all()
+        self._render()
+        self._notify()
+        return "break"
+
+    def _notify(self):
+        """通知選取已改變"""
+        self.event_generate('<<ListboxSelect>>')
+
+    # ---- 畫面 ----
+
+    def _on_configure(self, event):
+        listbox = self._listbox
+        border = int(listbox.cget('borderwidth')) + int(listbox.cget('highlightthickness'))
+        self._rows = max(1, (event.height - 2 * border) // self._line_height())
+        self._render()
+
+    def _line_height(self) -> int:
+        """每列的高度 (像素，與 tk.Listbox 的計算方式相同: 行距 + 1 + 上下選取框)"""
+        listbox = self._listbox
+        linespace = tkfont.Font(font=listbox.cget('font')).metrics('linespace')
+        return max(1, linespace + 1 + 2 * int(listbox.cget('selectborderwidth')))
+
+    def _schedule_render(self):
+        """合併多次資料變更，在閒置時只重畫一次"""
+        if not self._render_pending:
+            self._render_pending = True
+            self.after_idle(self._render)
+
+    def _render(self):
+        """以目前的捲動位置重新填入可見的列"""
+        self._render_pending = False
+        listbox = self._listbox
+        total = len(self._items)
+        self._top = max(0, min(self._top, total - self._rows))
+        # 多畫一列，讓底部只露出一部分的列也有內容
+        start, end = self._top, min(total, self._top + self._rows + 1)
+        display = self._display
+        items = self._items
+        listbox.delete(0, tk.END)
+        if end > start:
+            listbox.insert(tk.END, *(display.get(index, items[index]) for index in range(start, end)))
+        for row, index in enumerate(range(start, end)):
+            if index in self._selection:
+                listbox.selection_set(row)
+            elif index in self._disabled:
+                listbox.itemconfig(row, background=DISABLED_BACKGROUND, foreground=DISABLED_FOREGROUND,
+                                   selectbackground=DISABLED_BACKGROUND, selectforeground=DISABLED_FOREGROUND)
+        self._scrollbar.set(*self._fractions())
@@ -14,13 +14,23 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from tools.c3b_parser import C3BParser
+from src.scanner.registry import register_scanner
+from src.utils.file_index import FileIndex
+from src.utils.instrumentation import DISABLED
 from src.utils.logger import ScannerLogger
 
 
+@register_scanner
 class C3BScanner:
     """C3B檔案掃描器 - 負責解析.c3b檔案中引用的圖片檔案"""
     
-    def __init__(self, project_path: str, image_types: Set[str], progress_callback=None):
+    SCANNER_NAME = 'c3b'
+    FILE_EXTENSIONS = ('.c3b',)
+    # 模型只引用自身目錄 (含子目錄) 內的貼圖
+    REFERENCE_SCOPE = 'directory'
+    
+    def __init__(self, project_path: str, image_types: Set[str], progress_callback=None,
+                 file_index: Optional[FileIndex] = None):
         """
         初始化C3B掃描器
         
@@ -28,16 +38,23 @@ class C3BScanner:
             project_path: 專案根目錄路徑
             image_types: 要搜尋的圖片類型集合
             progress_callback: 進度回調函數，接收 (current, total, message) 參數
+            file_index: 共用檔案索引，未提供時自行走訪目錄
         """
         self.project_path = Path(project_path)
         self.image_types = image_types
+        self.file_index = file_index
         self.c3b_files = []
         self.results = {}
         self.logger = ScannerLogger()
         self.successful_scans = 0
         self.failed_scans = 0
         self.progress_callback = progress_callback
-        self.c3b_parser = C3BParser()
+        # 取消權杖 (CancellationToken)，由呼叫端設定
+        self.cancel_token = None
+        # 效能統計 (Instrumentation)，由掃描引擎設定
+        self.instrumentation = DISABLED
+        # 解析過程只以 DEBUG 等級記錄，不輸出到 stdout
+        self.c3b_parser = C3BParser(self.logger)
     
     def _report_progress(self, current: int, total: int, message: str):
         """報告進度"""
@@ -68,21 +85,23 @@ class C3BScanner:
             
             # 分析每個C3B檔案
             for i, c3b_file in enumerate(self.c3b_files, 1):
+                if self.cancel_token is not None:
+                    self.cancel_token.checkpoint()
                 try:
                     # 報告當前分析進度
                     progress_msg = f"正在分析C3B檔案: {c3b_file.name}"
                     self._report_progress(i, total_files, progress_msg)
-                    self.logger.info(f"分析C3B檔案 ({i}/{total_files}): {c3b_file.name}")
+                    self.logger.debug("分析C3B檔案 (%d/%d): %s", i, total_files, c3b_file.name)
                     
                     # 解析C3B檔案
                     referenced_images = self._analyze_c3b_file(c3b_file)
                     if referenced_images:
                         self.results[str(c3b_file)] = referenced_images
                         self.successful_scans += 1
-                        self.logger.info(f"成功解析C3B檔案，找到 {len(referenced_images)} 個圖片引用")
+                        self.logger.debug("成功解析C3B檔案，找到 %d 個圖片引用", len(referenced_images))
                     else:
                         self.successful_scans += 1
-                        self.logger.warning(f"C3B檔案解析完成，但未找到圖片引用")
+                        self.logger.debug("C3B檔案解析完成，但未找到圖片引用: %s", c3b_file.name)
                         
                 except Exception as e:
                     self.failed_scans += 1
@@ -108,6 +127,10 @@ class C3BScanner:
         """尋找專案中的所有.c3b檔案"""
         self.c3b_files = []
         
+        if self.file_index is not None:
+            self.c3b_files = [Path(path) for path in self.file_index.files_with_extensions(self.FILE_EXTENSIONS)]
+            return
+        
         try:
             for root, dirs, files in os.walk(self.project_path):
                 for file in files:
@@ -115,7 +138,19 @@ class C3BScanner:
                         file_path = Path(root) / file
                         self.c3b_files.append(file_path)
         except Exception as e:
-            print(f"掃描檔案時發生錯誤: {str(e)}")
+            self.logger.error("掃描檔案時發生錯誤: %s", e)
+    
+    def parse_file(self, file_path: Path) -> List[str]:
+        """
+        解析單一.c3b檔案
+        
+        Args:
+            file_path: 檔案路徑
+            
+        Returns:
+            List[str]: 引用圖片檔案的路徑列表
+        """
+        return self._analyze_c3b_file(Path(file_path))
     
     def _analyze_c3b_file(self, c3b_file_path: Path) -> List[str]:
         """
@@ -132,24 +167,24 @@ class C3BScanner:
         try:
             # 檢查檔案是否存在且可讀
             if not c3b_file_path.exists():
-                print(f"檔案不存在: {c3b_file_path}")
+                self.logger.warning("檔案不存在: %s", c3b_file_path)
                 return referenced_images
             
             if not c3b_file_path.is_file():
-                print(f"不是檔案: {c3b_file_path}")
+                self.logger.warning("不是檔案: %s", c3b_file_path)
                 return referenced_images
             
             # 檢查檔案大小
             file_size = c3b_file_path.stat().st_size
             if file_size > 50 * 1024 * 1024:  # 50MB限制
-                print(f"檔案太大，跳過: {c3b_file_path} ({file_size} bytes)")
+                self.logger.warning("檔案太大，跳過: %s (%d bytes)", c3b_file_path, file_size)
                 return referenced_images
             
             # 使用C3BParser解析檔案
             result = self.c3b_parser.parse_c3b_file(str(c3b_file_path))
             
             if 'error' in result:
-                print(f"解析C3B檔案時發生錯誤: {result['error']}")
+                self.logger.error("解析C3B檔案時發生錯誤: %s", result['error'])
                 return referenced_images
             
             # 提取圖片引用
@@ -169,9 +204,9 @@ class C3BScanner:
             self.c3b_parser.referenced_images.clear()
             
         except PermissionError:
-            print(f"沒有權限讀取檔案: {c3b_file_path}")
+            self.logger.error("沒有權限讀取檔案: %s", c3b_file_path)
         except Exception as e:
-            print(f"解析C3B檔案 {c3b_file_path} 時發生錯誤: {str(e)}")
+            self.logger.error("解析C3B檔案 %s 時發生錯誤: %s", c3b_file_path, e)
         
         return referenced_images
     
@@ -186,6 +221,17 @@ class C3BScanner:
         Returns:
             Optional[str]: 找到的完整路徑，未找到則返回None
         """
+        if self.file_index is not None:
+            if not self.file_index.is_built:
+                # 串流掃描時索引尚未建立完成: 只確認同目錄，其餘交給引用解析器在索引完成後處理
+                same_dir_path = base_path / image_name
+                return str(same_dir_path) if same_dir_path.exists() else None
+            same_dir_path = self.file_index.lookup(str(base_path / image_name))
+            if same_dir_path:
+                return same_dir_path
+            matches = self.file_index.find_by_name(image_name)
+            return matches[0] if matches else None
+        
         # 方法1: 在C3B檔案同一目錄下尋找
         same_dir_path = base_path / image_name
         if same_dir_path.exists():
@@ -207,15 +253,17 @@ class C3BScanner:
         取得掃描統計資訊
         
         Returns:
-            Dict[str, any]: 統計資訊字典
+            Dict[str, any]: 統計資訊字典 (啟用效能統計時包含 parse_ms / read_bytes / parse_us_p90)
         """
         total_files = len(self.c3b_files)
         total_referenced_files = sum(len(files) for files in self.results.values())
         
-        return {
+        statistics = {
             'total_files': total_files,
             'analyzed_files': self.successful_scans,
             'failed_scans': self.failed_scans,
             'total_referenced_files': total_referenced_files,
             'total_c3b_files': len(self.c3b_files)
-        } 
\ No newline at end of file
+        }
+        statistics.update(self.instrumentation.scanner_statistics(self.SCANNER_NAME))
+        return statistics
\ No newline at end of file
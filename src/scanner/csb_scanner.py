@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CSB/CSD檔案掃描器 - 負責解析 Cocos Studio 介面檔案中引用的資源
+
+.csb 為 FlatBuffers 二進位格式，透過 mmap + memoryview 的位移直接走訪表格，
+只解碼路徑字串，不反序列化整棵節點樹。
+.csd 為 XML 格式，使用 iterparse 逐元素處理並即時清除已處理的元素。
+"""
+
+import mmap
+import os
+import struct
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import List, Optional
+
+from src.scanner.registry import ScannerBase, register_scanner
+
+
+_U16 = struct.Struct('<H')
+_U32 = struct.Struct('<I')
+_I32 = struct.Struct('<i')
+
+# CSParseBinary 根表格欄位
+_ROOT_TEXTURES = 1
+_ROOT_TEXTURE_PNGS = 2
+_ROOT_NODE_TREE = 3
+# NodeTree 表格欄位
+_NODE_CHILDREN = 1
+_NODE_OPTIONS = 2
+# Options 表格欄位
+_OPTIONS_DATA = 0
+
+# 元件選項表格的最大巢狀深度 (WidgetOptions -> ResourceData 等)
+_MAX_OPTION_DEPTH = 3
+_MAX_STRING_LENGTH = 1024
+
+# 視為資源引用的副檔名
+_RESOURCE_EXTENSIONS = {
+    '.png', '.jpg', '.jpeg', '.pvr', '.ccz', '.ktx', '.webp', '.tga', '.bmp',
+    '.plist', '.csb', '.csd', '.fnt', '.ttf', '.json', '.atlas', '.skel',
+    '.exportjson', '.tmx', '.mp3', '.ogg', '.wav', '.c3b', '.c3t', '.efk'
+}
+
+
+@register_scanner
+class CSBScanner(ScannerBase):
+    """CSB/CSD檔案掃描器 - 負責解析 Cocos Studio 介面檔案引用的資源"""
+
+    SCANNER_NAME = 'csb'
+    FILE_EXTENSIONS = ('.csb', '.csd')
+
+    def parse_file(self, file_path: Path) -> List[str]:
+        """
+        依副檔名解析單一介面檔案
+
+        Args:
+            file_path: 檔案路徑
+
+        Returns:
+            List[str]: 引用資源的路徑列表
+        """
+        file_path = Path(file_path)
+        extension = file_path.suffix.lower()
+
+        if extension == '.csb':
+            return self._analyze_csb_file(file_path)
+        if extension == '.csd':
+            return self._analyze_csd_file(file_path)
+        return []
+
+    def _analyze_csb_file(self, csb_file_path: Path) -> List[str]:
+        """
+        以 mmap 映射 .csb 檔案並走訪 FlatBuffers 表格
+
+        Args:
+            csb_file_path: CSB檔案路徑
+
+        Returns:
+            List[str]: 引用資源的路徑列表
+        """
+        with open(csb_file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < 8:
+                return []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return _CSBReader(mapped, view).collect_references()
+
+    def _analyze_csd_file(self, csd_file_path: Path) -> List[str]:
+        """
+        以 iterparse 逐元素解析 .csd 檔案，處理完即清除元素以維持固定記憶體用量
+
+        Args:
+            csd_file_path: CSD檔案路徑
+
+        Returns:
+            List[str]: 引用資源的路徑列表
+        """
+        references = []
+        seen = set()
+        depth = 0
+        root = None
+
+        for event, element in ET.iterparse(str(csd_file_path), events=('start', 'end')):
+            if event == 'start':
+                depth += 1
+                if root is None:
+                    root = element
+
+                # FileData / NormalFileData / PressedFileData ... 都以 Type/Path/Plist 屬性描述資源
+                attributes = element.attrib
+                if 'Path' in attributes and attributes.get('Type') != 'Default':
+                    for key in ('Plist', 'Path'):
+                        value = attributes.get(key)
+                        if value and value not in seen:
+                            seen.add(value)
+                            references.append(value)
+                continue
+
+            depth -= 1
+            element.clear()
+            if depth == 1 and root is not None:
+                # 最上層的子元素結束時一併釋放根節點持有的參考
+                root.clear()
+
+        return references
+
+
+class _CSBReader:
+    """FlatBuffers 讀取器 - 只透過位移存取，不複製緩衝區"""
+
+    def __init__(self, buffer, view: memoryview):
+        """
+        Args:
+            buffer: 支援 rfind 的原始緩衝區 (mmap 或 bytes)
+            view: 同一緩衝區的 memoryview
+        """
+        self.buffer = buffer
+        self.view = view
+        self.size = len(view)
+        self.references = []
+        self._seen = set()
+
+    def collect_references(self) -> List[str]:
+        """走訪根表格、紋理列表與節點樹，收集資源路徑"""
+        root = self._read_offset(0)
+        if root is None or not self._is_table(root):
+            raise ValueError("不是有效的CSB檔案")
+
+        for field in (_ROOT_TEXTURES, _ROOT_TEXTURE_PNGS):
+            vector = self._field_offset(root, field)
+            if vector is not None:
+                for element in self._vector_offsets(vector):
+                    self._add_string(element)
+
+        node_tree = self._field_offset(root, _ROOT_NODE_TREE)
+        if node_tree is not None:
+            self._walk_node_tree(node_tree)
+
+        return self.references
+
+    def _walk_node_tree(self, node_tree: int):
+        """以堆疊走訪節點樹 (避免深層 UI 造成遞迴過深)"""
+        pending = [node_tree]
+        visited = set()
+
+        while pending:
+            node = pending.pop()
+            if node in visited or not self._is_table(node):
+                continue
+            visited.add(node)
+
+            options = self._field_offset(node, _NODE_OPTIONS)
+            if options is not None and self._is_table(options):
+                data = self._field_offset(options, _OPTIONS_DATA)
+                if data is not None:
+                    self._collect_option_strings(data, _MAX_OPTION_DEPTH, set())
+
+            children = self._field_offset(node, _NODE_CHILDREN)
+            if children is not None:
+                pending.extend(self._vector_offsets(children))
+
+    def _collect_option_strings(self, table: int, depth: int, visited: set):
+        """
+        在元件選項表格中尋找資源路徑
+
+        各元件的選項表格結構不同 (SpriteOptions、ButtonOptions...)，
+        因此逐一檢查欄位：指向路徑字串的收集起來，指向子表格 (ResourceData 等) 的繼續往下找
+        """
+        if depth <= 0 or table in visited or not self._is_table(table):
+            return
+        visited.add(table)
+
+        vtable = table - _I32.unpack_from(self.view, table)[0]
+        field_count = (_U16.unpack_from(self.view, vtable)[0] - 4) // 2
+
+        for field in range(field_count):
+            target = self._field_offset(table, field, vtable)
+            if target is None:
+                continue
+            # 字串與表格的格式可能互相誤判，兩者都檢查以免漏掉引用
+            self._add_string(target)
+            self._collect_option_strings(target, depth - 1, visited)
+
+    def _field_offset(self, table: int, field: int, vtable: Optional[int] = None) -> Optional[int]:
+        """讀取表格中 offset 類型欄位指向的位置"""
+        if vtable is None:
+            vtable = table - _I32.unpack_from(self.view, table)[0]
+        vtable_size = _U16.unpack_from(self.view, vtable)[0]
+        slot = 4 + field * 2
+        if slot + 2 > vtable_size:
+            return None
+        field_pos = _U16.unpack_from(self.view, vtable + slot)[0]
+        if field_pos == 0:
+            return None
+        return self._read_offset(table + field_pos)
+
+    def _read_offset(self, position: int) -> Optional[int]:
+        """讀取 uoffset 並轉換為絕對位置"""
+        if position < 0 or position + 4 > self.size:
+            return None
+        offset = _U32.unpack_from(self.view, position)[0]
+        target = position + offset
+        if offset == 0 or target + 4 > self.size:
+            return None
+        return target
+
+    def _vector_offsets(self, vector: int) -> List[int]:
+        """取得 offset 向量中每個元素指向的位置"""
+        length = _U32.unpack_from(self.view, vector)[0]
+        if vector + 4 + length * 4 > self.size:
+            return []
+        offsets = []
+        for index in range(length):
+            target = self._read_offset(vector + 4 + index * 4)
+            if target is not None:
+                offsets.append(target)
+        return offsets
+
+    def _is_table(self, position: int) -> bool:
+        """檢查位置是否為合理的 FlatBuffers 表格"""
+        if position < 0 or position + 4 > self.size or position % 4:
+            return False
+        vtable = position - _I32.unpack_from(self.view, position)[0]
+        if vtable < 0 or vtable + 4 > self.size or vtable % 2:
+            return False
+        vtable_size, object_size = _U16.unpack_from(self.view, vtable)[0], _U16.unpack_from(self.view, vtable + 2)[0]
+        return (4 <= vtable_size <= 512 and vtable_size % 2 == 0
+                and vtable + vtable_size <= self.size
+                and 4 <= object_size and position + object_size <= self.size)
+
+    def _add_string(self, position: int) -> bool:
+        """若位置是資源路徑字串則收集，返回是否為有效字串"""
+        if position % 4 or position + 4 > self.size:
+            return False
+        length = _U32.unpack_from(self.view, position)[0]
+        start = position + 4
+        end = start + length
+        if not 0 < length <= _MAX_STRING_LENGTH or end >= self.size or self.view[end] != 0:
+            return False
+
+        # 先在原始緩衝區上找副檔名，確認是路徑後才解碼
+        dot = self.buffer.rfind(b'.', start, end)
+        if dot < 0 or end - dot > 12:
+            return True
+        try:
+            value = str(self.view[start:end], 'utf-8')
+        except UnicodeDecodeError:
+            return False
+
+        if os.path.splitext(value)[1].lower() in _RESOURCE_EXTENSIONS and value not in self._seen:
+            self._seen.add(value)
+            self.references.append(value)
+        return True
@@ -1,15 +1,56 @@
 import os
 import re
 from pathlib import Path
-from typing import Dict, List, Set, Optional
+from typing import Dict, Iterable, List, Set, Optional
 import struct
+from src.scanner.registry import register_scanner
+from src.utils.file_index import FileIndex
+from src.utils.instrumentation import DISABLED
 from src.utils.logger import ScannerLogger
 
 
+# 字串中包含這些副檔名才會進一步提取檔案路徑
+EFK_STRING_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.tga', '.dds', '.bmp', '.efk', '.efkmat', '.efkmodel')
+EFKMODEL_STRING_EXTENSIONS = EFK_STRING_EXTENSIONS + ('.obj', '.fbx', '.3ds', '.dae')
+
+# 長度欄位讀取器 (unpack_from 直接讀取緩衝區，不需要先切出 4 bytes 的副本)
+_UINT32 = struct.Struct('<I')
+# 連續 4 個以上的可列印 ASCII 字元
+_ASCII_RUN = re.compile(rb'[\x20-\x7e]{4,}')
+
+
+class StringSpan:
+    """檔案中的一段字串 (以 __slots__ 保存，不為每個候選字串建立字典)"""
+    
+    __slots__ = ('position', 'length', 'string')
+    
+    def __init__(self, position: int, length: int, string: str):
+        """
+        初始化字串片段
+        
+        Args:
+            position: 字串 (含長度欄位) 在檔案中的起始位置
+            length: 字元數
+            string: 解碼後的字串
+        """
+        self.position = position
+        self.length = length
+        self.string = string
+
+
+@register_scanner
 class EFKScanner:
     """EFK檔案掃描器 - 負責解析.efk、.efkmat、.efkmodel檔案中的引用檔案"""
     
-    def __init__(self, project_path: str, image_types: Set[str], progress_callback=None):
+    SCANNER_NAME = 'efk'
+    FILE_EXTENSIONS = ('.efk', '.efkmat', '.efkmodel')
+    # 特效只引用自身目錄 (含子目錄) 內的資源
+    REFERENCE_SCOPE = 'directory'
+    # 除圖片外，材質與模型檔也是可被判定為未使用的目標
+    TARGET_EXTENSIONS = ('.efkmat', '.efkmodel')
+    
+    def __init__(self, project_path: str, image_types: Set[str], progress_callback=None,
+                 file_index: Optional[FileIndex] = None):
         """
         初始化EFK掃描器
         
@@ -17,9 +58,11 @@ class EFKScanner:
             project_path: 專案根目錄路徑
             image_types: 要搜尋的圖片類型集合
             progress_callback: 進度回調函數，接收 (current, total, message) 參數
+            file_index: 共用檔案索引，未提供時自行走訪目錄
         """
         self.project_path = Path(project_path)
         self.image_types = image_types
+        self.file_index = file_index
         self.efk_files = []
         self.efkmat_files = []
         self.efkmodel_files = []
@@ -28,6 +71,10 @@ class EFKScanner:
         self.successful_scans = 0
         self.failed_scans = 0
         self.progress_callback = progress_callback
+        # 取消權杖 (CancellationToken)，由呼叫端設定
+        self.cancel_token = None
+        # 效能統計 (Instrumentation)，由掃描引擎設定
+        self.instrumentation = DISABLED
     
     def _report_progress(self, current: int, total: int, message: str):
         """報告進度"""
@@ -61,21 +108,23 @@ class EFKScanner:
             
             # 分析每個EFK檔案
             for i, efk_file in enumerate(self.efk_files, 1):
+                if self.cancel_token is not None:
+                    self.cancel_token.checkpoint()
                 current_file_count += 1
                 try:
                     # 報告當前分析進度
                     progress_msg = f"正在分析EFK檔案: {efk_file.name}"
                     self._report_progress(current_file_count, total_files, progress_msg)
-                    self.logger.info(f"分析EFK檔案 ({current_file_count}/{total_files}): {efk_file.name}")
+                    self.logger.debug("分析EFK檔案 (%d/%d): %s", current_file_count, total_files, efk_file.name)
                     
                     referenced_files = self._analyze_efk_file(efk_file)
                     if referenced_files:
                         self.results[str(efk_file)] = referenced_files
                         self.successful_scans += 1
-                        self.logger.info(f"成功解析EFK檔案，找到 {len(referenced_files)} 個引用")
+                        self.logger.debug("成功解析EFK檔案，找到 %d 個引用", len(referenced_files))
                     else:
                         self.successful_scans += 1
-                        self.logger.warning(f"EFK檔案解析完成，但未找到引用")
+                        self.logger.debug("EFK檔案解析完成，但未找到引用: %s", efk_file.name)
                 except Exception as e:
                     self.failed_scans += 1
                     error_msg = str(e)
@@ -85,21 +134,23 @@ class EFKScanner:
             
             # 分析每個EFKMAT檔案
             for i, efkmat_file in enumerate(self.efkmat_files, 1):
+                if self.cancel_token is not None:
+                    self.cancel_token.checkpoint()
                 current_file_count += 1
                 try:
                     # 報告當前分析進度
                     progress_msg = f"正在分析EFKMAT檔案: {efkmat_file.name}"
                     self._report_progress(current_file_count, total_files, progress_msg)
-                    self.logger.info(f"分析EFKMAT檔案 ({current_file_count}/{total_files}): {efkmat_file.name}")
+                    self.logger.debug("分析EFKMAT檔案 (%d/%d): %s", current_file_count, total_files, efkmat_file.name)
                     
                     referenced_files = self._analyze_efkmat_file(efkmat_file)
                     if referenced_files:
                         self.results[str(efkmat_file)] = referenced_files
                         self.successful_scans += 1
-                        self.logger.info(f"成功解析EFKMAT檔案，找到 {len(referenced_files)} 個引用")
+                        self.logger.debug("成功解析EFKMAT檔案，找到 %d 個引用", len(referenced_files))
                     else:
                         self.successful_scans += 1
-                        self.logger.warning(f"EFKMAT檔案解析完成，但未找到引用")
+                        self.logger.debug("EFKMAT檔案解析完成，但未找到引用: %s", efkmat_file.name)
                 except Exception as e:
                     self.failed_scans += 1
                     error_msg = str(e)
@@ -109,21 +160,23 @@ class EFKScanner:
             
             # 分析每個EFKMODEL檔案
             for i, efkmodel_file in enumerate(self.efkmodel_files, 1):
+                if self.cancel_token is not None:
+                    self.cancel_token.checkpoint()
                 current_file_count += 1
                 try:
                     # 報告當前分析進度
                     progress_msg = f"正在分析EFKMODEL檔案: {efkmodel_file.name}"
                     self._report_progress(current_file_count, total_files, progress_msg)
-                    self.logger.info(f"分析EFKMODEL檔案 ({current_file_count}/{total_files}): {efkmodel_file.name}")
+                    self.logger.debug("分析EFKMODEL檔案 (%d/%d): %s", current_file_count, total_files, efkmodel_file.name)
                     
                     referenced_files = self._analyze_efkmodel_file(efkmodel_file)
                     if referenced_files:
                         self.results[str(efkmodel_file)] = referenced_files
                         self.successful_scans += 1
-                        self.logger.info(f"成功解析EFKMODEL檔案，找到 {len(referenced_files)} 個引用")
+                        self.logger.debug("成功解析EFKMODEL檔案，找到 %d 個引用", len(referenced_files))
                     else:
                         self.successful_scans += 1
-                        self.logger.warning(f"EFKMODEL檔案解析完成，但未找到引用")
+                        self.logger.debug("EFKMODEL檔案解析完成，但未找到引用: %s", efkmodel_file.name)
                 except Exception as e:
                     self.failed_scans += 1
                     error_msg = str(e)
@@ -150,6 +203,12 @@ class EFKScanner:
         self.efkmat_files = []
         self.efkmodel_files = []
         
+        if self.file_index is not None:
+            self.efk_files = [Path(path) for path in self.file_index.files_with_extensions(['.efk'])]
+            self.efkmat_files = [Path(path) for path in self.file_index.files_with_extensions(['.efkmat'])]
+            self.efkmodel_files = [Path(path) for path in self.file_index.files_with_extensions(['.efkmodel'])]
+            return
+        
         try:
             for root, dirs, files in os.walk(self.project_path):
                 for file in files:
@@ -163,10 +222,31 @@ class EFKScanner:
                     elif file_lower.endswith('.efkmodel'):
                         self.efkmodel_files.append(file_path)
         except Exception as e:
-            print(f"掃描檔案時發生錯誤: {str(e)}")
+            self.logger.error("掃描檔案時發生錯誤: %s", e)
             # 確保即使出錯也能返回已找到的檔案
             pass
     
+    def parse_file(self, file_path: Path) -> List[str]:
+        """
+        依副檔名解析單一EFK相關檔案
+        
+        Args:
+            file_path: 檔案路徑
+            
+        Returns:
+            List[str]: 引用檔案的路徑列表
+        """
+        file_path = Path(file_path)
+        extension = file_path.suffix.lower()
+        
+        if extension == '.efk':
+            return self._analyze_efk_file(file_path)
+        if extension == '.efkmat':
+            return self._analyze_efkmat_file(file_path)
+        if extension == '.efkmodel':
+            return self._analyze_efkmodel_file(file_path)
+        return []
+    
     def _analyze_efk_file(self, efk_file_path: Path) -> List[str]:
         """
         分析單個EFK檔案中的引用檔案
@@ -182,17 +262,17 @@ class EFKScanner:
         try:
             # 檢查檔案是否存在且可讀
             if not efk_file_path.exists():
-                print(f"檔案不存在: {efk_file_path}")
+                self.logger.warning("檔案不存在: %s", efk_file_path)
                 return referenced_files
             
             if not efk_file_path.is_file():
-                print(f"不是檔案: {efk_file_path}")
+                self.logger.warning("不是檔案: %s", efk_file_path)
                 return referenced_files
             
             # 檢查檔案大小
             file_size = efk_file_path.stat().st_size
             if file_size > 10 * 1024 * 1024:  # 10MB限制
-                print(f"檔案太大，跳過: {efk_file_path} ({file_size} bytes)")
+                self.logger.warning("檔案太大，跳過: %s (%d bytes)", efk_file_path, file_size)
                 return referenced_files
             
             # 讀取EFK檔案內容
@@ -203,13 +283,10 @@ class EFKScanner:
             referenced_files = self._parse_efk_content(content, efk_file_path)
             
         except PermissionError:
-            print(f"沒有權限讀取檔案: {efk_file_path}")
+            self.logger.error("沒有權限讀取檔案: %s", efk_file_path)
         except Exception as e:
             # 使用更安全的錯誤處理
-            try:
-                print(f"解析EFK檔案 {efk_file_path} 時發生錯誤: {str(e)}")
-            except Exception:
-                print(f"解析EFK檔案時發生未知錯誤")
+            self.logger.error("解析EFK檔案 %s 時發生錯誤: %s", efk_file_path, e)
         
         return referenced_files
     
@@ -228,17 +305,17 @@ class EFKScanner:
         try:
             # 檢查檔案是否存在且可讀
             if not efkmat_file_path.exists():
-                print(f"檔案不存在: {efkmat_file_path}")
+                self.logger.warning("檔案不存在: %s", efkmat_file_path)
                 return referenced_files
             
             if not efkmat_file_path.is_file():
-                print(f"不是檔案: {efkmat_file_path}")
+                self.logger.warning("不是檔案: %s", efkmat_file_path)
                 return referenced_files
             
             # 檢查檔案大小
             file_size = efkmat_file_path.stat().st_size
             if file_size > 10 * 1024 * 1024:  # 10MB限制
-                print(f"檔案太大，跳過: {efkmat_file_path} ({file_size} bytes)")
+                self.logger.warning("檔案太大，跳過: %s (%d bytes)", efkmat_file_path, file_size)
                 return referenced_files
             
             # 讀取EFKMAT檔案內容
@@ -249,13 +326,10 @@ class EFKScanner:
             referenced_files = self._parse_efkmat_content(content, efkmat_file_path)
             
         except PermissionError:
-            print(f"沒有權限讀取檔案: {efkmat_file_path}")
+            self.logger.error("沒有權限讀取檔案: %s", efkmat_file_path)
         except Exception as e:
             # 使用更安全的錯誤處理
-            try:
-                print(f"解析EFKMAT檔案 {efkmat_file_path} 時發生錯誤: {str(e)}")
-            except Exception:
-                print(f"解析EFKMAT檔案時發生未知錯誤")
+            self.logger.error("解析EFKMAT檔案 %s 時發生錯誤: %s", efkmat_file_path, e)
         
         return referenced_files
     
@@ -274,17 +348,17 @@ class EFKScanner:
         try:
             # 檢查檔案是否存在且可讀
             if not efkmodel_file_path.exists():
-                print(f"檔案不存在: {efkmodel_file_path}")
+                self.logger.warning("檔案不存在: %s", efkmodel_file_path)
                 return referenced_files
             
             if not efkmodel_file_path.is_file():
-                print(f"不是檔案: {efkmodel_file_path}")
+                self.logger.warning("不是檔案: %s", efkmodel_file_path)
                 return referenced_files
             
             # 檢查檔案大小
             file_size = efkmodel_file_path.stat().st_size
             if file_size > 10 * 1024 * 1024:  # 10MB限制
-                print(f"檔案太大，跳過: {efkmodel_file_path} ({file_size} bytes)")
+                self.logger.warning("檔案太大，跳過: %s (%d bytes)", efkmodel_file_path, file_size)
                 return referenced_files
             
             # 讀取EFKMODEL檔案內容
@@ -295,13 +369,10 @@ class EFKScanner:
             referenced_files = self._parse_efkmodel_content(content, efkmodel_file_path)
             
         except PermissionError:
-            print(f"沒有權限讀取檔案: {efkmodel_file_path}")
+            self.logger.error("沒有權限讀取檔案: %s", efkmodel_file_path)
         except Exception as e:
             # 使用更安全的錯誤處理
-            try:
-                print(f"解析EFKMODEL檔案 {efkmodel_file_path} 時發生錯誤: {str(e)}")
-            except Exception:
-                print(f"解析EFKMODEL檔案時發生未知錯誤")
+            self.logger.error("解析EFKMODEL檔案 %s 時發生錯誤: %s", efkmodel_file_path, e)
         
         return referenced_files
     
@@ -320,18 +391,12 @@ class EFKScanner:
         
         # 使用精確的EFK解析邏輯
         try:
-            # 解析UTF-16字串
-            strings = self._parse_utf16_strings(content)
+            # 解析UTF-16字串 (只保留包含檔案副檔名的字串)
+            strings = self._parse_utf16_strings(content, EFK_STRING_EXTENSIONS)
             
-            # 從字串中提取檔案路徑
-            for string_info in strings:
-                string = string_info['string']
-                
-                # 檢查是否包含檔案路徑
-                if any(ext in string.lower() for ext in ['.png', '.jpg', '.jpeg', '.tga', '.dds', '.bmp', '.efk', '.efkmat', '.efkmodel']):
-                    # 提取個別檔案路徑
-                    individual_paths = self._extract_file_paths_from_string(string)
-                    referenced_files.extend(individual_paths)
+            # 從字串中提取個別檔案路徑
+            for span in strings:
+                referenced_files.extend(self._extract_file_paths_from_string(span.string))
             
             # 移除重複
             referenced_files = list(set(referenced_files))
@@ -356,18 +421,12 @@ class EFKScanner:
         
         try:
             # 嘗試多種解析方法
-            # 方法1: 解析UTF-16字串
-            strings = self._parse_utf16_strings(content)
+            # 方法1: 解析UTF-16字串 (只保留包含檔案副檔名的字串)
+            strings = self._parse_utf16_strings(content, EFK_STRING_EXTENSIONS)
             
-            # 從字串中提取檔案路徑
-            for string_info in strings:
-                string = string_info['string']
-                
-                # 檢查是否包含檔案路徑
-                if any(ext in string.lower() for ext in ['.png', '.jpg', '.jpeg', '.tga', '.dds', '.bmp', '.efk', '.efkmat', '.efkmodel']):
-                    # 提取個別檔案路徑
-                    individual_paths = self._extract_file_paths_from_string(string)
-                    referenced_files.extend(individual_paths)
+            # 從字串中提取個別檔案路徑
+            for span in strings:
+                referenced_files.extend(self._extract_file_paths_from_string(span.string))
             
             # 方法2: 搜尋二進制模式
             binary_patterns = self._search_binary_patterns(content, efkmat_file_path)
@@ -395,18 +454,12 @@ class EFKScanner:
         referenced_files = []
         
         try:
-            # 方法1: 改進的UTF-16字串解析
-            strings = self._parse_utf16_strings(content)
+            # 方法1: 改進的UTF-16字串解析 (只保留包含檔案副檔名的字串)
+            strings = self._parse_utf16_strings(content, EFKMODEL_STRING_EXTENSIONS)
             
-            # 從字串中提取檔案路徑
-            for string_info in strings:
-                string = string_info['string']
-                
-                # 檢查是否包含檔案路徑
-                if any(ext in string.lower() for ext in ['.png', '.jpg', '.jpeg', '.tga', '.dds', '.bmp', '.efk', '.efkmat', '.efkmodel', '.obj', '.fbx', '.3ds', '.dae']):
-                    # 提取個別檔案路徑
-                    individual_paths = self._extract_file_paths_from_string(string)
-                    referenced_files.extend(individual_paths)
+            # 從字串中提取個別檔案路徑
+            for span in strings:
+                referenced_files.extend(self._extract_file_paths_from_string(span.string))
             
             # 方法2: 改進的二進制模式搜尋
             binary_patterns = self._search_binary_patterns_improved(content, efkmodel_file_path)
@@ -424,40 +477,54 @@ class EFKScanner:
         
         return referenced_files
     
-    def _parse_utf16_strings(self, content: bytes) -> List[Dict[str, any]]:
+    def _parse_utf16_strings(self, content: bytes,
+                             extensions: Optional[Iterable[str]] = None) -> List[StringSpan]:
         """
         解析檔案中的UTF-16字串
         
+        候選字串在加入時就去除重複並以副檔名過濾，
+        只有第一次出現且通過過濾的字串才會建立 StringSpan；
+        所有探測都直接讀取 memoryview，只有長度合理的片段才會被解碼
+        
         Args:
             content: 檔案的二進制內容
+            extensions: 字串 (小寫) 必須包含其中一個副檔名才會保留；None 代表保留所有字串
             
         Returns:
-            List[Dict[str, any]]: 字串資訊列表
+            List[StringSpan]: 不重複的字串片段列表 (依找到的順序)
         """
         strings = []
+        seen_strings = set()
+        extensions = tuple(extensions) if extensions is not None else None
+        view = memoryview(content)
+        size = len(content)
+        read_uint32 = _UINT32.unpack_from
+        
+        def add_string(position: int, length: int, string: str):
+            """去除重複與過短的字串，並只保留包含指定副檔名的字串"""
+            if len(string) <= 2 or string in seen_strings:
+                return
+            seen_strings.add(string)
+            if extensions is not None:
+                lowered = string.lower()
+                if not any(ext in lowered for ext in extensions):
+                    return
+            strings.append(StringSpan(position, length, string))
         
         # 方法1: 標準UTF-16字串解析
         pos = 4  # 跳過檔案頭（4 bytes）
         
-        while pos < len(content):
+        while pos < size:
             # 嘗試讀取長度
-            if pos + 4 <= len(content):
+            if pos + 4 <= size:
                 try:
-                    length = struct.unpack('<I', content[pos:pos+4])[0]
+                    length = read_uint32(view, pos)[0]
                     
                     # 檢查長度是否合理
-                    if 0 < length < 1000 and pos + 4 + length * 2 <= len(content):
-                        # 讀取UTF-16字串
-                        string_data = content[pos+4:pos+4+length*2]
-                        
+                    if 0 < length < 1000 and pos + 4 + length * 2 <= size:
                         try:
                             # 嘗試UTF-16LE解碼
-                            string = string_data.decode('utf-16le')
-                            strings.append({
-                                'position': pos,
-                                'length': length,
-                                'string': string
-                            })
+                            add_string(pos, length, str(view[pos+4:pos+4+length*2], 'utf-16le'))
                             
                             # 移動到下一個位置
                             pos += 4 + length * 2
@@ -471,81 +538,33 @@ class EFKScanner:
         
         # 方法2: 改進的UTF-16字串搜尋
         # 搜尋可能的UTF-16字串模式
-        for i in range(0, len(content) - 4, 2):  # 每2字節檢查一次
+        for i in range(0, size - 4, 2):  # 每2字節檢查一次
             try:
                 # 嘗試讀取長度
-                if i + 4 <= len(content):
-                    length = struct.unpack('<I', content[i:i+4])[0]
+                length = read_uint32(view, i)[0]
+                
+                if 0 < length < 500 and i + 4 + length * 2 <= size:
+                    # 字串數據 (memoryview 切片，不複製內容)
+                    string_data = view[i+4:i+4+length*2]
                     
-                    if 0 < length < 500 and i + 4 + length * 2 <= len(content):
-                        # 讀取字串數據
-                        string_data = content[i+4:i+4+length*2]
-                        
-                        # 嘗試不同的UTF-16編碼
-                        for encoding in ['utf-16le', 'utf-16be']:
-                            try:
-                                string = string_data.decode(encoding)
-                                if any(char.isprintable() for char in string):
-                                    strings.append({
-                                        'position': i,
-                                        'length': length,
-                                        'string': string
-                                    })
-                                    break
-                            except:
-                                continue
+                    # 嘗試不同的UTF-16編碼
+                    for encoding in ('utf-16le', 'utf-16be'):
+                        try:
+                            string = str(string_data, encoding)
+                            if any(char.isprintable() for char in string):
+                                add_string(i, length, string)
+                                break
+                        except:
+                            continue
             except:
                 continue
         
         # 方法3: 直接搜尋可讀字符串
-        # 搜尋連續的可打印字符
-        current_string = ""
-        string_start = 0
-        
-        for i in range(len(content)):
-            try:
-                char = content[i:i+1].decode('ascii')
-                if char.isprintable():
-                    if not current_string:
-                        string_start = i
-                    current_string += char
-                else:
-                    if len(current_string) > 3:  # 至少3個字符
-                        strings.append({
-                            'position': string_start,
-                            'length': len(current_string),
-                            'string': current_string
-                        })
-                    current_string = ""
-            except:
-                if current_string:
-                    if len(current_string) > 3:
-                        strings.append({
-                            'position': string_start,
-                            'length': len(current_string),
-                            'string': current_string
-                        })
-                    current_string = ""
-        
-        # 處理最後一個字符串
-        if len(current_string) > 3:
-            strings.append({
-                'position': string_start,
-                'length': len(current_string),
-                'string': current_string
-            })
-        
-        # 移除重複的字符串
-        unique_strings = []
-        seen_strings = set()
-        
-        for string_info in strings:
-            string = string_info['string']
-            if string not in seen_strings and len(string) > 2:
-                unique_strings.append(string_info)
-                seen_strings.add(string)
+        # 搜尋連續 4 個以上的可打印 ASCII 字符 (以正規表示式一次找出，只解碼找到的片段)
+        for match in _ASCII_RUN.finditer(content):
+            add_string(match.start(), match.end() - match.start(), match.group().decode('ascii'))
         
-        return unique_strings
+        return strings
     
     def _extract_file_paths_from_string(self, combined_string: str) -> List[str]:
         """
@@ -763,24 +782,26 @@ class EFKScanner:
         references = []
         
         try:
-            # 搜尋可能的字符串塊
+            # 搜尋可能的字符串塊 (直接讀取 memoryview，只解碼長度合理的片段)
+            view = memoryview(content)
+            size = len(content)
             pos = 0
-            while pos < len(content):
+            while pos < size:
                 # 尋找可能的字符串開始
-                if pos + 4 <= len(content):
+                if pos + 4 <= size:
                     try:
-                        length = struct.unpack('<I', content[pos:pos+4])[0]
-                        if 0 < length < 1000 and pos + 4 + length <= len(content):
+                        length = _UINT32.unpack_from(view, pos)[0]
+                        if 0 < length < 1000 and pos + 4 + length <= size:
                             # 嘗試解析為字符串
-                            string_data = content[pos+4:pos+4+length]
+                            string_data = view[pos+4:pos+4+length]
                             try:
                                 # 嘗試不同的編碼
-                                for encoding in ['utf-8', 'utf-16le', 'ascii']:
+                                for encoding in ('utf-8', 'utf-16le', 'ascii'):
                                     try:
-                                        string = string_data.decode(encoding)
+                                        string = str(string_data, encoding)
                                         if any(char.isprintable() for char in string):
                                             # 檢查是否包含檔案路徑
-                                            if any(ext in string.lower() for ext in ['.png', '.jpg', '.jpeg', '.tga', '.dds', '.bmp', '.efk', '.efkmat', '.efkmodel', '.obj', '.fbx', '.3ds', '.dae']):
+                                            if any(ext in string.lower() for ext in EFKMODEL_STRING_EXTENSIONS):
                                                 # 提取檔案路徑
                                                 individual_paths = self._extract_file_paths_from_string(string)
                                                 references.extend(individual_paths)
@@ -867,15 +888,17 @@ class EFKScanner:
         取得掃描統計資訊
         
         Returns:
-            Dict[str, int]: 統計資訊字典
+            Dict[str, int]: 統計資訊字典 (啟用效能統計時包含 parse_ms / read_bytes / parse_us_p90)
         """
         total_referenced_files = sum(len(files) for files in self.results.values())
         
-        return {
+        statistics = {
             'total_efk_files': len(self.efk_files),
             'total_efkmat_files': len(self.efkmat_files),
             'total_efkmodel_files': len(self.efkmodel_files),
             'analyzed_efk_files': self.successful_scans,
             'total_referenced_files': total_referenced_files,
             'failed_scans': self.failed_scans
-        } 
\ No newline at end of file
+        }
+        statistics.update(self.instrumentation.scanner_statistics(self.SCANNER_NAME))
+        return statistics
\ No newline at end of file
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FNT檔案掃描器 - 負責解析 BMFont 點陣字型 .fnt 檔案引用的頁面圖片
+
+支援文字格式 (page id=0 file="font.png")、XML 格式 (<page id="0" file="font.png"/>)
+以及二進位格式 (BMF\\x03)。
+"""
+
+import os
+import re
+import struct
+from pathlib import Path
+from typing import List
+
+from src.scanner.registry import ScannerBase, register_scanner
+
+
+# 文字 / XML 格式的頁面定義
+_PAGE_RE = re.compile(rb'\bpage\b[^\r\n]*?\bfile\s*=\s*"([^"\r\n]+)"')
+# 頁面定義一定出現在字元定義之前，讀到這些行即可停止
+_CHARS_PREFIXES = (b'chars', b'char ', b'<chars', b'kernings', b'<kernings')
+
+_BINARY_MAGIC = b'BMF'
+_BINARY_PAGES_BLOCK = 3
+_BLOCK_HEADER = struct.Struct('<BI')
+
+
+@register_scanner
+class FntScanner(ScannerBase):
+    """FNT檔案掃描器 - 負責解析點陣字型 .fnt 引用的頁面圖片"""
+
+    SCANNER_NAME = 'fnt'
+    FILE_EXTENSIONS = ('.fnt',)
+
+    def parse_file(self, file_path: Path) -> List[str]:
+        """
+        解析單一.fnt檔案
+
+        Args:
+            file_path: 檔案路徑
+
+        Returns:
+            List[str]: 頁面圖片路徑列表
+        """
+        with open(file_path, 'rb') as f:
+            if f.read(3) == _BINARY_MAGIC:
+                return self._parse_binary_pages(f)
+            f.seek(0)
+            return self._parse_text_pages(f)
+
+    def _parse_text_pages(self, stream) -> List[str]:
+        """逐行讀取文字 / XML 格式的 page 定義，遇到字元區段即停止"""
+        pages = []
+        for line in stream:
+            stripped = line.lstrip()
+            if stripped.startswith(_CHARS_PREFIXES):
+                break
+            match = _PAGE_RE.search(stripped)
+            if match:
+                page = match.group(1).decode('utf-8', errors='replace')
+                if page not in pages:
+                    pages.append(page)
+        return pages
+
+    def _parse_binary_pages(self, stream) -> List[str]:
+        """依區塊標頭跳躍讀取二進位格式的 pages 區塊"""
+        stream.seek(4)  # 'BMF' + 版本
+        while True:
+            header = stream.read(_BLOCK_HEADER.size)
+            if len(header) < _BLOCK_HEADER.size:
+                return []
+            block_type, block_size = _BLOCK_HEADER.unpack(header)
+            if block_type == _BINARY_PAGES_BLOCK:
+                data = stream.read(block_size)
+                return [
+                    name.decode('utf-8', errors='replace')
+                    for name in data.split(b'\x00') if name
+                ]
+            stream.seek(block_size, os.SEEK_CUR)
+
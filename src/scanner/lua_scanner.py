@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Lua檔案掃描器 - 讓掃描引擎以與其他掃描器相同的介面解析 .lua 檔案
+
+實際的字串擷取由 LuaAnalyzer 負責；Lua 程式以檔名引用圖片 (搜尋路徑由執行期決定)，
+因此引用以檔名比對，所有同名檔案都視為被引用。
+可達性分析時 Lua 入口腳本就是根檔案: 掃描引擎會呼叫 enable_asset_references，
+改為擷取所有資源副檔名 (.efk / .csb / .plist / .json ...) 的字串常值，
+並把 require("a.b") 當作 a/b.lua 的引用，讓走訪能從入口腳本延伸到其他腳本與它們載入的資源。
+"""
+
+from pathlib import Path
+from typing import Iterable, List, Optional, Set
+
+from src.scanner.registry import ScannerBase, register_scanner
+from src.utils.file_index import FileIndex
+from src.utils.lua_analyzer import LuaAnalyzer
+
+
+@register_scanner
+class LuaScanner(ScannerBase):
+    """Lua檔案掃描器 - 擷取Lua程式碼中引號內的圖片路徑"""
+
+    SCANNER_NAME = 'lua'
+    FILE_EXTENSIONS = ('.lua',)
+    REFERENCE_SCOPE = 'name'
+    CODE_SCANNER = True
+
+    def __init__(self, project_path: str, image_types: Set[str], file_index: Optional[FileIndex] = None):
+        """
+        初始化Lua掃描器
+
+        Args:
+            project_path: 專案根目錄路徑
+            image_types: 要搜尋的圖片類型集合
+            file_index: 共用檔案索引 (由掃描引擎設定)
+        """
+        super().__init__(project_path, image_types, file_index)
+        self.analyzer = LuaAnalyzer(str(project_path))
+        # 擷取字串常值的副檔名與是否追蹤 require (預設只擷取圖片)
+        self.reference_extensions: Set[str] = set(self.analyzer.image_extensions)
+        self.follow_requires = False
+
+    def enable_asset_references(self, extensions: Iterable[str]):
+        """
+        可達性分析模式: 擷取所有資源副檔名的字串常值並追蹤 require 載入的模組
+
+        Args:
+            extensions: 要擷取的副檔名 (含點)
+        """
+        self.reference_extensions = self.reference_extensions | {extension.lower() for extension in extensions}
+        self.follow_requires = True
+
+    def parse_file(self, file_path: Path) -> List[str]:
+        """
+        解析單一.lua檔案
+
+        Args:
+            file_path: 檔案路徑
+
+        Returns:
+            List[str]: 引號內的圖片路徑字串列表 (可達性分析模式另含資源路徑與 require 的模組路徑)
+        """
+        return self.analyzer.extract_references(Path(file_path), self.reference_extensions, self.follow_requires)
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PLIST檔案掃描器 - 負責解析 TexturePacker 圖集與粒子系統 .plist 中引用的圖片
+
+XML 格式以 iterparse 串流處理，只記錄需要的 key (frames 名稱、textureFileName 等)，
+不建立完整的 frames 字典；二進位 plist (bplist) 則交給 plistlib 解析。
+"""
+
+import plistlib
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from src.scanner.registry import ScannerBase, register_scanner
+from src.utils.file_index import FileIndex
+
+
+# 圖集 metadata 中指向紋理的 key
+_METADATA_TEXTURE_KEYS = ('textureFileName', 'realTextureFileName')
+# 粒子系統最上層指向紋理的 key
+_PARTICLE_TEXTURE_KEY = 'textureFileName'
+# 動畫 plist 中引用其他圖集的陣列 key
+_SPRITESHEETS_KEY = 'spritesheets'
+
+
+@register_scanner
+class PlistScanner(ScannerBase):
+    """PLIST檔案掃描器 - 負責解析圖集與粒子 .plist 引用的紋理並建立 sprite frame 索引"""
+
+    SCANNER_NAME = 'plist'
+    FILE_EXTENSIONS = ('.plist',)
+
+    def __init__(self, project_path: str, image_types: Set[str], file_index: Optional[FileIndex] = None):
+        """
+        初始化PLIST掃描器
+
+        Args:
+            project_path: 專案根目錄路徑
+            image_types: 要搜尋的圖片類型集合
+            file_index: 共用檔案索引 (由掃描引擎設定)
+        """
+        super().__init__(project_path, image_types, file_index)
+        # plist 路徑 -> sprite frame 名稱列表
+        self.sprite_frames: Dict[str, List[str]] = {}
+        # sprite frame 名稱 (小寫) -> 定義該 frame 的 plist 路徑列表
+        self.frame_index: Dict[str, List[str]] = {}
+    def parse_file(self, file_path: Path) -> List[str]:
+        """
+        解析單一.plist檔案，並把 sprite frame 名稱登記到 frame 索引
+
+        Args:
+            file_path: 檔案路徑
+
+        Returns:
+            List[str]: 引用紋理 (或其他圖集) 的路徑列表
+        """
+        file_path = Path(file_path)
+        with open(file_path, 'rb') as f:
+            header = f.read(8)
+
+        if header.startswith(b'bplist'):
+            references, frames = self._analyze_binary_plist(file_path)
+        else:
+            try:
+                references, frames = self._analyze_xml_plist(file_path)
+            except ET.ParseError:
+                # 非標準 XML (例如含有特殊實體) 時退回 plistlib
+                references, frames = self._analyze_binary_plist(file_path)
+
+        if frames and not references:
+            # 舊版 TexturePacker 不寫 metadata，紋理與 plist 同名
+            references = self._sibling_texture_reference(file_path)
+
+        if frames:
+            self.register_frames(str(file_path), frames)
+
+        return references
+
+    def _analyze_xml_plist(self, plist_file_path: Path) -> tuple:
+        """
+        串流解析 XML plist，只處理需要的 key
+
+        Args:
+            plist_file_path: PLIST檔案路徑
+
+        Returns:
+            tuple: (引用路徑列表, sprite frame 名稱列表)
+        """
+        references = []
+        frames = []
+        # 每一層容器為 (標籤, 在上層字典中的 key, 元素)
+        stack = []
+        pending_key = None
+
+        for event, element in ET.iterparse(str(plist_file_path), events=('start', 'end')):
+            tag = element.tag
+
+            if event == 'start':
+                if tag in ('dict', 'array'):
+                    parent_key = pending_key if stack and stack[-1][0] == 'dict' else None
+                    stack.append((tag, parent_key, element))
+                    pending_key = None
+                continue
+
+            if tag == 'key':
+                pending_key = element.text or ''
+                # 最上層 frames 字典中的 key 就是 sprite frame 名稱
+                if len(stack) == 2 and stack[1][1] == 'frames' and stack[1][0] == 'dict':
+                    frames.append(pending_key)
+            elif tag in ('dict', 'array'):
+                if stack:
+                    stack.pop()
+                pending_key = None
+            else:
+                if tag == 'string' and element.text:
+                    if self._is_texture_value(stack, pending_key):
+                        references.append(element.text)
+                pending_key = None
+
+            # 釋放已處理完的子元素，記憶體用量只與巢狀深度有關
+            element.clear()
+            if stack:
+                stack[-1][2].clear()
+
+        return self._unique(references), frames
+
+    @staticmethod
+    def _is_texture_value(stack: list, key: Optional[str]) -> bool:
+        """判斷目前的字串值是否為紋理 / 圖集引用"""
+        depth = len(stack)
+        if depth == 0:
+            return False
+        container, container_key = stack[-1][:2]
+        if container == 'array':
+            return container_key == _SPRITESHEETS_KEY
+        if depth == 1:
+            return key == _PARTICLE_TEXTURE_KEY
+        if depth == 2 and stack[1][1] == 'metadata':
+            return key in _METADATA_TEXTURE_KEYS
+        return False
+
+    def _analyze_binary_plist(self, plist_file_path: Path) -> tuple:
+        """
+        以 plistlib 解析 plist (二進位或 XML)
+
+        Args:
+            plist_file_path: PLIST檔案路徑
+
+        Returns:
+            tuple: (引用路徑列表, sprite frame 名稱列表)
+        """
+        with open(plist_file_path, 'rb') as f:
+            data = plistlib.load(f)
+
+        references = []
+        frames = []
+        if not isinstance(data, dict):
+            return references, frames
+
+        texture = data.get(_PARTICLE_TEXTURE_KEY)
+        if isinstance(texture, str) and texture:
+            references.append(texture)
+
+        metadata = data.get('metadata')
+        if isinstance(metadata, dict):
+            for key in _METADATA_TEXTURE_KEYS:
+                value = metadata.get(key)
+                if isinstance(value, str) and value:
+                    references.append(value)
+
+        frame_dict = data.get('frames')
+        if isinstance(frame_dict, dict):
+            frames = list(frame_dict.keys())
+
+        properties = data.get('properties')
+        if isinstance(properties, dict):
+            for value in properties.get(_SPRITESHEETS_KEY, ()) or ():
+                if isinstance(value, str) and value:
+                    references.append(value)
+
+        return self._unique(references), frames
+
+    def _sibling_texture_reference(self, plist_file_path: Path) -> List[str]:
+        """取得與 plist 同名的紋理檔案"""
+        for image_type in ('png', 'pvr.ccz', 'jpg'):
+            texture_path = plist_file_path.with_name(f"{plist_file_path.stem}.{image_type}")
+            # 串流掃描時索引可能尚未建立完成，此時改以檔案系統確認
+            if self.file_index is not None and self.file_index.is_built:
+                if self.file_index.contains(str(texture_path)):
+                    return [texture_path.name]
+            elif texture_path.exists():
+                return [texture_path.name]
+        return []
+
+    def register_frames(self, plist_path: str, frames: List[str]):
+        """把 sprite frame 名稱登記到 frame 索引"""
+        self.sprite_frames[plist_path] = frames
+        for frame in frames:
+            owners = self.frame_index.setdefault(frame.lower(), [])
+            if plist_path not in owners:
+                owners.append(plist_path)
+
+    def find_frame_owners(self, frame_name: str) -> List[str]:
+        """
+        查詢定義指定 sprite frame 的圖集 plist
+
+        程式碼中以 frame 名稱引用圖片時 (例如 createWithSpriteFrameName)，
+        可以透過這個索引讓對應的圖集與紋理保持被引用的狀態
+
+        Args:
+            frame_name: sprite frame 名稱 (可含路徑)
+
+        Returns:
+            List[str]: plist 路徑列表
+        """
+        owners = self.frame_index.get(frame_name.lower())
+        if owners is None:
+            owners = self.frame_index.get(frame_name.replace('\\', '/').rsplit('/', 1)[-1].lower(), [])
+        return list(owners)
+
+    @staticmethod
+    def _unique(values: List[str]) -> List[str]:
+        """移除重複並保留順序"""
+        return list(dict.fromkeys(values))
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        取得掃描統計資訊
+
+        Returns:
+            Dict[str, int]: 統計資訊字典
+        """
+        statistics = super().get_statistics()
+        statistics['total_sprite_sheets'] = len(self.sprite_frames)
+        statistics['total_sprite_frames'] = len(self.frame_index)
+        return statistics
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+可達性分析 (mark-and-sweep) - 從設定的根檔案出發走訪引用關係圖
+
+「未引用」只代表沒有任何掃描到的檔案引用它；沒有人使用的特效仍然會讓它的
+材質與貼圖被視為已引用。可達性分析改為從根檔案 (Lua 入口腳本、場景檔、清單)
+出發做廣度優先走訪，走不到的檔案全部視為未使用，
+因此整條 .efk -> .efkmat -> .png 的死鏈都會一起被找出來。
+
+根檔案以相對於搜尋根目錄 (專案目錄、程式碼專案目錄) 的萬用字元樣式指定，
+不分大小寫，分隔符一律使用 '/'，'*' 也會比對子目錄，例如:
+    lua/main.lua
+    scenes/*.csb
+清單檔每行一個樣式，空行與 '#' 開頭的行會被忽略。
+"""
+
+import fnmatch
+import os
+import re
+from array import array
+from typing import Iterable, List, Optional
+
+from src.scanner.reference_graph import ReferenceGraph
+
+
+MANIFEST_COMMENT_PREFIX = '#'
+
+
+def load_root_manifest(manifest_path: str) -> List[str]:
+    """
+    讀取根檔案清單
+
+    Args:
+        manifest_path: 清單檔路徑 (UTF-8)
+
+    Returns:
+        List[str]: 根檔案樣式列表
+    """
+    patterns = []
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith(MANIFEST_COMMENT_PREFIX):
+                patterns.append(line)
+    return patterns
+
+
+def _compile_patterns(patterns: Iterable[str]) -> Optional['re.Pattern']:
+    """把所有根檔案樣式合併成單一正規表示式，每個檔案只需比對一次"""
+    translated = []
+    for pattern in patterns:
+        pattern = pattern.strip().replace('\\', '/').lower()
+        if os.path.isabs(pattern):
+            pattern = os.path.normpath(pattern).replace('\\', '/')
+        elif pattern.startswith('./'):
+            pattern = pattern[2:]
+        if pattern:
+            translated.append(fnmatch.translate(pattern))
+    if not translated:
+        return None
+    return re.compile('|'.join(f'(?:{expression})' for expression in translated))
+
+
+def match_root_files(file_paths: Iterable[str], search_roots: Iterable[str],
+                     patterns: Iterable[str]) -> List[str]:
+    """
+    找出符合根檔案樣式的檔案
+
+    Args:
+        file_paths: 候選檔案路徑 (通常為檔案索引中的所有檔案)
+        search_roots: 搜尋根目錄，樣式以相對於這些目錄的路徑比對
+        patterns: 根檔案樣式 (相對路徑或絕對路徑，可使用萬用字元)
+
+    Returns:
+        List[str]: 符合的檔案路徑列表
+    """
+    matcher = _compile_patterns(patterns)
+    if matcher is None:
+        return []
+
+    prefixes = [os.path.normpath(str(root)).replace('\\', '/').lower().rstrip('/') + '/'
+                for root in search_roots]
+    roots = []
+    for file_path in file_paths:
+        key = file_path.replace('\\', '/').lower()
+        if matcher.fullmatch(key):
+            roots.append(file_path)
+            continue
+        for prefix in prefixes:
+            if key.startswith(prefix) and matcher.fullmatch(key[len(prefix):]):
+                roots.append(file_path)
+                break
+    return roots
+
+
+def mark_reachable(graph: ReferenceGraph, root_paths: Iterable[str], cancel_token=None) -> bytearray:
+    """
+    從根檔案出發做廣度優先走訪，標記所有可到達的節點
+
+    每個節點最多進入佇列一次、每條邊最多檢查一次，時間與空間都與圖的大小成線性
+
+    Args:
+        graph: 引用關係圖
+        root_paths: 根檔案路徑 (不在圖中的根檔案會被忽略)
+        cancel_token: 取消權杖 (每處理一批節點檢查一次)
+
+    Returns:
+        bytearray: 以節點 id 為索引的標記，可到達為 1
+    """
+    offsets, targets = graph.forward_csr()
+    reached = bytearray(graph.node_count)
+    queue = array('I')
+
+    for root_path in root_paths:
+        node_id = graph.node_id(root_path)
+        if node_id is not None and not reached[node_id]:
+            reached[node_id] = 1
+            queue.append(node_id)
+
+    head = 0
+    while head < len(queue):
+        if cancel_token is not None and head % 4096 == 0:
+            cancel_token.checkpoint()
+        node_id = queue[head]
+        head += 1
+        for target in targets[offsets[node_id]:offsets[node_id + 1]]:
+            if not reached[target]:
+                reached[target] = 1
+                queue.append(target)
+
+    return reached
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+引用關係圖 - 合併所有掃描器解析出的「檔案 -> 被引用檔案」關係
+
+每個路徑只在字串表中保存一次並對應到整數 id；邊以 array('I') 儲存，
+查詢前壓縮成 CSR (compressed sparse row) 形式的正向與反向鄰接表，
+每條邊只佔用十多個位元組，不會為每條邊重複保存完整路徑字串。
+"""
+
+from array import array
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+
+class ReferenceGraph:
+    """引用關係圖 - 以整數 id 與 CSR 鄰接表記錄來源檔案與被引用檔案之間的邊"""
+
+    def __init__(self):
+        """初始化空的引用關係圖"""
+        # 字串表: id -> 路徑，以及路徑 -> id
+        self._paths: List[str] = []
+        self._ids: Dict[str, int] = {}
+        # 以 id 為索引，標記是否為來源檔案
+        self._is_source = bytearray()
+        # 尚未壓縮的邊 (來源 id, 目標 id)，可能含有重複
+        self._edge_sources = array('I')
+        self._edge_targets = array('I')
+        # 壓縮後的鄰接表 (offsets, 鄰點 id)；新增邊後會失效並在下次查詢時重建
+        self._forward: Optional[Tuple[array, array]] = None
+        self._reverse: Optional[Tuple[array, array]] = None
+
+    def intern(self, path: str) -> int:
+        """
+        取得路徑的整數 id (不存在時加入字串表)
+
+        Args:
+            path: 檔案路徑
+
+        Returns:
+            int: 節點 id
+        """
+        node_id = self._ids.get(path)
+        if node_id is None:
+            node_id = len(self._paths)
+            self._ids[path] = node_id
+            self._paths.append(path)
+            self._is_source.append(0)
+        return node_id
+
+    def add_source(self, source: str):
+        """登記來源檔案 (即使沒有任何可解析的引用)"""
+        self._is_source[self.intern(source)] = 1
+
+    def add_reference(self, source: str, target: str):
+        """
+        新增一條引用邊 (重複的邊會在壓縮時合併)
+
+        Args:
+            source: 發出引用的檔案
+            target: 被引用的檔案
+        """
+        source_id = self.intern(source)
+        self._is_source[source_id] = 1
+        self._edge_sources.append(source_id)
+        self._edge_targets.append(self.intern(target))
+        self._forward = None
+        self._reverse = None
+
+    def merge(self, edges: Iterable[tuple]):
+        """批次合併 (source, target) 邊"""
+        for source, target in edges:
+            self.add_reference(source, target)
+
+    def freeze(self):
+        """把累積的邊壓縮成去除重複的 CSR 正向 / 反向鄰接表"""
+        if self._forward is not None:
+            return
+
+        node_count = len(self._paths)
+        offsets, targets = self._build_csr(self._edge_sources, self._edge_targets, node_count)
+
+        # 以去除重複後的邊取代原始邊，之後再新增邊也不會累積重複
+        sources = array('I')
+        for node_id in range(node_count):
+            degree = offsets[node_id + 1] - offsets[node_id]
+            if degree:
+                sources.extend(array('I', (node_id,)) * degree)
+        self._edge_sources = sources
+        self._edge_targets = array('I', targets)
+
+        self._forward = (offsets, targets)
+        self._reverse = self._build_csr(targets, sources, node_count)
+
+    @staticmethod
+    def _build_csr(rows: array, columns: array, node_count: int) -> Tuple[array, array]:
+        """以計數排序建立 CSR 鄰接表，並去除每一列中重複的鄰點"""
+        counts = [0] * (node_count + 1)
+        for row in rows:
+            counts[row + 1] += 1
+        for node_id in range(node_count):
+            counts[node_id + 1] += counts[node_id]
+
+        cursor = counts[:-1]
+        values = array('I', bytes(4 * len(rows)))
+        for row, column in zip(rows, columns):
+            values[cursor[row]] = column
+            cursor[row] += 1
+
+        offsets = array('I', [0])
+        unique_values = array('I')
+        for node_id in range(node_count):
+            start, end = counts[node_id], counts[node_id + 1]
+            if end - start > 1:
+                unique_values.extend(sorted(set(values[start:end])))
+            elif end > start:
+                unique_values.append(values[start])
+            offsets.append(len(unique_values))
+        return offsets, unique_values
+
+    @property
+    def node_count(self) -> int:
+        """節點數量 (所有出現過的路徑)"""
+        return len(self._paths)
+
+    @property
+    def edge_count(self) -> int:
+        """去除重複後的邊數量"""
+        self.freeze()
+        return len(self._forward[1])
+
+    def node_id(self, path: str) -> Optional[int]:
+        """取得路徑的 id，不存在時返回None"""
+        return self._ids.get(path)
+
+    def path_of(self, node_id: int) -> str:
+        """取得 id 對應的路徑"""
+        return self._paths[node_id]
+
+    def successors(self, node_id: int) -> array:
+        """取得節點引用的所有節點 id"""
+        self.freeze()
+        offsets, targets = self._forward
+        return targets[offsets[node_id]:offsets[node_id + 1]]
+
+    def predecessors(self, node_id: int) -> array:
+        """取得引用該節點的所有節點 id"""
+        self.freeze()
+        offsets, sources = self._reverse
+        return sources[offsets[node_id]:offsets[node_id + 1]]
+
+    def forward_csr(self) -> Tuple[array, array]:
+        """取得正向 CSR 鄰接表 (offsets, 鄰點 id)，供需要線性走訪整張圖的演算法使用"""
+        self.freeze()
+        return self._forward
+
+    def references_of(self, source: str) -> List[str]:
+        """取得來源檔案引用的所有檔案"""
+        node_id = self._ids.get(source)
+        if node_id is None:
+            return []
+        return [self._paths[target] for target in self.successors(node_id)]
+
+    def referrers_of(self, target: str) -> List[str]:
+        """取得引用指定檔案的所有來源檔案"""
+        node_id = self._ids.get(target)
+        if node_id is None:
+            return []
+        return [self._paths[source] for source in self.predecessors(node_id)]
+
+    def iter_sources(self) -> Iterator[str]:
+        """依加入順序走訪所有來源檔案"""
+        for node_id, is_source in enumerate(self._is_source):
+            if is_source:
+                yield self._paths[node_id]
+
+    def sources(self) -> List[str]:
+        """取得所有來源檔案"""
+        return list(self.iter_sources())
+
+    def is_referenced(self, file_path: str) -> bool:
+        """檢查檔案是否被任何來源引用"""
+        node_id = self._ids.get(file_path)
+        if node_id is None:
+            return False
+        self.freeze()
+        offsets = self._reverse[0]
+        return offsets[node_id + 1] > offsets[node_id]
+
+    def referenced_count(self) -> int:
+        """被至少一個來源引用的檔案數量"""
+        self.freeze()
+        offsets = self._reverse[0]
+        return sum(1 for node_id in range(len(self._paths)) if offsets[node_id + 1] > offsets[node_id])
+
+    def as_mapping(self) -> 'ReferenceMapping':
+        """取得「來源檔案 -> 引用檔案列表」的唯讀對應表檢視"""
+        return ReferenceMapping(self)
+
+    def __len__(self) -> int:
+        """來源檔案數量"""
+        return sum(self._is_source)
+
+
+class ReferenceMapping(Mapping):
+    """引用關係圖的唯讀檢視 - 以 Mapping[str, List[str]] 介面提供結果顯示使用，不另外複製資料"""
+
+    def __init__(self, graph: ReferenceGraph):
+        """
+        初始化檢視
+
+        Args:
+            graph: 引用關係圖
+        """
+        self._graph = graph
+
+    def __getitem__(self, source: str) -> List[str]:
+        node_id = self._graph.node_id(source)
+        if node_id is None or not self._graph._is_source[node_id]:
+            raise KeyError(source)
+        return [self._graph.path_of(target) for target in self._graph.successors(node_id)]
+
+    def __iter__(self) -> Iterator[str]:
+        return self._graph.iter_sources()
+
+    def __len__(self) -> int:
+        return len(self._graph)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+引用路徑解析器 - 將掃描器取得的引用字串對應到專案中的實際檔案
+
+所有查詢都透過共用檔案索引完成，不再為每個引用重新走訪目錄。
+"""
+
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.utils.file_index import FileIndex
+
+
+# 引用範圍
+SCOPE_DIRECTORY = 'directory'   # 只接受引用檔案所在目錄 (含子目錄) 內的檔案
+SCOPE_PROJECT = 'project'       # 在整個索引中尋找最符合的檔案
+SCOPE_NAME = 'name'             # 以檔名比對，所有同名檔案都視為被引用
+
+
+class ReferenceResolver:
+    """引用路徑解析器 - 依引用範圍將引用字串解析為完整路徑"""
+
+    def __init__(self, file_index: FileIndex, search_roots: Iterable[str] = ()):
+        """
+        初始化解析器
+
+        Args:
+            file_index: 共用檔案索引
+            search_roots: 相對路徑的額外搜尋根目錄 (例如專案根目錄、程式碼專案根目錄)
+        """
+        self.file_index = file_index
+        self.search_roots = [os.path.normpath(str(root)) for root in search_roots]
+        self._cache: Dict[Tuple[str, Optional[str], str], List[str]] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # 目錄範圍檢查次數 (效能統計用)
+        self.scope_checks = 0
+
+    def resolve(self, reference: str, source_path: str, scope: str = SCOPE_PROJECT) -> List[str]:
+        """
+        解析單一引用
+
+        Args:
+            reference: 引用字串 (檔名、相對路徑或絕對路徑)
+            source_path: 發出引用的檔案路徑
+            scope: 引用範圍 (SCOPE_DIRECTORY / SCOPE_PROJECT / SCOPE_NAME)
+
+        Returns:
+            List[str]: 解析出的完整路徑列表，無法解析時為空列表
+        """
+        reference = reference.strip()
+        if not reference:
+            return []
+
+        source_dir = os.path.dirname(source_path)
+        cache_key = (reference.lower(), None if scope == SCOPE_NAME else source_dir, scope)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self.cache_hits += 1
+            return cached
+
+        self.cache_misses += 1
+        if scope == SCOPE_NAME:
+            resolved = self._resolve_by_name(reference)
+        else:
+            resolved = self._resolve_single(reference, source_dir, scope == SCOPE_DIRECTORY)
+
+        self._cache[cache_key] = resolved
+        return resolved
+
+    def resolve_path(self, reference: str, source_path: str, scope: str = SCOPE_PROJECT) -> List[str]:
+        """
+        只以路徑 (絕對路徑、相對於來源檔案、相對於搜尋根目錄) 解析引用，不做檔名比對
+
+        路徑命中的結果不會因為之後加入索引的檔案而改變，因此可以在索引尚未建立完成時使用；
+        未命中時不寫入快取，留待索引完成後再以 resolve() 做完整解析
+
+        Args:
+            reference: 引用字串
+            source_path: 發出引用的檔案路徑
+            scope: 引用範圍 (SCOPE_NAME 一律返回空列表)
+
+        Returns:
+            List[str]: 命中的完整路徑列表，未命中時為空列表
+        """
+        reference = reference.strip()
+        if not reference or scope == SCOPE_NAME:
+            return []
+
+        found = self._lookup_path(reference, os.path.dirname(source_path), scope == SCOPE_DIRECTORY)
+        return [found] if found else []
+
+    def _lookup_path(self, reference: str, source_dir: str, directory_scope: bool) -> Optional[str]:
+        """依序嘗試絕對路徑與相對路徑"""
+        candidates = []
+        if os.path.isabs(reference):
+            candidates.append(reference)
+        candidates.append(os.path.join(source_dir, reference))
+        if not directory_scope:
+            candidates.extend(os.path.join(root, reference) for root in self.search_roots)
+
+        for candidate in candidates:
+            found = self.file_index.lookup(candidate)
+            if not found:
+                continue
+            if not directory_scope:
+                return found
+            self.scope_checks += 1
+            if self._in_scope(found, source_dir):
+                return found
+        return None
+
+    def _resolve_single(self, reference: str, source_dir: str, directory_scope: bool) -> List[str]:
+        """依序嘗試絕對路徑、相對路徑與檔名比對，返回最符合的單一檔案"""
+        found = self._lookup_path(reference, source_dir, directory_scope)
+        if found:
+            return [found]
+
+        matches = self.file_index.find_by_name(reference)
+        if directory_scope:
+            self.scope_checks += len(matches)
+            matches = [match for match in matches if self._in_scope(match, source_dir)]
+        if not matches:
+            return []
+        if len(matches) == 1:
+            return matches
+
+        best_match = self._best_suffix_match(reference, matches)
+        return [best_match or matches[0]]
+
+    def _resolve_by_name(self, reference: str) -> List[str]:
+        """以檔名比對，所有同名檔案都視為被引用 (與舊版 Lua 比對規則一致，寧可保留也不誤刪)"""
+        return self.file_index.find_by_name(reference)
+
+    def _best_suffix_match(self, reference: str, matches: List[str]) -> Optional[str]:
+        """在同名檔案中選出目錄結構與引用最相近的一個"""
+        parts = self._split_parts(reference)
+        if len(parts) < 2:
+            return None
+
+        best_match = None
+        max_common_parts = 1
+        for match in matches:
+            common_parts = self._common_suffix(parts, match)
+            if common_parts > max_common_parts:
+                max_common_parts = common_parts
+                best_match = match
+        return best_match
+
+    @staticmethod
+    def _split_parts(path: str) -> List[str]:
+        """拆解路徑為小寫的各段 (忽略 . 與空白段)"""
+        return [part for part in path.replace('\\', '/').lower().split('/') if part and part != '.']
+
+    def _common_suffix(self, parts: List[str], file_path: str) -> int:
+        """計算引用與實際路徑從尾端開始相同的段數"""
+        file_parts = self._split_parts(file_path)
+        common = 0
+        for ref_part, file_part in zip(reversed(parts), reversed(file_parts)):
+            if ref_part != file_part:
+                break
+            common += 1
+        return common
+
+    @staticmethod
+    def _in_scope(file_path: str, directory: str) -> bool:
+        """檢查檔案是否位於指定目錄 (含子目錄) 內"""
+        file_key = os.path.normpath(file_path).replace('\\', '/').lower()
+        directory_key = os.path.normpath(directory).replace('\\', '/').lower().rstrip('/')
+        return file_key.startswith(directory_key + '/')
+
+    def get_statistics(self) -> Dict[str, int]:
+        """取得解析快取與範圍檢查統計"""
+        return {
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'cached_references': len(self._cache),
+            'scope_checks': self.scope_checks
+        }
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+掃描器註冊表 - 依副檔名將檔案分派給對應的掃描器
+
+每個掃描器類別需提供:
+    SCANNER_NAME: 掃描器名稱
+    FILE_EXTENSIONS: 負責解析的副檔名 (含點)
+    parse_file(file_path): 解析單一檔案並返回引用字串列表
+
+可選屬性:
+    REFERENCE_SCOPE: 引用解析範圍 ('directory' / 'project' / 'name'，預設 'project')
+    TARGET_EXTENSIONS: 額外列入未引用檢查的副檔名
+    CODE_SCANNER: 為 True 時，解析的是程式碼而非資源檔 (可達性分析不會把程式碼檔案列為未使用)
+    enable_asset_references(extensions): 可達性分析時由掃描引擎呼叫，讓程式碼掃描器
+        也回報資源檔與其他程式碼檔的引用 (根檔案通常是程式碼)
+
+新的掃描器可以繼承 ScannerBase: 掃描引擎負責走訪與分派，掃描器只需要實作 parse_file，
+解析次數、取消權杖與效能統計等共用狀態都由基底類別提供。
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Type
+
+from src.utils.file_index import FileIndex
+from src.utils.instrumentation import DISABLED
+from src.utils.logger import ScannerLogger
+
+
+SCANNER_REGISTRY: Dict[str, Type] = {}
+
+
+class ScannerBase:
+    """掃描器基底類別 - 保存掃描引擎使用的共用狀態與解析統計"""
+
+    SCANNER_NAME = ''
+    FILE_EXTENSIONS: tuple = ()
+
+    def __init__(self, project_path: str, image_types: Set[str], file_index: Optional[FileIndex] = None):
+        """
+        初始化掃描器
+
+        Args:
+            project_path: 專案根目錄路徑
+            image_types: 要搜尋的圖片類型集合
+            file_index: 共用檔案索引 (由掃描引擎設定)
+        """
+        self.project_path = Path(project_path)
+        self.image_types = image_types
+        self.file_index = file_index
+        self.logger = ScannerLogger()
+        # 解析成功 / 失敗的檔案數，由掃描引擎在每次呼叫 parse_file 後累計
+        self.successful_scans = 0
+        self.failed_scans = 0
+        # 取消權杖 (CancellationToken) 與效能統計 (Instrumentation)，由掃描引擎設定
+        self.cancel_token = None
+        self.instrumentation = DISABLED
+
+    def parse_file(self, file_path: Path) -> List[str]:
+        """
+        解析單一檔案
+
+        Args:
+            file_path: 檔案路徑
+
+        Returns:
+            List[str]: 引用字串列表
+        """
+        raise NotImplementedError
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        取得掃描統計資訊
+
+        Returns:
+            Dict[str, int]: 統計資訊字典 (啟用效能統計時包含 parse_ms / read_bytes 等項目)
+        """
+        statistics = {
+            'analyzed_files': self.successful_scans,
+            'failed_scans': self.failed_scans,
+        }
+        statistics.update(self.instrumentation.scanner_statistics(self.SCANNER_NAME))
+        return statistics
+
+
+def register_scanner(scanner_class: Type) -> Type:
+    """
+    註冊掃描器類別 (可作為類別裝飾器使用)
+
+    Args:
+        scanner_class: 掃描器類別
+
+    Returns:
+        Type: 原本的掃描器類別
+    """
+    name = getattr(scanner_class, 'SCANNER_NAME', None)
+    extensions = getattr(scanner_class, 'FILE_EXTENSIONS', None)
+    if not name or not extensions:
+        raise ValueError(f"掃描器 {scanner_class.__name__} 缺少 SCANNER_NAME 或 FILE_EXTENSIONS")
+
+    SCANNER_REGISTRY[name] = scanner_class
+    return scanner_class
+
+
+def get_scanner_class(name: str) -> Type:
+    """
+    依名稱取得掃描器類別
+
+    Args:
+        name: 掃描器名稱
+
+    Returns:
+        Type: 掃描器類別
+    """
+    if name not in SCANNER_REGISTRY:
+        raise KeyError(f"未註冊的掃描器: {name}")
+    return SCANNER_REGISTRY[name]
+
+
+def get_registered_scanners() -> Dict[str, Type]:
+    """取得所有已註冊的掃描器 (名稱 -> 類別)"""
+    return dict(SCANNER_REGISTRY)
+
+
+def scanner_names_for_extension(extension: str) -> List[str]:
+    """
+    取得負責指定副檔名的掃描器名稱
+
+    Args:
+        extension: 副檔名 (含點)
+
+    Returns:
+        List[str]: 掃描器名稱列表
+    """
+    extension = extension.lower()
+    return [
+        name for name, scanner_class in SCANNER_REGISTRY.items()
+        if extension in scanner_class.FILE_EXTENSIONS
+    ]
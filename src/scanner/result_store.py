@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+結果資料庫 - 以 SQLite 保存檔案、引用關係與未使用狀態 (可選，供大型專案使用)
+
+掃描引擎一邊走訪一邊把檔案 (含走訪時取得的大小) 寫入資料庫，解析出的引用邊與比對出的未使用檔案
+也隨產生隨寫入，不在最後另外走訪整個引用關係圖；寫入先累積在緩衝區，
+每滿 BATCH_SIZE 筆才以一次 executemany 在同一個交易中寫入；
+介面以分頁查詢讀取未使用檔案，不需要把整個列表同時放進記憶體或 Tk 元件。
+
+資料表:
+    files       每個索引檔案一列 (是否為目標檔案 / 未使用 / 已刪除、檔案大小)
+    refs        去除重複後的引用邊 (來源檔案 id, 被引用檔案 id)
+    unresolved  無法解析的引用字串
+    meta        專案路徑、掃描是否完整完成等資訊
+"""
+
+import sqlite3
+import time
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+# 每個交易寫入的筆數
+BATCH_SIZE = 10000
+
+# 介面每頁顯示的筆數
+PAGE_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    is_target INTEGER NOT NULL DEFAULT 0,
+    is_unused INTEGER NOT NULL DEFAULT 0,
+    is_deleted INTEGER NOT NULL DEFAULT 0,
+    size INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_files_unused ON files (path) WHERE is_unused = 1;
+CREATE TABLE IF NOT EXISTS refs (
+    source_id INTEGER NOT NULL,
+    target_id INTEGER NOT NULL,
+    PRIMARY KEY (source_id, target_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_refs_target ON refs (target_id);
+CREATE TABLE IF NOT EXISTS unresolved (
+    source_id INTEGER NOT NULL,
+    reference TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_unresolved_source ON unresolved (source_id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_INSERT_FILE = "INSERT OR IGNORE INTO files (path, is_target, size) VALUES (?, ?, ?)"
+_INSERT_REFERENCE = (
+    "INSERT OR IGNORE INTO refs (source_id, target_id) "
+    "SELECT s.id, t.id FROM files AS s, files AS t WHERE s.path = ? AND t.path = ?"
+)
+_INSERT_UNRESOLVED = "INSERT INTO unresolved (source_id, reference) SELECT id, ? FROM files WHERE path = ?"
+_MARK_UNUSED = "UPDATE files SET is_unused = 1 WHERE path = ?"
+_MARK_DELETED = "UPDATE files SET is_deleted = 1 WHERE path = ?"
+
+
+class ResultStore:
+    """結果資料庫 - 批次寫入掃描結果，並提供有索引的分頁查詢"""
+
+    def __init__(self, db_path: str):
+        """
+        開啟 (或建立) 結果資料庫
+
+        每個執行緒需要各自開啟自己的 ResultStore (sqlite3 連線不可跨執行緒使用)
+
+        Args:
+            db_path: 資料庫檔案路徑
+        """
+        self.path = str(db_path)
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+        # 尚未寫入的緩衝 (必須依序寫入: 引用與未解析引用以路徑查詢檔案 id)
+        self._pending_files: List[Tuple[str, int, int]] = []
+        self._pending_references: List[Tuple[str, str]] = []
+        self._pending_unresolved: List[Tuple[str, str]] = []
+        self._pending_unused: List[Tuple[str]] = []
+
+    def close(self):
+        """寫入剩餘的緩衝並關閉資料庫"""
+        self.flush()
+        self._connection.close()
+
+    def __enter__(self) -> 'ResultStore':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # ---- 寫入 (掃描引擎使用) ----
+
+    def begin_scan(self, project_path: str):
+        """
+        清除上一次的結果並記錄這次掃描的專案
+
+        Args:
+            project_path: 專案根目錄路徑
+        """
+        self._pending_files.clear()
+        self._pending_references.clear()
+        self._pending_unresolved.clear()
+        self._pending_unused.clear()
+        with self._connection:
+            for table in ('refs', 'unresolved', 'files', 'meta'):
+                self._connection.execute(f"DELETE FROM {table}")
+        self._set_meta({
+            'project_path': project_path,
+            'started_at': str(time.time()),
+            'complete': '0',
+        })
+
+    def add_file(self, file_path: str, is_target: bool = False, size: int = 0):
+        """
+        加入一個索引檔案 (累積到 BATCH_SIZE 筆才寫入)
+
+        Args:
+            file_path: 檔案路徑
+            is_target: 是否為判定未使用的目標檔案
+            size: 檔案大小 (走訪時取得，供介面統計；不需要時為 0)
+        """
+        self._pending_files.append((file_path, 1 if is_target else 0, size))
+        if len(self._pending_files) >= BATCH_SIZE:
+            self._flush_files()
+
+    def add_reference(self, source_file: str, target_file: str):
+        """
+        加入一條已解析的引用邊 (重複的邊由主鍵去除；兩個檔案都必須已經以 add_file 加入)
+
+        Args:
+            source_file: 來源檔案
+            target_file: 被引用的檔案
+        """
+        self._pending_references.append((source_file, target_file))
+        if len(self._pending_references) >= BATCH_SIZE:
+            self.flush()
+
+    def add_unresolved(self, source_file: str, reference: str):
+        """加入一筆無法解析的引用"""
+        self._pending_unresolved.append((reference, source_file))
+        if len(self._pending_unresolved) >= BATCH_SIZE:
+            self.flush()
+
+    def add_unused(self, file_path: str):
+        """標記一個未使用的檔案 (累積到 BATCH_SIZE 筆才寫入)"""
+        self._pending_unused.append((file_path,))
+        if len(self._pending_unused) >= BATCH_SIZE:
+            self.flush()
+
+    def discard_unused(self):
+        """清除所有未使用標記 (比對被取消時使用，避免留下不完整的未使用列表)"""
+        self._pending_unused = []
+        with self._connection:
+            self._connection.execute("UPDATE files SET is_unused = 0 WHERE is_unused = 1")
+
+    def finish_scan(self, statistics: Dict[str, int], complete: bool):
+        """
+        寫入剩餘的緩衝並記錄掃描結果摘要
+
+        Args:
+            statistics: 整體統計資訊 (ScanResult.get_statistics)
+            complete: 掃描是否完整完成 (被取消時未使用狀態不完整)
+        """
+        self.flush()
+        values = {key: str(value) for key, value in statistics.items()}
+        values['complete'] = '1' if complete else '0'
+        self._set_meta(values)
+
+    def flush(self):
+        """寫入所有緩衝中的資料"""
+        self._flush_files()
+        if self._pending_references:
+            self._execute_batch(_INSERT_REFERENCE, self._pending_references)
+            self._pending_references = []
+        if self._pending_unresolved:
+            self._execute_batch(_INSERT_UNRESOLVED, self._pending_unresolved)
+            self._pending_unresolved = []
+        if self._pending_unused:
+            self._execute_batch(_MARK_UNUSED, self._pending_unused)
+            self._pending_unused = []
+
+    def mark_deleted(self, file_paths: Iterable[str]):
+        """標記已被使用者刪除的檔案 (每 BATCH_SIZE 筆一個交易)"""
+        batch = []
+        for file_path in file_paths:
+            batch.append((file_path,))
+            if len(batch) >= BATCH_SIZE:
+                self._execute_batch(_MARK_DELETED, batch)
+                batch = []
+        self._execute_batch(_MARK_DELETED, batch)
+
+    def _flush_files(self):
+        """寫入緩衝中的檔案"""
+        if self._pending_files:
+            self._execute_batch(_INSERT_FILE, self._pending_files)
+            self._pending_files = []
+
+    def _execute_batch(self, statement: str, rows: List[tuple]):
+        """在單一交易中寫入一批資料"""
+        if rows:
+            with self._connection:
+                self._connection.executemany(statement, rows)
+
+    def _set_meta(self, values: Dict[str, str]):
+        """寫入 meta 資料"""
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", values.items()
+            )
+
+    # ---- 查詢 ----
+
+    def meta(self) -> Dict[str, str]:
+        """取得 meta 資料 (專案路徑、統計資訊、是否完整完成)"""
+        return dict(self._connection.execute("SELECT key, value FROM meta"))
+
+    @property
+    def is_complete(self) -> bool:
+        """資料庫中的結果是否來自完整完成的掃描"""
+        row = self._connection.execute("SELECT value FROM meta WHERE key = 'complete'").fetchone()
+        return row is not None and row[0] == '1'
+
+    def unused_count(self) -> int:
+        """未使用的檔案數量 (包含已刪除的檔案)"""
+        return self._connection.execute("SELECT COUNT(*) FROM files WHERE is_unused = 1").fetchone()[0]
+
+    def unused_summary(self) -> Tuple[int, int, int, int]:
+        """
+        取得未使用檔案的統計
+
+        Returns:
+            Tuple[int, int, int, int]: (總數, 總大小, 剩餘數量, 剩餘大小)，剩餘代表尚未刪除
+        """
+        row = self._connection.execute(
+            "SELECT COUNT(*), TOTAL(size), TOTAL(1 - is_deleted), TOTAL(size * (1 - is_deleted)) "
+            "FROM files WHERE is_unused = 1"
+        ).fetchone()
+        return row[0], int(row[1]), int(row[2]), int(row[3])
+
+    def unused_page(self, after: str = '', limit: int = PAGE_SIZE) -> List[Tuple[str, bool, int]]:
+        """
+        依路徑排序取得一頁未使用的檔案 (以上一頁最後的路徑接續查詢，不論第幾頁都只讀取這一頁)
+
+        Args:
+            after: 上一頁最後一個檔案的路徑 (第一頁為空字串)
+            limit: 筆數
+
+        Returns:
+            List[Tuple[str, bool, int]]: (檔案路徑, 是否已刪除, 檔案大小)
+        """
+        rows = self._connection.execute(
+            "SELECT path, is_deleted, size FROM files INDEXED BY idx_files_unused "
+            "WHERE is_unused = 1 AND path > ? ORDER BY path LIMIT ?",
+            (after, limit)
+        )
+        return [(path, bool(is_deleted), size) for path, is_deleted, size in rows]
+
+    def iter_unused(self, include_deleted: bool = False) -> Iterator[str]:
+        """
+        依路徑排序走訪所有未使用的檔案 (每次只讀取一批，以上一批最後的路徑接續查詢)
+
+        Args:
+            include_deleted: 是否包含已刪除的檔案
+
+        Yields:
+            str: 檔案路徑
+        """
+        last_path = ''
+        while True:
+            rows = self._connection.execute(
+                "SELECT path, is_deleted FROM files INDEXED BY idx_files_unused "
+                "WHERE is_unused = 1 AND path > ? ORDER BY path LIMIT ?",
+                (last_path, BATCH_SIZE)
+            ).fetchall()
+            if not rows:
+                return
+            for path, is_deleted in rows:
+                if include_deleted or not is_deleted:
+                    yield path
+            last_path = rows[-1][0]
+
+    def references_of(self, source_file: str) -> List[str]:
+        """取得來源檔案引用的所有檔案"""
+        rows = self._connection.execute(
+            "SELECT t.path FROM files AS s JOIN refs ON refs.source_id = s.id "
+            "JOIN files AS t ON t.id = refs.target_id WHERE s.path = ? ORDER BY t.path",
+            (source_file,)
+        )
+        return [row[0] for row in rows]
+
+    def referrers_of(self, target_file: str) -> List[str]:
+        """取得引用指定檔案的所有來源檔案"""
+        rows = self._connection.execute(
+            "SELECT s.path FROM files AS t JOIN refs ON refs.target_id = t.id "
+            "JOIN files AS s ON s.id = refs.source_id WHERE t.path = ? ORDER BY s.path",
+            (target_file,)
+        )
+        return [row[0] for row in rows]
+
+    def unresolved_of(self, source_file: str) -> List[str]:
+        """取得來源檔案無法解析的引用字串"""
+        rows = self._connection.execute(
+            "SELECT reference FROM files JOIN unresolved ON unresolved.source_id = files.id "
+            "WHERE files.path = ? ORDER BY unresolved.rowid",
+            (source_file,)
+        )
+        return [row[0] for row in rows]
@@ -0,0 +1,819 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+掃描引擎 - 以一次目錄走訪執行所有引用來源的掃描
+
+流程 (前三段以產生器串接，同時進行):
+    1. 走訪目錄並建立共用檔案索引 (專案目錄 + 程式碼專案目錄只走訪一次)
+    2. 依副檔名將每個檔案分派給已註冊掃描器的 parse_file
+    3. 以引用路徑解析器把引用字串對應到實際檔案，合併為一張引用關係圖
+    4. 對目標檔案 (圖片、特效材質等) 做一次差集，找出未被引用的檔案
+指定結果資料庫 (ResultStore) 時，檔案在走訪時即分批寫入，引用邊與未使用狀態在比對後寫入。
+指定效能統計 (Instrumentation) 時，另外記錄各格式的解析耗時分布、讀取位元組數與解析器快取命中等數據；
+指定追蹤記錄器 (Tracer) 時，記錄各階段與每個檔案的解析 / 引用解析區間。
+進度經由 ProgressReporter 合併後限速送出，逐檔案只累加計數。
+"""
+
+import importlib
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from src.scanner.reachability import mark_reachable, match_root_files
+from src.scanner.reference_graph import ReferenceGraph, ReferenceMapping
+from src.scanner.reference_resolver import ReferenceResolver, SCOPE_NAME, SCOPE_PROJECT
+from src.scanner.registry import get_registered_scanners, get_scanner_class
+from src.utils.cancellation import CancellationToken, ScanCancelled
+from src.utils.file_index import FileIndex
+from src.utils.instrumentation import DISABLED
+from src.utils.logger import ScannerLogger
+from src.utils.progress import DISABLED_PROGRESS, ProgressReporter
+from src.utils.tracer import DISABLED_TRACER
+
+
+# 內建掃描器模組 (匯入時會自動註冊)
+BUILTIN_SCANNER_MODULES = (
+    'src.scanner.efk_scanner',
+    'src.scanner.c3b_scanner',
+    'src.scanner.spine_scanner',
+    'src.scanner.csb_scanner',
+    'src.scanner.plist_scanner',
+    'src.scanner.fnt_scanner',
+    'src.scanner.tmx_scanner',
+    'src.scanner.lua_scanner',
+)
+
+# 預設的圖片目標副檔名
+IMAGE_TARGET_EXTENSIONS = (
+    '.png', '.jpg', '.jpeg', '.tga', '.dds', '.bmp', '.tiff', '.tif', '.webp', '.ktx', '.pvr'
+)
+
+# 掃描設定檔
+#   scanners: 掃描專案目錄的掃描器 (None 代表全部已註冊掃描器)
+#   code_scanners: 只有指定程式碼專案路徑時才啟用的掃描器
+#   target_extensions: 判定未引用的目標副檔名 (None 代表圖片 + 各掃描器的 TARGET_EXTENSIONS)
+SCAN_PROFILES = {
+    'efk_scan': {
+        'title': 'EFK檔案分析',
+        'scanners': ('efk',),
+        'code_scanners': (),
+        'target_extensions': IMAGE_TARGET_EXTENSIONS + ('.efkmat', '.efkmodel'),
+    },
+    'c3b_scan': {
+        'title': 'C3B檔案分析',
+        'scanners': ('c3b',),
+        'code_scanners': ('lua',),
+        'target_extensions': ('.png', '.jpg', '.jpeg'),
+    },
+    'all_scan': {
+        'title': '全部引用分析',
+        'scanners': None,
+        'code_scanners': (),
+        'target_extensions': None,
+    },
+}
+
+# 管線事件種類
+_EVENT_FILE = 0     # (_EVENT_FILE, 檔案路徑): 索引加入了一個檔案
+_EVENT_SOURCE = 1   # (_EVENT_SOURCE, 掃描器, 來源檔案, 引用字串列表): 來源檔案解析完成
+
+
+def load_builtin_scanners() -> Dict[str, type]:
+    """
+    匯入所有內建掃描器模組並返回註冊表內容
+
+    Returns:
+        Dict[str, type]: 掃描器名稱 -> 掃描器類別
+    """
+    for module_name in BUILTIN_SCANNER_MODULES:
+        importlib.import_module(module_name)
+    return get_registered_scanners()
+
+
+def _file_size(file_path: str) -> int:
+    """檔案大小 (無法取得時為 0)"""
+    try:
+        return os.path.getsize(file_path)
+    except OSError:
+        return 0
+
+
+class ScanResult:
+    """掃描結果 - 引用關係圖、各掃描器統計與未引用檔案"""
+
+    def __init__(self, project_path: str):
+        """
+        初始化掃描結果
+
+        Args:
+            project_path: 專案根目錄路徑
+        """
+        self.project_path = project_path
+        self.graph = ReferenceGraph()
+        # 掃描器名稱 -> 統計資訊
+        self.scanner_statistics: Dict[str, Dict[str, int]] = {}
+        # 來源檔案 -> 無法解析的引用字串列表
+        self.unresolved: Dict[str, List[str]] = {}
+        self.target_files: List[str] = []
+        # 使用結果資料庫時未引用檔案只寫入資料庫，這裡保持空白 (以 unused_count / iter_unused 讀取)
+        self.unused_files: List[str] = []
+        # 可達性分析的根檔案 (只有指定根檔案樣式時才會填入)
+        self.root_files: List[str] = []
+        self.total_indexed_files = 0
+        # 階段名稱 -> 耗時 (秒)
+        self.timings: Dict[str, float] = {}
+        # 掃描被取消時為 True；此時只保留已完成的部分結果，未引用檔案列表不會計算
+        self.cancelled = False
+        # 與上次分析快照的差異 (SnapshotDelta)，只有比較快照時才會設定
+        self.snapshot_delta = None
+        # 結果資料庫與其路徑，只有指定 ResultStore 時才會設定 (介面以分頁方式從資料庫讀取)
+        self.store = None
+        self.store_path: Optional[str] = None
+        # 寫入結果資料庫的未引用檔案數量
+        self.stored_unused_count = 0
+        # 效能統計 (Instrumentation)，只有啟用時才會設定
+        self.metrics = None
+        # 未引用檔案 -> 檔案大小 (呼叫 collect_unused_file_sizes 後才會填入)
+        self.unused_file_sizes: Dict[str, int] = {}
+
+    @property
+    def references(self) -> ReferenceMapping:
+        """「來源檔案 -> 已解析的被引用檔案列表」唯讀檢視 (直接讀取引用關係圖，不另外保存字串)"""
+        return self.graph.as_mapping()
+
+    @property
+    def referenced_count(self) -> int:
+        """被引用的檔案數量"""
+        return self.graph.referenced_count()
+
+    def unused_count(self) -> int:
+        """未引用檔案數量 (使用結果資料庫時為寫入資料庫的數量)"""
+        return self.stored_unused_count if self.store is not None else len(self.unused_files)
+
+    def iter_unused(self) -> Iterator[str]:
+        """
+        依路徑排序走訪未引用檔案 (使用結果資料庫時分批從資料庫讀取，必須在呼叫端關閉資料庫之前呼叫)
+
+        Yields:
+            str: 檔案路徑
+        """
+        if self.store is None:
+            yield from self.unused_files
+        elif not self.cancelled:
+            yield from self.store.iter_unused(include_deleted=True)
+
+    def collect_unused_file_sizes(self) -> Dict[str, int]:
+        """
+        讀取每個未引用檔案的大小 (每個檔案只讀一次，結果保存在 unused_file_sizes)
+
+        大量檔案逐一 stat 很慢: 介面在背景執行緒呼叫，主執行緒的統計只查表；命令列不需要大小，不會呼叫
+
+        Returns:
+            Dict[str, int]: 檔案路徑 -> 位元組數 (無法取得時為 0)
+        """
+        sizes = self.unused_file_sizes
+        for file_path in self.unused_files:
+            if file_path not in sizes:
+                sizes[file_path] = _file_size(file_path)
+        return sizes
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        取得整體統計資訊
+
+        Returns:
+            Dict[str, int]: 統計資訊字典 (啟用效能統計時包含 count.* / time_ms.* 等項目)
+        """
+        statistics = {
+            'total_indexed_files': self.total_indexed_files,
+            'total_source_files': len(self.graph),
+            'total_references': self.graph.edge_count,
+            'total_unresolved_references': sum(len(refs) for refs in self.unresolved.values()),
+            'total_target_files': len(self.target_files),
+            'total_unused_files': self.unused_count(),
+            'total_root_files': len(self.root_files),
+        }
+        if self.metrics is not None:
+            statistics.update(self.metrics.get_statistics())
+        return statistics
+
+
+class ScanEngine:
+    """掃描引擎 - 依副檔名分派檔案給已註冊的掃描器，並統一解析引用與計算未引用檔案"""
+
+    def __init__(self, project_path: str, scanner_names: Optional[Iterable[str]] = None,
+                 code_paths: Iterable[str] = (), target_extensions: Optional[Iterable[str]] = None,
+                 progress_callback: Optional[Callable] = None,
+                 message_callback: Optional[Callable[[str], None]] = None,
+                 source_callback: Optional[Callable[[str, str, List[str]], None]] = None,
+                 cancel_token: Optional[CancellationToken] = None,
+                 root_patterns: Iterable[str] = (),
+                 store=None,
+                 instrumentation=None,
+                 tracer=None,
+                 progress: Optional[ProgressReporter] = None):
+        """
+        初始化掃描引擎
+
+        Args:
+            project_path: 專案根目錄路徑
+            scanner_names: 要啟用的掃描器名稱 (None 代表全部已註冊掃描器)
+            code_paths: 額外的程式碼專案路徑 (只作為引用來源，不列入未引用檢查)
+            target_extensions: 判定未引用的目標副檔名 (None 代表圖片 + 各掃描器的 TARGET_EXTENSIONS)
+            progress_callback: 進度回調函數，接收 (stage, current, total, message) 參數
+                (經過合併，每秒最多呼叫 DEFAULT_MAX_RATE 次；指定 progress 時忽略)
+            message_callback: 訊息回調函數，接收要顯示給使用者的文字
+            source_callback: 來源檔案解析完成時的回調，接收 (掃描器名稱, 來源檔案, 引用字串列表)
+            cancel_token: 取消權杖，每個工作單位之間檢查一次
+            root_patterns: 可達性分析的根檔案樣式 (見 reachability 模組)；指定後改為
+                從根檔案走訪引用關係圖，無法到達的目標檔案與資源檔都視為未使用
+            store: 結果資料庫 (ResultStore)；指定後掃描結果會分批寫入資料庫，關閉由呼叫端負責
+            instrumentation: 效能統計 (Instrumentation)；未指定時不收集，幾乎沒有額外成本
+            tracer: 追蹤記錄器 (Tracer)；未指定時不記錄
+            progress: 進度回報器 (ProgressReporter)；未指定 progress 與 progress_callback 時不回報
+        """
+        self.project_path = os.path.normpath(str(project_path))
+        self.code_paths = [os.path.normpath(str(path)) for path in code_paths if path]
+        if progress is None:
+            progress = ProgressReporter.for_callback(progress_callback) if progress_callback else DISABLED_PROGRESS
+        self.progress = progress
+        self.message_callback = message_callback
+        self.source_callback = source_callback
+        self.cancel_token = cancel_token
+        self.root_patterns = [pattern for pattern in root_patterns if pattern.strip()]
+        self.store = store
+        self.instrumentation = instrumentation if instrumentation is not None else DISABLED
+        self.tracer = tracer if tracer is not None else DISABLED_TRACER
+        self.logger = ScannerLogger()
+
+        registered = load_builtin_scanners()
+        names = list(registered.keys()) if scanner_names is None else list(scanner_names)
+        image_types = {extension.lstrip('.') for extension in IMAGE_TARGET_EXTENSIONS}
+        self.scanners = {}
+        for name in names:
+            scanner_class = get_scanner_class(name)
+            self.scanners[name] = scanner_class(self.project_path, image_types)
+            self.scanners[name].cancel_token = cancel_token
+            self.scanners[name].instrumentation = self.instrumentation
+
+        if target_extensions is None:
+            target_extensions = set(IMAGE_TARGET_EXTENSIONS)
+            for scanner in self.scanners.values():
+                target_extensions.update(getattr(scanner, 'TARGET_EXTENSIONS', ()))
+        self.target_extensions = {extension.lower() for extension in target_extensions}
+
+        # 判定未使用的候選檔案: 專案目錄中的目標檔案 (可達性分析時再加上資源類來源檔案)
+        self._project_prefix = self.project_path.replace('\\', '/').lower().rstrip('/') + '/'
+        self._candidate_extensions = self.target_extensions
+        if self.root_patterns:
+            self._candidate_extensions = self.target_extensions | self._asset_source_extensions()
+            # 根檔案多半是程式碼: 程式碼掃描器也要回報資源檔與其他程式碼檔的引用，否則走訪停在入口腳本
+            reference_extensions = self._candidate_extensions | self.source_extensions()
+            for scanner in self.scanners.values():
+                enable_asset_references = getattr(scanner, 'enable_asset_references', None)
+                if enable_asset_references is not None:
+                    enable_asset_references(reference_extensions)
+
+        self.file_index: Optional[FileIndex] = None
+        self.resolver: Optional[ReferenceResolver] = None
+
+    @classmethod
+    def from_profile(cls, profile_name: str, project_path: str, code_paths: Iterable[str] = (),
+                     progress_callback: Optional[Callable] = None,
+                     message_callback: Optional[Callable[[str], None]] = None,
+                     source_callback: Optional[Callable[[str, str, List[str]], None]] = None,
+                     cancel_token: Optional[CancellationToken] = None,
+                     root_patterns: Iterable[str] = (),
+                     store=None,
+                     instrumentation=None,
+                     tracer=None,
+                     progress: Optional[ProgressReporter] = None) -> 'ScanEngine':
+        """
+        依掃描設定檔建立掃描引擎
+
+        Args:
+            profile_name: SCAN_PROFILES 中的設定檔名稱
+            project_path: 專案根目錄路徑
+            code_paths: 程式碼專案路徑
+            progress_callback: 進度回調函數
+            message_callback: 訊息回調函數
+            source_callback: 來源檔案解析完成時的回調
+            cancel_token: 取消權杖
+            root_patterns: 可達性分析的根檔案樣式
+            store: 結果資料庫 (ResultStore)
+            instrumentation: 效能統計 (Instrumentation)
+            tracer: 追蹤記錄器 (Tracer)
+            progress: 進度回報器 (ProgressReporter)
+
+        Returns:
+            ScanEngine: 掃描引擎
+        """
+        profile = SCAN_PROFILES[profile_name]
+        code_paths = [path for path in code_paths if path]
+        scanner_names = profile['scanners']
+        if scanner_names is not None and code_paths:
+            scanner_names = tuple(scanner_names) + tuple(profile['code_scanners'])
+        return cls(project_path, scanner_names, code_paths, profile['target_extensions'],
+                   progress_callback, message_callback, source_callback, cancel_token,
+                   root_patterns, store, instrumentation, tracer, progress)
+
+    def source_extensions(self) -> Set[str]:
+        """取得已啟用掃描器負責解析的副檔名 (小寫)"""
+        return {extension.lower() for scanner in self.scanners.values() for extension in scanner.FILE_EXTENSIONS}
+
+    def size_extensions(self, targets: bool = False) -> Optional[Set[str]]:
+        """
+        走訪時需要一併取得大小的副檔名
+
+        回報進度或效能統計時需要來源檔案的大小；結果資料庫需要候選檔案的大小 (供介面統計)
+
+        Args:
+            targets: 沒有結果資料庫時也取得候選檔案的大小 (分片工作行程交給合併時寫入資料庫)
+
+        Returns:
+            Optional[Set[str]]: 副檔名集合 (None 代表不需要任何大小)
+        """
+        extensions = set()
+        if self.progress.enabled or self.instrumentation.enabled:
+            extensions |= self.source_extensions()
+        if targets or self.store is not None:
+            extensions |= self._candidate_extensions
+        return extensions or None
+
+    def _checkpoint(self):
+        """工作單位之間的取消 / 暫停檢查點"""
+        if self.cancel_token is not None:
+            self.cancel_token.checkpoint()
+
+    def _emit(self, text: str):
+        """輸出訊息"""
+        if self.message_callback:
+            self.message_callback(text)
+
+    def run(self) -> ScanResult:
+        """
+        執行完整掃描
+
+        各階段以產生器串接: 走訪目錄的同時解析來源檔案，解析的同時解析引用；
+        只有需要完整索引的引用 (檔名比對、sprite frame) 會延後到走訪結束後處理。
+        被取消時不會拋出例外，而是返回 cancelled=True 的部分結果
+
+        Returns:
+            ScanResult: 掃描結果
+        """
+        result = ScanResult(self.project_path)
+        result.timings = {'index': 0.0, 'parse': 0.0, 'resolve': 0.0, 'diff': 0.0}
+        self.logger.info(f"開始掃描專案: {self.project_path} (掃描器: {', '.join(self.scanners)})")
+
+        scan_started = time.perf_counter()
+        if self.store is not None:
+            self.store.begin_scan(self.project_path)
+        self._prepare_pipeline()
+        try:
+            # 只走訪一次目錄: 總數以目前已走訪的目錄比例推算，不另外預先統計
+            events = self._parse_stage(self._discover_stage(result), result,
+                                       discovered=self.file_index.walked_fraction)
+            self._resolve_stage(events, result)
+
+            started = time.perf_counter()
+            self._find_unused_files(result)
+            result.timings['diff'] = time.perf_counter() - started
+            self.tracer.record('diff', started, started + result.timings['diff'])
+        except ScanCancelled:
+            result.cancelled = True
+            self.logger.warning("掃描已取消")
+            self._emit("⚠️ 掃描已取消，保留已完成的部分結果 (未引用檔案列表不會計算，避免誤刪)")
+        finally:
+            self._collect_statistics(result)
+        self._finish_store(result)
+        self.progress.flush()
+        self.tracer.record('scan', scan_started, time.perf_counter(), self.project_path)
+
+        if not result.cancelled:
+            self.logger.info(
+                f"掃描完成: {result.graph.edge_count} 條引用, {result.unused_count()} 個未引用檔案"
+            )
+        return result
+
+    def run_parse_only(self, file_index: FileIndex, entries: Iterable[Tuple[str, int]]) -> ScanResult:
+        """
+        只執行解析階段 (分片掃描的工作行程使用)
+
+        引用字串透過 source_callback 取得；不解析引用，也不計算未引用檔案
+
+        Args:
+            file_index: 此次解析使用的檔案索引 (可以只涵蓋部分目錄)
+            entries: 要解析的 (檔案路徑, 位元組數)，通常是一邊建立 file_index 一邊產出的目錄項目
+
+        Returns:
+            ScanResult: 只包含各掃描器統計與耗時的結果
+        """
+        result = ScanResult(self.project_path)
+        result.timings = {'index': 0.0, 'parse': 0.0, 'resolve': 0.0, 'diff': 0.0}
+        scan_started = time.perf_counter()
+        self._prepare_pipeline(file_index)
+        try:
+            for _ in self._parse_stage(entries, result):
+                pass
+        except ScanCancelled:
+            result.cancelled = True
+        finally:
+            self._collect_statistics(result)
+        self.progress.flush()
+        self.tracer.record('scan_parse_only', scan_started, time.perf_counter(), self.project_path)
+        return result
+
+    def run_from_sources(self, entries: Iterable[Tuple[str, int]], sources: Iterable[tuple],
+                         scanner_statistics: Optional[Dict[str, Dict[str, int]]] = None) -> ScanResult:
+        """
+        以已解析的來源檔案執行引用解析與未引用比對 (合併分片掃描的部分結果時使用)
+
+        Args:
+            entries: 所有分片走訪到的 (檔案路徑, 位元組數)
+            sources: (掃描器名稱, 來源檔案, 引用字串列表)
+            scanner_statistics: 各分片解析階段的掃描器統計 (會累加到結果中)
+
+        Returns:
+            ScanResult: 掃描結果
+        """
+        result = ScanResult(self.project_path)
+        result.timings = {'index': 0.0, 'parse': 0.0, 'resolve': 0.0, 'diff': 0.0}
+        scan_started = time.perf_counter()
+        if self.store is not None:
+            self.store.begin_scan(self.project_path)
+        entries = self._store_files(entries)
+        self._prepare_pipeline(FileIndex.from_files(self._search_roots(), (file_path for file_path, _ in entries)))
+        for name, stats in (scanner_statistics or {}).items():
+            if name in self.scanners:
+                self._file_counts[name] += stats['total_files']
+                self._reference_counts[name] += stats['total_referenced_files']
+                self.scanners[name].successful_scans += stats['analyzed_files']
+                self.scanners[name].failed_scans += stats['failed_scans']
+
+        try:
+            events = (
+                (_EVENT_SOURCE, self.scanners[name], source_file, references)
+                for name, source_file, references in sources
+                if name in self.scanners
+            )
+            self._resolve_stage(events, result)
+
+            started = time.perf_counter()
+            self._find_unused_files(result)
+            result.timings['diff'] = time.perf_counter() - started
+            self.tracer.record('diff', started, started + result.timings['diff'])
+        except ScanCancelled:
+            result.cancelled = True
+            self._emit("⚠️ 掃描已取消，保留已完成的部分結果 (未引用檔案列表不會計算，避免誤刪)")
+        finally:
+            self._collect_statistics(result)
+        self._finish_store(result)
+        self.progress.flush()
+        self.tracer.record('merge', scan_started, time.perf_counter(), self.project_path)
+        return result
+
+    def _search_roots(self) -> List[str]:
+        """專案目錄與程式碼專案目錄 (去除重複)"""
+        return [self.project_path] + [path for path in self.code_paths if path != self.project_path]
+
+    def _prepare_pipeline(self, file_index: Optional[FileIndex] = None):
+        """建立檔案索引、解析器與副檔名分派表"""
+        roots = self._search_roots()
+        self.file_index = file_index if file_index is not None else FileIndex(roots)
+        self.resolver = ReferenceResolver(self.file_index, roots)
+
+        self._dispatch: Dict[str, List] = {}
+        for scanner in self.scanners.values():
+            scanner.file_index = self.file_index
+            for extension in scanner.FILE_EXTENSIONS:
+                self._dispatch.setdefault(extension.lower(), []).append(scanner)
+
+        self._file_counts = {name: 0 for name in self.scanners}
+        self._reference_counts = {name: 0 for name in self.scanners}
+
+    def _store_files(self, entries: Iterable[Tuple[str, int]]) -> Iterator[Tuple[str, int]]:
+        """把經過的 (檔案路徑, 位元組數) 分批寫入結果資料庫 (沒有指定資料庫時原樣產出)"""
+        if self.store is None:
+            yield from entries
+            return
+        for entry in entries:
+            file_path = entry[0]
+            is_target = (os.path.splitext(file_path)[1].lower() in self._candidate_extensions
+                         and file_path.replace('\\', '/').lower().startswith(self._project_prefix))
+            self.store.add_file(file_path, is_target, entry[1] if is_target else 0)
+            yield entry
+
+    def _finish_store(self, result: ScanResult):
+        """
+        寫入結果資料庫剩餘的緩衝與統計 (檔案、引用邊與未使用狀態在各階段已隨產生寫入)
+
+        被取消時只保留已寫入的檔案、引用邊與未解析引用，清除不完整的未使用狀態
+        """
+        if self.store is None:
+            return
+        started = time.perf_counter()
+        self.progress.begin_stage('store', "正在寫入結果資料庫")
+        if result.cancelled:
+            self.store.discard_unused()
+            result.stored_unused_count = 0
+        self.store.finish_scan(result.get_statistics(), complete=not result.cancelled)
+        result.store = self.store
+        result.store_path = self.store.path
+        result.timings['store'] = time.perf_counter() - started
+        self.instrumentation.add_time('store', result.timings['store'])
+        self.tracer.record('store', started, started + result.timings['store'])
+
+    def _discover_stage(self, result: ScanResult) -> Iterator[Tuple[str, int]]:
+        """
+        管線第一段: 走訪目錄並建立索引
+
+        Yields:
+            Tuple[str, int]: (新加入索引的檔案路徑, 位元組數；只有 size_extensions 中的檔案才有大小)
+        """
+        entries = self._store_files(self.file_index.iter_entries(self.cancel_token, self.size_extensions()))
+        while True:
+            started = time.perf_counter()
+            try:
+                entry = next(entries)
+            except StopIteration:
+                break
+            finally:
+                result.timings['index'] += time.perf_counter() - started
+            yield entry
+
+        result.total_indexed_files = self.file_index.total_files
+        self._emit(f"📂 索引完成: 共 {self.file_index.total_files} 個檔案")
+
+    def _parse_stage(self, entries: Iterable[Tuple[str, int]], result: ScanResult,
+                     discovered: Optional[Callable[[], float]] = None) -> Iterator[tuple]:
+        """
+        管線第二段: 依副檔名把檔案分派給掃描器解析
+
+        Args:
+            entries: 要分派的 (檔案路徑, 位元組數)，大小由走訪時的目錄項目提供
+            result: 掃描結果 (累計耗時)
+            discovered: 返回目前已走訪比例的函數 (只用於推算進度的總數；None 代表不推算)
+
+        Yields:
+            tuple: (_EVENT_FILE, 檔案路徑) 或 (_EVENT_SOURCE, 掃描器, 來源檔案, 引用字串列表)
+        """
+        metrics = self.instrumentation
+        tracer = self.tracer
+        progress = self.progress
+        # 分片工作行程不推算總數，只回報已走訪的檔案數與已解析的位元組數 (總數由父行程掌握)
+        progress.begin_stage('parse', "正在走訪目錄並分析檔案", discovered=discovered)
+        for file_path, size in entries:
+            yield (_EVENT_FILE, file_path)
+
+            scanners = self._dispatch.get(os.path.splitext(file_path)[1].lower())
+            if not scanners:
+                if progress.enabled:
+                    progress.advance()
+                continue
+
+            self._checkpoint()
+            if progress.enabled:
+                progress.advance(1, size, file_path)
+
+            for scanner in scanners:
+                name = scanner.SCANNER_NAME
+                self._file_counts[name] += 1
+                started = time.perf_counter()
+                try:
+                    references = scanner.parse_file(Path(file_path))
+                    scanner.successful_scans += 1
+                except Exception as e:
+                    scanner.failed_scans += 1
+                    scanner.logger.log_file_scan(file_path, False, str(e))
+                    continue
+                finally:
+                    elapsed = time.perf_counter() - started
+                    result.timings['parse'] += elapsed
+                    if metrics.enabled:
+                        self._record_parse(name, elapsed, size)
+                    if tracer.enabled:
+                        tracer.record('parse.' + name, started, started + elapsed, file_path)
+
+                if not references:
+                    continue
+                self._reference_counts[name] += len(references)
+                if self.source_callback:
+                    self.source_callback(name, file_path, references)
+                yield (_EVENT_SOURCE, scanner, file_path, references)
+
+    def _record_parse(self, scanner_name: str, elapsed: float, size: int):
+        """記錄單一檔案的解析耗時與大小 (只有啟用效能統計時才會呼叫)"""
+        metrics = self.instrumentation
+        metrics.add_time('parse.' + scanner_name, elapsed)
+        metrics.count('read_bytes.' + scanner_name, size)
+        metrics.observe('parse_us.' + scanner_name, int(elapsed * 1000000))
+        metrics.observe('file_bytes.' + scanner_name, size)
+
+    def _resolve_stage(self, events: Iterable[tuple], result: ScanResult):
+        """
+        管線第三段: 邊解析邊把引用寫入引用關係圖
+
+        路徑命中的引用立即寫入；以檔名比對的引用先連到目前已知的同名檔案，
+        之後走訪到的同名檔案也會即時補上；其餘未命中的引用等索引完成後再完整解析
+        """
+        graph = result.graph
+        add_reference = self._reference_writer(graph)
+        # 檔名 (小寫) -> 以檔名引用它、仍在等待後續同名檔案的來源檔案
+        name_watch: Dict[str, List[str]] = {}
+        name_references = []
+        deferred = []
+        tracer = self.tracer
+
+        for event in events:
+            started = time.perf_counter()
+            if event[0] == _EVENT_FILE:
+                waiting = name_watch.get(os.path.basename(event[1]).lower())
+                if waiting:
+                    for source_file in waiting:
+                        add_reference(source_file, event[1])
+            else:
+                _, scanner, source_file, references = event
+                scope = getattr(scanner, 'REFERENCE_SCOPE', SCOPE_PROJECT)
+                graph.add_source(source_file)
+                for reference in references:
+                    if scope == SCOPE_NAME:
+                        for target in self.file_index.find_by_name(reference):
+                            add_reference(source_file, target)
+                        base_name = reference.replace('\\', '/').rsplit('/', 1)[-1].lower()
+                        name_watch.setdefault(base_name, []).append(source_file)
+                        name_references.append((source_file, reference))
+                        continue
+
+                    resolved = self.resolver.resolve_path(reference, source_file, scope)
+                    if resolved:
+                        add_reference(source_file, resolved[0])
+                    else:
+                        deferred.append((source_file, reference, scope))
+                if tracer.enabled:
+                    tracer.record('resolve', started, time.perf_counter(), source_file)
+            result.timings['resolve'] += time.perf_counter() - started
+
+        # 索引已完成，不再需要等待同名檔案
+        name_watch.clear()
+        started = time.perf_counter()
+        pending = [
+            (source_file, reference, SCOPE_NAME) for source_file, reference in name_references
+            if not self.file_index.find_by_name(reference)
+        ]
+        pending.extend(deferred)
+        self._resolve_deferred(pending, result)
+        result.timings['resolve'] += time.perf_counter() - started
+        tracer.record('resolve_deferred', started, time.perf_counter())
+
+    def _reference_writer(self, graph: ReferenceGraph) -> Callable[[str, str], None]:
+        """
+        取得寫入一條已解析引用的函數
+
+        使用結果資料庫時引用邊同時寫入資料庫的緩衝，不必在掃描結束後再走訪一次整個引用關係圖
+
+        Returns:
+            Callable[[str, str], None]: 接收 (來源檔案, 被引用檔案)
+        """
+        if self.store is None:
+            return graph.add_reference
+        graph_add_reference = graph.add_reference
+        store_add_reference = self.store.add_reference
+
+        def add_reference(source_file: str, target_file: str):
+            graph_add_reference(source_file, target_file)
+            store_add_reference(source_file, target_file)
+
+        return add_reference
+
+    def _resolve_deferred(self, pending: List[tuple], result: ScanResult):
+        """以完整索引解析延後處理的引用 (檔名比對、sprite frame 名稱)"""
+        plist_scanner = self.scanners.get('plist')
+        add_reference = self._reference_writer(result.graph)
+        total = len(pending)
+        self.instrumentation.count('resolve.deferred', total)
+
+        tracer = self.tracer
+
+        for i, (source_file, reference, scope) in enumerate(pending, 1):
+            if i % 256 == 1:
+                self._checkpoint()
+                if i == 1:
+                    self.progress.begin_stage('resolve', "正在解析引用", total, unit='個引用')
+                else:
+                    self.progress.advance(256)
+
+            started = time.perf_counter() if tracer.enabled else 0.0
+            resolved = [] if scope == SCOPE_NAME else self.resolver.resolve(reference, source_file, scope)
+            if not resolved and plist_scanner is not None:
+                # 以 sprite frame 名稱引用時，改為引用定義該 frame 的圖集
+                resolved = plist_scanner.find_frame_owners(reference)
+            if tracer.enabled:
+                tracer.record('resolve.' + scope, started, time.perf_counter(), reference)
+            if not resolved:
+                result.unresolved.setdefault(source_file, []).append(reference)
+                if self.store is not None:
+                    self.store.add_unresolved(source_file, reference)
+                self._emit(f"⚠️  無法解析引用檔案或跨目錄: {reference} ({os.path.basename(source_file)})")
+                continue
+            for target in resolved:
+                add_reference(source_file, target)
+
+    def _collect_statistics(self, result: ScanResult):
+        """整理各掃描器統計 (被取消時也會保留部分統計)"""
+        result.total_indexed_files = self.file_index.total_files
+        for name, scanner in self.scanners.items():
+            result.scanner_statistics[name] = {
+                'total_files': self._file_counts[name],
+                'analyzed_files': scanner.successful_scans,
+                'failed_scans': scanner.failed_scans,
+                'total_referenced_files': self._reference_counts[name],
+            }
+        if self.instrumentation.enabled:
+            self._collect_metrics(result)
+
+    def _collect_metrics(self, result: ScanResult):
+        """把各階段耗時與解析器統計寫入效能統計，並附加到結果與各掃描器統計"""
+        metrics = self.instrumentation
+        for phase, name in (('index', 'walk'), ('resolve', 'resolve'), ('diff', 'diff')):
+            if result.timings.get(phase):
+                metrics.add_time(name, result.timings[phase])
+        metrics.count('walk.files', self.file_index.total_files)
+        metrics.count('diff.targets', len(result.target_files))
+        if self.resolver is not None:
+            metrics.count('resolver.cache_hits', self.resolver.cache_hits)
+            metrics.count('resolver.cache_misses', self.resolver.cache_misses)
+            metrics.count('resolver.scope_checks', self.resolver.scope_checks)
+        for name, statistics in result.scanner_statistics.items():
+            statistics.update(metrics.scanner_statistics(name))
+        result.metrics = metrics
+
+    def _find_unused_files(self, result: ScanResult):
+        """
+        以一次差集找出專案目錄中未使用的目標檔案
+
+        一般模式下未被任何來源引用即為未使用；指定根檔案樣式時改為可達性分析，
+        無法從根檔案到達的目標檔案與資源檔 (非程式碼的來源檔案) 都視為未使用。
+        使用結果資料庫時未使用的檔案直接分批寫入資料庫，不保存在記憶體中
+        """
+        self.progress.begin_stage('diff', "正在查找未引用檔案")
+        is_used = result.graph.is_referenced
+        if self.root_patterns:
+            is_used = self._mark_reachable(result)
+
+        target_files = []
+        unused_files = []
+        add_unused = unused_files.append if self.store is None else self.store.add_unused
+        unused_count = 0
+        for i, file_path in enumerate(self.file_index.files_with_extensions(self._candidate_extensions)):
+            if i % 1024 == 0:
+                self._checkpoint()
+            if not file_path.replace('\\', '/').lower().startswith(self._project_prefix):
+                continue
+            target_files.append(file_path)
+            if not is_used(file_path):
+                add_unused(file_path)
+                unused_count += 1
+
+        # 只有完整比對完成才寫入結果，取消時不會留下不完整的未引用列表 (資料庫中的標記由 _finish_store 清除)
+        result.target_files = target_files
+        result.unused_files = sorted(unused_files)
+        result.stored_unused_count = unused_count if self.store is not None else 0
+
+    def _asset_source_extensions(self) -> Set[str]:
+        """取得資源類來源檔案的副檔名 (排除程式碼掃描器負責的檔案)"""
+        extensions = set()
+        for scanner in self.scanners.values():
+            if not getattr(scanner, 'CODE_SCANNER', False):
+                extensions.update(extension.lower() for extension in scanner.FILE_EXTENSIONS)
+        return extensions
+
+    def _mark_reachable(self, result: ScanResult) -> Callable[[str], bool]:
+        """
+        從根檔案走訪引用關係圖
+
+        Returns:
+            Callable[[str], bool]: 判斷檔案是否可從根檔案到達的函數
+
+        Raises:
+            ValueError: 沒有任何檔案符合根檔案樣式時 (避免把整個專案都判定為未使用)
+        """
+        roots = match_root_files(self.file_index.all_files(), self.file_index.root_paths, self.root_patterns)
+        if not roots:
+            raise ValueError(f"沒有任何檔案符合根檔案樣式: {', '.join(self.root_patterns)}")
+        result.root_files = roots
+
+        graph = result.graph
+        reached = mark_reachable(graph, roots, self.cancel_token)
+        root_set = set(roots)
+        # 不在引用關係圖中的根檔案 (沒有任何引用的根檔案) 也算可到達
+        reachable_count = sum(reached) + sum(1 for root in root_set if graph.node_id(root) is None)
+        self._emit(f"🌱 根檔案: {len(roots)} 個, 可到達的檔案: {reachable_count} 個")
+
+        def is_reachable(file_path: str) -> bool:
+            if file_path in root_set:
+                return True
+            node_id = graph.node_id(file_path)
+            return node_id is not None and reached[node_id] == 1
+
+        return is_reachable
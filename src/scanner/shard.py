@@ -0,0 +1,621 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+分片掃描 - 把專案目錄拆成多個子樹，以多個行程 (或多台機器) 分別執行解析階段
+
+流程:
+    1. census: 以 os.scandir 快速走訪一次，計算每個子樹的檔案數
+    2. plan_shards: 依檔案數把子樹平均分配到各分片 (太大的子樹會再往下拆)
+    3. scan_shard: 每個分片只走訪自己的子樹並解析來源檔案，結果寫成精簡的二進位部分結果檔
+    4. merge_partials: 合併所有部分結果，只執行一次引用解析與未引用比對
+
+部分結果檔記錄的是完整路徑，因此在多台機器分工時，各機器的專案路徑必須相同。
+可達性分析時程式碼掃描器會擷取更多種引用 (見 lua_scanner)，分片解析也必須指定根檔案樣式，
+部分結果檔會記錄這個設定，合併時設定不一致即拒絕合併。
+走訪時順便取得的候選檔案大小也記錄在部分結果檔中，合併時直接寫入結果資料庫，不必再讀取一次。
+啟用追蹤時，每個工作行程另外寫出 <部分結果檔>.trace，合併時一併匯入同一份追蹤檔。
+指定進度回報器時，工作行程各自合併進度後經由 multiprocessing 佇列送回父行程，由父行程彙總後回報。
+同一個目錄樹與分片數量產生的分片計畫是固定的，每台機器只要指定自己的分片編號即可。
+"""
+
+import multiprocessing
+import os
+import queue
+import struct
+import sys
+import time
+import zlib
+from array import array
+from concurrent.futures import ProcessPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from src.scanner.scan_engine import ScanEngine, ScanResult
+from src.utils.file_index import FileIndex
+from src.utils.logger import get_logger
+from src.utils.progress import DISABLED_PROGRESS, ProgressReporter
+from src.utils.tracer import TRACE_SUFFIX, Tracer
+
+
+# 部分結果檔的檔頭 (魔術字串 + 格式版本) 與副檔名
+PARTIAL_MAGIC = b'CPMSHARD'
+PARTIAL_VERSION = 3
+PARTIAL_SUFFIX = '.shard'
+_HEADER = struct.Struct('<8sI')
+
+
+class ShardUnit:
+    """分片單位 - 一個遞迴走訪的子目錄，或某個目錄第一層的檔案"""
+
+    def __init__(self, path: str, recursive: bool, file_count: int, source_bytes: int = 0):
+        """
+        初始化分片單位
+
+        Args:
+            path: 目錄路徑
+            recursive: True 代表包含整個子樹，False 代表只包含該目錄第一層的檔案
+            file_count: 檔案數量
+            source_bytes: 來源檔案的位元組數 (census 指定 source_extensions 時才會計算)
+        """
+        self.path = path
+        self.recursive = recursive
+        self.file_count = file_count
+        self.source_bytes = source_bytes
+
+    def __repr__(self) -> str:
+        return f"ShardUnit({self.path!r}, recursive={self.recursive}, file_count={self.file_count})"
+
+
+def _distinct_roots(root_paths: Iterable[str]) -> List[str]:
+    """去除重複或位於其他根目錄底下的根目錄 (避免同一個檔案被兩個分片解析)"""
+    roots = []
+    for root in sorted({os.path.normpath(str(path)) for path in root_paths}, key=len):
+        key = root.replace('\\', '/').lower().rstrip('/') + '/'
+        if not any(key.startswith(parent.replace('\\', '/').lower().rstrip('/') + '/') for parent in roots):
+            roots.append(root)
+    return roots
+
+
+def census(root_paths: Iterable[str], shard_count: int, cancel_token=None,
+           source_extensions: Optional[Set[str]] = None) -> List[ShardUnit]:
+    """
+    快速走訪目錄並切出分片單位
+
+    每個目錄只記錄第一層檔案數與子目錄；檔案數超過平均分片大小的子樹會再拆成
+    「該目錄第一層的檔案」加上各子目錄，讓單一巨大的資源目錄也能分散到多個分片
+
+    Args:
+        root_paths: 根目錄 (專案目錄與程式碼專案目錄)
+        shard_count: 分片數量
+        cancel_token: 取消權杖，每走訪一個目錄檢查一次
+        source_extensions: 需要計算位元組數的來源檔案副檔名 (小寫；用於以位元組估算剩餘時間，
+            只有這些檔案會多一次 stat)
+
+    Returns:
+        List[ShardUnit]: 互不重疊、涵蓋所有檔案的分片單位
+    """
+    loose_counts: Dict[str, int] = {}
+    loose_bytes: Dict[str, int] = {}
+    children: Dict[str, List[str]] = {}
+    roots = _distinct_roots(root_paths)
+
+    for root in roots:
+        pending = [root]
+        while pending:
+            if cancel_token is not None:
+                cancel_token.checkpoint()
+            directory = pending.pop()
+            count = 0
+            size = 0
+            subdirectories = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirectories.append(entry.path)
+                            elif entry.is_file():
+                                count += 1
+                                if source_extensions and os.path.splitext(entry.name)[1].lower() in source_extensions:
+                                    size += entry.stat().st_size
+                        except OSError:
+                            continue
+            except OSError as e:
+                get_logger().error("掃描目錄時發生錯誤: %s - %s", directory, e)
+            loose_counts[directory] = count
+            loose_bytes[directory] = size
+            children[directory] = sorted(subdirectories)
+            pending.extend(subdirectories)
+
+    # 由下而上計算子樹檔案數 (以路徑長度排序，子目錄一定比父目錄長)
+    totals: Dict[str, int] = {}
+    total_bytes: Dict[str, int] = {}
+    for directory in sorted(loose_counts, key=len, reverse=True):
+        totals[directory] = loose_counts[directory] + sum(totals[child] for child in children[directory])
+        total_bytes[directory] = loose_bytes[directory] + sum(total_bytes[child] for child in children[directory])
+
+    target_size = max(1, sum(totals[root] for root in roots) // max(1, shard_count))
+    units = []
+    pending = list(reversed(roots))
+    while pending:
+        directory = pending.pop()
+        if totals[directory] <= target_size or not children[directory]:
+            if totals[directory]:
+                units.append(ShardUnit(directory, True, totals[directory], total_bytes[directory]))
+            continue
+        if loose_counts[directory]:
+            units.append(ShardUnit(directory, False, loose_counts[directory], loose_bytes[directory]))
+        pending.extend(reversed(children[directory]))
+    return units
+
+
+def plan_shards(units: List[ShardUnit], shard_count: int) -> List[List[ShardUnit]]:
+    """
+    依檔案數把分片單位分配到各分片 (最大者優先放入目前最輕的分片)
+
+    Args:
+        units: 分片單位
+        shard_count: 分片數量
+
+    Returns:
+        List[List[ShardUnit]]: 各分片的單位列表 (不會產生空分片)
+    """
+    shard_count = max(1, min(shard_count, len(units)))
+    shards: List[List[ShardUnit]] = [[] for _ in range(shard_count)]
+    loads = [0] * shard_count
+    for unit in sorted(units, key=lambda unit: (-unit.file_count, unit.path)):
+        lightest = loads.index(min(loads))
+        shards[lightest].append(unit)
+        loads[lightest] += unit.file_count
+    for shard in shards:
+        shard.sort(key=lambda unit: unit.path)
+    return shards
+
+
+class PartialResult:
+    """分片掃描的部分結果 - 走訪到的檔案、解析出的引用字串與掃描器統計"""
+
+    def __init__(self, project_path: str, profile_name: str, code_paths: Iterable[str] = (),
+                 shard_index: int = 0, shard_count: int = 1, reachability: bool = False):
+        """
+        初始化部分結果
+
+        Args:
+            project_path: 專案根目錄路徑
+            profile_name: 掃描設定檔名稱
+            code_paths: 程式碼專案路徑
+            shard_index: 分片編號 (從 0 開始)
+            shard_count: 分片總數
+            reachability: 是否以可達性分析模式解析 (程式碼掃描器另外擷取資源與模組引用)
+        """
+        self.project_path = os.path.normpath(str(project_path))
+        self.profile_name = profile_name
+        self.code_paths = [os.path.normpath(str(path)) for path in code_paths if path]
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+        self.reachability = reachability
+        self.files: List[str] = []
+        # 檔案路徑 -> 走訪時取得的位元組數 (只記錄大小不為 0 的檔案)
+        self.file_sizes: Dict[str, int] = {}
+        # (掃描器名稱, 來源檔案, 引用字串列表)
+        self.sources: List[Tuple[str, str, List[str]]] = []
+        # plist 路徑 -> sprite frame 名稱列表
+        self.sprite_frames: Dict[str, List[str]] = {}
+        self.scanner_statistics: Dict[str, Dict[str, int]] = {}
+        self.timings: Dict[str, float] = {}
+
+    def write(self, file_path: str):
+        """
+        寫入部分結果檔
+
+        所有字串只在字串表中出現一次，其餘資料都是字串表的 u32 編號，整體再以 zlib 壓縮
+
+        Args:
+            file_path: 輸出檔案路徑
+        """
+        strings: List[str] = []
+        string_ids: Dict[str, int] = {}
+
+        def intern(value: str) -> int:
+            string_id = string_ids.get(value)
+            if string_id is None:
+                string_id = string_ids[value] = len(strings)
+                strings.append(value)
+            return string_id
+
+        values = array('I', (self.shard_index, self.shard_count, intern(self.project_path),
+                             intern(self.profile_name), int(self.reachability), len(self.code_paths)))
+        values.extend(intern(path) for path in self.code_paths)
+
+        values.append(len(self.scanner_statistics))
+        for name, stats in self.scanner_statistics.items():
+            values.extend((intern(name), stats['total_files'], stats['analyzed_files'],
+                           stats['failed_scans'], stats['total_referenced_files']))
+
+        values.append(len(self.timings))
+        for phase, seconds in self.timings.items():
+            values.extend((intern(phase), int(seconds * 1000)))
+
+        values.append(len(self.files))
+        values.extend(intern(path) for path in self.files)
+        # 大小可能超過 u32，拆成低 / 高 32 位元
+        values.append(len(self.file_sizes))
+        for path, size in self.file_sizes.items():
+            values.extend((intern(path), size & 0xFFFFFFFF, size >> 32))
+
+        values.append(len(self.sources))
+        for name, source_file, references in self.sources:
+            values.extend((intern(name), intern(source_file), len(references)))
+            values.extend(intern(reference) for reference in references)
+
+        values.append(len(self.sprite_frames))
+        for plist_path, frames in self.sprite_frames.items():
+            values.extend((intern(plist_path), len(frames)))
+            values.extend(intern(frame) for frame in frames)
+
+        if sys.byteorder == 'big':
+            values.byteswap()
+        blob = '\0'.join(strings).encode('utf-8', 'surrogateescape')
+        payload = struct.pack('<II', len(strings), len(blob)) + blob + values.tobytes()
+
+        with open(file_path, 'wb') as f:
+            f.write(_HEADER.pack(PARTIAL_MAGIC, PARTIAL_VERSION))
+            f.write(zlib.compress(payload))
+
+    @classmethod
+    def read(cls, file_path: str) -> 'PartialResult':
+        """
+        讀取部分結果檔
+
+        Args:
+            file_path: 部分結果檔路徑
+
+        Returns:
+            PartialResult: 部分結果
+
+        Raises:
+            ValueError: 檔案格式或版本不符時
+        """
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        if len(data) < _HEADER.size:
+            raise ValueError(f"不是分片部分結果檔: {file_path}")
+        magic, version = _HEADER.unpack_from(data)
+        if magic != PARTIAL_MAGIC:
+            raise ValueError(f"不是分片部分結果檔: {file_path}")
+        if version != PARTIAL_VERSION:
+            raise ValueError(f"不支援的部分結果檔版本 {version}: {file_path}")
+
+        payload = zlib.decompress(data[_HEADER.size:])
+        string_count, blob_size = struct.unpack_from('<II', payload)
+        blob_start = struct.calcsize('<II')
+        blob = payload[blob_start:blob_start + blob_size]
+        strings = blob.decode('utf-8', 'surrogateescape').split('\0') if string_count else []
+        values = array('I')
+        values.frombytes(payload[blob_start + blob_size:])
+        if sys.byteorder == 'big':
+            values.byteswap()
+
+        numbers: Iterator[int] = iter(values)
+        read_int = numbers.__next__
+
+        def read_string() -> str:
+            return strings[read_int()]
+
+        shard_index, shard_count = read_int(), read_int()
+        project_path, profile_name = read_string(), read_string()
+        reachability = bool(read_int())
+        code_paths = [read_string() for _ in range(read_int())]
+        partial = cls(project_path, profile_name, code_paths, shard_index, shard_count, reachability)
+
+        for _ in range(read_int()):
+            name = read_string()
+            partial.scanner_statistics[name] = {
+                'total_files': read_int(),
+                'analyzed_files': read_int(),
+                'failed_scans': read_int(),
+                'total_referenced_files': read_int(),
+            }
+        for _ in range(read_int()):
+            phase = read_string()
+            partial.timings[phase] = read_int() / 1000
+
+        partial.files = [read_string() for _ in range(read_int())]
+        for _ in range(read_int()):
+            path = read_string()
+            partial.file_sizes[path] = read_int() | read_int() << 32
+        for _ in range(read_int()):
+            name, source_file = read_string(), read_string()
+            partial.sources.append((name, source_file, [read_string() for _ in range(read_int())]))
+        for _ in range(read_int()):
+            plist_path = read_string()
+            partial.sprite_frames[plist_path] = [read_string() for _ in range(read_int())]
+        return partial
+
+
+def _iter_unit_files(file_index: FileIndex, units: List[ShardUnit], cancel_token=None,
+                     size_extensions: Optional[Set[str]] = None) -> Iterator[Tuple[str, int]]:
+    """走訪分片單位並把 (檔案路徑, 位元組數) 加入索引 (子樹以 FileIndex 走訪，只取第一層的目錄最後加入)"""
+    yield from file_index.iter_entries(cancel_token, size_extensions)
+
+    loose_files = []
+    for unit in units:
+        if unit.recursive:
+            continue
+        try:
+            with os.scandir(unit.path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file() and file_index.add_file(entry.path):
+                            loose_files.append((entry.path, FileIndex.entry_size(entry, size_extensions)))
+                    except OSError:
+                        continue
+        except OSError as e:
+            get_logger().error("掃描目錄時發生錯誤: %s - %s", unit.path, e)
+    # 全部加入索引後才交給解析，讓同目錄的檔案查詢可以使用索引
+    yield from loose_files
+
+
+def scan_shard(project_path: str, profile_name: str, units: List[ShardUnit], code_paths: Iterable[str] = (),
+               shard_index: int = 0, shard_count: int = 1, cancel_token=None, tracer=None,
+               progress: Optional[ProgressReporter] = None, root_patterns: Iterable[str] = ()) -> PartialResult:
+    """
+    執行單一分片的解析階段
+
+    Args:
+        project_path: 專案根目錄路徑
+        profile_name: 掃描設定檔名稱
+        units: 此分片負責的分片單位
+        code_paths: 程式碼專案路徑
+        shard_index: 分片編號
+        shard_count: 分片總數
+        cancel_token: 取消權杖
+        tracer: 追蹤記錄器 (Tracer)
+        progress: 進度回報器 (ProgressReporter)
+        root_patterns: 可達性分析的根檔案樣式 (合併時要使用相同的設定；解析階段只決定擷取哪些引用)
+
+    Returns:
+        PartialResult: 部分結果
+    """
+    root_patterns = [pattern for pattern in root_patterns if pattern.strip()]
+    partial = PartialResult(project_path, profile_name, code_paths, shard_index, shard_count,
+                            bool(root_patterns))
+
+    def collect(scanner_name: str, source_file: str, references: List[str]):
+        partial.sources.append((scanner_name, source_file, list(references)))
+
+    engine = ScanEngine.from_profile(profile_name, project_path, code_paths,
+                                     source_callback=collect, cancel_token=cancel_token,
+                                     root_patterns=root_patterns, tracer=tracer, progress=progress)
+    file_index = FileIndex([unit.path for unit in units if unit.recursive])
+
+    def record_sizes(entries: Iterator[Tuple[str, int]]) -> Iterator[Tuple[str, int]]:
+        for entry in entries:
+            if entry[1]:
+                partial.file_sizes[entry[0]] = entry[1]
+            yield entry
+
+    started = time.perf_counter()
+    entries = _iter_unit_files(file_index, units, cancel_token, engine.size_extensions(targets=True))
+    result = engine.run_parse_only(file_index, record_sizes(entries))
+
+    partial.files = file_index.all_files()
+    partial.scanner_statistics = result.scanner_statistics
+    partial.timings = {'parse': time.perf_counter() - started}
+    plist_scanner = engine.scanners.get('plist')
+    if plist_scanner is not None:
+        partial.sprite_frames = dict(plist_scanner.sprite_frames)
+    return partial
+
+
+def shard_roots(project_path: str, code_paths: Iterable[str] = ()) -> List[str]:
+    """分片走訪的根目錄 (專案目錄 + 程式碼專案目錄)"""
+    return [os.path.normpath(str(project_path))] + [os.path.normpath(str(path)) for path in code_paths if path]
+
+
+def partial_file_name(shard_index: int, shard_count: int) -> str:
+    """部分結果檔的預設檔名"""
+    return f"shard-{shard_index + 1:03d}-of-{shard_count:03d}{PARTIAL_SUFFIX}"
+
+
+# 工作行程送回進度的佇列 (只有父行程指定進度回報器時才會由 _init_worker 設定)
+_progress_queue = None
+
+
+def _init_worker(progress_queue):
+    """工作行程初始化 (ProcessPoolExecutor 的 initializer)"""
+    global _progress_queue
+    _progress_queue = progress_queue
+
+
+def _run_shard_task(task: tuple) -> str:
+    """工作行程入口 (需為模組層級函數才能傳給 ProcessPoolExecutor)"""
+    (project_path, profile_name, code_paths, root_patterns, shard_index, shard_count,
+     unit_specs, output_path, trace) = task
+    units = [ShardUnit(path, recursive, file_count) for path, recursive, file_count in unit_specs]
+    tracer = Tracer() if trace else None
+    progress = None
+    if _progress_queue is not None:
+        # 工作行程只送回累計數量，由父行程彙總所有分片後再回報
+        progress_queue = _progress_queue
+        progress = ProgressReporter(
+            lambda update: progress_queue.put((shard_index, update.done, update.bytes_done))
+        )
+    scan_shard(project_path, profile_name, units, code_paths, shard_index, shard_count,
+               tracer=tracer, progress=progress, root_patterns=root_patterns).write(output_path)
+    if tracer is not None:
+        tracer.save(output_path + TRACE_SUFFIX)
+    return output_path
+
+
+def run_shards(project_path: str, profile_name: str, shard_count: int, output_dir: str,
+               code_paths: Iterable[str] = (), max_workers: Optional[int] = None,
+               message_callback: Optional[Callable[[str], None]] = None, trace: bool = False,
+               progress: Optional[ProgressReporter] = None, root_patterns: Iterable[str] = ()) -> List[str]:
+    """
+    在本機以多個行程執行所有分片，並把部分結果寫到輸出目錄
+
+    Args:
+        project_path: 專案根目錄路徑
+        profile_name: 掃描設定檔名稱
+        shard_count: 分片數量
+        output_dir: 部分結果檔輸出目錄
+        code_paths: 程式碼專案路徑
+        max_workers: 最多同時執行的行程數 (預設為 CPU 數量)
+        message_callback: 訊息回調函數
+        trace: 是否在每個工作行程記錄追蹤 (寫在部分結果檔旁，merge_partials 會匯入)
+        progress: 進度回報器 (ProgressReporter)；彙總所有工作行程的進度，以位元組估算剩餘時間
+        root_patterns: 可達性分析的根檔案樣式 (傳給各工作行程，合併時要使用相同的設定)
+
+    Returns:
+        List[str]: 部分結果檔路徑 (依分片編號排序)
+    """
+    code_paths = [path for path in code_paths if path]
+    root_patterns = list(root_patterns)
+    progress = progress if progress is not None else DISABLED_PROGRESS
+    source_extensions = None
+    if progress.enabled:
+        source_extensions = ScanEngine.from_profile(profile_name, project_path, code_paths).source_extensions()
+    shards = plan_shards(census(shard_roots(project_path, code_paths), shard_count,
+                                source_extensions=source_extensions), shard_count)
+    if message_callback:
+        for shard_index, units in enumerate(shards):
+            message_callback(f"分片 {shard_index + 1}/{len(shards)}: "
+                             f"{sum(unit.file_count for unit in units)} 個檔案, {len(units)} 個目錄單位")
+
+    tasks = [
+        (project_path, profile_name, code_paths, root_patterns, shard_index, len(shards),
+         [(unit.path, unit.recursive, unit.file_count) for unit in units],
+         os.path.join(output_dir, partial_file_name(shard_index, len(shards))), trace)
+        for shard_index, units in enumerate(shards)
+    ]
+    if not tasks:
+        return []
+    workers = max_workers or min(len(tasks), os.cpu_count() or 1)
+    if not progress.enabled:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_run_shard_task, tasks))
+
+    progress.begin_stage('parse', f"正在以 {len(tasks)} 個分片走訪並分析檔案",
+                         sum(unit.file_count for units in shards for unit in units),
+                         sum(unit.source_bytes for units in shards for unit in units))
+    progress_queue = multiprocessing.Queue()
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(progress_queue,)) as pool:
+            futures = [pool.submit(_run_shard_task, task) for task in tasks]
+            _forward_progress(futures, progress_queue, progress)
+            return [future.result() for future in futures]
+    finally:
+        progress_queue.close()
+
+
+def _forward_progress(futures: list, progress_queue, progress: ProgressReporter):
+    """等待所有工作行程結束，期間把各分片送回的累計數量彙總到進度回報器"""
+    reported: Dict[int, Tuple[int, int]] = {}
+
+    def drain():
+        while True:
+            try:
+                shard_index, files, size = progress_queue.get_nowait()
+            except queue.Empty:
+                return
+            last_files, last_size = reported.get(shard_index, (0, 0))
+            if (files, size) != (last_files, last_size):
+                reported[shard_index] = (files, size)
+                progress.advance(files - last_files, size - last_size)
+
+    pending = set(futures)
+    while pending:
+        _, pending = wait(pending, timeout=max(progress.interval, 0.05))
+        drain()
+    drain()
+    progress.flush()
+
+
+def merge_partials(partial_paths: Iterable[str], project_path: str, profile_name: str,
+                   code_paths: Iterable[str] = (), root_patterns: Iterable[str] = (),
+                   message_callback: Optional[Callable[[str], None]] = None,
+                   source_callback: Optional[Callable[[str, str, List[str]], None]] = None,
+                   store=None, instrumentation=None, tracer=None,
+                   progress: Optional[ProgressReporter] = None) -> ScanResult:
+    """
+    合併所有分片的部分結果，並執行一次引用解析與未引用比對
+
+    Args:
+        partial_paths: 部分結果檔路徑
+        project_path: 專案根目錄路徑 (必須與分片掃描時相同)
+        profile_name: 掃描設定檔名稱 (必須與分片掃描時相同)
+        code_paths: 程式碼專案路徑
+        root_patterns: 可達性分析的根檔案樣式
+        message_callback: 訊息回調函數
+        source_callback: 每個來源檔案的回調，接收 (掃描器名稱, 來源檔案, 引用字串列表)
+        store: 結果資料庫 (ResultStore)
+        instrumentation: 效能統計 (Instrumentation)；只涵蓋合併時的引用解析與比對，
+            不包含各分片行程的解析耗時
+        tracer: 追蹤記錄器 (Tracer)；部分結果檔旁有追蹤檔時一併匯入
+        progress: 進度回報器 (ProgressReporter)
+
+    Returns:
+        ScanResult: 掃描結果
+
+    Raises:
+        ValueError: 部分結果不屬於同一次分片掃描，或缺少某些分片時
+    """
+    partial_paths = list(partial_paths)
+    root_patterns = [pattern for pattern in root_patterns if pattern.strip()]
+    partials = [PartialResult.read(path) for path in partial_paths]
+    if not partials:
+        raise ValueError("沒有任何分片部分結果")
+
+    expected_project = os.path.normcase(os.path.normpath(str(project_path)))
+    shard_count = partials[0].shard_count
+    seen = set()
+    for partial in partials:
+        if os.path.normcase(partial.project_path) != expected_project:
+            raise ValueError(f"部分結果的專案路徑不符: {partial.project_path}")
+        if partial.profile_name != profile_name:
+            raise ValueError(f"部分結果的掃描設定檔不符: {partial.profile_name}")
+        if partial.shard_count != shard_count:
+            raise ValueError("部分結果來自不同的分片計畫 (分片數量不一致)")
+        if partial.reachability != bool(root_patterns):
+            raise ValueError("部分結果的可達性分析設定不符 (shard-scan 與 merge 必須同時指定或同時不指定 --root)")
+        if partial.shard_index in seen:
+            raise ValueError(f"分片 {partial.shard_index + 1} 重複")
+        seen.add(partial.shard_index)
+    missing = sorted(set(range(shard_count)) - seen)
+    if missing:
+        raise ValueError(f"缺少分片: {', '.join(str(index + 1) for index in missing)}")
+
+    engine = ScanEngine.from_profile(profile_name, project_path, code_paths,
+                                     message_callback=message_callback, root_patterns=root_patterns,
+                                     store=store, instrumentation=instrumentation, tracer=tracer,
+                                     progress=progress)
+    if tracer is not None:
+        for path in partial_paths:
+            tracer.include(path + TRACE_SUFFIX)
+    plist_scanner = engine.scanners.get('plist')
+    if plist_scanner is not None:
+        for partial in partials:
+            for plist_path, frames in partial.sprite_frames.items():
+                plist_scanner.register_frames(plist_path, frames)
+
+    statistics: Dict[str, Dict[str, int]] = {}
+    for partial in partials:
+        for name, stats in partial.scanner_statistics.items():
+            merged = statistics.setdefault(name, dict.fromkeys(stats, 0))
+            for key, value in stats.items():
+                merged[key] += value
+
+    def iter_sources() -> Iterator[tuple]:
+        for partial in partials:
+            for source in partial.sources:
+                if source_callback:
+                    source_callback(*source)
+                yield source
+
+    entries = ((file_path, partial.file_sizes.get(file_path, 0))
+               for partial in partials for file_path in partial.files)
+    result = engine.run_from_sources(entries, iter_sources(), statistics)
+    # 各分片平行執行，解析階段耗時以最慢的分片為準
+    result.timings['parse'] = max(partial.timings.get('parse', 0.0) for partial in partials)
+    return result
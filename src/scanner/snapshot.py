@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+分析快照 - 保存每次分析的目標檔案狀態，並比較兩次分析之間的差異
+
+快照由一張路徑字串表與三個位元集 (存在 / 被引用 / 未使用) 組成，第 i 個位元對應字串表的第 i 個路徑。
+新快照會沿用上一次快照的字串表 (只在尾端加入新路徑，已刪除的路徑保留位置)，
+同一個字串表系列 (lineage) 的快照位元位置一致，比較時只需要對位元集做 XOR / AND，
+再走訪有變化的位元組，耗時與變化量成正比，而不是與檔案總數成正比。
+"""
+
+import os
+import re
+import struct
+import time
+import uuid
+import zlib
+from typing import Dict, Iterator, List, Optional
+
+
+# 快照檔的檔頭 (魔術字串 + 格式版本)
+SNAPSHOT_MAGIC = b'CPMSNAPS'
+SNAPSHOT_VERSION = 1
+_HEADER = struct.Struct('<8sI')
+_META = struct.Struct('<dII')
+
+# 已刪除路徑超過字串表的這個比例時重建字串表 (新的 lineage，下一次比較會改用路徑對應)
+COMPACT_RATIO = 0.5
+
+_NONZERO_BYTE = re.compile(rb'[^\x00]')
+
+
+def _to_bytes(bits: int) -> bytes:
+    """位元集 (int) 轉為 little-endian 位元組"""
+    return bits.to_bytes((bits.bit_length() + 7) // 8, 'little')
+
+
+def _iter_set_bits(bits: int) -> Iterator[int]:
+    """依序產出位元集中為 1 的位元位置 (只走訪非零的位元組)"""
+    data = _to_bytes(bits)
+    for match in _NONZERO_BYTE.finditer(data):
+        byte_index = match.start()
+        value = data[byte_index]
+        base = byte_index * 8
+        while value:
+            lowest = value & -value
+            yield base + lowest.bit_length() - 1
+            value ^= lowest
+
+
+class Snapshot:
+    """分析快照 - 路徑字串表與存在 / 被引用 / 未使用位元集"""
+
+    def __init__(self, project_path: str, lineage: Optional[str] = None):
+        """
+        初始化空快照
+
+        Args:
+            project_path: 專案根目錄路徑
+            lineage: 字串表系列編號 (沿用上一次快照的字串表時相同)
+        """
+        self.project_path = os.path.normpath(str(project_path))
+        self.lineage = lineage or uuid.uuid4().hex
+        self.created_at = time.time()
+        self.paths: List[str] = []
+        # 位元集以 Python int 保存 (位元 i 對應 paths[i])
+        self.exists = 0
+        self.referenced = 0
+        self.unused = 0
+
+    @classmethod
+    def from_result(cls, result, base: Optional['Snapshot'] = None) -> 'Snapshot':
+        """
+        由掃描結果建立快照
+
+        Args:
+            result: 完整完成的掃描結果 (ScanResult)
+            base: 上一次的快照；提供時沿用其字串表，讓兩次快照的位元位置一致
+
+        Returns:
+            Snapshot: 快照
+
+        Raises:
+            ValueError: 掃描結果是被取消的部分結果時
+        """
+        if result.cancelled:
+            raise ValueError("掃描已取消，不建立快照 (部分結果的未引用檔案列表不完整)")
+
+        reuse = base is not None and base.exists.bit_count() >= len(base.paths) * (1 - COMPACT_RATIO)
+        snapshot = cls(result.project_path, base.lineage if reuse else None)
+        if reuse:
+            snapshot.paths = list(base.paths)
+        path_ids: Dict[str, int] = {path: index for index, path in enumerate(snapshot.paths)}
+
+        unused_files = set(result.iter_unused())
+        exists = bytearray((len(snapshot.paths) + len(result.target_files) + 7) // 8)
+        referenced = bytearray(len(exists))
+        unused = bytearray(len(exists))
+        for file_path in result.target_files:
+            index = path_ids.get(file_path)
+            if index is None:
+                index = path_ids[file_path] = len(snapshot.paths)
+                snapshot.paths.append(file_path)
+            mask = 1 << (index & 7)
+            exists[index >> 3] |= mask
+            if result.graph.is_referenced(file_path):
+                referenced[index >> 3] |= mask
+            if file_path in unused_files:
+                unused[index >> 3] |= mask
+
+        snapshot.exists = int.from_bytes(exists, 'little')
+        snapshot.referenced = int.from_bytes(referenced, 'little')
+        snapshot.unused = int.from_bytes(unused, 'little')
+        return snapshot
+
+    def write(self, file_path: str):
+        """
+        寫入快照檔 (字串表與位元集整體以 zlib 壓縮)
+
+        Args:
+            file_path: 輸出檔案路徑
+        """
+        strings = [self.project_path, self.lineage] + self.paths
+        blob = '\0'.join(strings).encode('utf-8', 'surrogateescape')
+        payload = [_META.pack(self.created_at, len(strings), len(blob)), blob]
+        for bits in (self.exists, self.referenced, self.unused):
+            data = _to_bytes(bits)
+            payload.append(struct.pack('<I', len(data)))
+            payload.append(data)
+
+        with open(file_path, 'wb') as f:
+            f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION))
+            f.write(zlib.compress(b''.join(payload)))
+
+    @classmethod
+    def read(cls, file_path: str) -> 'Snapshot':
+        """
+        讀取快照檔
+
+        Args:
+            file_path: 快照檔路徑
+
+        Returns:
+            Snapshot: 快照
+
+        Raises:
+            ValueError: 檔案格式或版本不符時
+        """
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        if len(data) < _HEADER.size or _HEADER.unpack_from(data)[0] != SNAPSHOT_MAGIC:
+            raise ValueError(f"不是分析快照檔: {file_path}")
+        version = _HEADER.unpack_from(data)[1]
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"不支援的快照檔版本 {version}: {file_path}")
+
+        payload = zlib.decompress(data[_HEADER.size:])
+        created_at, string_count, blob_size = _META.unpack_from(payload)
+        offset = _META.size
+        strings = payload[offset:offset + blob_size].decode('utf-8', 'surrogateescape').split('\0')
+        offset += blob_size
+        if len(strings) != string_count:
+            raise ValueError(f"快照檔內容損毀: {file_path}")
+
+        snapshot = cls(strings[0], strings[1])
+        snapshot.created_at = created_at
+        snapshot.paths = strings[2:]
+        bitsets = []
+        for _ in range(3):
+            (size,) = struct.unpack_from('<I', payload, offset)
+            offset += 4
+            bitsets.append(int.from_bytes(payload[offset:offset + size], 'little'))
+            offset += size
+        snapshot.exists, snapshot.referenced, snapshot.unused = bitsets
+        return snapshot
+
+    def unused_files(self) -> List[str]:
+        """取得快照中的未使用檔案"""
+        return [self.paths[index] for index in _iter_set_bits(self.unused & self.exists)]
+
+
+class SnapshotDelta:
+    """兩次快照之間的差異"""
+
+    def __init__(self, old: Snapshot, new: Snapshot):
+        """
+        初始化差異
+
+        Args:
+            old: 較舊的快照
+            new: 較新的快照
+        """
+        self.old_created_at = old.created_at
+        self.new_created_at = new.created_at
+        # 這次才變成未使用的檔案 (包含新加入且未使用的檔案)
+        self.newly_unused: List[str] = []
+        # 上次存在但未被引用，這次被引用的檔案
+        self.newly_referenced: List[str] = []
+        # 上次存在，這次已不存在的檔案
+        self.deleted: List[str] = []
+
+    @property
+    def is_empty(self) -> bool:
+        """是否沒有任何變化"""
+        return not (self.newly_unused or self.newly_referenced or self.deleted)
+
+
+def _align(old: Snapshot, new: Snapshot) -> Snapshot:
+    """
+    把舊快照對應到新快照的字串表
+
+    同一個 lineage 的字串表只會在尾端加入路徑，位元位置本來就一致，直接返回；
+    否則以路徑重新對應 (耗時與檔案數成正比，只有字串表重建後的第一次比較會發生)
+    """
+    if old.lineage == new.lineage and len(old.paths) <= len(new.paths):
+        return old
+
+    path_ids = {path: index for index, path in enumerate(new.paths)}
+    paths = list(new.paths)
+    size = (len(new.paths) + len(old.paths) + 7) // 8
+    exists, referenced, unused = bytearray(size), bytearray(size), bytearray(size)
+    old_referenced = _to_bytes(old.referenced)
+    old_unused = _to_bytes(old.unused)
+
+    for index in _iter_set_bits(old.exists):
+        path = old.paths[index]
+        new_index = path_ids.get(path)
+        if new_index is None:
+            # 新快照的字串表沒有這個路徑: 接在尾端，讓它被判定為已刪除
+            new_index = len(paths)
+            paths.append(path)
+        mask = 1 << (new_index & 7)
+        exists[new_index >> 3] |= mask
+        byte_index, bit = index >> 3, 1 << (index & 7)
+        if byte_index < len(old_referenced) and old_referenced[byte_index] & bit:
+            referenced[new_index >> 3] |= mask
+        if byte_index < len(old_unused) and old_unused[byte_index] & bit:
+            unused[new_index >> 3] |= mask
+
+    aligned = Snapshot(old.project_path, new.lineage)
+    aligned.created_at = old.created_at
+    aligned.paths = paths
+    aligned.exists = int.from_bytes(exists, 'little')
+    aligned.referenced = int.from_bytes(referenced, 'little')
+    aligned.unused = int.from_bytes(unused, 'little')
+    return aligned
+
+
+def diff_snapshots(old: Snapshot, new: Snapshot) -> SnapshotDelta:
+    """
+    比較兩次快照
+
+    Args:
+        old: 較舊的快照
+        new: 較新的快照
+
+    Returns:
+        SnapshotDelta: 差異 (各列表依路徑排序)
+    """
+    delta = SnapshotDelta(old, new)
+    old = _align(old, new)
+    paths = old.paths if len(old.paths) > len(new.paths) else new.paths
+
+    old_unused, new_unused = old.unused & old.exists, new.unused & new.exists
+    old_unreferenced = old.exists & ~old.referenced
+    newly_unused = (old_unused ^ new_unused) & new_unused
+    newly_referenced = (old_unreferenced ^ (new.exists & ~new.referenced)) & old_unreferenced & new.exists
+    deleted = (old.exists ^ new.exists) & old.exists
+
+    delta.newly_unused = sorted(paths[index] for index in _iter_set_bits(newly_unused))
+    delta.newly_referenced = sorted(paths[index] for index in _iter_set_bits(newly_referenced))
+    delta.deleted = sorted(paths[index] for index in _iter_set_bits(deleted))
+    return delta
+
+
+def record_snapshot(result, snapshot_path: str, base_path: Optional[str] = None) -> Optional[SnapshotDelta]:
+    """
+    建立並寫入這次分析的快照，並與上一次的快照比較
+
+    Args:
+        result: 完整完成的掃描結果 (ScanResult)
+        snapshot_path: 快照輸出路徑
+        base_path: 上一次的快照 (預設為 snapshot_path 既有的檔案)；不存在時不比較
+
+    Returns:
+        Optional[SnapshotDelta]: 與上一次快照的差異，沒有上一次快照時返回None
+    """
+    base_path = base_path or snapshot_path
+    base = Snapshot.read(base_path) if os.path.isfile(base_path) else None
+    snapshot = Snapshot.from_result(result, base)
+    snapshot.write(snapshot_path)
+    return diff_snapshots(base, snapshot) if base is not None else None
@@ -0,0 +1,699 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Spine檔案掃描器 - 負責解析 .atlas、骨骼 .json 與二進位 .skel 檔案中引用的圖片
+"""
+
+import codecs
+import json
+import os
+import re
+import struct
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional, Set, Tuple
+
+from src.scanner.registry import ScannerBase, register_scanner
+from src.utils.file_index import FileIndex
+
+
+# JSON 詞法單元: 字串 | 結構符號 | 其他純量
+_JSON_TOKEN_RE = re.compile(r'"((?:[^"\\]|\\.)*)"|([{}\[\]:,])|([^\s{}\[\]:,"]+)')
+
+# 骨骼 .json 每次讀取的位元組數 (記憶體用量只與區塊大小及最長的詞法單元有關)
+_JSON_CHUNK_SIZE = 64 * 1024
+
+# 會引用圖片的附件類型 (未指定 type 時預設為 region)
+_IMAGE_ATTACHMENT_TYPES = {'region', 'mesh', 'linkedmesh'}
+
+_VERSION_RE = re.compile(r'^\d+\.\d+')
+
+
+def _iter_json_tokens(stream: BinaryIO,
+                      head: bytes = b'') -> Iterator[Tuple[Optional[str], Optional[str], Optional[str]]]:
+    """
+    以固定大小的區塊讀取 JSON 並逐一產生詞法單元 (不把整個檔案讀入記憶體)
+
+    區塊尾端可能切斷詞法單元 (數值被截斷或字串尚未結束)。未結束的字串只可能從區塊中
+    最後一個完整字串之後開始，因此每個區塊只產生到最後一個字串為止，其餘留到與下一個區塊合併；
+    沒有任何引號的區塊 (例如很長的數值陣列) 則只保留最後一個單元。
+
+    Args:
+        stream: 以二進位模式開啟的檔案
+        head: 已經從 stream 讀出的開頭資料
+
+    Yields:
+        Tuple[Optional[str], Optional[str], Optional[str]]: _JSON_TOKEN_RE 的 (字串內容, 結構符號, 純量)
+    """
+    decoder = codecs.getincrementaldecoder('utf-8-sig')(errors='replace')
+    finditer = _JSON_TOKEN_RE.finditer
+    groups = re.Match.groups
+    pending = ''
+    data = head or stream.read(_JSON_CHUNK_SIZE)
+    while data:
+        text = pending + decoder.decode(data)
+        matches = list(finditer(text))
+        keep = len(matches)
+        if '"' in text:
+            while keep and matches[keep - 1].group(1) is None:
+                keep -= 1
+        elif keep:
+            keep -= 1
+        if keep:
+            del matches[keep:]
+            yield from map(groups, matches)
+            pending = text[matches[-1].end():]
+        else:
+            pending = text
+        data = stream.read(_JSON_CHUNK_SIZE)
+    yield from map(groups, finditer(pending + decoder.decode(b'', True)))
+
+
+@register_scanner
+class SpineScanner(ScannerBase):
+    """Spine檔案掃描器 - 負責解析.atlas、.json、.skel檔案中引用的圖片檔案"""
+
+    SCANNER_NAME = 'spine'
+    FILE_EXTENSIONS = ('.atlas', '.json', '.skel')
+
+    def __init__(self, project_path: str, image_types: Set[str], file_index: Optional[FileIndex] = None):
+        """
+        初始化Spine掃描器
+
+        Args:
+            project_path: 專案根目錄路徑
+            image_types: 要搜尋的圖片類型集合
+            file_index: 共用檔案索引 (由掃描引擎設定)
+        """
+        super().__init__(project_path, image_types, file_index)
+        # 不是 Spine 骨骼資料而略過的 .json 檔案數
+        self.skipped_json_files = 0
+
+    def parse_file(self, file_path: Path) -> List[str]:
+        """
+        依副檔名解析單一Spine檔案
+
+        Args:
+            file_path: 檔案路徑
+
+        Returns:
+            List[str]: 引用檔案的路徑列表 (相對於該檔案所在目錄)
+        """
+        file_path = Path(file_path)
+        extension = file_path.suffix.lower()
+
+        if extension == '.atlas':
+            return self._analyze_atlas_file(file_path)
+        if extension == '.json':
+            return self._analyze_json_file(file_path)
+        if extension == '.skel':
+            return self._analyze_skel_file(file_path)
+        return []
+
+    def _analyze_atlas_file(self, atlas_file_path: Path) -> List[str]:
+        """
+        逐行解析.atlas檔案的頁面圖片
+
+        atlas 格式中，檔案開頭或空白行之後的第一行即為頁面圖片名稱，
+        其後才是 size/format/filter 等屬性與 region 名稱
+
+        Args:
+            atlas_file_path: ATLAS檔案路徑
+
+        Returns:
+            List[str]: 頁面圖片列表
+        """
+        pages = []
+        expect_page = True
+
+        with open(atlas_file_path, 'r', encoding='utf-8-sig', errors='replace') as f:
+            for line in f:
+                stripped = line.strip()
+                if not stripped:
+                    expect_page = True
+                    continue
+
+                if expect_page:
+                    expect_page = False
+                    if ':' not in stripped and stripped not in pages:
+                        pages.append(stripped)
+
+        return pages
+
+    def _analyze_json_file(self, json_file_path: Path) -> List[str]:
+        """
+        以詞法掃描的方式解析Spine骨骼.json的附件路徑 (不建立完整的物件樹)
+
+        同時支援 3.7 (skins 為物件) 與 3.8+ (skins 為陣列) 的格式
+
+        Args:
+            json_file_path: JSON檔案路徑
+
+        Returns:
+            List[str]: 附件對應的圖片路徑列表，非Spine檔案則返回空列表
+        """
+        with open(json_file_path, 'rb') as f:
+            head = f.read(4096)
+            # Spine 匯出的 json 一開始就是 skeleton 區段，其他 json 直接跳過
+            if b'"skeleton"' not in head or b'"spine"' not in head:
+                self.skipped_json_files += 1
+                return []
+
+            is_spine = False
+            images_path = ''
+            attachments = []
+
+            # 堆疊中每一層為 [容器類型, 目前的key或索引, 是否等待key]
+            stack = []
+            current_attachment = None
+            attachment_depth = -1
+
+            for raw_string, symbol, scalar in _iter_json_tokens(f, head):
+                if symbol:
+                    if symbol in '{[':
+                        path = [frame[1] for frame in stack]
+                        if symbol == '{' and current_attachment is None and self._is_attachment_path(path):
+                            current_attachment = {'name': path[-1], 'path': None, 'type': 'region'}
+                            attachment_depth = len(stack) + 1
+                        stack.append([symbol, 0 if symbol == '[' else None, symbol == '{'])
+                    elif symbol in '}]':
+                        if current_attachment is not None and len(stack) == attachment_depth:
+                            if current_attachment['type'] in _IMAGE_ATTACHMENT_TYPES:
+                                attachments.append(current_attachment['path'] or current_attachment['name'])
+                            current_attachment = None
+                        if stack:
+                            stack.pop()
+                    elif symbol == ',' and stack:
+                        frame = stack[-1]
+                        if frame[0] == '[':
+                            frame[1] += 1
+                        else:
+                            frame[2] = True
+                    continue
+
+                if raw_string is not None:
+                    value = json.loads(f'"{raw_string}"') if '\\' in raw_string else raw_string
+                else:
+                    value = scalar
+
+                if not stack:
+                    continue
+
+                frame = stack[-1]
+                if frame[0] == '{' and frame[2]:
+                    # 物件中的 key
+                    frame[1] = value
+                    frame[2] = False
+                    continue
+
+                # 純量值: 記錄需要的欄位
+                depth = len(stack)
+                key = frame[1]
+                if depth == 2 and stack[0][1] == 'skeleton':
+                    if key == 'spine':
+                        is_spine = True
+                    elif key == 'images' and raw_string is not None:
+                        images_path = value
+                elif current_attachment is not None and depth == attachment_depth:
+                    if key == 'path' and raw_string is not None:
+                        current_attachment['path'] = value
+                    elif key == 'type' and raw_string is not None:
+                        current_attachment['type'] = value
+
+        if not is_spine:
+            self.skipped_json_files += 1
+            return []
+
+        references = self._attachment_references(attachments, images_path)
+        references.extend(self._sibling_atlas_reference(json_file_path))
+        return references
+
+    @staticmethod
+    def _is_attachment_path(path: List) -> bool:
+        """判斷目前的key路徑是否指向單一附件物件"""
+        if len(path) < 4 or path[0] != 'skins':
+            return False
+        if isinstance(path[1], int):
+            # 3.8+: skins[i].attachments.slot.attachment
+            return len(path) == 5 and path[2] == 'attachments'
+        # 3.7: skins.skinName.slot.attachment
+        return len(path) == 4
+
+    def _analyze_skel_file(self, skel_file_path: Path) -> List[str]:
+        """
+        解析二進位.skel檔案，讀取各造型 (skin) 中會引用圖片的附件路徑 (以 seek 逐段讀取，不載入整個檔案)
+
+        只取 region / mesh / linkedmesh 附件的 path (未指定時為附件名稱)，與 .json 的處理相同；
+        字串表中的骨骼、插槽、事件名稱不會被當成引用
+
+        Args:
+            skel_file_path: SKEL檔案路徑
+
+        Returns:
+            List[str]: 附件對應的圖片路徑列表
+        """
+        with open(skel_file_path, 'rb') as f:
+            reader = _SkelReader(f)
+            header = reader.read_header()
+            if header is None:
+                raise ValueError("無法辨識的Spine二進位格式")
+
+            version, images_path = header
+            names = []
+            # 3.8 之前的版本沒有共用字串表，附件名稱散落在各區段中
+            if reader.format_version >= (3, 8):
+                strings = reader.read_string_table()
+                try:
+                    names = reader.read_attachment_paths()
+                except (EOFError, IndexError, ValueError) as e:
+                    # 未支援的版本或結構不符時退回整個字串表: 寧可多保留圖片，也不要誤判為未使用
+                    self.logger.warning("無法解析SKEL附件 (%s, 版本 %s): %s", skel_file_path, version, e)
+                    names = [value for value in strings if value]
+
+        references = self._attachment_references(names, images_path or '')
+        references.extend(self._sibling_atlas_reference(skel_file_path))
+        return references
+
+    def _attachment_references(self, names: List[str], images_path: str) -> List[str]:
+        """將附件名稱轉換為圖片路徑 (套用 skeleton.images 前綴)"""
+        references = []
+        seen = set()
+        prefix = images_path.replace('\\', '/').strip()
+        if prefix.startswith('./'):
+            prefix = prefix[2:]
+        if prefix and not prefix.endswith('/'):
+            prefix += '/'
+
+        for name in names:
+            if not name:
+                continue
+            name = name.replace('\\', '/')
+            if os.path.splitext(name)[1].lower().lstrip('.') not in self.image_types:
+                name += '.png'
+            reference = prefix + name
+            if reference not in seen:
+                seen.add(reference)
+                references.append(reference)
+        return references
+
+    def _sibling_atlas_reference(self, skeleton_file_path: Path) -> List[str]:
+        """骨骼檔案依命名慣例引用同目錄下同名的.atlas"""
+        atlas_path = skeleton_file_path.with_suffix('.atlas')
+        # 串流掃描時索引可能尚未建立完成，此時改以檔案系統確認
+        if self.file_index is not None and self.file_index.is_built:
+            if self.file_index.contains(str(atlas_path)):
+                return [atlas_path.name]
+            return []
+        return [atlas_path.name] if atlas_path.exists() else []
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        取得掃描統計資訊
+
+        Returns:
+            Dict[str, int]: 統計資訊字典
+        """
+        statistics = super().get_statistics()
+        statistics['skipped_json_files'] = self.skipped_json_files
+        return statistics
+
+
+class _SkelReader:
+    """
+    Spine二進位格式讀取器 - 透過檔案物件逐段讀取
+
+    附件位於骨骼、插槽與約束區段之後，這些區段沒有固定長度，只能依格式逐欄跳過；
+    支援 3.8、4.0、4.1 與 4.2 (4.2 改以旗標位元組決定選用欄位)
+    """
+
+    _SUPPORTED_VERSIONS = ((3, 8), (4, 0), (4, 1), (4, 2))
+
+    # 附件類型編號
+    _REGION, _BOUNDING_BOX, _MESH, _LINKED_MESH, _PATH, _POINT, _CLIPPING = range(7)
+
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+        # 由 read_header / read_string_table 設定
+        self.format_version: Tuple[int, int] = (0, 0)
+        self.nonessential = False
+        self.strings: List[Optional[str]] = []
+
+    def read_byte(self) -> int:
+        data = self.stream.read(1)
+        if not data:
+            raise EOFError("SKEL檔案意外結束")
+        return data[0]
+
+    def read_varint(self) -> int:
+        """讀取 Spine 的可變長度正整數 (每位元組 7 bits，最多 5 位元組)"""
+        result = 0
+        for shift in range(0, 35, 7):
+            byte = self.read_byte()
+            result |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return result
+        return result
+
+    def read_string(self) -> Optional[str]:
+        """讀取字串 (長度+1 的 varint 後接 UTF-8 內容，0 代表 null)"""
+        length = self.read_varint()
+        if length == 0:
+            return None
+        if length == 1:
+            return ''
+        data = self.stream.read(length - 1)
+        if len(data) != length - 1:
+            raise EOFError("SKEL字串長度超出檔案範圍")
+        return data.decode('utf-8', errors='replace')
+
+    def read_string_ref(self) -> Optional[str]:
+        """讀取字串表索引 (0 代表 null，其餘為索引+1)"""
+        index = self.read_varint()
+        return self.strings[index - 1] if index else None
+
+    def skip(self, size: int):
+        self.stream.seek(size, os.SEEK_CUR)
+
+    def read_header(self) -> Optional[tuple]:
+        """
+        讀取檔案標頭
+
+        Returns:
+            Optional[tuple]: (版本字串, images路徑)，無法辨識時返回None
+        """
+        # 4.x: hash 為 8 bytes 的 long
+        try:
+            self.stream.seek(8)
+            version = self.read_string()
+        except (EOFError, OSError):
+            version = None
+
+        if version and version.startswith('4.') and _VERSION_RE.match(version):
+            self._set_format_version(version)
+            # x, y, width, height (4.2 之後多了 referenceScale)
+            self.skip(16)
+            if self.format_version >= (4, 2):
+                self.skip(4)
+            return version, self._read_nonessential()
+
+        # 3.x: hash 與版本都是字串
+        try:
+            self.stream.seek(0)
+            self.read_string()
+            version = self.read_string()
+        except (EOFError, OSError):
+            return None
+
+        if not version or not _VERSION_RE.match(version):
+            return None
+
+        self._set_format_version(version)
+        # 3.8 才有 x, y；之前的版本只有 width, height
+        self.skip(16 if self.format_version >= (3, 8) else 8)
+        return version, self._read_nonessential()
+
+    def _set_format_version(self, version: str):
+        major, minor = _VERSION_RE.match(version).group().split('.')
+        self.format_version = (int(major), int(minor))
+
+    def _read_nonessential(self) -> Optional[str]:
+        """讀取非必要資料區段中的 images 路徑"""
+        self.nonessential = bool(self.read_byte())
+        if not self.nonessential:
+            return None
+        self.skip(4)  # fps
+        images_path = self.read_string()
+        self.read_string()  # audio 路徑
+        return images_path
+
+    def read_string_table(self) -> List[Optional[str]]:
+        """讀取共用字串表 (保留 null 與空字串，字串索引才會對應)"""
+        self.strings = [self.read_string() for _ in range(self.read_varint())]
+        return self.strings
+
+    def read_attachment_paths(self) -> List[str]:
+        """
+        跳過骨骼、插槽與約束區段，讀取預設造型與所有造型中會引用圖片的附件路徑
+
+        造型之後的事件與動畫區段不會引用圖片，讀完造型即停止
+
+        Returns:
+            List[str]: region / mesh / linkedmesh 附件的 path (未指定時為附件名稱)
+
+        Raises:
+            ValueError: 不支援的版本或無法辨識的附件類型
+            EOFError: 檔案在讀到造型區段前結束
+            IndexError: 字串表索引超出範圍 (結構與預期不符)
+        """
+        if self.format_version not in self._SUPPORTED_VERSIONS:
+            raise ValueError(f"不支援的SKEL版本 {self.format_version[0]}.{self.format_version[1]}")
+
+        self._skip_bones()
+        self._skip_slots()
+        self._skip_ik_constraints()
+        self._skip_transform_constraints()
+        self._skip_path_constraints()
+        if self.format_version >= (4, 2):
+            self._skip_physics_constraints()
+
+        paths = []
+        self._read_skin(paths, default_skin=True)
+        for _ in range(self.read_varint()):
+            self._read_skin(paths, default_skin=False)
+        return paths
+
+    def _skip_varints(self, count: int):
+        for _ in range(count):
+            self.read_varint()
+
+    def _skip_bones(self):
+        for index in range(self.read_varint()):
+            self.read_string()  # 名稱
+            if index:
+                self.read_varint()  # 父骨骼
+            self.skip(32)  # rotation, x, y, scaleX, scaleY, shearX, shearY, length
+            if self.format_version >= (4, 2):
+                self.skip(1)  # inherit
+            else:
+                self.read_varint()  # transformMode
+            self.skip(1)  # skinRequired
+            if self.nonessential:
+                self.skip(4)  # 顏色
+                if self.format_version >= (4, 2):
+                    self.read_string()  # icon
+                    self.skip(1)  # visible
+
+    def _skip_slots(self):
+        for _ in range(self.read_varint()):
+            self.read_string()  # 名稱
+            self.read_varint()  # 骨骼
+            self.skip(8)  # color, darkColor
+            self.read_varint()  # 預設附件 (字串表索引)
+            self.read_varint()  # blendMode
+            if self.nonessential and self.format_version >= (4, 2):
+                self.skip(1)  # visible
+
+    def _skip_ik_constraints(self):
+        for _ in range(self.read_varint()):
+            self.read_string()  # 名稱
+            self.read_varint()  # order
+            if self.format_version < (4, 2):
+                self.skip(1)  # skinRequired
+            self._skip_varints(self.read_varint())  # 骨骼
+            self.read_varint()  # 目標骨骼
+            if self.format_version < (4, 2):
+                self.skip(12)  # mix, softness, bendDirection, compress, stretch, uniform
+                continue
+            flags = self.read_byte()
+            if flags & 32 and flags & 64:
+                self.skip(4)  # mix
+            if flags & 128:
+                self.skip(4)  # softness
+
+    def _skip_transform_constraints(self):
+        for _ in range(self.read_varint()):
+            self.read_string()  # 名稱
+            self.read_varint()  # order
+            if self.format_version < (4, 2):
+                self.skip(1)  # skinRequired
+            self._skip_varints(self.read_varint())  # 骨骼
+            self.read_varint()  # 目標骨骼
+            if self.format_version < (4, 2):
+                # local, relative + 6 個 offset + mix (3.8 為 4 個，4.0 起為 6 個)
+                self.skip(2 + 4 * (10 if self.format_version < (4, 0) else 12))
+                continue
+            # 兩個旗標位元組: 除了前三個布林位元外，每個位元代表一個選用的 float
+            flags = self.read_byte()
+            self.skip(4 * bin(flags & 0xF8).count('1'))
+            flags = self.read_byte()
+            self.skip(4 * bin(flags & 0x7F).count('1'))
+
+    def _skip_path_constraints(self):
+        for _ in range(self.read_varint()):
+            self.read_string()  # 名稱
+            self.read_varint()  # order
+            self.skip(1)  # skinRequired
+            self._skip_varints(self.read_varint())  # 骨骼
+            self.read_varint()  # 目標插槽
+            if self.format_version < (4, 2):
+                self._skip_varints(3)  # positionMode, spacingMode, rotateMode
+                # offsetRotation, position, spacing + mix (3.8 為 2 個，4.0 起為 3 個)
+                self.skip(4 * (5 if self.format_version < (4, 0) else 6))
+                continue
+            flags = self.read_byte()
+            if flags & 128:
+                self.skip(4)  # offsetRotation
+            self.skip(20)  # position, spacing, mixRotate, mixX, mixY
+
+    def _skip_physics_constraints(self):
+        for _ in range(self.read_varint()):
+            self.read_string()  # 名稱
+            self.read_varint()  # order
+            self.read_varint()  # 骨骼
+            flags = self.read_byte()
+            self.skip(4 * bin(flags & 0x7E).count('1'))  # x, y, rotate, scaleX, shearX, limit
+            self.skip(1)  # step
+            self.skip(12)  # inertia, strength, damping
+            if flags & 128:
+                self.skip(4)  # massInverse
+            self.skip(8)  # wind, gravity
+            if self.read_byte() & 128:
+                self.skip(4)  # mix
+
+    def _read_skin(self, paths: List[str], default_skin: bool):
+        """讀取一個造型，把會引用圖片的附件路徑加入 paths"""
+        if not default_skin:
+            if self.format_version >= (4, 2):
+                self.read_string()  # 名稱
+                if self.nonessential:
+                    self.skip(4)  # 顏色
+            else:
+                self.read_varint()  # 名稱 (字串表索引)
+            # 骨骼、IK、transform、path (4.2 另有 physics) 約束的索引
+            for _ in range(5 if self.format_version >= (4, 2) else 4):
+                self._skip_varints(self.read_varint())
+
+        for _ in range(self.read_varint()):
+            self.read_varint()  # 插槽
+            for _ in range(self.read_varint()):
+                attachment_name = self.read_string_ref()
+                if self.format_version >= (4, 2):
+                    path = self._read_attachment_42(attachment_name)
+                else:
+                    path = self._read_attachment(attachment_name)
+                if path:
+                    paths.append(path)
+
+    def _read_attachment(self, attachment_name: Optional[str]) -> Optional[str]:
+        """讀取 3.8 - 4.1 的附件，返回引用圖片的路徑 (其他類型返回 None)"""
+        name = self.read_string_ref() or attachment_name
+        attachment_type = self.read_byte()
+        has_sequence = self.format_version >= (4, 1)
+
+        if attachment_type == self._REGION:
+            path = self.read_string_ref()
+            self.skip(32)  # rotation, x, y, scaleX, scaleY, width, height, color
+            if has_sequence:
+                self._skip_sequence(self.read_byte())
+            return path or name
+        if attachment_type == self._MESH:
+            path = self.read_string_ref()
+            self.skip(4)  # 顏色
+            vertex_count = self.read_varint()
+            self.skip(8 * vertex_count)  # uvs
+            self.skip(2 * self.read_varint())  # triangles
+            self._skip_vertices(vertex_count, self.read_byte())
+            self.read_varint()  # hullLength
+            if has_sequence:
+                self._skip_sequence(self.read_byte())
+            if self.nonessential:
+                self.skip(2 * self.read_varint())  # edges
+                self.skip(8)  # width, height
+            return path or name
+        if attachment_type == self._LINKED_MESH:
+            path = self.read_string_ref()
+            self.skip(4)  # 顏色
+            self._skip_varints(2)  # 造型、父網格
+            self.skip(1)  # inheritDeform / inheritTimelines
+            if has_sequence:
+                self._skip_sequence(self.read_byte())
+            if self.nonessential:
+                self.skip(8)  # width, height
+            return path or name
+        if attachment_type in (self._BOUNDING_BOX, self._CLIPPING):
+            if attachment_type == self._CLIPPING:
+                self.read_varint()  # 結束插槽
+            self._skip_vertices(self.read_varint(), self.read_byte())
+        elif attachment_type == self._PATH:
+            self.skip(2)  # closed, constantSpeed
+            vertex_count = self.read_varint()
+            self._skip_vertices(vertex_count, self.read_byte())
+            self.skip(4 * (vertex_count // 3))  # lengths
+        elif attachment_type == self._POINT:
+            self.skip(12)  # rotation, x, y
+        else:
+            raise ValueError(f"未知的SKEL附件類型 {attachment_type}")
+        if self.nonessential:
+            self.skip(4)  # 顏色
+        return None
+
+    def _read_attachment_42(self, attachment_name: Optional[str]) -> Optional[str]:
+        """讀取 4.2 的附件 (以旗標位元組決定選用欄位)，返回引用圖片的路徑 (其他類型返回 None)"""
+        flags = self.read_byte()
+        name = self.read_string_ref() if flags & 8 else attachment_name
+        attachment_type = flags & 0x7
+
+        if attachment_type in (self._REGION, self._MESH, self._LINKED_MESH):
+            path = self.read_string_ref() if flags & 16 else None
+            if flags & 32:
+                self.skip(4)  # 顏色
+            self._skip_sequence(flags & 64)
+            if attachment_type == self._REGION:
+                if flags & 128:
+                    self.skip(4)  # rotation
+                self.skip(24)  # x, y, scaleX, scaleY, width, height
+            elif attachment_type == self._MESH:
+                hull_length = self.read_varint()
+                vertex_count = self.read_varint()
+                self._skip_vertices(vertex_count, flags & 128)
+                self.skip(8 * vertex_count)  # uvs
+                self._skip_varints((2 * vertex_count - hull_length - 2) * 3)  # triangles
+                if self.nonessential:
+                    self._skip_varints(self.read_varint())  # edges
+                    self.skip(8)  # width, height
+            else:
+                self._skip_varints(2)  # 造型、父網格
+                if self.nonessential:
+                    self.skip(8)  # width, height
+            return path or name
+
+        if attachment_type == self._BOUNDING_BOX:
+            self._skip_vertices(self.read_varint(), flags & 16)
+        elif attachment_type == self._PATH:
+            vertex_count = self.read_varint()
+            self._skip_vertices(vertex_count, flags & 64)
+            self.skip(4 * (vertex_count // 3))  # lengths
+        elif attachment_type == self._POINT:
+            self.skip(12)  # rotation, x, y
+        elif attachment_type == self._CLIPPING:
+            self.read_varint()  # 結束插槽
+            self._skip_vertices(self.read_varint(), flags & 16)
+        else:
+            raise ValueError(f"未知的SKEL附件類型 {attachment_type}")
+        if self.nonessential:
+            self.skip(4)  # 顏色
+        return None
+
+    def _skip_sequence(self, present: int):
+        """跳過圖片序列設定 (count, start, digits, setupIndex)"""
+        if present:
+            self._skip_varints(4)
+
+    def _skip_vertices(self, vertex_count: int, weighted: int):
+        """跳過頂點資料 (權重頂點為每個頂點的骨骼數 + 每根骨骼的索引與 x, y, weight)"""
+        if not weighted:
+            self.skip(8 * vertex_count)
+            return
+        for _ in range(vertex_count):
+            for _ in range(self.read_varint()):
+                self.read_varint()
+                self.skip(12)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+TMX檔案掃描器 - 負責解析 Tiled 地圖 .tmx 與外部圖塊集 .tsx 引用的圖片
+"""
+
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import List
+
+from src.scanner.registry import ScannerBase, register_scanner
+
+
+# 元素標籤 -> 引用檔案的屬性
+_REFERENCE_ATTRIBUTES = {
+    'image': 'source',       # 圖塊集 / 圖片圖層 / 單一圖塊的圖片
+    'tileset': 'source',     # 外部 .tsx 圖塊集
+    'object': 'template',    # 物件範本 .tx
+}
+
+
+@register_scanner
+class TmxScanner(ScannerBase):
+    """TMX檔案掃描器 - 負責解析 Tiled 地圖與圖塊集引用的圖片"""
+
+    SCANNER_NAME = 'tmx'
+    FILE_EXTENSIONS = ('.tmx', '.tsx')
+
+    def parse_file(self, file_path: Path) -> List[str]:
+        """
+        以 iterparse 解析單一地圖 / 圖塊集檔案，處理完的元素立即清除
+
+        Args:
+            file_path: 檔案路徑
+
+        Returns:
+            List[str]: 引用檔案路徑列表 (相對於該檔案所在目錄)
+        """
+        references = []
+        stack = []
+
+        for event, element in ET.iterparse(str(file_path), events=('start', 'end')):
+            if event == 'start':
+                attribute = _REFERENCE_ATTRIBUTES.get(element.tag)
+                if attribute:
+                    value = element.get(attribute)
+                    if value and value not in references:
+                        references.append(value)
+                stack.append(element)
+                continue
+
+            # 圖層資料 (<data>) 可能非常大，結束後立即釋放
+            stack.pop()
+            element.clear()
+            if stack:
+                stack[-1].remove(element)
+
+        return references
+
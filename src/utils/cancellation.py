@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+協同式取消 / 暫停 - 讓長時間掃描可以從其他執行緒停止或暫停
+
+掃描流程在每個工作單位 (一個目錄、一個檔案、一個來源檔案的引用) 之間呼叫
+checkpoint()；取消時會拋出 ScanCancelled，暫停時會在 checkpoint() 內等待。
+"""
+
+import threading
+
+
+class ScanCancelled(BaseException):
+    """掃描已被取消 (繼承 BaseException，避免被掃描器內部的 except Exception 當成一般錯誤吞掉)"""
+
+
+class CancellationToken:
+    """取消權杖 - 由UI執行緒設定，由掃描執行緒在工作單位之間檢查"""
+
+    # 暫停時每隔多久重新檢查是否被取消 (秒)
+    PAUSE_POLL_INTERVAL = 0.05
+
+    def __init__(self):
+        """初始化取消權杖 (預設為執行中)"""
+        self._cancelled = threading.Event()
+        self._running = threading.Event()
+        self._running.set()
+
+    def cancel(self):
+        """要求取消掃描 (也會解除暫停，讓掃描執行緒可以結束)"""
+        self._cancelled.set()
+        self._running.set()
+
+    def pause(self):
+        """暫停掃描，掃描執行緒會在下一個 checkpoint 等待"""
+        if not self._cancelled.is_set():
+            self._running.clear()
+
+    def resume(self):
+        """繼續掃描"""
+        self._running.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """是否已要求取消"""
+        return self._cancelled.is_set()
+
+    @property
+    def is_paused(self) -> bool:
+        """是否為暫停狀態"""
+        return not self._running.is_set()
+
+    def checkpoint(self):
+        """
+        工作單位之間的檢查點
+
+        Raises:
+            ScanCancelled: 已要求取消時
+        """
+        if self._running.is_set() and not self._cancelled.is_set():
+            return
+        while not self._running.wait(self.PAUSE_POLL_INTERVAL):
+            if self._cancelled.is_set():
+                break
+        if self._cancelled.is_set():
+            raise ScanCancelled()
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+共用檔案索引 - 一次走訪專案目錄，提供各掃描器共用的副檔名分類與檔名查詢
+"""
+
+import os
+from pathlib import Path
+from typing import Collection, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from src.utils.logger import get_logger
+
+
+class FileIndex:
+    """共用檔案索引 - 以單次 os.scandir 走訪建立副檔名與檔名查詢表"""
+
+    def __init__(self, root_paths: Union[str, Path, Iterable[Union[str, Path]]]):
+        """
+        初始化檔案索引
+
+        Args:
+            root_paths: 要索引的根目錄 (單一路徑或路徑列表)
+        """
+        if isinstance(root_paths, (str, Path)):
+            root_paths = [root_paths]
+        self.root_paths = [os.path.normpath(str(path)) for path in root_paths]
+
+        self.files_by_extension: Dict[str, List[str]] = {}
+        self._files_by_name: Dict[str, List[str]] = {}
+        self._known_paths: Dict[str, str] = {}
+        self.total_files = 0
+        self.is_built = False
+        # 已開始走訪的目錄數與已知的目錄數 (含尚未走訪的根目錄與子目錄)，用於估算走訪進度
+        self._directories_started = 0
+        self._directories_known = 0
+
+    def build(self, cancel_token=None) -> 'FileIndex':
+        """
+        走訪所有根目錄並建立索引
+
+        Args:
+            cancel_token: 取消權杖 (CancellationToken)，每走訪一個目錄檢查一次
+
+        Returns:
+            FileIndex: 自身，方便串接呼叫
+        """
+        for _ in self.iter_build(cancel_token):
+            pass
+        return self
+
+    def iter_build(self, cancel_token=None) -> Iterator[str]:
+        """
+        邊走訪邊建立索引，每加入一個檔案就產出該檔案路徑
+
+        讓後續的解析可以在走訪尚未結束時就開始；全部產出完畢後 is_built 才會成為 True
+
+        Args:
+            cancel_token: 取消權杖 (CancellationToken)，每走訪一個目錄檢查一次
+
+        Yields:
+            str: 新加入索引的檔案路徑
+        """
+        for file_path, _ in self.iter_entries(cancel_token):
+            yield file_path
+
+    def iter_entries(self, cancel_token=None,
+                     size_extensions: Optional[Collection[str]] = None) -> Iterator[Tuple[str, int]]:
+        """
+        與 iter_build 相同，但同時產出檔案大小
+
+        大小取自 os.scandir 的目錄項目 (Windows 在列出目錄時就已取得，不需要另外 stat)，
+        只有副檔名在 size_extensions 中的檔案才會讀取，其餘檔案的大小為 0
+
+        Args:
+            cancel_token: 取消權杖 (CancellationToken)，每走訪一個目錄檢查一次
+            size_extensions: 需要大小的副檔名 (小寫、含點；None 代表都不需要)
+
+        Yields:
+            Tuple[str, int]: (新加入索引的檔案路徑, 位元組數)
+        """
+        self.files_by_extension = {}
+        self._files_by_name = {}
+        self._known_paths = {}
+        self.total_files = 0
+        self.is_built = False
+        self._directories_started = 0
+        self._directories_known = len(self.root_paths)
+
+        for root_path in self.root_paths:
+            yield from self._walk(root_path, cancel_token, size_extensions or ())
+
+        self.is_built = True
+
+    def walked_fraction(self) -> float:
+        """
+        已開始走訪的目錄佔已知目錄的比例 (邊走訪邊處理時用來推算總數；走訪完成時為 1)
+
+        Returns:
+            float: 0 ~ 1 (尚未開始走訪時為 0)
+        """
+        if self.is_built:
+            return 1.0
+        if not self._directories_known:
+            return 0.0
+        return self._directories_started / self._directories_known
+
+    def _walk(self, root_path: str, cancel_token=None,
+              size_extensions: Collection[str] = ()) -> Iterator[Tuple[str, int]]:
+        """以堆疊方式走訪目錄 (避免遞迴深度限制)"""
+        pending = [root_path]
+        while pending:
+            if cancel_token is not None:
+                cancel_token.checkpoint()
+            directory = pending.pop()
+            self._directories_started += 1
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                                self._directories_known += 1
+                            elif entry.is_file() and self.add_file(entry.path):
+                                yield entry.path, self.entry_size(entry, size_extensions)
+                        except OSError:
+                            continue
+            except OSError as e:
+                get_logger().error("掃描目錄時發生錯誤: %s - %s", directory, e)
+
+    @staticmethod
+    def entry_size(entry: os.DirEntry, size_extensions: Optional[Collection[str]] = None) -> int:
+        """目錄項目的檔案大小 (副檔名不在 size_extensions 中或無法取得時為 0)"""
+        if not size_extensions or os.path.splitext(entry.name)[1].lower() not in size_extensions:
+            return 0
+        try:
+            return entry.stat().st_size
+        except OSError:
+            return 0
+
+    @classmethod
+    def from_files(cls, root_paths: Union[str, Path, Iterable[Union[str, Path]]],
+                   file_paths: Iterable[str]) -> 'FileIndex':
+        """
+        以已知的檔案列表建立完整索引 (不走訪目錄，例如合併分片掃描結果時)
+
+        Args:
+            root_paths: 索引的根目錄
+            file_paths: 檔案完整路徑
+
+        Returns:
+            FileIndex: 已建立完成的檔案索引
+        """
+        file_index = cls(root_paths)
+        for file_path in file_paths:
+            file_index.add_file(file_path)
+        file_index.is_built = True
+        return file_index
+
+    def add_file(self, file_path: str) -> bool:
+        """
+        將單一檔案加入索引
+
+        Args:
+            file_path: 檔案完整路徑
+
+        Returns:
+            bool: 是否為新加入的檔案 (已存在則返回False)
+        """
+        key = self._path_key(file_path)
+        if key in self._known_paths:
+            return False
+        self._known_paths[key] = file_path
+
+        file_name = os.path.basename(file_path).lower()
+        extension = os.path.splitext(file_name)[1]
+        self.files_by_extension.setdefault(extension, []).append(file_path)
+        self._files_by_name.setdefault(file_name, []).append(file_path)
+        self.total_files += 1
+        return True
+
+    def files_with_extensions(self, extensions: Iterable[str]) -> List[str]:
+        """
+        取得指定副檔名的所有檔案
+
+        Args:
+            extensions: 副檔名集合 (含點，例如 {'.png', '.jpg'})
+
+        Returns:
+            List[str]: 檔案路徑列表
+        """
+        files = []
+        for extension in extensions:
+            files.extend(self.files_by_extension.get(extension.lower(), ()))
+        return files
+
+    def find_by_name(self, file_name: str) -> List[str]:
+        """
+        以檔名 (不分大小寫) 查詢檔案
+
+        Args:
+            file_name: 檔案名稱，可包含路徑，只會取最後一段
+
+        Returns:
+            List[str]: 同名檔案的完整路徑列表
+        """
+        base_name = file_name.replace('\\', '/').rsplit('/', 1)[-1].lower()
+        return list(self._files_by_name.get(base_name, ()))
+
+    def lookup(self, file_path: str) -> Optional[str]:
+        """
+        檢查路徑是否存在於索引中 (不分大小寫、忽略分隔符差異)
+
+        Args:
+            file_path: 檔案路徑
+
+        Returns:
+            Optional[str]: 索引中記錄的實際路徑，不存在則返回None
+        """
+        return self._known_paths.get(self._path_key(file_path))
+
+    def contains(self, file_path: str) -> bool:
+        """檢查路徑是否存在於索引中"""
+        return self.lookup(file_path) is not None
+
+    def all_files(self) -> List[str]:
+        """取得索引中的所有檔案"""
+        return list(self._known_paths.values())
+
+    @staticmethod
+    def _path_key(file_path: str) -> str:
+        """產生查詢用的正規化路徑鍵值"""
+        return os.path.normpath(str(file_path)).replace('\\', '/').lower()
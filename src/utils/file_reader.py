@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+檔案讀取工具 - 單次讀取、BOM 編碼偵測與位元組層級的字串常值掃描
+
+程式碼檔案 (Lua 等) 中的資源路徑幾乎都是 ASCII 字元，因此不需要先把整個
+檔案解碼成文字：直接在 bytes 上比對引號內的 ASCII 常值，只解碼命中的片段。
+GBK / Big5 等雙位元組編碼的首位元組都 >= 0x81，引號 (0x22 / 0x27) 不會出現在
+字元中間，所以這個做法對舊專案的多種編碼都安全。
+"""
+
+import codecs
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+
+# BOM 對應表 (較長的 BOM 必須排在前面，避免 UTF-32 被誤判為 UTF-16)
+_BOM_TABLE = (
+    (codecs.BOM_UTF32_LE, 'utf-32-le'),
+    (codecs.BOM_UTF32_BE, 'utf-32-be'),
+    (codecs.BOM_UTF8, 'utf-8'),
+    (codecs.BOM_UTF16_LE, 'utf-16-le'),
+    (codecs.BOM_UTF16_BE, 'utf-16-be'),
+)
+
+# 這些編碼的 ASCII 區段與 ASCII 相同，可以直接在 bytes 上掃描
+_ASCII_COMPATIBLE = {None, 'utf-8'}
+
+
+def read_file_bytes(file_path: Union[str, Path]) -> bytes:
+    """
+    以二進位模式一次讀取整個檔案
+
+    Args:
+        file_path: 檔案路徑
+
+    Returns:
+        bytes: 檔案內容
+    """
+    with open(file_path, 'rb') as f:
+        return f.read()
+
+
+def detect_bom(data: bytes) -> Tuple[Optional[str], int]:
+    """
+    偵測資料開頭的 BOM
+
+    Args:
+        data: 檔案內容
+
+    Returns:
+        Tuple[Optional[str], int]: (編碼名稱, BOM 長度)，沒有 BOM 時為 (None, 0)
+    """
+    for bom, encoding in _BOM_TABLE:
+        if data.startswith(bom):
+            return encoding, len(bom)
+    return None, 0
+
+
+@lru_cache(maxsize=32)
+def _compile_literal_pattern(extensions: Tuple[str, ...], as_bytes: bool):
+    """編譯「以指定副檔名結尾的引號字串」正則表達式"""
+    ext_group = '|'.join(re.escape(ext.lstrip('.')) for ext in extensions)
+    # 引號內只允許可列印的 ASCII (不含引號本身)，遇到多位元組字元即視為非路徑字串
+    pattern = r'["\']([\x20-\x21\x23-\x26\x28-\x7e]*\.(?:' + ext_group + r'))["\']'
+    if as_bytes:
+        return re.compile(pattern.encode('ascii'), re.IGNORECASE)
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def iter_quoted_literals(data: bytes, extensions: Iterable[str]) -> Iterator[str]:
+    """
+    掃描引號內以指定副檔名結尾的 ASCII 字串常值
+
+    沒有 BOM 或 UTF-8 BOM 的檔案直接在 bytes 上比對，只解碼命中的片段；
+    UTF-16 / UTF-32 檔案才需要整份解碼。
+
+    Args:
+        data: 檔案內容
+        extensions: 副檔名集合 (例如 {'.png', '.jpg'})
+
+    Yields:
+        str: 引號內的字串內容
+    """
+    key = tuple(sorted({ext.lower() for ext in extensions}))
+    if not key:
+        return
+
+    encoding, offset = detect_bom(data)
+    if encoding in _ASCII_COMPATIBLE:
+        pattern = _compile_literal_pattern(key, True)
+        for match in pattern.finditer(data, offset):
+            yield match.group(1).decode('ascii')
+    else:
+        text = data[offset:].decode(encoding, errors='ignore')
+        pattern = _compile_literal_pattern(key, False)
+        for match in pattern.finditer(text):
+            yield match.group(1)
+
+
+def find_quoted_literals(file_path: Union[str, Path], extensions: Iterable[str]) -> List[str]:
+    """
+    讀取檔案一次並回傳所有符合副檔名的字串常值
+
+    Args:
+        file_path: 檔案路徑
+        extensions: 副檔名集合
+
+    Returns:
+        List[str]: 字串常值列表 (依出現順序)
+    """
+    return list(iter_quoted_literals(read_file_bytes(file_path), extensions))
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+效能統計 - 計時器、計數器與直方圖 (可選，用於找出客戶專案中的效能熱點)
+
+停用時使用 DISABLED (NullInstrumentation)，所有記錄方法都是空操作；
+熱路徑上的呼叫端先檢查 enabled，停用時不會多做任何計時或 stat 呼叫。
+
+名稱慣例 (以 . 分隔，最後一段為掃描器名稱的項目會併入該掃描器的統計):
+    timer      walk / parse.<掃描器> / resolve / diff / store
+    counter    walk.files / read_bytes.<掃描器> / resolver.cache_hits / resolver.cache_misses /
+               resolver.scope_checks / resolve.deferred / diff.targets
+    histogram  parse_us.<掃描器> (每個檔案的解析耗時，微秒) / file_bytes.<掃描器>
+
+機器可讀的輸出為 Tab 分隔文字 (與命令列結果格式一致):
+    COUNTER  <名稱>  <值>
+    TIMER    <名稱>  <次數>  <總耗時 ms>
+    HIST     <名稱>  <次數>  <最小>  <p50>  <p90>  <p99>  <最大>  <平均>
+"""
+
+import time
+from typing import Dict, List, Optional, TextIO
+
+
+class Histogram:
+    """以 2 的次方為區間的直方圖 (固定記憶體，百分位數為區間上限的近似值)"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.minimum: Optional[int] = None
+        self.maximum: Optional[int] = None
+        # 區間編號 (value.bit_length()) -> 次數；區間 n 涵蓋 [2^(n-1), 2^n)
+        self.buckets: Dict[int, int] = {}
+
+    def add(self, value: int):
+        """加入一個非負整數值"""
+        value = max(0, int(value))
+        self.count += 1
+        self.total += value
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+        bucket = value.bit_length()
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    @property
+    def mean(self) -> float:
+        """平均值"""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, fraction: float) -> int:
+        """
+        取得近似的百分位數
+
+        Args:
+            fraction: 0 到 1 之間的比例 (0.9 代表 p90)
+
+        Returns:
+            int: 該百分位數所在區間的上限 (不超過最大值)
+        """
+        if not self.count:
+            return 0
+        threshold = fraction * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= threshold:
+                upper = (1 << bucket) - 1 if bucket else 0
+                return min(upper, self.maximum)
+        return self.maximum
+
+
+class _Timer:
+    """計時區塊 (with instrumentation.timer(name): ...)"""
+
+    def __init__(self, instrumentation: 'Instrumentation', name: str):
+        self._instrumentation = instrumentation
+        self._name = name
+        self._started = 0.0
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._instrumentation.add_time(self._name, time.perf_counter() - self._started)
+
+
+class _NullTimer:
+    """停用時的計時區塊 (不計時)"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Instrumentation:
+    """效能統計收集器 (非執行緒安全，每次掃描使用一個實例)"""
+
+    enabled = True
+
+    def __init__(self):
+        self.counters: Dict[str, int] = {}
+        # 名稱 -> [次數, 總耗時 (秒)]
+        self.timers: Dict[str, List[float]] = {}
+        self.histograms: Dict[str, Histogram] = {}
+
+    def count(self, name: str, value: int = 1):
+        """累加計數器"""
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def add_time(self, name: str, seconds: float):
+        """累加計時器 (次數 + 1)"""
+        timer = self.timers.get(name)
+        if timer is None:
+            self.timers[name] = [1, seconds]
+        else:
+            timer[0] += 1
+            timer[1] += seconds
+
+    def observe(self, name: str, value: int):
+        """加入一個直方圖樣本"""
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.add(value)
+
+    def timer(self, name: str):
+        """
+        建立計時區塊
+
+        Args:
+            name: 計時器名稱
+
+        Returns:
+            離開區塊時累加耗時的 context manager
+        """
+        return _Timer(self, name)
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        以整數字典表示所有統計 (可直接併入 ScanResult.get_statistics)
+
+        Returns:
+            Dict[str, int]: count.<名稱> / time_ms.<名稱> / <直方圖名稱>.p50 / .p90 / .max
+        """
+        statistics = {f'count.{name}': value for name, value in self.counters.items()}
+        for name, (_, seconds) in self.timers.items():
+            statistics[f'time_ms.{name}'] = int(seconds * 1000)
+        for name, histogram in self.histograms.items():
+            statistics[f'{name}.p50'] = histogram.percentile(0.5)
+            statistics[f'{name}.p90'] = histogram.percentile(0.9)
+            statistics[f'{name}.max'] = histogram.maximum or 0
+        return statistics
+
+    def scanner_statistics(self, scanner_name: str) -> Dict[str, int]:
+        """
+        取得單一掃描器的統計 (名稱最後一段為掃描器名稱的項目)
+
+        Args:
+            scanner_name: 掃描器名稱
+
+        Returns:
+            Dict[str, int]: parse_ms / read_bytes / parse_us_p90 等統計，沒有資料時為空字典
+        """
+        suffix = '.' + scanner_name
+        statistics = {}
+        for name, value in self.counters.items():
+            if name.endswith(suffix):
+                statistics[name[:-len(suffix)]] = value
+        for name, (_, seconds) in self.timers.items():
+            if name.endswith(suffix):
+                statistics[name[:-len(suffix)] + '_ms'] = int(seconds * 1000)
+        for name, histogram in self.histograms.items():
+            if name.endswith(suffix):
+                statistics[name[:-len(suffix)] + '_p90'] = histogram.percentile(0.9)
+        return statistics
+
+    def format_lines(self) -> List[str]:
+        """
+        格式化為給使用者閱讀的文字 (介面輸出視窗與命令列摘要使用)
+
+        Returns:
+            List[str]: 每行一項統計
+        """
+        lines = []
+        for name in sorted(self.timers):
+            count, seconds = self.timers[name]
+            lines.append(f"{name}: {seconds * 1000:.1f} ms ({int(count)} 次)")
+        for name in sorted(self.counters):
+            lines.append(f"{name}: {self.counters[name]}")
+        for name in sorted(self.histograms):
+            histogram = self.histograms[name]
+            lines.append(
+                f"{name}: {histogram.count} 筆, p50 {histogram.percentile(0.5)}, "
+                f"p90 {histogram.percentile(0.9)}, p99 {histogram.percentile(0.99)}, 最大 {histogram.maximum}"
+            )
+        return lines
+
+    def write_tsv(self, stream: TextIO):
+        """
+        以 Tab 分隔格式輸出所有統計
+
+        Args:
+            stream: 輸出串流
+        """
+        for name in sorted(self.counters):
+            stream.write(f"COUNTER\t{name}\t{self.counters[name]}\n")
+        for name in sorted(self.timers):
+            count, seconds = self.timers[name]
+            stream.write(f"TIMER\t{name}\t{int(count)}\t{seconds * 1000:.3f}\n")
+        for name in sorted(self.histograms):
+            histogram = self.histograms[name]
+            stream.write(
+                f"HIST\t{name}\t{histogram.count}\t{histogram.minimum}\t{histogram.percentile(0.5)}\t"
+                f"{histogram.percentile(0.9)}\t{histogram.percentile(0.99)}\t{histogram.maximum}\t"
+                f"{histogram.mean:.1f}\n"
+            )
+
+
+class NullInstrumentation(Instrumentation):
+    """停用的效能統計 - 所有記錄方法都是空操作"""
+
+    enabled = False
+
+    def count(self, name: str, value: int = 1):
+        pass
+
+    def add_time(self, name: str, seconds: float):
+        pass
+
+    def observe(self, name: str, value: int):
+        pass
+
+    def timer(self, name: str):
+        return _NULL_TIMER
+
+
+# 共用的停用實例 (未指定效能統計時使用)
+DISABLED = NullInstrumentation()
@@ -1,58 +1,186 @@
+"""
+日誌工具 - 整個行程共用一組日誌設定
+
+預設只把訊息保存在記憶體中的環狀緩衝區 (get_recent_logs 可取得最近的訊息)，
+警告以上的訊息另外輸出到 stderr；不會建立任何日誌檔案。
+輸出到 stderr 或檔案的 I/O 經由 QueueHandler 交給背景的 QueueListener 執行緒處理，不在掃描的熱路徑上。
+逐檔案的訊息一律使用 DEBUG 等級並以 % 參數延遲格式化，未啟用 DEBUG 時幾乎沒有成本。
+"""
+
+import atexit
 import logging
 import os
-from datetime import datetime
-from pathlib import Path
+import queue
+import sys
+import threading
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
+
+
+LOGGER_NAME = 'clearproj'
+
+# 環狀緩衝區預設保留的訊息數
+DEFAULT_BUFFER_SIZE = 2000
+
+_LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+
+class RingBufferHandler(logging.Handler):
+    """把格式化後的訊息保存在固定大小的環狀緩衝區"""
+
+    def __init__(self, capacity: int = DEFAULT_BUFFER_SIZE):
+        super().__init__()
+        self.records = deque(maxlen=capacity)
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.records.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
+class _LoggingState:
+    """行程層級的日誌設定 (只建立一次)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # 設定日誌的行程 (fork 出來的工作行程沒有父行程的背景輸出執行緒，需要重新設定)
+        self.pid = 0
+        self.logger: Optional[logging.Logger] = None
+        self.buffer: Optional[RingBufferHandler] = None
+        self.queue_handler: Optional[QueueHandler] = None
+        self.listener: Optional[QueueListener] = None
+
+
+_state = _LoggingState()
+
+
+def configure_logging(level: int = logging.INFO, console_level: Optional[int] = logging.WARNING,
+                      log_file: Optional[str] = None, buffer_size: int = DEFAULT_BUFFER_SIZE) -> logging.Logger:
+    """
+    設定 (或重新設定) 行程共用的日誌
+
+    Args:
+        level: 記錄的最低等級 (logging.DEBUG 才會記錄逐檔案的訊息)
+        console_level: 輸出到 stderr 的最低等級 (None 代表不輸出)
+        log_file: 日誌檔案路徑 (預設不寫檔)
+        buffer_size: 記憶體環狀緩衝區保留的訊息數
+
+    Returns:
+        logging.Logger: 共用的 logger
+    """
+    with _state.lock:
+        if _state.pid == os.getpid():
+            _stop_listener()
+        else:
+            _state.listener = None
+        _state.pid = os.getpid()
+        logger = logging.getLogger(LOGGER_NAME)
+        logger.setLevel(level)
+        # 不交給 root logger，避免與其他程式的 basicConfig 重複輸出
+        logger.propagate = False
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+
+        formatter = logging.Formatter(_LOG_FORMAT)
+        _state.buffer = RingBufferHandler(buffer_size)
+        _state.buffer.setFormatter(formatter)
+        logger.addHandler(_state.buffer)
+
+        io_handlers = []
+        if console_level is not None:
+            console = logging.StreamHandler(sys.stderr)
+            console.setLevel(console_level)
+            io_handlers.append(console)
+        if log_file:
+            file_handler = logging.FileHandler(log_file, encoding='utf-8')
+            file_handler.setLevel(level)
+            io_handlers.append(file_handler)
+        for handler in io_handlers:
+            handler.setFormatter(formatter)
+
+        _state.queue_handler = None
+        if io_handlers:
+            # 低於所有輸出目標等級的訊息不進入佇列
+            _state.queue_handler = QueueHandler(queue.SimpleQueue())
+            _state.queue_handler.setLevel(min(handler.level for handler in io_handlers))
+            logger.addHandler(_state.queue_handler)
+            _state.listener = QueueListener(_state.queue_handler.queue, *io_handlers, respect_handler_level=True)
+            _state.listener.start()
+
+        _state.logger = logger
+        return logger
+
+
+def _stop_listener():
+    """停止背景輸出執行緒 (會先處理完佇列中的訊息)"""
+    if _state.listener is not None:
+        _state.listener.stop()
+        _state.listener = None
+
+
+def shutdown_logging():
+    """寫出佇列中剩餘的訊息並停止背景輸出執行緒 (行程結束時自動呼叫)"""
+    with _state.lock:
+        if _state.pid == os.getpid():
+            _stop_listener()
+
+
+def get_logger() -> logging.Logger:
+    """取得共用的 logger (第一次呼叫時以預設值設定)"""
+    if _state.logger is None or _state.pid != os.getpid():
+        configure_logging()
+    return _state.logger
+
+
+def get_recent_logs(limit: Optional[int] = None) -> List[str]:
+    """
+    取得環狀緩衝區中最近的訊息
+
+    Args:
+        limit: 最多返回的筆數 (None 代表全部)
+
+    Returns:
+        List[str]: 由舊到新的訊息
+    """
+    get_logger()
+    records = list(_state.buffer.records)
+    return records if limit is None else records[-limit:]
+
+
+atexit.register(shutdown_logging)
 
 
 class ScannerLogger:
-    """掃描器日誌工具"""
-    
-    def __init__(self, log_dir: str = "logs"):
-        self.log_dir = Path(log_dir)
-        self.log_dir.mkdir(exist_ok=True)
-        
-        # 設定日誌格式
-        log_format = '%(asctime)s - %(levelname)s - %(message)s'
-        
-        # 建立日誌檔案名稱
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_file = self.log_dir / f"scanner_{timestamp}.log"
-        
-        # 設定日誌配置
-        logging.basicConfig(
-            level=logging.INFO,
-            format=log_format,
-            handlers=[
-                logging.FileHandler(log_file, encoding='utf-8'),
-                logging.StreamHandler()
-            ]
-        )
-        
-        self.logger = logging.getLogger(__name__)
-    
-    def info(self, message: str):
+    """掃描器日誌工具 - 共用行程層級的 logger，建立多個實例不會重複設定"""
+
+    def __init__(self):
+        self.logger = get_logger()
+
+    def info(self, message: str, *args):
         """記錄資訊訊息"""
-        self.logger.info(message)
-    
-    def warning(self, message: str):
+        self.logger.info(message, *args)
+
+    def warning(self, message: str, *args):
         """記錄警告訊息"""
-        self.logger.warning(message)
-    
-    def error(self, message: str):
+        self.logger.warning(message, *args)
+
+    def error(self, message: str, *args):
         """記錄錯誤訊息"""
-        self.logger.error(message)
-    
-    def debug(self, message: str):
-        """記錄除錯訊息"""
-        self.logger.debug(message)
-    
+        self.logger.error(message, *args)
+
+    def debug(self, message: str, *args):
+        """記錄除錯訊息 (args 只有在啟用 DEBUG 時才會格式化)"""
+        self.logger.debug(message, *args)
+
     def log_file_scan(self, file_path: str, success: bool, error_msg: str = None):
-        """記錄檔案掃描結果"""
+        """記錄檔案掃描結果 (成功只記錄在 DEBUG 等級)"""
         if success:
-            self.info(f"成功掃描檔案: {file_path}")
+            self.logger.debug("成功掃描檔案: %s", file_path)
         else:
-            self.error(f"掃描檔案失敗: {file_path} - {error_msg}")
-    
+            self.logger.error("掃描檔案失敗: %s - %s", file_path, error_msg)
+
     def log_scan_summary(self, total_files: int, successful_scans: int, failed_scans: int):
         """記錄掃描摘要"""
-        self.info(f"掃描摘要 - 總檔案數: {total_files}, 成功: {successful_scans}, 失敗: {failed_scans}") 
\ No newline at end of file
+        self.logger.info("掃描摘要 - 總檔案數: %d, 成功: %d, 失敗: %d", total_files, successful_scans, failed_scans)
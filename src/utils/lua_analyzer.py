@@ -7,7 +7,37 @@ Lua檔案分析器 - 負責搜尋Lua程式碼中的圖片檔案引用
 import os
 import re
 from pathlib import Path
-from typing import Set, List, Dict, Optional
+from typing import Iterable, Iterator, Set, List, Dict, Optional
+
+from src.utils.file_reader import detect_bom, read_file_bytes, iter_quoted_literals
+
+
+# require("a.b") / require "a.b" / require 'a.b' 的模組名稱 (只接受 ASCII 的模組路徑)
+_REQUIRE_PATTERN = r"""\brequire\s*\(?\s*["']([A-Za-z0-9_./\-]+)["']"""
+_REQUIRE_BYTES = re.compile(_REQUIRE_PATTERN.encode('ascii'))
+_REQUIRE_TEXT = re.compile(_REQUIRE_PATTERN)
+
+
+def iter_required_modules(data: bytes) -> Iterator[str]:
+    """
+    掃描 require 載入的模組，並依 Lua 的模組路徑規則轉換為檔案路徑 (a.b -> a/b.lua)
+
+    Args:
+        data: Lua 檔案內容
+
+    Yields:
+        str: 模組對應的 .lua 相對路徑
+    """
+    encoding, offset = detect_bom(data)
+    if encoding in (None, 'utf-8'):
+        modules = (match.group(1).decode('ascii') for match in _REQUIRE_BYTES.finditer(data, offset))
+    else:
+        text = data[offset:].decode(encoding, errors='ignore')
+        modules = (match.group(1) for match in _REQUIRE_TEXT.finditer(text))
+    for module in modules:
+        if module.lower().endswith('.lua'):
+            module = module[:-len('.lua')]
+        yield module.replace('.', '/') + '.lua'
 
 
 class LuaAnalyzer:
@@ -26,12 +56,6 @@ class LuaAnalyzer:
         
         # 常見的圖片檔案擴展名
         self.image_extensions = {'.png', '.jpg', '.jpeg', '.bmp', '.tga', '.gif'}
-        
-        # 常見的Lua字串引用模式
-        self.lua_string_patterns = [
-            r'["\']([^"\']*\.(?:png|jpg|jpeg|bmp|tga|gif))["\']',  # "image.png" 或 'image.png'
-            r'["\']([^"\']*)["\']',  # 一般字串，後續會檢查是否包含圖片
-        ]
     
     def scan_lua_files(self) -> Set[str]:
         """
@@ -79,71 +103,55 @@ class LuaAnalyzer:
         """
         分析單個Lua檔案中的圖片引用
         
+        檔案只讀取一次，直接在 bytes 上掃描引號內的 ASCII 字串，
+        不需要猜測 UTF-8 / GBK / Big5 編碼後整份解碼
+        
         Args:
             lua_file_path: Lua檔案路徑
         """
         try:
-            # 讀取檔案內容
-            with open(lua_file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            # 使用正則表達式搜尋字串引用
-            for pattern in self.lua_string_patterns:
-                matches = re.finditer(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    string_value = match.group(1)
-                    
-                    # 檢查是否是圖片檔案引用
-                    if self._is_image_reference(string_value):
-                        # 提取檔案名稱部分（去掉路徑）
-                        image_name = self._extract_image_filename(string_value)
-                        if image_name:
-                            self.image_references.add(image_name)
-                            print(f"  在 {lua_file_path.name} 中找到圖片引用: {string_value} -> {image_name}")
-        
-        except UnicodeDecodeError:
-            # 嘗試其他編碼
-            try:
-                with open(lua_file_path, 'r', encoding='gb2312', errors='ignore') as f:
-                    content = f.read()
-                self._extract_from_content(content, lua_file_path.name)
-            except Exception as e:
-                print(f"無法讀取檔案 {lua_file_path}: {str(e)}")
+            image_literals = self.extract_image_literals(lua_file_path)
         except Exception as e:
-            print(f"分析檔案 {lua_file_path} 時發生錯誤: {str(e)}")
-    
-    def _extract_from_content(self, content: str, filename: str):
-        """從內容中提取圖片引用"""
-        for pattern in self.lua_string_patterns:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            for match in matches:
-                string_value = match.group(1)
-                
-                if self._is_image_reference(string_value):
-                    image_name = self._extract_image_filename(string_value)
-                    if image_name:
-                        self.image_references.add(image_name)
-                        print(f"  在 {filename} 中找到圖片引用: {string_value} -> {image_name}")
+            print(f"無法讀取檔案 {lua_file_path}: {str(e)}")
+            return
+        
+        for string_value in image_literals:
+            # 提取檔案名稱部分（去掉路徑）
+            image_name = self._extract_image_filename(string_value)
+            if image_name:
+                self.image_references.add(image_name)
+                print(f"  在 {lua_file_path.name} 中找到圖片引用: {string_value} -> {image_name}")
     
-    def _is_image_reference(self, string_value: str) -> bool:
+    def extract_image_literals(self, lua_file_path: Path) -> List[str]:
         """
-        檢查字串是否是圖片檔案引用
+        取得單個Lua檔案中所有引號內的圖片路徑字串 (保留原始路徑，不去除目錄)
         
         Args:
-            string_value: 要檢查的字串
+            lua_file_path: Lua檔案路徑
             
         Returns:
-            bool: 是否是圖片檔案引用
+            List[str]: 圖片路徑字串列表 (依出現順序、已去除重複)
         """
-        if not string_value or len(string_value) < 3:
-            return False
-        
-        # 檢查是否有圖片副檔名
-        for ext in self.image_extensions:
-            if string_value.lower().endswith(ext):
-                return True
+        return self.extract_references(lua_file_path, self.image_extensions)
+    
+    def extract_references(self, lua_file_path: Path, extensions: Iterable[str],
+                           follow_requires: bool = False) -> List[str]:
+        """
+        取得單個Lua檔案中所有引號內以指定副檔名結尾的路徑字串 (檔案只讀取一次)
         
-        return False
+        Args:
+            lua_file_path: Lua檔案路徑
+            extensions: 副檔名集合 (例如圖片副檔名，或可達性分析時的所有資源副檔名)
+            follow_requires: 是否同時回報 require 載入的模組 (a.b -> a/b.lua)
+            
+        Returns:
+            List[str]: 路徑字串列表 (依出現順序、已去除重複；模組排在字串常值之後)
+        """
+        content = read_file_bytes(lua_file_path)
+        references = dict.fromkeys(iter_quoted_literals(content, extensions))
+        if follow_requires:
+            references.update(dict.fromkeys(iter_required_modules(content)))
+        return list(references)
     
     def _extract_image_filename(self, image_path: str) -> Optional[str]:
         """
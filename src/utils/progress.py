@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+進度回報 - 合併逐檔案的進度事件，每秒最多送出 max_rate 次更新
+
+掃描引擎每處理一個檔案就呼叫 advance (只累加計數並讀一次時鐘)，
+距離上一次送出超過 1 / max_rate 秒時才建立 ProgressUpdate 交給 emit；
+其間的事件只會合併到下一次更新。介面、命令列與分片工作行程都使用同一個類別，
+只有 emit 不同 (送進介面佇列 / 寫到 stderr / 送回父行程)。
+
+剩餘時間優先以位元組估算 (解析耗時大致與檔案大小成正比)，不知道總位元組數時改以項目數估算。
+邊走訪邊解析時總數未知，階段開始時可以提供「目前已走訪的比例」函數，
+送出更新時才呼叫一次，以已處理的數量除以這個比例推算總數 (標示為估計值)；
+兩者都沒有時只回報已處理的數量與吞吐量。
+停用時使用 DISABLED_PROGRESS (NullProgressReporter)，所有方法都是空操作。
+"""
+
+import os
+import time
+from typing import Callable, Optional
+
+
+# 預設每秒最多送出的更新次數
+DEFAULT_MAX_RATE = 10.0
+
+_MB = 1024 * 1024
+
+
+def format_duration(seconds: float) -> str:
+    """把秒數格式化為 "1 小時 2 分" / "3 分 4 秒" / "5 秒" """
+    seconds = int(seconds + 0.5)
+    if seconds >= 3600:
+        return f"{seconds // 3600} 小時 {seconds % 3600 // 60} 分"
+    if seconds >= 60:
+        return f"{seconds // 60} 分 {seconds % 60} 秒"
+    return f"{seconds} 秒"
+
+
+class ProgressUpdate:
+    """合併後的一次進度更新"""
+
+    def __init__(self, stage: str, message: str, detail: str, unit: str, done: int, total: int,
+                 bytes_done: int, bytes_total: int, elapsed: float, estimated: bool = False):
+        """
+        初始化進度更新
+
+        Args:
+            stage: 階段名稱 (parse / resolve / diff / store)
+            message: 階段說明
+            detail: 最近處理的項目 (通常是檔案路徑，可為空字串)
+            unit: 項目單位 (例如 "個檔案")
+            done: 已處理的項目數
+            total: 項目總數 (0 代表未知)
+            bytes_done: 已處理的位元組數
+            bytes_total: 總位元組數 (0 代表未知)
+            elapsed: 此階段已經過的秒數
+            estimated: total / bytes_total 是否為依走訪比例推算的估計值
+        """
+        self.stage = stage
+        self.message = message
+        self.detail = detail
+        self.unit = unit
+        self.done = done
+        self.total = total
+        self.bytes_done = bytes_done
+        self.bytes_total = bytes_total
+        self.elapsed = elapsed
+        self.estimated = estimated
+
+    @property
+    def fraction(self) -> Optional[float]:
+        """完成比例 (優先以位元組計算；總數未知時為 None)"""
+        if self.bytes_total > 0:
+            return min(1.0, self.bytes_done / self.bytes_total)
+        if self.total > 0:
+            return min(1.0, self.done / self.total)
+        return None
+
+    @property
+    def eta(self) -> Optional[float]:
+        """預估剩餘秒數 (以目前的平均速度推算；無法估算時為 None)"""
+        fraction = self.fraction
+        if not fraction or self.elapsed <= 0:
+            return None
+        return self.elapsed * (1.0 - fraction) / fraction
+
+    @property
+    def bytes_per_second(self) -> float:
+        """平均每秒處理的位元組數"""
+        return self.bytes_done / self.elapsed if self.elapsed > 0 else 0.0
+
+    def describe(self) -> str:
+        """
+        格式化為給使用者閱讀的一行文字
+
+        Returns:
+            str: 例如 "正在分析檔案: hero.efk (1200/5000 個檔案, 12.5/40.0 MB, 8.1 MB/秒, 剩餘約 3 秒)"
+        """
+        text = f"{self.message}: {os.path.basename(self.detail)}" if self.detail else self.message
+        if not self.done and not self.total:
+            return text
+        about = '約 ' if self.estimated else ''
+        parts = [f"{self.done}/{about}{self.total} {self.unit}" if self.total else f"已處理 {self.done} {self.unit}"]
+        if self.bytes_done or self.bytes_total:
+            if self.bytes_total:
+                parts.append(f"{self.bytes_done / _MB:.1f}/{about}{self.bytes_total / _MB:.1f} MB")
+            else:
+                parts.append(f"{self.bytes_done / _MB:.1f} MB")
+            parts.append(f"{self.bytes_per_second / _MB:.1f} MB/秒")
+        eta = self.eta
+        if eta is not None:
+            parts.append(f"剩餘約 {format_duration(eta)}")
+        return f"{text} ({', '.join(parts)})"
+
+
+class ProgressReporter:
+    """進度回報器 - 合併事件並限制送出頻率 (非執行緒安全，由執行掃描的執行緒呼叫)"""
+
+    enabled = True
+
+    def __init__(self, emit: Callable[[ProgressUpdate], None], max_rate: float = DEFAULT_MAX_RATE,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        初始化進度回報器
+
+        Args:
+            emit: 送出更新的函數 (每秒最多呼叫 max_rate 次，另外每個階段開始時各一次)
+            max_rate: 每秒最多送出的更新次數
+            clock: 時鐘函數 (秒)
+        """
+        self._emit_update = emit
+        self.interval = 1.0 / max_rate if max_rate > 0 else 0.0
+        self._clock = clock
+        self._next_emit = 0.0
+        self._pending = False
+        self.stage = ''
+        self.message = ''
+        self.unit = ''
+        self.detail = ''
+        self.done = 0
+        self.total = 0
+        self.bytes_done = 0
+        self.bytes_total = 0
+        self._discovered: Optional[Callable[[], float]] = None
+        self._stage_started = clock()
+
+    @classmethod
+    def for_callback(cls, callback: Callable[[str, int, int, str], None],
+                     max_rate: float = DEFAULT_MAX_RATE) -> 'ProgressReporter':
+        """
+        建立以 (stage, current, total, message) 回調送出更新的回報器 (相容舊的 progress_callback)
+
+        Args:
+            callback: 進度回調函數
+            max_rate: 每秒最多送出的更新次數
+
+        Returns:
+            ProgressReporter: 進度回報器
+        """
+        return cls(lambda update: callback(update.stage, update.done, update.total, update.describe()), max_rate)
+
+    def begin_stage(self, stage: str, message: str, total: int = 0, bytes_total: int = 0, unit: str = '個檔案',
+                    discovered: Optional[Callable[[], float]] = None):
+        """
+        開始新的階段並立即送出一次更新 (上一個階段尚未送出的事件直接捨棄)
+
+        Args:
+            stage: 階段名稱
+            message: 階段說明
+            total: 項目總數 (0 代表未知)
+            bytes_total: 總位元組數 (0 代表未知)
+            unit: 項目單位
+            discovered: 返回目前已走訪比例 (0 ~ 1) 的函數；總數未知時以它推算總數
+                (只在送出更新時呼叫，不影響 advance 的成本)
+        """
+        self.stage = stage
+        self.message = message
+        self.unit = unit
+        self.detail = ''
+        self.done = 0
+        self.total = total
+        self.bytes_done = 0
+        self.bytes_total = bytes_total
+        self._discovered = discovered
+        self._stage_started = self._clock()
+        self._emit(self._stage_started)
+
+    def advance(self, count: int = 1, size: int = 0, detail: str = ''):
+        """
+        累加已處理的項目 (熱路徑: 只有距離上一次更新超過間隔時才會送出)
+
+        Args:
+            count: 新處理的項目數
+            size: 新處理的位元組數
+            detail: 最近處理的項目 (空字串代表沿用上一個)
+        """
+        self.done += count
+        self.bytes_done += size
+        if detail:
+            self.detail = detail
+        now = self._clock()
+        if now >= self._next_emit:
+            self._emit(now)
+        else:
+            self._pending = True
+
+    def flush(self):
+        """立即送出尚未送出的事件 (階段或掃描結束時呼叫)"""
+        if self._pending:
+            self._emit(self._clock())
+
+    def _emit(self, now: float):
+        """建立並送出目前的進度"""
+        self._pending = False
+        self._next_emit = now + self.interval
+        total, bytes_total = self.total, self.bytes_total
+        estimated = False
+        if self._discovered is not None and not (total or bytes_total):
+            fraction = self._discovered()
+            if fraction > 0:
+                total, bytes_total = int(self.done / fraction), int(self.bytes_done / fraction)
+                estimated = fraction < 1.0
+        self._emit_update(ProgressUpdate(self.stage, self.message, self.detail, self.unit, self.done, total,
+                                         self.bytes_done, bytes_total, now - self._stage_started, estimated))
+
+
+class NullProgressReporter(ProgressReporter):
+    """停用的進度回報器 - 所有方法都是空操作"""
+
+    enabled = False
+
+    def __init__(self):
+        super().__init__(lambda update: None, max_rate=0)
+
+    def begin_stage(self, stage: str, message: str, total: int = 0, bytes_total: int = 0, unit: str = '個檔案',
+                    discovered: Optional[Callable[[], float]] = None):
+        pass
+
+    def advance(self, count: int = 1, size: int = 0, detail: str = ''):
+        pass
+
+    def flush(self):
+        pass
+
+
+# 共用的停用實例 (未指定進度回報時使用)
+DISABLED_PROGRESS = NullProgressReporter()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+追蹤記錄器 - 記錄各階段與每個檔案的解析 / 引用解析區間 (可選，用於找出單一異常緩慢的檔案)
+
+區間在結束時才寫入固定大小的環狀緩衝區，超過容量時丟棄最舊的完整區間 (不會留下不成對的開始 / 結束)。
+輸出為 systrace (ftrace 文字) 格式，可直接在 Perfetto (ui.perfetto.dev) 或 Chrome about://tracing 開啟:
+    # tracer: nop
+    <執行緒>-<tid> (<pid>) [000] ...1 <秒>: tracing_mark_write: B|<pid>|<名稱>
+    <執行緒>-<tid> (<pid>) [000] ...1 <秒>: tracing_mark_write: E|<pid>
+時間使用 time.perf_counter (系統層級的單調時鐘)，因此分片工作行程的追蹤檔可以合併到同一條時間軸。
+"""
+
+import os
+import re
+import threading
+import time
+from collections import deque
+from typing import List, TextIO, Tuple
+
+
+# 環狀緩衝區預設容量 (區間數)
+DEFAULT_CAPACITY = 100000
+
+# 分片工作行程的追蹤檔副檔名 (附加在部分結果檔路徑後)
+TRACE_SUFFIX = '.trace'
+
+_HEADER = "# tracer: nop\n#\n#           TASK-PID    TGID   CPU#  ||||    TIMESTAMP  FUNCTION\n"
+_TIMESTAMP = re.compile(r'\s(\d+\.\d+):\s')
+
+
+def _clean(text: str) -> str:
+    """移除會破壞 systrace 欄位的字元"""
+    return text.replace('|', '/').replace('\n', ' ').replace('\r', ' ')
+
+
+class _Span:
+    """追蹤區塊 (with tracer.span(label, detail): ...)"""
+
+    def __init__(self, tracer: 'Tracer', label: str, detail: str):
+        self._tracer = tracer
+        self._label = label
+        self._detail = detail
+        self._started = 0.0
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._tracer.record(self._label, self._started, time.perf_counter(), self._detail)
+
+
+class _NullSpan:
+    """停用時的追蹤區塊"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """追蹤記錄器 (可跨執行緒記錄；deque.append 本身是執行緒安全的)"""
+
+    enabled = True
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        初始化追蹤記錄器
+
+        Args:
+            capacity: 環狀緩衝區可保留的區間數
+        """
+        self.pid = os.getpid()
+        # (開始秒數, 結束秒數, tid, 執行緒名稱, 名稱, 細節)
+        self._spans = deque(maxlen=max(1, capacity))
+        self.recorded = 0
+        # 從其他行程的追蹤檔匯入的事件行 (時間, 行內容)
+        self._imported: List[Tuple[float, str]] = []
+
+    @property
+    def dropped(self) -> int:
+        """因為超過容量而被丟棄的區間數"""
+        return self.recorded - len(self._spans)
+
+    def record(self, label: str, started: float, ended: float, detail: str = ''):
+        """
+        記錄一個已結束的區間
+
+        Args:
+            label: 區間名稱 (例如 'parse.efk')
+            started: 開始時間 (time.perf_counter 秒數)
+            ended: 結束時間 (time.perf_counter 秒數)
+            detail: 附加在名稱後的細節 (例如檔案路徑)；保留原字串參考，寫出時才組合
+        """
+        thread = threading.current_thread()
+        self._spans.append((started, ended, threading.get_native_id(), thread.name, label, detail))
+        self.recorded += 1
+
+    def span(self, label: str, detail: str = ''):
+        """
+        建立追蹤區塊
+
+        Args:
+            label: 區間名稱
+            detail: 附加在名稱後的細節
+
+        Returns:
+            離開區塊時記錄區間的 context manager
+        """
+        return _Span(self, label, detail)
+
+    def include(self, trace_path: str) -> bool:
+        """
+        匯入其他行程寫出的追蹤檔 (分片工作行程)
+
+        Args:
+            trace_path: 追蹤檔路徑
+
+        Returns:
+            bool: 檔案存在且已匯入時為 True
+        """
+        try:
+            with open(trace_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.startswith('#'):
+                        continue
+                    match = _TIMESTAMP.search(line)
+                    if match:
+                        self._imported.append((float(match.group(1)), line.rstrip('\n')))
+        except OSError:
+            return False
+        return True
+
+    def _event_lines(self) -> List[Tuple[float, int, float, str]]:
+        """
+        把區間展開為開始 / 結束事件
+
+        同一時間點的事件: 結束事件在開始事件之前；較晚開始的區間先結束，較長的區間先開始，
+        確保同一執行緒的 B / E 事件正確巢狀
+        """
+        events = []
+        pid = self.pid
+        for started, ended, tid, thread_name, label, detail in self._spans:
+            task = f"{_clean(thread_name).replace(' ', '_')}-{tid} ({pid:5d}) [000] ...1"
+            name = _clean(f"{label} {detail}" if detail else label)
+            events.append((started, 1, -ended, f"{task} {started:.6f}: tracing_mark_write: B|{pid}|{name}"))
+            events.append((ended, 0, -started, f"{task} {ended:.6f}: tracing_mark_write: E|{pid}"))
+        return events
+
+    def write(self, stream: TextIO):
+        """
+        以 systrace 格式輸出所有事件 (依時間排序)
+
+        Args:
+            stream: 輸出串流
+        """
+        events = self._event_lines()
+        events.extend((timestamp, 0, index, line) for index, (timestamp, line) in enumerate(self._imported))
+        events.sort(key=lambda event: event[:3])
+        stream.write(_HEADER)
+        if self.dropped:
+            stream.write(f"# 環狀緩衝區已滿，丟棄了最舊的 {self.dropped} 個區間\n")
+        for event in events:
+            stream.write(event[3])
+            stream.write('\n')
+
+    def save(self, trace_path: str):
+        """
+        寫出追蹤檔
+
+        Args:
+            trace_path: 追蹤檔路徑 (建議副檔名 .trace)
+        """
+        with open(trace_path, 'w', encoding='utf-8') as f:
+            self.write(f)
+
+
+class NullTracer(Tracer):
+    """停用的追蹤記錄器 - 所有記錄方法都是空操作"""
+
+    enabled = False
+
+    def __init__(self):
+        super().__init__(capacity=1)
+
+    def record(self, label: str, started: float, ended: float, detail: str = ''):
+        pass
+
+    def span(self, label: str, detail: str = ''):
+        return _NULL_SPAN
+
+    def include(self, trace_path: str) -> bool:
+        return False
+
+
+# 共用的停用實例 (未指定追蹤記錄器時使用)
+DISABLED_TRACER = NullTracer()
+
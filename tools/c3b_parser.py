@@ -7,45 +7,62 @@ C3B 模型檔案解析器
 
 import struct
 import os
+import sys
 import json
 import argparse
+import logging
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
 
+# 預先編譯的讀取器 (unpack_from 直接讀取緩衝區，不需要先切出副本)
+_UINT32 = struct.Struct('<I')
+_FLOAT32 = struct.Struct('<f')
+
+# 解析過程的訊息 (單獨執行時由 main 依 --verbose 設定輸出；掃描器會改傳入共用的 logger)
+_logger = logging.getLogger('clearproj.c3b_parser')
+
+
 class C3BParser:
     """C3B 檔案解析器"""
     
-    def __init__(self):
+    def __init__(self, logger=None):
+        """
+        初始化解析器
+        
+        Args:
+            logger: 記錄解析過程的 logger (需要 debug(message, *args) 方法，例如 ScannerLogger)；
+                逐檔案的訊息都是 DEBUG 等級，未指定時使用模組的 logger
+        """
+        self.logger = logger if logger is not None else _logger
         self.materials = []
         self.textures = []
         self.referenced_images = set()
         
     def read_string(self, data: bytes, offset: int) -> tuple[str, int]:
-        """讀取字串，返回字串和新的偏移位置"""
+        """讀取字串，返回字串和新的偏移位置 (data 可以是 bytes 或 memoryview)"""
         # 讀取字串長度 (4 bytes)
-        length = struct.unpack('<I', data[offset:offset + 4])[0]
+        length = _UINT32.unpack_from(data, offset)[0]
         offset += 4
         
-        # 讀取字串內容
-        string_data = data[offset:offset + length]
-        # 移除 null terminator
-        if length > 0 and string_data[-1] == 0:
-            string_data = string_data[:-1]
+        # 讀取字串內容 (移除 null terminator)
+        end = min(offset + length, len(data))
+        if end > offset and data[end - 1] == 0:
+            end -= 1
         
-        string = string_data.decode('utf-8', errors='ignore')
+        string = str(memoryview(data)[offset:end], 'utf-8', 'ignore')
         offset += length
         
         return string, offset
     
     def read_uint32(self, data: bytes, offset: int) -> tuple[int, int]:
         """讀取 32 位無符號整數"""
-        value = struct.unpack('<I', data[offset:offset + 4])[0]
+        value = _UINT32.unpack_from(data, offset)[0]
         return value, offset + 4
     
     def read_float(self, data: bytes, offset: int) -> tuple[float, int]:
         """讀取 32 位浮點數"""
-        value = struct.unpack('<f', data[offset:offset + 4])[0]
+        value = _FLOAT32.unpack_from(data, offset)[0]
         return value, offset + 4
     
     def parse_header(self, data: bytes) -> int:
@@ -54,45 +71,56 @@ class C3BParser:
         if data[:4] != b'C3B\x00':
             raise ValueError("不是有效的 C3B 檔案")
         
-        print("✓ 檔案格式: C3B")
+        self.logger.debug("✓ 檔案格式: C3B")
         
         # 讀取版本資訊
-        version = struct.unpack('<I', data[4:8])[0]
-        print(f"✓ 檔案版本: {version}")
+        version = _UINT32.unpack_from(data, 4)[0]
+        self.logger.debug("✓ 檔案版本: %d", version)
         
         return 8  # 返回頭部長度
     
     def extract_strings_from_data(self, data: bytes, start_offset: int = 0) -> List[str]:
-        """從二進位資料中提取可能的字串（包括檔案名）"""
+        """
+        從二進位資料中提取可能的字串（包括檔案名）
+        
+        每個位置都以 unpack_from 直接讀取長度欄位，不切出副本；
+        只有長度合理的片段才會以 memoryview 切片解碼
+        """
         strings = []
+        view = memoryview(data)
+        size = len(data)
+        read_uint32 = _UINT32.unpack_from
         i = start_offset
         
-        while i < len(data) - 4:
+        while i < size - 4:
             try:
                 # 嘗試讀取長度
-                length = struct.unpack('<I', data[i:i + 4])[0]
+                length = read_uint32(view, i)[0]
                 
                 # 檢查長度是否合理 (1-1024 字元)
-                if 1 <= length <= 1024 and i + 4 + length <= len(data):
-                    # 提取字串
-                    string_data = data[i + 4:i + 4 + length]
-                    
+                if 1 <= length <= 1024 and i + 4 + length <= size:
                     # 檢查是否包含 null terminator
-                    if length > 0 and string_data[-1] == 0:
-                        string_data = string_data[:-1]
+                    end = i + 4 + length
+                    if view[end - 1] == 0:
+                        end -= 1
+                    
+                    # 少於 3 個位元組不可能是有效的資源名稱，不需要解碼
+                    if end - (i + 4) < 3:
+                        i += 1
+                        continue
                     
                     try:
-                        string = string_data.decode('utf-8')
+                        string = str(view[i + 4:end], 'utf-8')
                         
                         # 檢查是否是有效的檔案名或材質名
                         if self.is_valid_resource_name(string):
                             strings.append(string)
-                            print(f"✓ 發現字串: {string}")
+                            self.logger.debug("✓ 發現字串: %s", string)
                             
                             # 檢查是否是圖片檔案
                             if self.is_image_file(string):
                                 self.referenced_images.add(string)
-                                print(f"  → 圖片檔案: {string}")
+                                self.logger.debug("  → 圖片檔案: %s", string)
                     
                     except UnicodeDecodeError:
                         pass
@@ -144,14 +172,14 @@ class C3BParser:
             with open(filepath, 'rb') as f:
                 data = f.read()
             
-            print(f"📁 正在解析檔案: {filepath}")
-            print(f"📊 檔案大小: {len(data)} bytes")
+            self.logger.debug("📁 正在解析檔案: %s", filepath)
+            self.logger.debug("📊 檔案大小: %d bytes", len(data))
             
             # 解析檔案頭
             offset = self.parse_header(data)
             
             # 提取所有可能的字串
-            print("\n🔍 搜尋資源引用...")
+            self.logger.debug("🔍 搜尋資源引用...")
             strings = self.extract_strings_from_data(data, offset)
             
             # 分析結果
@@ -166,7 +194,7 @@ class C3BParser:
             return result
             
         except Exception as e:
-            print(f"❌ 解析檔案時發生錯誤: {e}")
+            self.logger.debug("❌ 解析檔案時發生錯誤: %s - %s", filepath, e)
             return {'error': str(e)}
     
     def scan_directory(self, directory: str) -> List[Dict[str, Any]]:
@@ -246,6 +274,9 @@ def main():
     parser.add_argument('-v', '--verbose', action='store_true', help='顯示詳細輸出')
     
     args = parser.parse_args()
+    # 逐檔案的解析過程只在 --verbose 時輸出
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format='%(message)s',
+                        stream=sys.stdout)
     
     c3b_parser = C3BParser()
     
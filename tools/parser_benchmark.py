@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+二進位解析器微基準測試
+量測 EFK 掃描器與 C3B 解析器每解析 1 MB 資料的耗時與記憶體配置
+
+CPython 沒有提供「累計配置次數」的計數器，因此以 tracemalloc 量測兩個數值:
+    peak/MB      解析期間相對於開始前的最高記憶體用量 (不含輸入緩衝區本身)
+    blocks/MB    解析結束時仍存活的配置區塊數 (結果與快取)
+另外以同一份資料比較「切出副本再解碼」與「memoryview + unpack_from」兩種長度欄位探測方式的耗時。
+
+使用方式:
+    python tools/parser_benchmark.py [檔案或目錄 ...] [--synthetic-mb 1] [--repeat 3]
+未指定檔案時使用合成的特效 / 模型資料。
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import struct
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+# 讓 tools/ 內的腳本可以直接匯入 src 與 tools 套件
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.scanner.efk_scanner import EFKScanner  # noqa: E402
+from tools.c3b_parser import C3BParser  # noqa: E402
+
+
+_UINT32 = struct.Struct('<I')
+_MB = 1024 * 1024
+
+SAMPLE_STRINGS = ('Texture/fire_01.png', 'Model/sword.efkmodel', 'Material/glow.efkmat',
+                  'ParticleName', 'diffuse_map.jpg', 'Emitter')
+
+
+def synthetic_data(size: int, header: bytes, utf16: bool, seed: int = 0) -> bytes:
+    """
+    產生類似特效 / 模型檔的合成資料 (長度前綴字串與隨機二進位資料交錯)
+
+    Args:
+        size: 大約的位元組數
+        header: 檔頭
+        utf16: 字串是否以 UTF-16LE 編碼 (EFK) 或 UTF-8 編碼 (C3B)
+        seed: 亂數種子
+
+    Returns:
+        bytes: 合成資料
+    """
+    rng = random.Random(seed)
+    parts = [header]
+    total = len(header)
+    while total < size:
+        if rng.random() < 0.2:
+            text = rng.choice(SAMPLE_STRINGS)
+            encoded = text.encode('utf-16le') if utf16 else text.encode('utf-8')
+            chunk = _UINT32.pack(len(text) if utf16 else len(encoded)) + encoded
+        else:
+            chunk = rng.randbytes(rng.randint(16, 256))
+        parts.append(chunk)
+        total += len(chunk)
+    return b''.join(parts)
+
+
+def collect_files(paths: List[str]) -> Tuple[List[bytes], List[bytes]]:
+    """讀取指定的檔案或目錄中的 EFK 與 C3B 檔案"""
+    efk_data, c3b_data = [], []
+    for path in paths:
+        files = [Path(path)] if os.path.isfile(path) else [p for p in Path(path).rglob('*') if p.is_file()]
+        for file_path in files:
+            extension = file_path.suffix.lower()
+            if extension in ('.efk', '.efkmat', '.efkmodel'):
+                efk_data.append(file_path.read_bytes())
+            elif extension == '.c3b':
+                c3b_data.append(file_path.read_bytes())
+    return efk_data, c3b_data
+
+
+def measure(name: str, parse: Callable[[bytes], object], datas: List[bytes], repeat: int):
+    """量測並輸出一個解析器的耗時與記憶體配置"""
+    total_bytes = sum(len(data) for data in datas)
+    if not total_bytes:
+        print(f"{name:<28} (沒有資料)")
+        return
+    megabytes = total_bytes / _MB
+
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for data in datas:
+            parse(data)
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    blocks_before = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+    results = [parse(data) for data in datas]
+    _, peak = tracemalloc.get_traced_memory()
+    blocks_after = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+    tracemalloc.stop()
+    del results
+
+    print(f"{name:<28} {megabytes:8.2f} MB  {best / megabytes * 1000:9.1f} ms/MB  "
+          f"peak/MB {(peak - baseline) / megabytes / 1024:9.1f} KB  "
+          f"blocks/MB {(blocks_after - blocks_before) / megabytes:9.1f}")
+
+
+def compare_probes(data: bytes, repeat: int):
+    """比較兩種長度欄位探測方式 (每個位置讀取一次 uint32)"""
+    megabytes = len(data) / _MB
+    count = len(data) - 4
+
+    def copy_probe():
+        unpack = struct.unpack
+        for i in range(count):
+            unpack('<I', data[i:i + 4])
+
+    def view_probe():
+        view = memoryview(data)
+        unpack_from = _UINT32.unpack_from
+        for i in range(count):
+            unpack_from(view, i)
+
+    for name, probe in (('slice + struct.unpack', copy_probe), ('memoryview + unpack_from', view_probe)):
+        best = float('inf')
+        for _ in range(repeat):
+            started = time.perf_counter()
+            probe()
+            best = min(best, time.perf_counter() - started)
+        # 切片方式每個位置都會建立一個 4 bytes 的 bytes 物件
+        copies = count if probe is copy_probe else 0
+        print(f"{name:<28} {best / megabytes * 1000:9.1f} ms/MB  暫存副本/MB {copies / megabytes:12.0f}")
+
+
+def main():
+    """主函數"""
+    parser = argparse.ArgumentParser(description="二進位解析器微基準測試 (耗時與記憶體配置 / MB)")
+    parser.add_argument('paths', nargs='*', help='EFK / C3B 檔案或目錄 (未指定時使用合成資料)')
+    parser.add_argument('--synthetic-mb', type=float, default=1.0, help='合成資料大小 (MB，預設 1)')
+    parser.add_argument('--repeat', type=int, default=3, help='重複次數，取最快的一次 (預設 3)')
+    args = parser.parse_args()
+
+    if args.paths:
+        efk_data, c3b_data = collect_files(args.paths)
+    else:
+        size = int(args.synthetic_mb * _MB)
+        efk_data = [synthetic_data(size, b'SKFE', utf16=True)]
+        c3b_data = [synthetic_data(size, b'C3B\x00' + _UINT32.pack(1), utf16=False, seed=1)]
+
+    efk_scanner = EFKScanner('.', set())
+    c3b_parser = C3BParser()
+
+    def parse_c3b(data: bytes):
+        # C3BParser 每找到一個字串都會 print，量測時丟棄輸出
+        with contextlib.redirect_stdout(io.StringIO()):
+            strings = c3b_parser.extract_strings_from_data(data, 8)
+        c3b_parser.referenced_images.clear()
+        return strings
+
+    print("== 解析器 ==")
+    measure('EFK _parse_efk_content', lambda data: efk_scanner._parse_efk_content(data, None), efk_data, args.repeat)
+    measure('EFK _parse_efkmodel_content',
+            lambda data: efk_scanner._parse_efkmodel_content(data, None), efk_data, args.repeat)
+    measure('C3B extract_strings', parse_c3b, c3b_data, args.repeat)
+
+    print("== 長度欄位探測 ==")
+    probe_data = b''.join(efk_data + c3b_data)[:_MB]
+    if probe_data:
+        compare_probes(probe_data, args.repeat)
+
+
+if __name__ == "__main__":
+    main()